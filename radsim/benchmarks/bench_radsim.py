@@ -0,0 +1,324 @@
+#!/usr/bin/env python
+'''Times radsim's digestion hot paths and commands on synthetic genomes.
+
+    python benchmarks/bench_radsim.py --sizes 1 10 --json new.json
+    python benchmarks/bench_radsim.py --json new.json --compare old.json
+
+Genomes of each of ``--sizes`` Mbp, split into each of ``--contigs``
+sequences, are generated (once, in ``--workdir``) from a fixed seed, and
+digested with enzymes with 4, 6 and 8 bp sites. Each benchmark runs in a fresh
+process, so the peak RSS reported is its own, and the fastest of ``--repeat``
+runs is reported, as seconds and Mbp of genome per second. The ``startup``
+benchmark times each command from a cold start, in a new interpreter, on a
+tiny genome, so mostly measures imports. radsim must be importable, e.g.
+installed with ``pip install -e .``.
+'''
+from __future__ import print_function, division, absolute_import
+from argparse import ArgumentParser
+import io
+import json
+import multiprocessing
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+import time
+
+import numpy as np
+
+# Enzymes by the length of their recognition site
+ENZYMES = {4: 'MspI', 6: 'PstI', 8: 'NotI'}
+# The commands each benchmarked as a whole, and their arguments, beyond the
+# genome and enzyme. {out} is an output file, and {vcf} a VCF of the genome.
+COMMANDS = {
+    'hist': ('hist_main', ['-o', '{out}']),
+    'digest': ('digest_main', ['--output-bed', '{out}.bed',
+                               '--output-fasta', '{out}.fa']),
+    'rebed': ('rebed_main', ['-o', '{out}']),
+    'reads': ('reads_main', ['-1', '{out}.1.fq', '-2', '{out}.2.fq',
+                             '--seed', '1']),
+    'library': ('library_main', ['-o', '{out}', '--seed', '1']),
+    'variants': ('variants_main', ['-o', '{out}', '--vcf', '{vcf}']),
+    'screen': ('screen_main', ['-o', '{out}', '--target', '1000']),
+    'index': ('index_main', ['-o', '{out}.2bit']),
+}
+# The legacy print-based outputs are timed beside the writers.py ones the
+# commands use
+FUNCTIONS = ('re_sites', 'iter_fragments', 'seqfile_iter_frags',
+             'output_bed', 'output_frag_fasta', 'bed_writer', 'fasta_writer')
+# Size of the genome commands are started on by the startup benchmark
+STARTUP_SIZE = 10000
+
+
+def write_genome(path, size, contigs, seed=1):
+    '''Writes a random genome of ``size`` bases in ``contigs`` sequences'''
+    rng = np.random.default_rng(seed)
+    bases = np.frombuffer(b'ACGT', dtype=np.uint8)
+    with open(path, 'wb') as fh:
+        for i in range(contigs):
+            length = size // contigs + (i < size % contigs)
+            seq = bases[rng.integers(0, 4, length)].tobytes()
+            fh.write('>contig{}\n'.format(i).encode())
+            for start in range(0, length, 80):
+                fh.write(seq[start:start + 80] + b'\n')
+
+
+def write_vcf(path, genome, samples=4, spacing=1000, seed=1):
+    '''Writes a phased VCF of SNPs about every ``spacing`` bases of
+    ``genome``, each carried by random haplotypes'''
+    from radsim.utils import open_genome
+    rng = np.random.default_rng(seed)
+    with open(path, 'w') as fh:
+        print('##fileformat=VCFv4.2', file=fh)
+        print('#CHROM', 'POS', 'ID', 'REF', 'ALT', 'QUAL', 'FILTER', 'INFO',
+              'FORMAT', *['s{}'.format(i) for i in range(samples)], sep='\t',
+              file=fh)
+        for read in open_genome(genome):
+            seq = str(read.sequence)
+            positions = np.unique(rng.integers(0, len(seq),
+                                               len(seq) // spacing))
+            for pos in positions.tolist():
+                alt = 'ACGT'[('ACGT'.index(seq[pos]) + 1) % 4]
+                calls = rng.integers(0, 2, (samples, 2)).tolist()
+                print(read.name, pos + 1, '.', seq[pos], alt, '.', '.', '.',
+                      'GT', *['{}|{}'.format(*gt) for gt in calls], sep='\t',
+                      file=fh)
+
+
+def load_sequences(genome):
+    from radsim.utils import open_genome
+    return [str(read.sequence) for read in open_genome(genome)]
+
+
+def time_function(name, genome, enzyme, engine):
+    '''Returns the seconds ``name`` (one of ``FUNCTIONS``) takes on
+    ``genome``. Reading the genome, and for the output functions digesting
+    it, isn't timed.'''
+    from radsim import Digest, output_bed, output_frag_fasta
+    from radsim.utils import seqfile_iter_fragment_tables, seqfile_iter_frags
+    from radsim.writers import BedWriter, FastaWriter
+    digestor = Digest(enzyme, engine=engine)
+    if name == 'seqfile_iter_frags':
+        start = time.perf_counter()
+        for _ in seqfile_iter_frags(genome, digestor, 1, 10000):
+            pass
+        return time.perf_counter() - start
+    if name in ('output_bed', 'output_frag_fasta'):
+        frags = list(seqfile_iter_frags(genome, digestor, 1, 10000))
+        stream = io.StringIO()
+        start = time.perf_counter()
+        for read, frag in frags:
+            if name == 'output_bed':
+                output_bed(read.name, frag.lhs, frag.rhs, '.', stream)
+            else:
+                output_frag_fasta(read, frag, stream)
+        return time.perf_counter() - start
+    if name in ('bed_writer', 'fasta_writer'):
+        tables = list(seqfile_iter_fragment_tables(genome, digestor, 1,
+                                                   10000))
+        stream = io.BytesIO()
+        start = time.perf_counter()
+        if name == 'bed_writer':
+            with BedWriter(stream) as writer:
+                for read, table in tables:
+                    writer.write_fragments(read.name, table, digestor.enzymes)
+        else:
+            with FastaWriter(stream) as writer:
+                for read, table in tables:
+                    writer.write_fragments(read, table)
+        return time.perf_counter() - start
+    sequences = load_sequences(genome)
+    start = time.perf_counter()
+    for seq in sequences:
+        if name == 're_sites':
+            digestor.re_sites(seq)
+        else:
+            for _ in digestor.iter_fragments(seq):
+                pass
+    return time.perf_counter() - start
+
+
+def command_argv(name, genome, enzyme, engine, workdir, vcf):
+    '''The arguments to run command ``name`` (one of ``COMMANDS``) with'''
+    out = os.path.join(workdir, 'out.{}'.format(name))
+    argv = ['-i', genome]
+    if name == 'screen':
+        argv += ['--enzymes', enzyme]
+    elif name != 'index':
+        argv += ['-e', enzyme, '--engine', engine]
+    return argv + [arg.format(out=out, vcf=vcf) for arg in COMMANDS[name][1]]
+
+
+def time_command(name, genome, enzyme, engine, workdir, vcf):
+    '''Returns the seconds command ``name`` (one of ``COMMANDS``) takes on
+    ``genome``'''
+    from radsim import main
+    sys.argv = [name] + command_argv(name, genome, enzyme, engine, workdir,
+                                     vcf)
+    stderr = sys.stderr
+    sys.stderr = open(os.devnull, 'w')
+    try:
+        start = time.perf_counter()
+        getattr(main, COMMANDS[name][0])()
+        return time.perf_counter() - start
+    finally:
+        sys.stderr.close()
+        sys.stderr = stderr
+
+
+def time_startup(name, genome, enzyme, engine, workdir, vcf):
+    '''Returns the seconds command ``name`` (one of ``COMMANDS``) takes on
+    ``genome`` in a new interpreter, including starting it and imports'''
+    code = 'import sys; from radsim import main; sys.argv[0] = {!r}; ' \
+        'main.{}()'.format(name, COMMANDS[name][0])
+    argv = [sys.executable, '-c', code] + command_argv(
+        name, genome, enzyme, engine, workdir, vcf)
+    with open(os.devnull, 'w') as devnull:
+        start = time.perf_counter()
+        subprocess.check_call(argv, stderr=devnull)
+        return time.perf_counter() - start
+
+
+def _run(queue, kind, args, repeat):
+    func = {'command': time_command, 'function': time_function,
+            'startup': time_startup}[kind]
+    seconds = min(func(*args) for _ in range(repeat))
+    # Kilobytes on Linux, bytes on macOS
+    scale = 1 if sys.platform == 'darwin' else 1024
+    who = resource.RUSAGE_CHILDREN if kind == 'startup' \
+        else resource.RUSAGE_SELF
+    rss = resource.getrusage(who).ru_maxrss * scale
+    queue.put((seconds, rss))
+
+
+def run_isolated(kind, args, repeat):
+    '''Runs a benchmark in a new process, returning its seconds and peak RSS
+    in bytes'''
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    proc = context.Process(target=_run, args=(queue, kind, args, repeat))
+    proc.start()
+    result = queue.get()
+    proc.join()
+    return result
+
+
+def compare(results, old_path, threshold):
+    '''Prints the change in time and RSS of each benchmark since the results
+    in ``old_path``, returning how many slowed by more than ``threshold``'''
+    with open(old_path) as fh:
+        old = json.load(fh)
+    keys = ('benchmark', 'size', 'contigs', 'site_length', 'engine')
+    before = {tuple(res[key] for key in keys): res for res in old['results']}
+    print('\nChanges since', old.get('version', old_path))
+    slower = 0
+    for res in results:
+        prev = before.get(tuple(res[key] for key in keys))
+        if prev is None:
+            continue
+        ratio = res['seconds'] / prev['seconds']
+        flag = ''
+        if ratio > 1 + threshold:
+            flag = '\tSLOWER'
+            slower += 1
+        print(res['benchmark'], res['size'], res['contigs'],
+              res['site_length'], '{:.2f}x time'.format(ratio),
+              '{:.2f}x RSS{}'.format(res['peak_rss'] / prev['peak_rss'], flag),
+              sep='\t')
+    return slower
+
+
+def main():
+    ap = ArgumentParser(description=__doc__.split('\n')[0])
+    ap.add_argument('--sizes', nargs='+', type=float, default=[1, 10],
+                    metavar='MBP', help='Genome sizes (default 1 10)')
+    ap.add_argument('--contigs', nargs='+', type=int, default=[1, 1000],
+                    help='Numbers of sequences per genome (default 1 1000)')
+    ap.add_argument('--site-lengths', nargs='+', type=int,
+                    default=sorted(ENZYMES), choices=sorted(ENZYMES),
+                    help='Enzyme recognition site lengths (default 4 6 8)')
+    ap.add_argument('--benchmarks', nargs='+',
+                    default=list(FUNCTIONS) + list(COMMANDS) + ['startup'],
+                    choices=list(FUNCTIONS) + list(COMMANDS) + ['startup'],
+                    help='Benchmarks to run (default all)')
+    ap.add_argument('--engine', default='numpy',
+                    help='Site search engine (default numpy)')
+    ap.add_argument('--repeat', type=int, default=3,
+                    help='Runs of each benchmark, the fastest reported '
+                    '(default 3)')
+    ap.add_argument('--workdir', default=None,
+                    help='Directory for genomes, kept between runs (default '
+                    'a temporary directory)')
+    ap.add_argument('--json', default=None, metavar='FILE',
+                    help='Write results to FILE')
+    ap.add_argument('--compare', default=None, metavar='FILE',
+                    help='Compare to results from an earlier --json')
+    ap.add_argument('--threshold', type=float, default=0.1,
+                    help='Report slowdowns beyond this fraction (default '
+                    '0.1), exiting non-zero if there are any')
+    args = ap.parse_args()
+
+    import radsim
+    workdir = args.workdir or tempfile.mkdtemp(prefix='radsim-bench-')
+    if not os.path.isdir(workdir):
+        os.makedirs(workdir)
+    results = []
+    print('benchmark', 'size', 'contigs', 'site_length', 'seconds', 'mbp_s',
+          'peak_rss_mb', sep='\t')
+
+    def record(name, bases, contigs, site_length, seconds, rss):
+        res = dict(benchmark=name, size=bases, contigs=contigs,
+                   site_length=site_length, engine=args.engine,
+                   seconds=seconds, peak_rss=rss, mbp_s=bases / 1e6 / seconds)
+        results.append(res)
+        print(name, bases, contigs, site_length, '{:.4f}'.format(seconds),
+              '{:.2f}'.format(res['mbp_s']), '{:.1f}'.format(rss / 2 ** 20),
+              sep='\t')
+        sys.stdout.flush()
+
+    if 'startup' in args.benchmarks:
+        genome = os.path.join(workdir, 'genome_startup.fa')
+        vcf = genome + '.vcf'
+        if not os.path.exists(vcf):
+            write_genome(genome, STARTUP_SIZE, 1)
+            write_vcf(vcf, genome)
+        for name in COMMANDS:
+            seconds, rss = run_isolated(
+                'startup', (name, genome, ENZYMES[6], args.engine, workdir,
+                            vcf), args.repeat)
+            record('startup:' + name, STARTUP_SIZE, 1, 6, seconds, rss)
+    for size in args.sizes:
+        bases = int(size * 1e6)
+        for contigs in args.contigs:
+            genome = os.path.join(workdir, 'genome_{}_{}.fa'.format(bases,
+                                                                    contigs))
+            vcf = genome + '.vcf'
+            if not os.path.exists(genome):
+                write_genome(genome, bases, contigs)
+            if 'variants' in args.benchmarks and not os.path.exists(vcf):
+                write_vcf(vcf, genome)
+            for site_length in args.site_lengths:
+                enzyme = ENZYMES[site_length]
+                for name in args.benchmarks:
+                    if name == 'startup':
+                        continue
+                    if name in COMMANDS:
+                        seconds, rss = run_isolated(
+                            'command', (name, genome, enzyme, args.engine,
+                                        workdir, vcf), args.repeat)
+                    else:
+                        seconds, rss = run_isolated(
+                            'function', (name, genome, enzyme, args.engine),
+                            args.repeat)
+                    record(name, bases, contigs, site_length, seconds, rss)
+    if args.json:
+        with open(args.json, 'w') as fh:
+            json.dump({'version': radsim.__version__, 'results': results}, fh,
+                      indent=1)
+    if args.compare and compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -1,14 +1,43 @@
 from __future__ import print_function, division, absolute_import
+import importlib
 
-from .digest import (
-    list_enzymes,
-    Digest,
-    Fragment,
-)
-from .utils import (
-    output_frag_fasta,
-    output_bed,
-)
-from ._version import get_versions
-__version__ = get_versions()['version']
-del get_versions
+# Names exported by the package, and the modules they come from. Modules are
+# only imported when a name is first used, as importing Biopython and NumPy
+# takes much longer than most commands on small inputs.
+_EXPORTS = {
+    'list_enzymes': 'digest',
+    'Digest': 'digest',
+    'Fragment': 'digest',
+    'FRAGMENT_DTYPE': 'digest',
+    'genome_fragments_array': 'utils',
+    'output_frag_fasta': 'utils',
+    'output_bed': 'utils',
+}
+
+__all__ = sorted(_EXPORTS) + ['__version__']
+
+try:
+    # Written by setup.py when the package is built or installed
+    from ._static_version import __version__
+except ImportError:
+    pass
+
+
+def __getattr__(name):
+    if name == '__version__':
+        # Only a source checkout that was never built or installed gets
+        # here, where _version.py runs git, so is only done if asked
+        from ._version import get_versions
+        value = get_versions()['version']
+    elif name in _EXPORTS:
+        module = importlib.import_module('.' + _EXPORTS[name], __name__)
+        value = getattr(module, name)
+    else:
+        raise AttributeError("module {!r} has no attribute {!r}".format(
+            __name__, name))
+    globals()[name] = value
+    return value
+
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
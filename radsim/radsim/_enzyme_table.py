@@ -0,0 +1,1092 @@
+# Generated by ``python -m radsim.enzymes`` from the REBASE data in
+# Biopython 1.88. Do not edit. Columns are the fields of ``enzymes.Enzyme``.
+TABLE = '''
+AanI	TTATAA	3	-3			0		defined	blunt	3	3	1	0	PsiI
+AarI	CACCTGC	11	8			-4	NNNN	ambiguous	5prime	11	-8	0	0	PaqCI
+AasI	GACNNNNNNGTC	7	-7			2	NN	ambiguous	3prime	7	7	1	0	DrdI,DseDI
+AatII	GACGTC	5	-5			4	ACGT	defined	3prime	5	5	1	1	ZraI
+Aba13301I	GCAAAC							unknown	unknown	0	0	0	1	
+Aba6411II	CRRTAAG							unknown	unknown	0	0	0	1	
+AbaB8342IV	CATTAG							unknown	unknown	0	0	0	1	
+AbaCIII	CTATCAV							unknown	unknown	0	0	0	1	
+AbaPBA3II	CAYGAC							unknown	unknown	0	0	0	1	
+AbaSI	C	12	9			2	NN	ambiguous	3prime	12	-9	0	0	BmeDI,EcoO157SI,YkrI
+AbaUMB2I	YCCGSS							unknown	unknown	0	0	0	0	
+Abr4036II	GRTYGACC							unknown	unknown	0	0	0	1	
+AbsI	CCTCGAGG	2	-2			-4	TCGA	defined	5prime	2	2	1	0	
+Acc16I	TGCGCA	3	-3			0		defined	blunt	3	3	1	0	FspI,MstI,NsbI
+Acc36I	ACCTGC	10	8			-4	NNNN	ambiguous	5prime	10	-8	0	0	BfuAI,BspMI,BveI
+Acc65I	GGTACC	1	-1			-4	GTAC	defined	5prime	1	1	1	1	Asp718I,KpnI
+Acc65V	GACGCA							unknown	unknown	0	0	0	1	
+AccB1I	GGYRCC	1	-1			-4	GYRC	ambiguous	5prime	1	1	1	0	BanI,BshNI,BspT107I,HgiCI
+AccB7I	CCANNNNNTGG	7	-7			3	NNN	ambiguous	3prime	7	7	1	0	PflMI,Van91I
+AccBSI	CCGCTC	3	-3			0		defined	blunt	3	3	0	0	BsrBI,MbiI
+AccI	GTMKAC	2	-2			-2	MK	ambiguous	5prime	2	2	1	1	FblI,XmiI
+AccII	CGCG	2	-2			0		defined	blunt	2	2	1	1	Bsh1236I,BspFNI,BstFNI,BstUI,FnuDII,MvnI,SelI
+AccIII	TCCGGA	1	-1			-4	CCGG	defined	5prime	1	1	1	1	Aor13HI,BseAI,Bsp13I,BspEI,BspMII,Kpn2I,MroI
+AccIX	GACRAC							unknown	unknown	0	0	0	1	
+AccX	GGARCA							unknown	unknown	0	0	0	1	
+AceIII	CAGCTC	13	11			-4	NNNN	ambiguous	5prime	13	-11	0	0	
+AchA6III	AGCCAG							unknown	unknown	0	0	0	1	
+AciI	CCGC	1	-1			-2	CG	defined	5prime	1	1	0	1	BspACI,SsiI
+AclI	AACGTT	2	-2			-2	CG	defined	5prime	2	2	1	1	Psp1406I
+AclWI	GGATC	9	5			-1	N	ambiguous	5prime	9	-5	0	0	AlwI,BinI,BspPI
+Aco12261II	CCRGAG							unknown	unknown	0	0	0	1	
+AcoI	YGGCCR	1	-1			-4	GGCC	defined	5prime	1	1	1	0	CfrI,EaeI
+AcoY31II	TAGCRAB							unknown	unknown	0	0	0	1	
+AcsI	RAATTY	1	-1			-4	AATT	defined	5prime	1	1	1	0	ApoI,XapI
+AcuI	CTGAAG	22	14			2	NN	ambiguous	3prime	22	-14	0	1	Eco57I
+AcvI	CACGTG	3	-3			0		defined	blunt	3	3	1	0	BbrPI,Eco72I,PmaCI,PmlI,PspCI
+AcyI	GRCGYC	2	-2			-2	CG	defined	5prime	2	2	1	0	BsaHI,BssNI,BstACI,Hin1I,Hsp92I
+AdeI	CACNNNGTG	6	-6			3	NNN	ambiguous	3prime	6	6	1	0	DraIII
+Adh6U21I	GAANCAG							unknown	unknown	0	0	0	1	
+AfaI	GTAC	2	-2			0		defined	blunt	2	2	1	0	Csp6I,CviQI,PabI,RsaI,RsaNI
+AfeI	AGCGCT	3	-3			0		defined	blunt	3	3	1	0	Aor51HI,Eco47III
+AfiI	CCNNNNNNNGG	7	-7			3	NNN	ambiguous	3prime	7	7	1	0	Bsc4I,BseLI,BsiYI,BslI
+AflII	CTTAAG	1	-1			-4	TTAA	defined	5prime	1	1	1	1	BfrI,BspTI,BstAFI,MspCI,Vha464I
+AflIII	ACRYGT	1	-1			-4	CRYG	ambiguous	5prime	1	1	1	1	
+AgeI	ACCGGT	1	-1			-4	CCGG	defined	5prime	1	1	1	1	AsiGI,BshTI,CspAI,PinAI
+AgsI	TTSAA	3	-3			1	S	ambiguous	3prime	3	3	1	1	
+AhaIII	TTTAAA	3	-3			0		defined	blunt	3	3	1	0	DraI
+AhdI	GACNNNNNGTC	6	-6			1	N	ambiguous	3prime	6	6	1	1	BmeRI,DriI,Eam1105I
+AhlI	ACTAGT	1	-1			-4	CTAG	defined	5prime	1	1	1	0	BcuI,SpeI
+AhyRBAHI	GCYYGAC							unknown	unknown	0	0	0	1	
+AhyYL17I	YAAMGAG							unknown	unknown	0	0	0	1	
+AjiI	CACGTC	3	-3			0		defined	blunt	3	3	0	0	BmgBI,BtrI
+AjnI	CCWGG	0	0			-5	CCWGG	ambiguous	5prime	0	0	1	1	BciT130I,BseBI,Bst2UI,BstNI,Dde51507I,EcoRII,MvaI,Psp6I,PspGI
+AjuI	GAANNNNNNNTTGG	-7	-26	25	6	5	NNNNN	ambiguous	3prime	-7,25	26,-6	0	0	
+AleI	CACNNNNGTG	5	-5			0		defined	blunt	5	5	1	1	OliI
+AlfI	GCANNNNNNTGC	-10	-24	24	10	2	NN	ambiguous	3prime	-10,24	24,-10	1	0	
+AloI	GAACNNNNNNTCC	-7	-25	25	7	5	NNNNN	ambiguous	3prime	-7,25	25,-7	0	1	
+AluBI	AGCT	2	-2			0		defined	blunt	2	2	1	1	AluI
+AluI	AGCT	2	-2			0		defined	blunt	2	2	1	1	AluBI
+Alw21I	GWGCWC	5	-5			4	WGCW	ambiguous	3prime	5	5	1	0	Bbv12I,BsiHKAI,HgiAI
+Alw26I	GTCTC	6	5			-4	NNNN	ambiguous	5prime	6	-5	0	1	BcoDI,BsmAI,BstMAI
+Alw44I	GTGCAC	1	-1			-4	TGCA	defined	5prime	1	1	1	0	ApaLI,VneI
+AlwFI	GAAAYNNNNNRTG							unknown	unknown	0	0	0	0	
+AlwI	GGATC	9	5			-1	N	ambiguous	5prime	9	-5	0	1	AclWI,BinI,BspPI
+AlwNI	CAGNNNCTG	6	-6			3	NNN	ambiguous	3prime	6	6	1	0	CaiI,PstNI
+Ama87I	CYCGRG	1	-1			-4	YCGR	ambiguous	5prime	1	1	1	0	AvaI,BmeT110I,BsiHKCI,BsoBI,Eco88I,Nli3877I
+AmaCSI	GCTCCA	17	9			2	NN	ambiguous	3prime	17	-9	0	1	
+Aod1I	GATCNAC							unknown	unknown	0	0	0	1	
+Aor13HI	TCCGGA	1	-1			-4	CCGG	defined	5prime	1	1	1	0	AccIII,BseAI,Bsp13I,BspEI,BspMII,Kpn2I,MroI
+Aor51HI	AGCGCT	3	-3			0		defined	blunt	3	3	1	0	AfeI,Eco47III
+AoxI	GGCC	0	0			-4	GGCC	defined	5prime	0	0	1	0	BshFI,BsnI,BspANI,BsuRI,HaeIII
+ApaBI	GCANNNNNTGC	8	-8			5	NNNNN	ambiguous	3prime	8	8	1	0	BstAPI
+ApaI	GGGCCC	5	-5			4	GGCC	defined	3prime	5	5	1	1	Bsp120I,PspOMI
+ApaLI	GTGCAC	1	-1			-4	TGCA	defined	5prime	1	1	1	1	Alw44I,VneI
+ApeKI	GCWGC	1	-1			-3	CWG	ambiguous	5prime	1	1	1	1	NhoI,TseI
+ApoI	RAATTY	1	-1			-4	AATT	defined	5prime	1	1	1	1	AcsI,XapI
+ApyPI	ATCGAC	26	18			2	NN	ambiguous	3prime	26	-18	0	1	
+AquII	GCCGNAC	27	18			2	NN	ambiguous	3prime	27	-18	0	1	
+AquIII	GAGGAG	26	18			2	NN	ambiguous	3prime	26	-18	0	1	BseRI
+AquIV	GRGGAAG	26	17			2	NN	ambiguous	3prime	26	-17	0	1	
+ArsI	GACNNNNNNTTYG	-8	-26	24	6	5	NNNNN	ambiguous	3prime	-8,24	26,-6	0	0	
+AscI	GGCGCGCC	2	-2			-4	CGCG	defined	5prime	2	2	1	1	PalAI,SgsI
+AseI	ATTAAT	2	-2			-2	TA	defined	5prime	2	2	1	1	PshBI,VspI
+Asi256I	GATC	1	-1			-2	AT	defined	5prime	1	1	1	0	Bsp143I,BssMI,BstKTI,BstMBI,ChaI,DpnI,DpnII,Kzo9I,MalI,MboI,NdeII,Sau3AI
+AsiGI	ACCGGT	1	-1			-4	CCGG	defined	5prime	1	1	1	0	AgeI,BshTI,CspAI,PinAI
+AsiSI	GCGATCGC	5	-5			2	AT	defined	3prime	5	5	1	1	RgaI,SfaAI,SgfI
+Asl11923II	GGGABCC							unknown	unknown	0	0	0	1	
+Asp103I	CGRAGGC							unknown	unknown	0	0	0	1	
+Asp114pII	AGCABCC							unknown	unknown	0	0	0	1	
+Asp337I	CARABGG							unknown	unknown	0	0	0	1	
+Asp700I	GAANNNNTTC	5	-5			0		defined	blunt	5	5	1	0	MroXI,PdmI,XmnI
+Asp718I	GGTACC	1	-1			-4	GTAC	defined	5prime	1	1	1	0	Acc65I,KpnI
+AspA2I	CCTAGG	1	-1			-4	CTAG	defined	5prime	1	1	1	0	AvrII,BlnI,XmaJI
+AspAMDIV	ACCCAC							unknown	unknown	0	0	0	1	
+AspBHI	YSCNS	13	12			-4	NNNN	ambiguous	5prime	13	-12	0	0	
+AspDUT2V	GNGCAAC							unknown	unknown	0	0	0	1	
+AspJHL3II	CGCCCAG							unknown	unknown	0	0	0	1	
+AspLEI	GCGC	3	-3			2	CG	defined	3prime	3	3	1	0	BstHHI,CfoI,GlaI,HhaI,Hin6I,HinP1I,HspAI
+AspNIH4III	AAGAACB							unknown	unknown	0	0	0	1	
+AspS9I	GGNCC	1	-1			-3	GNC	ambiguous	5prime	1	1	1	1	AsuI,BmgT120I,Cfr13I,FmuI,PspPI,Sau96I,UnbI
+AspSLV7III	GTCTCA							unknown	unknown	0	0	0	1	
+Asu14238IV	CGTRAC							unknown	unknown	0	0	0	1	
+AsuC2I	CCSGG	2	-2			-1	S	ambiguous	5prime	2	2	1	0	BcnI,BpuMI,CauII,EcoHI,NciI
+AsuHPI	GGTGA	13	7			1	N	ambiguous	3prime	13	-7	0	0	HphI,SspD5I
+AsuI	GGNCC	1	-1			-3	GNC	ambiguous	5prime	1	1	1	0	AspS9I,BmgT120I,Cfr13I,FmuI,PspPI,Sau96I,UnbI
+AsuII	TTCGAA	2	-2			-2	CG	defined	5prime	2	2	1	0	Bpu14I,Bsp119I,BspT104I,BstBI,NspV,SfuI
+AsuNHI	GCTAGC	1	-1			-4	CTAG	defined	5prime	1	1	1	0	BmtI,BspOI,NheI
+AteTI	GGGRAG							unknown	unknown	0	0	0	1	
+AvaI	CYCGRG	1	-1			-4	YCGR	ambiguous	5prime	1	1	1	1	Ama87I,BmeT110I,BsiHKCI,BsoBI,Eco88I,Nli3877I
+AvaII	GGWCC	1	-1			-3	GWC	ambiguous	5prime	1	1	1	1	Bme18I,Eco47I,Psp03I,SinI,VpaK11AI,VpaK11BI
+AvaIII	ATGCAT							unknown	unknown	0	0	1	1	EcoT22I,Mph1103I,NsiI,Ppu10I,Zsp2I
+Avi249I	CTGCA							unknown	unknown	0	0	0	1	
+AvrII	CCTAGG	1	-1			-4	CTAG	defined	5prime	1	1	1	0	AspA2I,BlnI,XmaJI
+Awo1030IV	GCCRAG							unknown	unknown	0	0	0	1	
+AxyI	CCTNAGG	2	-2			-3	TNA	ambiguous	5prime	2	2	1	0	Bse21I,Bsu36I,Eco81I,SauI
+BaeGI	GKGCMC	5	-5			4	KGCM	ambiguous	3prime	5	5	1	1	BseSI,BstSLI
+BaeI	ACNNNNGTAYC	-10	-26	23	7	5	NNNNN	ambiguous	3prime	-10,23	26,-7	0	1	
+Bag18758I	CCCGAG							unknown	unknown	0	0	0	1	
+BalI	TGGCCA	3	-3			0		defined	blunt	3	3	1	1	HauII,MlsI,MluNI,Mox20I,MscI,Msp20I
+BamHI	GGATCC	1	-1			-4	GATC	defined	5prime	1	1	1	1	
+BanI	GGYRCC	1	-1			-4	GYRC	ambiguous	5prime	1	1	1	1	AccB1I,BshNI,BspT107I,HgiCI
+BanII	GRGCYC	5	-5			4	RGCY	ambiguous	3prime	5	5	1	1	Eco24I,EcoT38I,FriOI,HgiJII
+BanLI	RTCAGG							unknown	unknown	0	0	0	1	
+BarI	GAAGNNNNNNTAC	-7	-25	25	7	5	NNNNN	ambiguous	3prime	-7,25	25,-7	0	0	
+Bau1417V	GTTCAG							unknown	unknown	0	0	0	1	
+BauI	CACGAG	1	-1			-4	ACGA	defined	5prime	1	1	0	0	BsiI,BssSI,Bst2BI
+Bbr52II	GGCGAG							unknown	unknown	0	0	0	1	
+Bbr57III	GTRAAYG							unknown	unknown	0	0	0	1	
+Bbr7017II	CGGGAG							unknown	unknown	0	0	0	1	
+Bbr7017III	GGRCAG							unknown	unknown	0	0	0	1	
+BbrPI	CACGTG	3	-3			0		defined	blunt	3	3	1	0	AcvI,Eco72I,PmaCI,PmlI,PspCI
+BbsI	GAAGAC	8	6			-4	NNNN	ambiguous	5prime	8	-6	0	0	BbvII,BpiI,BstV2I
+BbuB31I	GNAAYG							unknown	unknown	0	0	0	1	
+BbuB31II	CGRKA							unknown	unknown	0	0	0	1	
+Bbv12I	GWGCWC	5	-5			4	WGCW	ambiguous	3prime	5	5	1	0	Alw21I,BsiHKAI,HgiAI
+BbvCI	CCTCAGC	2	-2			-3	TCA	defined	5prime	2	2	0	1	
+BbvI	GCAGC	13	12			-4	NNNN	ambiguous	5prime	13	-12	0	1	BceSIV,BseXI,BstV1I,Lsp1109I
+BbvII	GAAGAC	8	6			-4	NNNN	ambiguous	5prime	8	-6	0	0	BbsI,BpiI,BstV2I
+BccI	CCATC	9	5			-1	N	ambiguous	5prime	9	-5	0	1	
+Bce10661III	TATCNAG							unknown	unknown	0	0	0	1	
+Bce3081I	TAGGAG							unknown	unknown	0	0	0	1	
+Bce83I	CTTGAG	22	14			2	NN	ambiguous	3prime	22	-14	0	0	BpuEI
+BceAI	ACGGC	17	14			-2	NN	ambiguous	5prime	17	-14	0	1	BcefI
+BceSIV	GCAGC	-7	-10	14	11	-2	NN	ambiguous	5prime	-7,14	10,-11	0	1	BbvI,BseXI,BstV1I,Lsp1109I
+BcefI	ACGGC	17	13			-1	N	ambiguous	5prime	17	-13	0	0	BceAI
+BcgI	CGANNNNNNTGC	-10	-24	24	10	2	NN	ambiguous	3prime	-10,24	24,-10	0	1	
+BciT130I	CCWGG	2	-2			-1	W	ambiguous	5prime	2	2	1	0	AjnI,BseBI,Bst2UI,BstNI,Dde51507I,EcoRII,MvaI,Psp6I,PspGI
+BciVI	GTATCC	12	5			1	N	ambiguous	3prime	12	-5	0	0	BfuI,BsuI
+BclI	TGATCA	1	-1			-4	GATC	defined	5prime	1	1	1	1	FbaI,Ksp22I
+BcnI	CCSGG	2	-2			-1	S	ambiguous	5prime	2	2	1	1	AsuC2I,BpuMI,CauII,EcoHI,NciI
+Bco11035III	GAAGCY							unknown	unknown	0	0	0	1	
+BcoDI	GTCTC	6	5			-4	NNNN	ambiguous	5prime	6	-5	0	1	Alw26I,BsmAI,BstMAI
+BcuI	ACTAGT	1	-1			-4	CTAG	defined	5prime	1	1	1	0	AhlI,SpeI
+BdaI	TGANNNNNNTCA	-10	-24	24	10	2	NN	ambiguous	3prime	-10,24	24,-10	1	0	
+BetI	WCCGGW	1	-1			-4	CCGG	defined	5prime	1	1	1	0	BsaWI
+BfaI	CTAG	1	-1			-2	TA	defined	5prime	1	1	1	0	FspBI,MaeI,SspMI,XspI
+BfaSII	GANGGAG							unknown	unknown	0	0	0	1	
+BfiI	ACTGGG	11	4			1	N	ambiguous	3prime	11	-4	0	1	BmrI,BmuI
+BfmI	CTRYAG	1	-1			-4	TRYA	ambiguous	5prime	1	1	1	0	BstSFI,SfcI,SfeI
+BfoI	RGCGCY	5	-5			4	GCGC	defined	3prime	5	5	1	0	BstH2I,HaeII,LpnI
+BfrI	CTTAAG	1	-1			-4	TTAA	defined	5prime	1	1	1	0	AflII,BspTI,BstAFI,MspCI,Vha464I
+BfuAI	ACCTGC	10	8			-4	NNNN	ambiguous	5prime	10	-8	0	1	Acc36I,BspMI,BveI
+BfuI	GTATCC	12	5			1	N	ambiguous	3prime	12	-5	0	0	BciVI,BsuI
+Bga514I	GTRAAG							unknown	unknown	0	0	0	1	
+BglI	GCCNNNNNGGC	7	-7			3	NNN	ambiguous	3prime	7	7	1	1	
+BglII	AGATCT	1	-1			-4	GATC	defined	5prime	1	1	1	1	
+Bhe175II	GCCCNA							unknown	unknown	0	0	0	1	
+BinI	GGATC	9	5			-1	N	ambiguous	5prime	9	-5	0	0	AclWI,AlwI,BspPI
+BisI	GCNGC	2	-2			-1	N	ambiguous	5prime	2	2	1	0	BlsI,BthCI,Fnu4HI,Fsp4HI,GluI,PkrI,SatI
+BkrAM31DI	RTTAAATM							unknown	unknown	0	0	0	1	
+Ble402II	GRAGCAG							unknown	unknown	0	0	0	1	
+BlnI	CCTAGG	1	-1			-4	CTAG	defined	5prime	1	1	1	0	AspA2I,AvrII,XmaJI
+BloAII	GAGGAC							unknown	unknown	0	0	0	1	
+BlpI	GCTNAGC	2	-2			-3	TNA	ambiguous	5prime	2	2	1	1	Bpu1102I,Bsp1720I,EspI
+BlsI	GCNGC	3	-3			1	N	ambiguous	3prime	3	3	1	0	BisI,BthCI,Fnu4HI,Fsp4HI,GluI,PkrI,SatI
+BmcAI	AGTACT	3	-3			0		defined	blunt	3	3	1	0	ScaI,ZrmI
+Bme1390I	CCNGG	2	-2			-1	N	ambiguous	5prime	2	2	1	0	BmrFI,BstSCI,MspR9I,ScrFI,StyD4I
+Bme18I	GGWCC	1	-1			-3	GWC	ambiguous	5prime	1	1	1	0	AvaII,Eco47I,Psp03I,SinI,VpaK11AI,VpaK11BI
+BmeDI	C	3	0			2	NN	ambiguous	3prime	3	0	0	0	AbaSI,EcoO157SI,YkrI
+BmeRI	GACNNNNNGTC	6	-6			1	N	ambiguous	3prime	6	6	1	0	AhdI,DriI,Eam1105I
+BmeT110I	CYCGRG	1	-1			-4	YCGR	ambiguous	5prime	1	1	1	0	Ama87I,AvaI,BsiHKCI,BsoBI,Eco88I,Nli3877I
+BmgBI	CACGTC	3	-3			0		defined	blunt	3	3	0	0	AjiI,BtrI
+BmgI	GKGCCC							unknown	unknown	0	0	0	0	
+BmgT120I	GGNCC	1	-1			-3	GNC	ambiguous	5prime	1	1	1	0	AspS9I,AsuI,Cfr13I,FmuI,PspPI,Sau96I,UnbI
+BmiI	GGNNCC	3	-3			0		defined	blunt	3	3	1	0	BspLI,NlaIV,PspN4I
+BmrFI	CCNGG	2	-2			-1	N	ambiguous	5prime	2	2	1	0	Bme1390I,BstSCI,MspR9I,ScrFI,StyD4I
+BmrI	ACTGGG	11	4			1	N	ambiguous	3prime	11	-4	0	1	BfiI,BmuI
+BmsI	GCATC	10	9			-4	NNNN	ambiguous	5prime	10	-9	0	0	BscAI,LweI,SfaNI
+BmtI	GCTAGC	5	-5			4	CTAG	defined	3prime	5	5	1	1	AsuNHI,BspOI,NheI
+BmuI	ACTGGG	11	4			1	N	ambiguous	3prime	11	-4	0	0	BfiI,BmrI
+BoxI	GACNNNNGTC	5	-5			0		defined	blunt	5	5	1	0	BstPAI,PshAI
+BpiI	GAAGAC	8	6			-4	NNNN	ambiguous	5prime	8	-6	0	0	BbsI,BbvII,BstV2I
+BplI	GAGNNNNNCTC	-8	-24	24	8	5	NNNNN	ambiguous	3prime	-8,24	24,-8	1	0	
+BpmI	CTGGAG	22	14			2	NN	ambiguous	3prime	22	-14	0	1	GsuI
+Bps6700III	TACCNAG							unknown	unknown	0	0	0	1	
+Bpu10I	CCTNAGC	2	-2			-3	TNA	ambiguous	5prime	2	2	0	1	
+Bpu1102I	GCTNAGC	2	-2			-3	TNA	ambiguous	5prime	2	2	1	0	BlpI,Bsp1720I,EspI
+Bpu14I	TTCGAA	2	-2			-2	CG	defined	5prime	2	2	1	0	AsuII,Bsp119I,BspT104I,BstBI,NspV,SfuI
+BpuEI	CTTGAG	22	14			2	NN	ambiguous	3prime	22	-14	0	1	Bce83I
+BpuMI	CCSGG	2	-2			-1	S	ambiguous	5prime	2	2	1	0	AsuC2I,BcnI,CauII,EcoHI,NciI
+Bsa29I	ATCGAT	2	-2			-2	CG	defined	5prime	2	2	1	0	BseCI,BshVI,BspDI,Bsu15I,BsuTUI,ClaI
+BsaAI	YACGTR	3	-3			0		defined	blunt	3	3	1	1	BstBAI,Ppu21I
+BsaBI	GATNNNNATC	5	-5			0		defined	blunt	5	5	1	0	Bse8I,BseJI
+BsaHI	GRCGYC	2	-2			-2	CG	defined	5prime	2	2	1	1	AcyI,BssNI,BstACI,Hin1I,Hsp92I
+BsaI	GGTCTC	7	5			-4	NNNN	ambiguous	5prime	7	-5	0	1	Bso31I,BspTNI,Eco31I
+BsaJI	CCNNGG	1	-1			-4	CNNG	ambiguous	5prime	1	1	1	1	BseDI,BssECI,SecI
+BsaWI	WCCGGW	1	-1			-4	CCGG	defined	5prime	1	1	1	1	BetI
+BsaXI	ACNNNNNCTCC	-9	-23	21	7	3	NNN	ambiguous	3prime	-9,21	23,-7	0	0	
+BsbI	CAACAC	27	19			2	NN	ambiguous	3prime	27	-19	0	1	
+Bsc4I	CCNNNNNNNGG	7	-7			3	NNN	ambiguous	3prime	7	7	1	1	AfiI,BseLI,BsiYI,BslI
+BscAI	GCATC	9	6			-2	NN	ambiguous	5prime	9	-6	0	1	BmsI,LweI,SfaNI
+BscGI	CCCGT							unknown	unknown	0	0	0	1	
+BscXI	GCAGGC	5	-5			4	CAGG	defined	3prime	5	5	0	1	
+Bse118I	RCCGGY	1	-1			-4	CCGG	defined	5prime	1	1	1	0	BsrFI,BssAI,Cfr10I,NmeDI
+Bse1I	ACTGG	6	-1			2	GN	ambiguous	3prime	6	1	0	0	BseNI,BsrI
+Bse21I	CCTNAGG	2	-2			-3	TNA	ambiguous	5prime	2	2	1	0	AxyI,Bsu36I,Eco81I,SauI
+Bse3DI	GCAATG	8	0			2	NN	ambiguous	3prime	8	0	0	0	BseMI,BsrDI
+Bse8I	GATNNNNATC	5	-5			0		defined	blunt	5	5	1	0	BsaBI,BseJI
+BseAI	TCCGGA	1	-1			-4	CCGG	defined	5prime	1	1	1	0	AccIII,Aor13HI,Bsp13I,BspEI,BspMII,Kpn2I,MroI
+BseBI	CCWGG	2	-2			-1	W	ambiguous	5prime	2	2	1	0	AjnI,BciT130I,Bst2UI,BstNI,Dde51507I,EcoRII,MvaI,Psp6I,PspGI
+BseCI	ATCGAT	2	-2			-2	CG	defined	5prime	2	2	1	1	Bsa29I,BshVI,BspDI,Bsu15I,BsuTUI,ClaI
+BseDI	CCNNGG	1	-1			-4	CNNG	ambiguous	5prime	1	1	1	0	BsaJI,BssECI,SecI
+BseGI	GGATG	7	0			2	NN	ambiguous	3prime	7	0	0	0	BstF5I,BtsCI,FokI,StsI
+BseJI	GATNNNNATC	5	-5			0		defined	blunt	5	5	1	0	BsaBI,Bse8I
+BseLI	CCNNNNNNNGG	7	-7			3	NNN	ambiguous	3prime	7	7	1	0	AfiI,Bsc4I,BsiYI,BslI
+BseMI	GCAATG	8	0			2	NN	ambiguous	3prime	8	0	0	0	Bse3DI,BsrDI
+BseMII	CTCAG	15	8			2	NN	ambiguous	3prime	15	-8	0	1	BspCNI
+BseNI	ACTGG	6	-1			2	GN	ambiguous	3prime	6	1	0	0	Bse1I,BsrI
+BsePI	GCGCGC	1	-1			-4	CGCG	defined	5prime	1	1	1	0	BssHII,McaTI,PauI,PteI
+BseRI	GAGGAG	16	8			2	NN	ambiguous	3prime	16	-8	0	1	AquIII
+BseSI	GKGCMC	5	-5			4	KGCM	ambiguous	3prime	5	5	1	0	BaeGI,BstSLI
+BseX3I	CGGCCG	1	-1			-4	GGCC	defined	5prime	1	1	1	0	BstZI,EagI,EclXI,Eco52I,XmaIII
+BseXI	GCAGC	13	12			-4	NNNN	ambiguous	5prime	13	-12	0	0	BbvI,BceSIV,BstV1I,Lsp1109I
+BseYI	CCCAGC	1	-1			-4	CCAG	defined	5prime	1	1	0	0	GsaI,PspFI
+BsgI	GTGCAG	22	14			2	NN	ambiguous	3prime	22	-14	0	1	
+Bsh1236I	CGCG	2	-2			0		defined	blunt	2	2	1	0	AccII,BspFNI,BstFNI,BstUI,FnuDII,MvnI,SelI
+Bsh1285I	CGRYCG	4	-4			2	RY	ambiguous	3prime	4	4	1	0	BsiEI,BstMCI,McrI
+BshFI	GGCC	2	-2			0		defined	blunt	2	2	1	0	AoxI,BsnI,BspANI,BsuRI,HaeIII
+BshNI	GGYRCC	1	-1			-4	GYRC	ambiguous	5prime	1	1	1	0	AccB1I,BanI,BspT107I,HgiCI
+BshTI	ACCGGT	1	-1			-4	CCGG	defined	5prime	1	1	1	0	AgeI,AsiGI,CspAI,PinAI
+BshVI	ATCGAT	2	-2			-2	CG	defined	5prime	2	2	1	0	Bsa29I,BseCI,BspDI,Bsu15I,BsuTUI,ClaI
+BsiEI	CGRYCG	4	-4			2	RY	ambiguous	3prime	4	4	1	0	Bsh1285I,BstMCI,McrI
+BsiHKAI	GWGCWC	5	-5			4	WGCW	ambiguous	3prime	5	5	1	0	Alw21I,Bbv12I,HgiAI
+BsiHKCI	CYCGRG	1	-1			-4	YCGR	ambiguous	5prime	1	1	1	0	Ama87I,AvaI,BmeT110I,BsoBI,Eco88I,Nli3877I
+BsiI	CACGAG	1	-1			-4	ACGA	defined	5prime	1	1	0	0	BauI,BssSI,Bst2BI
+BsiSI	CCGG	1	-1			-2	CG	defined	5prime	1	1	1	0	HapII,HpaII,MspI,Sth302II
+BsiWI	CGTACG	1	-1			-4	GTAC	defined	5prime	1	1	1	1	Pfl23II,PspLI,SplI
+BsiYI	CCNNNNNNNGG	7	-7			3	NNN	ambiguous	3prime	7	7	1	0	AfiI,Bsc4I,BseLI,BslI
+BslFI	GGGAC	15	14			-4	NNNN	ambiguous	5prime	15	-14	0	0	BsmFI,FaqI,FinI
+BslI	CCNNNNNNNGG	7	-7			3	NNN	ambiguous	3prime	7	7	1	1	AfiI,Bsc4I,BseLI,BsiYI
+BsmAI	GTCTC	6	5			-4	NNNN	ambiguous	5prime	6	-5	0	1	Alw26I,BcoDI,BstMAI
+BsmBI	CGTCTC	7	5			-4	NNNN	ambiguous	5prime	7	-5	0	1	Esp3I
+BsmFI	GGGAC	15	14			-4	NNNN	ambiguous	5prime	15	-14	0	1	BslFI,FaqI,FinI
+BsmI	GAATGC	7	-1			2	CN	ambiguous	3prime	7	1	0	0	Mva1269I,PctI
+BsnI	GGCC	2	-2			0		defined	blunt	2	2	1	0	AoxI,BshFI,BspANI,BsuRI,HaeIII
+Bso31I	GGTCTC	7	5			-4	NNNN	ambiguous	5prime	7	-5	0	0	BsaI,BspTNI,Eco31I
+BsoBI	CYCGRG	1	-1			-4	YCGR	ambiguous	5prime	1	1	1	1	Ama87I,AvaI,BmeT110I,BsiHKCI,Eco88I,Nli3877I
+Bsp119I	TTCGAA	2	-2			-2	CG	defined	5prime	2	2	1	0	AsuII,Bpu14I,BspT104I,BstBI,NspV,SfuI
+Bsp120I	GGGCCC	1	-1			-4	GGCC	defined	5prime	1	1	1	0	ApaI,PspOMI
+Bsp1286I	GDGCHC	5	-5			4	DGCH	ambiguous	3prime	5	5	1	1	MhlI,SduI
+Bsp13I	TCCGGA	1	-1			-4	CCGG	defined	5prime	1	1	1	0	AccIII,Aor13HI,BseAI,BspEI,BspMII,Kpn2I,MroI
+Bsp1407I	TGTACA	1	-1			-4	GTAC	defined	5prime	1	1	1	0	BsrGI,BstAUI
+Bsp143I	GATC	0	0			-4	GATC	defined	5prime	0	0	1	0	Asi256I,BssMI,BstKTI,BstMBI,ChaI,DpnI,DpnII,Kzo9I,MalI,MboI,NdeII,Sau3AI
+Bsp1720I	GCTNAGC	2	-2			-3	TNA	ambiguous	5prime	2	2	1	0	BlpI,Bpu1102I,EspI
+Bsp19I	CCATGG	1	-1			-4	CATG	defined	5prime	1	1	1	0	NcoI
+Bsp24I	GACNNNNNNTGG	-8	-25	24	7	5	NNNNN	ambiguous	3prime	-8,24	25,-7	0	0	
+Bsp3004IV	CCGCAT							unknown	unknown	0	0	0	1	
+Bsp460III	CGCGCAG							unknown	unknown	0	0	0	1	
+Bsp68I	TCGCGA	3	-3			0		defined	blunt	3	3	1	0	BtuMI,NruI,RruI
+BspACI	CCGC	1	-1			-2	CG	defined	5prime	1	1	0	1	AciI,SsiI
+BspANI	GGCC	2	-2			0		defined	blunt	2	2	1	0	AoxI,BshFI,BsnI,BsuRI,HaeIII
+BspCNI	CTCAG	14	7			2	NN	ambiguous	3prime	14	-7	0	1	BseMII
+BspD6I	GAGTC	9	6			-2	NN	ambiguous	5prime	9	-6	0	0	MlyI,PleI,PpsI,SchI
+BspDI	ATCGAT	2	-2			-2	CG	defined	5prime	2	2	1	0	Bsa29I,BseCI,BshVI,Bsu15I,BsuTUI,ClaI
+BspEI	TCCGGA	1	-1			-4	CCGG	defined	5prime	1	1	1	0	AccIII,Aor13HI,BseAI,Bsp13I,BspMII,Kpn2I,MroI
+BspFNI	CGCG	2	-2			0		defined	blunt	2	2	1	0	AccII,Bsh1236I,BstFNI,BstUI,FnuDII,MvnI,SelI
+BspGI	CTGGAC							unknown	unknown	0	0	0	0	
+BspHI	TCATGA	1	-1			-4	CATG	defined	5prime	1	1	1	1	CciI,PagI
+BspLI	GGNNCC	3	-3			0		defined	blunt	3	3	1	0	BmiI,NlaIV,PspN4I
+BspLU11I	ACATGT	1	-1			-4	CATG	defined	5prime	1	1	1	0	PciI,PscI
+BspMAI	CTGCAG	5	-5			4	TGCA	defined	3prime	5	5	1	0	PstI
+BspMI	ACCTGC	10	8			-4	NNNN	ambiguous	5prime	10	-8	0	1	Acc36I,BfuAI,BveI
+BspMII	TCCGGA	1	-1			-4	CCGG	defined	5prime	1	1	1	1	AccIII,Aor13HI,BseAI,Bsp13I,BspEI,Kpn2I,MroI
+BspNCI	CCAGA							unknown	unknown	0	0	0	1	
+BspOI	GCTAGC	5	-5			4	CTAG	defined	3prime	5	5	1	0	AsuNHI,BmtI,NheI
+BspPI	GGATC	9	5			-1	N	ambiguous	5prime	9	-5	0	0	AclWI,AlwI,BinI
+BspQI	GCTCTTC	8	4			-3	NNN	ambiguous	5prime	8	-4	0	0	LguI,PciSI,SapI
+BspT104I	TTCGAA	2	-2			-2	CG	defined	5prime	2	2	1	0	AsuII,Bpu14I,Bsp119I,BstBI,NspV,SfuI
+BspT107I	GGYRCC	1	-1			-4	GYRC	ambiguous	5prime	1	1	1	0	AccB1I,BanI,BshNI,HgiCI
+BspTI	CTTAAG	1	-1			-4	TTAA	defined	5prime	1	1	1	0	AflII,BfrI,BstAFI,MspCI,Vha464I
+BspTNI	GGTCTC	7	5			-4	NNNN	ambiguous	5prime	7	-5	0	0	BsaI,Bso31I,Eco31I
+BsrBI	CCGCTC	3	-3			0		defined	blunt	3	3	0	1	AccBSI,MbiI
+BsrDI	GCAATG	8	0			2	NN	ambiguous	3prime	8	0	0	0	Bse3DI,BseMI
+BsrFI	RCCGGY	1	-1			-4	CCGG	defined	5prime	1	1	1	1	Bse118I,BssAI,Cfr10I,NmeDI
+BsrGI	TGTACA	1	-1			-4	GTAC	defined	5prime	1	1	1	0	Bsp1407I,BstAUI
+BsrI	ACTGG	6	-1			2	GN	ambiguous	3prime	6	1	0	1	Bse1I,BseNI
+BssAI	RCCGGY	1	-1			-4	CCGG	defined	5prime	1	1	1	0	Bse118I,BsrFI,Cfr10I,NmeDI
+BssECI	CCNNGG	1	-1			-4	CNNG	ambiguous	5prime	1	1	1	1	BsaJI,BseDI,SecI
+BssHII	GCGCGC	1	-1			-4	CGCG	defined	5prime	1	1	1	0	BsePI,McaTI,PauI,PteI
+BssMI	GATC	0	0			-4	GATC	defined	5prime	0	0	1	0	Asi256I,Bsp143I,BstKTI,BstMBI,ChaI,DpnI,DpnII,Kzo9I,MalI,MboI,NdeII,Sau3AI
+BssNAI	GTATAC	3	-3			0		defined	blunt	3	3	1	0	Bst1107I,BstZ17I,SnaI
+BssNI	GRCGYC	2	-2			-2	CG	defined	5prime	2	2	1	0	AcyI,BsaHI,BstACI,Hin1I,Hsp92I
+BssSI	CACGAG	1	-1			-4	ACGA	defined	5prime	1	1	0	1	BauI,BsiI,Bst2BI
+BssT1I	CCWWGG	1	-1			-4	CWWG	ambiguous	5prime	1	1	1	0	Eco130I,EcoT14I,ErhI,StyI
+Bst1107I	GTATAC	3	-3			0		defined	blunt	3	3	1	0	BssNAI,BstZ17I,SnaI
+Bst2BI	CACGAG	1	-1			-4	ACGA	defined	5prime	1	1	0	0	BauI,BsiI,BssSI
+Bst2UI	CCWGG	2	-2			-1	W	ambiguous	5prime	2	2	1	0	AjnI,BciT130I,BseBI,BstNI,Dde51507I,EcoRII,MvaI,Psp6I,PspGI
+Bst4CI	ACNGT	3	-3			1	N	ambiguous	3prime	3	3	1	0	HpyCH4III,TaaI,Tsp4CI
+Bst6I	CTCTTC	7	4			-3	NNN	ambiguous	5prime	7	-4	0	0	Eam1104I,EarI,Ksp632I
+BstACI	GRCGYC	2	-2			-2	CG	defined	5prime	2	2	1	0	AcyI,BsaHI,BssNI,Hin1I,Hsp92I
+BstAFI	CTTAAG	1	-1			-4	TTAA	defined	5prime	1	1	1	0	AflII,BfrI,BspTI,MspCI,Vha464I
+BstAPI	GCANNNNNTGC	7	-7			3	NNN	ambiguous	3prime	7	7	1	1	ApaBI
+BstAUI	TGTACA	1	-1			-4	GTAC	defined	5prime	1	1	1	0	Bsp1407I,BsrGI
+BstBAI	YACGTR	3	-3			0		defined	blunt	3	3	1	0	BsaAI,Ppu21I
+BstBI	TTCGAA	2	-2			-2	CG	defined	5prime	2	2	1	0	AsuII,Bpu14I,Bsp119I,BspT104I,NspV,SfuI
+BstC8I	GCNNGC	3	-3			0		defined	blunt	3	3	1	1	Cac8I,Pfl8569I
+BstDEI	CTNAG	1	-1			-3	TNA	ambiguous	5prime	1	1	1	0	DdeI,HpyF3I
+BstDSI	CCRYGG	1	-1			-4	CRYG	ambiguous	5prime	1	1	1	0	BtgI,DsaI
+BstEII	GGTNACC	1	-1			-5	GTNAC	ambiguous	5prime	1	1	1	1	BstPI,Eco91I,EcoO65I,PspEI
+BstENI	CCTNNNNNAGG	5	-5			-1	N	ambiguous	5prime	5	5	1	0	EcoNI,XagI
+BstF5I	GGATG	7	0			2	NN	ambiguous	3prime	7	0	0	1	BseGI,BtsCI,FokI,StsI
+BstFNI	CGCG	2	-2			0		defined	blunt	2	2	1	0	AccII,Bsh1236I,BspFNI,BstUI,FnuDII,MvnI,SelI
+BstH2I	RGCGCY	5	-5			4	GCGC	defined	3prime	5	5	1	0	BfoI,HaeII,LpnI
+BstHHI	GCGC	3	-3			2	CG	defined	3prime	3	3	1	0	AspLEI,CfoI,GlaI,HhaI,Hin6I,HinP1I,HspAI
+BstKTI	GATC	3	-3			2	AT	defined	3prime	3	3	1	0	Asi256I,Bsp143I,BssMI,BstMBI,ChaI,DpnI,DpnII,Kzo9I,MalI,MboI,NdeII,Sau3AI
+BstMAI	GTCTC	6	5			-4	NNNN	ambiguous	5prime	6	-5	0	0	Alw26I,BcoDI,BsmAI
+BstMBI	GATC	0	0			-4	GATC	defined	5prime	0	0	1	0	Asi256I,Bsp143I,BssMI,BstKTI,ChaI,DpnI,DpnII,Kzo9I,MalI,MboI,NdeII,Sau3AI
+BstMCI	CGRYCG	4	-4			2	RY	ambiguous	3prime	4	4	1	0	Bsh1285I,BsiEI,McrI
+BstMWI	GCNNNNNNNGC	7	-7			3	NNN	ambiguous	3prime	7	7	1	0	HpyF10VI,MwoI
+BstNI	CCWGG	2	-2			-1	W	ambiguous	5prime	2	2	1	1	AjnI,BciT130I,BseBI,Bst2UI,Dde51507I,EcoRII,MvaI,Psp6I,PspGI
+BstNSI	RCATGY	5	-5			4	CATG	defined	3prime	5	5	1	0	NspI,XceI
+BstPAI	GACNNNNGTC	5	-5			0		defined	blunt	5	5	1	0	BoxI,PshAI
+BstPI	GGTNACC	1	-1			-5	GTNAC	ambiguous	5prime	1	1	1	0	BstEII,Eco91I,EcoO65I,PspEI
+BstSCI	CCNGG	0	0			-5	CCNGG	ambiguous	5prime	0	0	1	0	Bme1390I,BmrFI,MspR9I,ScrFI,StyD4I
+BstSFI	CTRYAG	1	-1			-4	TRYA	ambiguous	5prime	1	1	1	0	BfmI,SfcI,SfeI
+BstSLI	GKGCMC	5	-5			4	KGCM	ambiguous	3prime	5	5	1	0	BaeGI,BseSI
+BstSNI	TACGTA	3	-3			0		defined	blunt	3	3	1	0	Eco105I,SnaBI
+BstUI	CGCG	2	-2			0		defined	blunt	2	2	1	1	AccII,Bsh1236I,BspFNI,BstFNI,FnuDII,MvnI,SelI
+BstV1I	GCAGC	13	12			-4	NNNN	ambiguous	5prime	13	-12	0	0	BbvI,BceSIV,BseXI,Lsp1109I
+BstV2I	GAAGAC	8	6			-4	NNNN	ambiguous	5prime	8	-6	0	0	BbsI,BbvII,BpiI
+BstX2I	RGATCY	1	-1			-4	GATC	defined	5prime	1	1	1	0	BstYI,MflI,PsuI,XhoII
+BstXI	CCANNNNNNTGG	8	-8			4	NNNN	ambiguous	3prime	8	8	1	1	
+BstYI	RGATCY	1	-1			-4	GATC	defined	5prime	1	1	1	1	BstX2I,MflI,PsuI,XhoII
+BstZ17I	GTATAC	3	-3			0		defined	blunt	3	3	1	0	BssNAI,Bst1107I,SnaI
+BstZI	CGGCCG	1	-1			-4	GGCC	defined	5prime	1	1	1	0	BseX3I,EagI,EclXI,Eco52I,XmaIII
+Bsu15I	ATCGAT	2	-2			-2	CG	defined	5prime	2	2	1	1	Bsa29I,BseCI,BshVI,BspDI,BsuTUI,ClaI
+Bsu36I	CCTNAGG	2	-2			-3	TNA	ambiguous	5prime	2	2	1	1	AxyI,Bse21I,Eco81I,SauI
+BsuI	GTATCC	12	5			1	N	ambiguous	3prime	12	-5	0	0	BciVI,BfuI
+BsuRI	GGCC	2	-2			0		defined	blunt	2	2	1	1	AoxI,BshFI,BsnI,BspANI,HaeIII
+BsuTUI	ATCGAT	2	-2			-2	CG	defined	5prime	2	2	1	0	Bsa29I,BseCI,BshVI,BspDI,Bsu15I,ClaI
+BtgI	CCRYGG	1	-1			-4	CRYG	ambiguous	5prime	1	1	1	0	BstDSI,DsaI
+BtgZI	GCGATG	16	14			-4	NNNN	ambiguous	5prime	16	-14	0	1	
+BthCI	GCNGC	4	-4			3	CNG	ambiguous	3prime	4	4	1	1	BisI,BlsI,Fnu4HI,Fsp4HI,GluI,PkrI,SatI
+BtrI	CACGTC	3	-3			0		defined	blunt	3	3	0	0	AjiI,BmgBI
+BtsCI	GGATG	7	0			2	NN	ambiguous	3prime	7	0	0	0	BseGI,BstF5I,FokI,StsI
+BtsI	GCAGTG	8	0			2	NN	ambiguous	3prime	8	0	0	0	
+BtsIMutI	CAGTG	7	0			2	NN	ambiguous	3prime	7	0	0	0	
+BtuMI	TCGCGA	3	-3			0		defined	blunt	3	3	1	0	Bsp68I,NruI,RruI
+Bve1B23I	GACNNNNNTGG							unknown	unknown	0	0	0	1	
+BveI	ACCTGC	10	8			-4	NNNN	ambiguous	5prime	10	-8	0	0	Acc36I,BfuAI,BspMI
+Cac8I	GCNNGC	3	-3			0		defined	blunt	3	3	1	1	BstC8I,Pfl8569I
+CaiI	CAGNNNCTG	6	-6			3	NNN	ambiguous	3prime	6	6	1	0	AlwNI,PstNI
+Cal14237I	GGTTAG							unknown	unknown	0	0	0	1	
+CalB3II	GRTTRAG							unknown	unknown	0	0	0	1	
+Cau10061II	GTTAAT							unknown	unknown	0	0	0	1	
+CauII	CCSGG	2	-2			-1	S	ambiguous	5prime	2	2	1	0	AsuC2I,BcnI,BpuMI,EcoHI,NciI
+Cba13II	AGGAAT							unknown	unknown	0	0	0	1	
+Cba16038I	CCTNAYNC							unknown	unknown	0	0	0	1	
+Cbo67071IV	GCRGAAG							unknown	unknown	0	0	0	1	
+CcaP7V	CRAAAAR							unknown	unknown	0	0	0	1	
+Cch467III	GNGAAAY							unknown	unknown	0	0	0	1	
+CchII	GGARGA	17	9			2	NN	ambiguous	3prime	17	-9	0	1	
+CchIII	CCCAAG	26	18			2	NN	ambiguous	3prime	26	-18	0	1	
+CciI	TCATGA	1	-1			-4	CATG	defined	5prime	1	1	1	0	BspHI,PagI
+CciNI	GCGGCCGC	2	-2			-4	GGCC	defined	5prime	2	2	1	0	NotI
+Cco11366VI	GAAGAA							unknown	unknown	0	0	0	1	
+Cco11437V	CAYNNNNNRTAG							unknown	unknown	0	0	0	1	
+Cco14983V	GGGTDA							unknown	unknown	0	0	0	1	
+Cco14983VI	GCYGA							unknown	unknown	0	0	0	1	
+CcrNAIII	CGACCAG							unknown	unknown	0	0	0	1	
+Cdi11397I	GCGCAG							unknown	unknown	0	0	0	1	
+Cdi13746V	RGAAAGR							unknown	unknown	0	0	0	1	
+Cdi13750III	CCGATCC							unknown	unknown	0	0	0	1	
+CdiI	CATCG	4	-1			0		defined	blunt	4	1	0	0	
+CdpI	GCGGAG	26	18			2	NN	ambiguous	3prime	26	-18	0	1	
+Cdu23823II	GTGAAG							unknown	unknown	0	0	0	1	TkoI
+Cfa8380I	GRGGAY							unknown	unknown	0	0	0	1	
+CfoI	GCGC	3	-3			2	CG	defined	3prime	3	3	1	0	AspLEI,BstHHI,GlaI,HhaI,Hin6I,HinP1I,HspAI
+Cfr10I	RCCGGY	1	-1			-4	CCGG	defined	5prime	1	1	1	1	Bse118I,BsrFI,BssAI,NmeDI
+Cfr13I	GGNCC	1	-1			-3	GNC	ambiguous	5prime	1	1	1	1	AspS9I,AsuI,BmgT120I,FmuI,PspPI,Sau96I,UnbI
+Cfr42I	CCGCGG	4	-4			2	GC	defined	3prime	4	4	1	1	KspI,SacII,Sfr303I,SgrBI
+Cfr9I	CCCGGG	1	-1			-4	CCGG	defined	5prime	1	1	1	1	SmaI,TspMI,XmaI
+CfrI	YGGCCR	1	-1			-4	GGCC	defined	5prime	1	1	1	1	AcoI,EaeI
+CfrMH13II	AGCANCC							unknown	unknown	0	0	0	1	
+CfrMH16VI	CTAAAG							unknown	unknown	0	0	0	1	
+Cfupf3II	GARCAG							unknown	unknown	0	0	0	1	
+Cgl13032I	GGCGCA							unknown	unknown	0	0	0	1	
+Cgl13032II	ACGABGG							unknown	unknown	0	0	0	1	
+ChaI	GATC	4	-4			4	GATC	defined	3prime	4	4	1	0	Asi256I,Bsp143I,BssMI,BstKTI,BstMBI,DpnI,DpnII,Kzo9I,MalI,MboI,NdeII,Sau3AI
+Cin11811I	TGKMCA							unknown	unknown	0	0	1	1	
+Cje265V	GKAAGC							unknown	unknown	0	0	0	1	
+Cje54107III	GKAAYC							unknown	unknown	0	0	0	1	
+CjeFIII	GCAAGG							unknown	unknown	0	0	0	1	
+CjeFV	GGRCA							unknown	unknown	0	0	0	1	
+CjeI	CCANNNNNNGT	-8	-25	26	9	6	NNNNNN	ambiguous	3prime	-8,26	25,-9	0	1	
+CjeNII	GAGNNNNNGT							unknown	unknown	0	0	0	1	
+CjeNIII	GKAAYG	25	17			2	NN	ambiguous	3prime	25	-17	0	1	
+CjeNV	CCYGA							unknown	unknown	0	0	0	1	
+CjeP659IV	CACNNNNNNNGAA							unknown	unknown	0	0	0	0	
+CjePI	CCANNNNNNNTC	-7	-25	26	8	6	NNNNNN	ambiguous	3prime	-7,26	25,-8	0	0	
+CjuI	CAYNNNNNRTG							unknown	unknown	0	0	1	0	
+CjuII	CAYNNNNNCTC							unknown	unknown	0	0	0	0	
+Cko11077IV	TGACAG							unknown	unknown	0	0	0	1	
+Cla11845III	GCGAA							unknown	unknown	0	0	0	1	
+ClaI	ATCGAT	2	-2			-2	CG	defined	5prime	2	2	1	1	Bsa29I,BseCI,BshVI,BspDI,Bsu15I,BsuTUI
+Cly7489II	AAAAGRG							unknown	unknown	0	0	0	1	
+Cpe10578V	GANGAGY							unknown	unknown	0	0	0	1	
+Cpe13170II	GTTGNAG							unknown	unknown	0	0	0	1	
+Cpe2837III	GRNACAYT							unknown	unknown	0	0	0	1	
+CpoI	CGGWCCG	2	-2			-3	GWC	ambiguous	5prime	2	2	1	0	CspI,Rsr2I,RsrII
+Cre7908I	GCGGGA							unknown	unknown	0	0	0	1	
+Csa9238II	CAAANTC							unknown	unknown	0	0	0	1	
+CseI	GACGC	10	10			-5	NNNNN	ambiguous	5prime	10	-10	0	0	HgaI
+CsiI	ACCWGGT	1	-1			-5	CCWGG	ambiguous	5prime	1	1	1	0	MabI,SexAI
+Csp2014I	GGAGGC							unknown	unknown	0	0	0	1	
+Csp6I	GTAC	1	-1			-2	TA	defined	5prime	1	1	1	0	AfaI,CviQI,PabI,RsaI,RsaNI
+CspAI	ACCGGT	1	-1			-4	CCGG	defined	5prime	1	1	1	0	AgeI,AsiGI,BshTI,PinAI
+CspBP25III	CCANNNNNRTGA							unknown	unknown	0	0	0	1	
+CspCI	CAANNNNNGTGG	-11	-25	24	10	2	NN	ambiguous	3prime	-11,24	25,-10	0	1	
+CspI	CGGWCCG	2	-2			-3	GWC	ambiguous	5prime	2	2	1	0	CpoI,Rsr2I,RsrII
+CspL61I	TYGAYCT							unknown	unknown	0	0	0	1	
+CspX1II	ACCCCA							unknown	unknown	0	0	0	1	
+CstMI	AAGGAG	26	18			2	NN	ambiguous	3prime	26	-18	0	1	
+CviAII	CATG	1	-1			-2	AT	defined	5prime	1	1	1	1	FaeI,FatI,Hin1II,Hsp92II,NlaIII,UpaP162I
+CviJI	RGCY	2	-2			0		defined	blunt	2	2	1	1	CviKI_1
+CviKI_1	RGCY	2	-2			0		defined	blunt	2	2	1	0	CviJI
+CviQI	GTAC	1	-1			-2	TA	defined	5prime	1	1	1	1	AfaI,Csp6I,PabI,RsaI,RsaNI
+CviRI	TGCA	2	-2			0		defined	blunt	2	2	1	1	HpyCH4V
+Dde51507I	CCWGG							unknown	unknown	0	0	1	0	AjnI,BciT130I,BseBI,Bst2UI,BstNI,EcoRII,MvaI,Psp6I,PspGI
+DdeI	CTNAG	1	-1			-3	TNA	ambiguous	5prime	1	1	1	1	BstDEI,HpyF3I
+DinI	GGCGCC	3	-3			0		defined	blunt	3	3	1	0	EgeI,EheI,KasI,Mly113I,NarI,PluTI,SfoI,SspDI
+Dpi3069I	GACAG							unknown	unknown	0	0	0	1	
+Dpi3084I	CGRAG							unknown	unknown	0	0	0	1	
+Dpi3090II	AAGRAG							unknown	unknown	0	0	0	1	
+DpnI	GATC	2	-2			0		defined	blunt	2	2	1	0	Asi256I,Bsp143I,BssMI,BstKTI,BstMBI,ChaI,DpnII,Kzo9I,MalI,MboI,NdeII,Sau3AI
+DpnII	GATC	0	0			-4	GATC	defined	5prime	0	0	1	1	Asi256I,Bsp143I,BssMI,BstKTI,BstMBI,ChaI,DpnI,Kzo9I,MalI,MboI,NdeII,Sau3AI
+DraI	TTTAAA	3	-3			0		defined	blunt	3	3	1	1	AhaIII
+DraII	RGGNCCY	2	-2			-3	GNC	ambiguous	5prime	2	2	1	0	EcoO109I,PssI
+DraIII	CACNNNGTG	6	-6			3	NNN	ambiguous	3prime	6	6	1	1	AdeI
+DraRI	CAAGNAC	27	18			2	NN	ambiguous	3prime	27	-18	0	1	
+DrdI	GACNNNNNNGTC	7	-7			2	NN	ambiguous	3prime	7	7	1	1	AasI,DseDI
+DrdII	GAACCA							unknown	unknown	0	0	0	1	
+DrdIV	TACGAC	26	18			2	NN	ambiguous	3prime	26	-18	0	1	
+DrdV	CATGNAC	17	8			2	NN	ambiguous	3prime	17	-8	0	1	
+DrdVI	GCAGCC							unknown	unknown	0	0	0	1	
+DrdVIII	ARGAGC							unknown	unknown	0	0	0	1	
+DriI	GACNNNNNGTC	6	-6			1	N	ambiguous	3prime	6	6	1	0	AhdI,BmeRI,Eam1105I
+DsaI	CCRYGG	1	-1			-4	CRYG	ambiguous	5prime	1	1	1	0	BstDSI,BtgI
+DseDI	GACNNNNNNGTC	7	-7			2	NN	ambiguous	3prime	7	7	1	0	AasI,DrdI
+DspS02II	TGCCGAC							unknown	unknown	0	0	0	1	
+DvuIII	CACNCAC							unknown	unknown	0	0	0	1	
+EaeI	YGGCCR	1	-1			-4	GGCC	defined	5prime	1	1	1	1	AcoI,CfrI
+EagI	CGGCCG	1	-1			-4	GGCC	defined	5prime	1	1	1	1	BseX3I,BstZI,EclXI,Eco52I,XmaIII
+Eam1104I	CTCTTC	7	4			-3	NNN	ambiguous	5prime	7	-4	0	0	Bst6I,EarI,Ksp632I
+Eam1105I	GACNNNNNGTC	6	-6			1	N	ambiguous	3prime	6	6	1	0	AhdI,BmeRI,DriI
+EarI	CTCTTC	7	4			-3	NNN	ambiguous	5prime	7	-4	0	1	Bst6I,Eam1104I,Ksp632I
+EciI	GGCGGA	17	9			2	NN	ambiguous	3prime	17	-9	0	0	
+Ecl136II	GAGCTC	3	-3			0		defined	blunt	3	3	1	0	Eco53kI,EcoICRI,Psp124BI,SacI,SstI,UcoMSI
+Ecl234I	CGGNAAG							unknown	unknown	0	0	0	1	
+Ecl35734I	GAAAYTC							unknown	unknown	0	0	0	1	
+EclXI	CGGCCG	1	-1			-4	GGCC	defined	5prime	1	1	1	0	BseX3I,BstZI,EagI,Eco52I,XmaIII
+Eco105I	TACGTA	3	-3			0		defined	blunt	3	3	1	0	BstSNI,SnaBI
+Eco130I	CCWWGG	1	-1			-4	CWWG	ambiguous	5prime	1	1	1	0	BssT1I,EcoT14I,ErhI,StyI
+Eco147I	AGGCCT	3	-3			0		defined	blunt	3	3	1	0	PceI,SseBI,StuI
+Eco1836I	CACANTT							unknown	unknown	0	0	0	1	
+Eco24I	GRGCYC	5	-5			4	RGCY	ambiguous	3prime	5	5	1	0	BanII,EcoT38I,FriOI,HgiJII
+Eco31I	GGTCTC	7	5			-4	NNNN	ambiguous	5prime	7	-5	0	1	BsaI,Bso31I,BspTNI
+Eco32I	GATATC	3	-3			0		defined	blunt	3	3	1	0	EcoRV
+Eco4174I	GCACAG							unknown	unknown	0	0	0	1	
+Eco43896II	CRARCAG							unknown	unknown	0	0	0	1	
+Eco4465II	GAAABCC							unknown	unknown	0	0	0	1	
+Eco47I	GGWCC	1	-1			-3	GWC	ambiguous	5prime	1	1	1	0	AvaII,Bme18I,Psp03I,SinI,VpaK11AI,VpaK11BI
+Eco47III	AGCGCT	3	-3			0		defined	blunt	3	3	1	0	AfeI,Aor51HI
+Eco52I	CGGCCG	1	-1			-4	GGCC	defined	5prime	1	1	1	0	BseX3I,BstZI,EagI,EclXI,XmaIII
+Eco53kI	GAGCTC	3	-3			0		defined	blunt	3	3	1	0	Ecl136II,EcoICRI,Psp124BI,SacI,SstI,UcoMSI
+Eco57I	CTGAAG	22	14			2	NN	ambiguous	3prime	22	-14	0	1	AcuI
+Eco57MI	CTGRAG	22	14			2	NN	ambiguous	3prime	22	-14	0	0	
+Eco72I	CACGTG	3	-3			0		defined	blunt	3	3	1	0	AcvI,BbrPI,PmaCI,PmlI,PspCI
+Eco8164I	GCCKAG							unknown	unknown	0	0	0	1	
+Eco81I	CCTNAGG	2	-2			-3	TNA	ambiguous	5prime	2	2	1	0	AxyI,Bse21I,Bsu36I,SauI
+Eco88I	CYCGRG	1	-1			-4	YCGR	ambiguous	5prime	1	1	1	0	Ama87I,AvaI,BmeT110I,BsiHKCI,BsoBI,Nli3877I
+Eco9009II	GAAANTC							unknown	unknown	0	0	0	1	
+Eco9020I	CGAABTT							unknown	unknown	0	0	0	1	
+Eco9035I	GGGANTT							unknown	unknown	0	0	0	1	
+Eco91I	GGTNACC	1	-1			-5	GTNAC	ambiguous	5prime	1	1	1	0	BstEII,BstPI,EcoO65I,PspEI
+Eco9699II	TAGARC							unknown	unknown	0	0	0	1	
+EcoBLMcrX	RCSRC	2	-2			-1	S	ambiguous	5prime	2	2	0	0	
+EcoE1140I	ACCYAC							unknown	unknown	0	0	0	1	
+EcoHI	CCSGG	0	0			-5	CCSGG	ambiguous	5prime	0	0	1	1	AsuC2I,BcnI,BpuMI,CauII,NciI
+EcoHSI	GGTAAG							unknown	unknown	0	0	0	1	
+EcoICRI	GAGCTC	3	-3			0		defined	blunt	3	3	1	0	Ecl136II,Eco53kI,Psp124BI,SacI,SstI,UcoMSI
+EcoMVII	CANCATC							unknown	unknown	0	0	0	1	
+EcoNI	CCTNNNNNAGG	5	-5			-1	N	ambiguous	5prime	5	5	1	1	BstENI,XagI
+EcoNIH6II	ATGAAG							unknown	unknown	0	0	0	1	
+EcoO109I	RGGNCCY	2	-2			-3	GNC	ambiguous	5prime	2	2	1	1	DraII,PssI
+EcoO157SI	C	15	12			2	NN	ambiguous	3prime	15	-12	0	0	AbaSI,BmeDI,YkrI
+EcoO65I	GGTNACC	1	-1			-5	GTNAC	ambiguous	5prime	1	1	1	0	BstEII,BstPI,Eco91I,PspEI
+EcoRI	GAATTC	1	-1			-4	AATT	defined	5prime	1	1	1	1	
+EcoRII	CCWGG	0	0			-5	CCWGG	ambiguous	5prime	0	0	1	1	AjnI,BciT130I,BseBI,Bst2UI,BstNI,Dde51507I,MvaI,Psp6I,PspGI
+EcoRV	GATATC	3	-3			0		defined	blunt	3	3	1	1	Eco32I
+EcoT14I	CCWWGG	1	-1			-4	CWWG	ambiguous	5prime	1	1	1	0	BssT1I,Eco130I,ErhI,StyI
+EcoT22I	ATGCAT	5	-5			4	TGCA	defined	3prime	5	5	1	0	AvaIII,Mph1103I,NsiI,Ppu10I,Zsp2I
+EcoT38I	GRGCYC	5	-5			4	RGCY	ambiguous	3prime	5	5	1	1	BanII,Eco24I,FriOI,HgiJII
+EgeI	GGCGCC	3	-3			0		defined	blunt	3	3	1	0	DinI,EheI,KasI,Mly113I,NarI,PluTI,SfoI,SspDI
+EheI	GGCGCC	3	-3			0		defined	blunt	3	3	1	0	DinI,EgeI,KasI,Mly113I,NarI,PluTI,SfoI,SspDI
+Ehi46392I	CCCNNAG							unknown	unknown	0	0	0	1	
+Eli8509II	CCGGAG							unknown	unknown	0	0	0	1	
+ErhG4T10I	CGANNNNNNTC							unknown	unknown	0	0	0	1	
+ErhI	CCWWGG	1	-1			-4	CWWG	ambiguous	5prime	1	1	1	0	BssT1I,Eco130I,EcoT14I,StyI
+EsaBC3I	TCGA	2	-2			0		defined	blunt	2	2	1	1	TaqI
+EsaSSI	GACCAC							unknown	unknown	0	0	0	1	
+Esp3007I	CAGAAG							unknown	unknown	0	0	0	1	
+Esp3I	CGTCTC	7	5			-4	NNNN	ambiguous	5prime	7	-5	0	1	BsmBI
+EspI	GCTNAGC	2	-2			-3	TNA	ambiguous	5prime	2	2	1	0	BlpI,Bpu1102I,Bsp1720I
+FaeI	CATG	4	-4			4	CATG	defined	3prime	4	4	1	0	CviAII,FatI,Hin1II,Hsp92II,NlaIII,UpaP162I
+FaiI	YATR	2	-2			0		defined	blunt	2	2	1	0	
+FalI	AAGNNNNNCTT	-8	-24	24	8	5	NNNNN	ambiguous	3prime	-8,24	24,-8	1	0	
+FaqI	GGGAC	15	14			-4	NNNN	ambiguous	5prime	15	-14	0	0	BslFI,BsmFI,FinI
+FatI	CATG	0	0			-4	CATG	defined	5prime	0	0	1	1	CviAII,FaeI,Hin1II,Hsp92II,NlaIII,UpaP162I
+FauI	CCCGC	9	6			-2	NN	ambiguous	5prime	9	-6	0	0	
+FauNDI	CATATG	2	-2			-2	TA	defined	5prime	2	2	1	0	NdeI
+Fba202Z8II	AGAAGG							unknown	unknown	0	0	0	1	
+FbaI	TGATCA	1	-1			-4	GATC	defined	5prime	1	1	1	0	BclI,Ksp22I
+FblI	GTMKAC	2	-2			-2	MK	ambiguous	5prime	2	2	1	0	AccI,XmiI
+Fco1691IV	GCVGAG							unknown	unknown	0	0	0	1	
+FinI	GGGAC							unknown	unknown	0	0	0	0	BslFI,BsmFI,FaqI
+FmuI	GGNCC	4	-4			3	GNC	ambiguous	3prime	4	4	1	0	AspS9I,AsuI,BmgT120I,Cfr13I,PspPI,Sau96I,UnbI
+Fna13121I	TTGAYC							unknown	unknown	0	0	0	1	
+Fnu11326II	GAGNNNNRTAY							unknown	unknown	0	0	0	1	
+Fnu11326IV	CTTAATT							unknown	unknown	0	0	0	1	
+Fnu4HI	GCNGC	2	-2			-1	N	ambiguous	5prime	2	2	1	1	BisI,BlsI,BthCI,Fsp4HI,GluI,PkrI,SatI
+FnuDII	CGCG	2	-2			0		defined	blunt	2	2	1	1	AccII,Bsh1236I,BspFNI,BstFNI,BstUI,MvnI,SelI
+FokI	GGATG	14	13			-4	NNNN	ambiguous	5prime	14	-13	0	1	BseGI,BstF5I,BtsCI,StsI
+FriOI	GRGCYC	5	-5			4	RGCY	ambiguous	3prime	5	5	1	0	BanII,Eco24I,EcoT38I,HgiJII
+FseI	GGCCGGCC	6	-6			4	CCGG	defined	3prime	6	6	1	1	RigI
+Fsp4HI	GCNGC	2	-2			-1	N	ambiguous	5prime	2	2	1	1	BisI,BlsI,BthCI,Fnu4HI,GluI,PkrI,SatI
+FspAI	RTGCGCAY	4	-4			0		defined	blunt	4	4	1	0	
+FspBI	CTAG	1	-1			-2	TA	defined	5prime	1	1	1	0	BfaI,MaeI,SspMI,XspI
+FspEI	CC	14	16			-4	NNNN	ambiguous	5prime	14	-16	0	0	
+FspI	TGCGCA	3	-3			0		defined	blunt	3	3	1	1	Acc16I,MstI,NsbI
+FspPK15I	GARGAAG							unknown	unknown	0	0	0	1	
+FtnUV	GAAACA							unknown	unknown	0	0	0	1	
+GauT27I	CGCGCAGG							unknown	unknown	0	0	0	1	
+Gba708II	ATGCAC							unknown	unknown	0	0	0	1	
+GdiII	CGGCCR	1	-1			-4	GGCC	defined	5prime	1	1	0	0	
+GlaI	GCGC	2	-2			0		defined	blunt	2	2	1	0	AspLEI,BstHHI,CfoI,HhaI,Hin6I,HinP1I,HspAI
+GluI	GCNGC	2	-2			-1	N	ambiguous	5prime	2	2	1	0	BisI,BlsI,BthCI,Fnu4HI,Fsp4HI,PkrI,SatI
+Gru56503II	CARABGC							unknown	unknown	0	0	0	1	
+GsaI	CCCAGC	5	-5			4	CCAG	defined	3prime	5	5	0	0	BseYI,PspFI
+GsuI	CTGGAG	22	14			2	NN	ambiguous	3prime	22	-14	0	0	BpmI
+GsuPI	GTACAG							unknown	unknown	0	0	0	1	
+HaeI	WGGCCW	3	-3			0		defined	blunt	3	3	1	0	
+HaeII	RGCGCY	5	-5			4	GCGC	defined	3prime	5	5	1	1	BfoI,BstH2I,LpnI
+HaeIII	GGCC	2	-2			0		defined	blunt	2	2	1	1	AoxI,BshFI,BsnI,BspANI,BsuRI
+HapII	CCGG	1	-1			-2	CG	defined	5prime	1	1	1	1	BsiSI,HpaII,MspI,Sth302II
+HauII	TGGCCA	17	9			2	NN	ambiguous	3prime	17	-9	1	1	BalI,MlsI,MluNI,Mox20I,MscI,Msp20I
+HbaII	GCCCAG							unknown	unknown	0	0	0	1	
+Hca13221V	CACNNNNNRTAY							unknown	unknown	0	0	0	1	
+HdeNY26I	CGANNNNNNTCC							unknown	unknown	0	0	0	1	
+HdeZA17I	GCANNNNNNTCC							unknown	unknown	0	0	0	1	
+HgaI	GACGC	10	10			-5	NNNNN	ambiguous	5prime	10	-10	0	1	CseI
+HgiAI	GWGCWC	5	-5			4	WGCW	ambiguous	3prime	5	5	1	0	Alw21I,Bbv12I,BsiHKAI
+HgiCI	GGYRCC	1	-1			-4	GYRC	ambiguous	5prime	1	1	1	1	AccB1I,BanI,BshNI,BspT107I
+HgiEII	ACCNNNNNNGGT							unknown	unknown	0	0	1	0	
+HgiJII	GRGCYC	5	-5			4	RGCY	ambiguous	3prime	5	5	1	0	BanII,Eco24I,EcoT38I,FriOI
+HhaI	GCGC	3	-3			2	CG	defined	3prime	3	3	1	1	AspLEI,BstHHI,CfoI,GlaI,Hin6I,HinP1I,HspAI
+Hin1I	GRCGYC	2	-2			-2	CG	defined	5prime	2	2	1	0	AcyI,BsaHI,BssNI,BstACI,Hsp92I
+Hin1II	CATG	4	-4			4	CATG	defined	3prime	4	4	1	0	CviAII,FaeI,FatI,Hsp92II,NlaIII,UpaP162I
+Hin4I	GAYNNNNNVTC	-8	-24	24	8	5	NNNNN	ambiguous	3prime	-8,24	24,-8	0	0	
+Hin4II	CCTTC	11	5			1	N	ambiguous	3prime	11	-5	0	0	HpyAV
+Hin6I	GCGC	1	-1			-2	CG	defined	5prime	1	1	1	0	AspLEI,BstHHI,CfoI,GlaI,HhaI,HinP1I,HspAI
+HinP1I	GCGC	1	-1			-2	CG	defined	5prime	1	1	1	1	AspLEI,BstHHI,CfoI,GlaI,HhaI,Hin6I,HspAI
+HincII	GTYRAC	3	-3			0		defined	blunt	3	3	1	1	HindII
+HindII	GTYRAC	3	-3			0		defined	blunt	3	3	1	1	HincII
+HindIII	AAGCTT	1	-1			-4	AGCT	defined	5prime	1	1	1	1	
+HinfI	GANTC	1	-1			-3	ANT	ambiguous	5prime	1	1	1	1	
+HpaI	GTTAAC	3	-3			0		defined	blunt	3	3	1	1	KspAI
+HpaII	CCGG	1	-1			-2	CG	defined	5prime	1	1	1	1	BsiSI,HapII,MspI,Sth302II
+HphI	GGTGA	13	7			1	N	ambiguous	3prime	13	-7	0	1	AsuHPI,SspD5I
+Hpy166II	GTNNAC	3	-3			0		defined	blunt	3	3	1	0	Hpy8I,MjaIV
+Hpy178III	TCNNGA	2	-2			-2	NN	ambiguous	5prime	2	2	1	0	Hpy188III
+Hpy188I	TCNGA	3	-3			1	N	ambiguous	3prime	3	3	1	1	
+Hpy188III	TCNNGA	2	-2			-2	NN	ambiguous	5prime	2	2	1	0	Hpy178III
+Hpy300XI	CCTYNA							unknown	unknown	0	0	0	1	
+Hpy8I	GTNNAC	3	-3			0		defined	blunt	3	3	1	1	Hpy166II,MjaIV
+Hpy99I	CGWCG	5	-5			5	CGWCG	ambiguous	3prime	5	5	1	1	
+Hpy99XIII	GCCTA							unknown	unknown	0	0	0	1	
+Hpy99XIV	GGWTAA							unknown	unknown	0	0	0	1	
+Hpy99XIV_mut1	GGWCNA							unknown	unknown	0	0	0	1	
+Hpy99XXII	CYANNNNNNTGA							unknown	unknown	0	0	0	1	
+HpyAS001VI	CYANNNNNNTTC							unknown	unknown	0	0	0	1	
+HpyAV	CCTTC	11	5			1	N	ambiguous	3prime	11	-5	0	1	Hin4II
+HpyAXIV	GCGTA							unknown	unknown	0	0	0	1	
+HpyAXVIII	GGANNAG							unknown	unknown	0	0	0	1	
+HpyAXVI_mut1	CRTTAA							unknown	unknown	0	0	0	1	
+HpyAXVI_mut2	CRTCNA							unknown	unknown	0	0	0	1	
+HpyCH4III	ACNGT	3	-3			1	N	ambiguous	3prime	3	3	1	0	Bst4CI,TaaI,Tsp4CI
+HpyCH4IV	ACGT	1	-1			-2	CG	defined	5prime	1	1	1	1	HpySE526I,MaeII,TagI,TaiI
+HpyCH4V	TGCA	2	-2			0		defined	blunt	2	2	1	0	CviRI
+HpyF10VI	GCNNNNNNNGC	7	-7			3	NNN	ambiguous	3prime	7	7	1	0	BstMWI,MwoI
+HpyF3I	CTNAG	1	-1			-3	TNA	ambiguous	5prime	1	1	1	0	BstDEI,DdeI
+HpyG272XV	GAAAAG							unknown	unknown	0	0	0	1	HpyLIM9XVI
+HpyLIM6XII	CYANNNNNNTCC							unknown	unknown	0	0	0	1	
+HpyLIM9XVI	GAAAAG							unknown	unknown	0	0	0	1	HpyG272XV
+HpyPU007XIX	CYANNNNNNTGY							unknown	unknown	0	0	0	1	
+HpySE526I	ACGT	1	-1			-2	CG	defined	5prime	1	1	1	0	HpyCH4IV,MaeII,TagI,TaiI
+HpyUM032XIII	CYANNNNNNNTRG							unknown	unknown	0	0	1	1	
+HpyUM032XIII_mut1	CYANNNNNNNTTC							unknown	unknown	0	0	0	1	
+HpyUM032XIV	GAAAG							unknown	unknown	0	0	0	1	
+HpyUM037X	TNGGNAG|GTGGNAG							unknown	unknown	0	0	0	1	
+Hso63250IV	AACNNNNNGTT							unknown	unknown	0	0	1	1	
+Hso63373III	CGANNNNNRTAY							unknown	unknown	0	0	0	1	
+Hsp92I	GRCGYC	2	-2			-2	CG	defined	5prime	2	2	1	0	AcyI,BsaHI,BssNI,BstACI,Hin1I
+Hsp92II	CATG	4	-4			4	CATG	defined	3prime	4	4	1	0	CviAII,FaeI,FatI,Hin1II,NlaIII,UpaP162I
+HspAI	GCGC	1	-1			-2	CG	defined	5prime	1	1	1	1	AspLEI,BstHHI,CfoI,GlaI,HhaI,Hin6I,HinP1I
+HspMHR1II	GAGCAGC							unknown	unknown	0	0	0	1	
+Jma19592I	GTATNAC							unknown	unknown	0	0	0	1	
+Jma19592II	GRGCRAC							unknown	unknown	0	0	0	1	
+Jsp2502II	GRNGAAT							unknown	unknown	0	0	0	1	
+Kas9737III	CCCRAG							unknown	unknown	0	0	0	1	
+KasI	GGCGCC	1	-1			-4	GCGC	defined	5prime	1	1	1	1	DinI,EgeI,EheI,Mly113I,NarI,PluTI,SfoI,SspDI
+KflI	GGGWCCC	2	-2			-3	GWC	ambiguous	5prime	2	2	1	0	SanDI
+Kor51II	RTCGAG							unknown	unknown	0	0	0	1	
+Kpn156V	CRTGATT							unknown	unknown	0	0	0	1	
+Kpn2I	TCCGGA	1	-1			-4	CCGG	defined	5prime	1	1	1	1	AccIII,Aor13HI,BseAI,Bsp13I,BspEI,BspMII,MroI
+Kpn327I	GACATC							unknown	unknown	0	0	0	1	
+Kpn9178I	GNGCGAG							unknown	unknown	0	0	0	1	
+Kpn9644II	GRACRAC							unknown	unknown	0	0	0	1	
+KpnI	GGTACC	5	-5			4	GTAC	defined	3prime	5	5	1	1	Acc65I,Asp718I
+KpnNH25III	CTRGAG							unknown	unknown	0	0	0	1	
+KpnNIH30III	GTTCNAC							unknown	unknown	0	0	0	1	
+KpnNIH50I	GCYAAG							unknown	unknown	0	0	0	1	
+Kro7512II	ARCAGKC							unknown	unknown	0	0	0	1	
+KroI	GCCGGC	1	-1			-4	CCGG	defined	5prime	1	1	1	0	KroNI,MroNI,MspGI,NaeI,NgoMIV,PdiI
+KroNI	GCCGGC	3	-3			0		defined	blunt	3	3	1	0	KroI,MroNI,MspGI,NaeI,NgoMIV,PdiI
+Ksp22I	TGATCA	1	-1			-4	GATC	defined	5prime	1	1	1	0	BclI,FbaI
+Ksp632I	CTCTTC	7	4			-3	NNN	ambiguous	5prime	7	-4	0	0	Bst6I,Eam1104I,EarI
+KspAI	GTTAAC	3	-3			0		defined	blunt	3	3	1	0	HpaI
+KspI	CCGCGG	4	-4			2	GC	defined	3prime	4	4	1	0	Cfr42I,SacII,Sfr303I,SgrBI
+Kzo9I	GATC	0	0			-4	GATC	defined	5prime	0	0	1	0	Asi256I,Bsp143I,BssMI,BstKTI,BstMBI,ChaI,DpnI,DpnII,MalI,MboI,NdeII,Sau3AI
+Lba2029III	CYAAANG							unknown	unknown	0	0	0	1	
+Lbr124II	CATCNAC							unknown	unknown	0	0	0	1	
+Lcr047I	CTCCA							unknown	unknown	0	0	0	1	
+Lcr047II	AGAAG							unknown	unknown	0	0	0	1	
+LcrJM4II	GMAGG							unknown	unknown	0	0	0	1	
+Lde4408II	ACAAAG							unknown	unknown	0	0	0	1	
+LguI	GCTCTTC	8	4			-3	NNN	ambiguous	5prime	8	-4	0	0	BspQI,PciSI,SapI
+LlaG50I	CCGTKA							unknown	unknown	0	0	0	1	
+Lme32I	CTYCAA							unknown	unknown	0	0	0	1	
+LmnI	GCTCC	6	-1			2	CN	ambiguous	3prime	6	1	0	0	
+Lmo370I	AGCGCCG							unknown	unknown	0	0	0	1	
+Lmo911II	TAGRAG							unknown	unknown	0	0	0	1	
+Lpl1004II	AGGRAG							unknown	unknown	0	0	0	1	
+Lpn11417II	ACGAAT							unknown	unknown	0	0	0	1	
+Lpn12272I	GCNCAAC							unknown	unknown	0	0	0	1	
+LpnI	RGCGCY	3	-3			0		defined	blunt	3	3	1	0	BfoI,BstH2I,HaeII
+LpnPI	CCDG	14	14			-4	NNNN	ambiguous	5prime	14	-14	0	0	
+Lra68I	GTTCNAG							unknown	unknown	0	0	0	1	
+LsaDS4I	TGGAAT							unknown	unknown	0	0	0	1	
+Lsp1109I	GCAGC	13	12			-4	NNNN	ambiguous	5prime	13	-12	0	1	BbvI,BceSIV,BseXI,BstV1I
+Lsp48III	AGCACC							unknown	unknown	0	0	0	1	
+Lsp6406VI	CRAGCAC							unknown	unknown	0	0	0	1	
+LweI	GCATC	10	9			-4	NNNN	ambiguous	5prime	10	-9	0	0	BmsI,BscAI,SfaNI
+MabI	ACCWGGT	1	-1			-5	CCWGG	ambiguous	5prime	1	1	1	0	CsiI,SexAI
+MaeI	CTAG	1	-1			-2	TA	defined	5prime	1	1	1	0	BfaI,FspBI,SspMI,XspI
+MaeII	ACGT	1	-1			-2	CG	defined	5prime	1	1	1	0	HpyCH4IV,HpySE526I,TagI,TaiI
+MaeIII	GTNAC	0	0			-5	GTNAC	ambiguous	5prime	0	0	1	0	
+MalI	GATC	2	-2			0		defined	blunt	2	2	1	0	Asi256I,Bsp143I,BssMI,BstKTI,BstMBI,ChaI,DpnI,DpnII,Kzo9I,MboI,NdeII,Sau3AI
+MaqI	CRTTGAC	28	19			2	NN	ambiguous	3prime	28	-19	0	1	
+MauBI	CGCGCGCG	2	-2			-4	CGCG	defined	5prime	2	2	1	0	
+Mba11I	AGGCGA							unknown	unknown	0	0	0	1	
+MbiI	CCGCTC	3	-3			0		defined	blunt	3	3	0	0	AccBSI,BsrBI
+MboI	GATC	0	0			-4	GATC	defined	5prime	0	0	1	1	Asi256I,Bsp143I,BssMI,BstKTI,BstMBI,ChaI,DpnI,DpnII,Kzo9I,MalI,NdeII,Sau3AI
+MboII	GAAGA	13	7			1	N	ambiguous	3prime	13	-7	0	1	
+McaTI	GCGCGC	4	-4			2	GC	defined	3prime	4	4	1	1	BsePI,BssHII,PauI,PteI
+Mch10819I	CYCAGCG							unknown	unknown	0	0	0	1	
+Mch946II	WCGATCT							unknown	unknown	0	0	0	1	
+McrI	CGRYCG	4	-4			2	RY	ambiguous	3prime	4	4	1	0	Bsh1285I,BsiEI,BstMCI
+MfeI	CAATTG	1	-1			-4	AATT	defined	5prime	1	1	1	1	MunI
+MflI	RGATCY	1	-1			-4	GATC	defined	5prime	1	1	1	0	BstX2I,BstYI,PsuI,XhoII
+MhlI	GDGCHC	5	-5			4	DGCH	ambiguous	3prime	5	5	1	0	Bsp1286I,SduI
+MjaIV	GTNNAC							unknown	unknown	0	0	1	1	Hpy166II,Hpy8I
+MkaDII	GAGAYGT							unknown	unknown	0	0	0	1	
+Mla10359I	CGANNNNNNTCA							unknown	unknown	0	0	0	1	
+MlsI	TGGCCA	3	-3			0		defined	blunt	3	3	1	0	BalI,HauII,MluNI,Mox20I,MscI,Msp20I
+Mlu211III	AGCCCA							unknown	unknown	0	0	0	1	
+MluCI	AATT	0	0			-4	AATT	defined	5prime	0	0	1	1	Sse9I,TasI,TspEI
+MluI	ACGCGT	1	-1			-4	CGCG	defined	5prime	1	1	1	1	
+MluNI	TGGCCA	3	-3			0		defined	blunt	3	3	1	0	BalI,HauII,MlsI,Mox20I,MscI,Msp20I
+Mly113I	GGCGCC	2	-2			-2	CG	defined	5prime	2	2	1	0	DinI,EgeI,EheI,KasI,NarI,PluTI,SfoI,SspDI
+MlyI	GAGTC	10	5			0		defined	blunt	10	-5	0	1	BspD6I,PleI,PpsI,SchI
+MmeI	TCCRAC	26	18			2	NN	ambiguous	3prime	26	-18	0	1	
+MnlI	CCTC	11	6			1	N	ambiguous	3prime	11	-6	0	1	
+Mox20I	TGGCCA	3	-3			0		defined	blunt	3	3	1	0	BalI,HauII,MlsI,MluNI,MscI,Msp20I
+Mph1103I	ATGCAT	5	-5			4	TGCA	defined	3prime	5	5	1	0	AvaIII,EcoT22I,NsiI,Ppu10I,Zsp2I
+MreI	CGCCGGCG	2	-2			-4	CCGG	defined	5prime	2	2	1	0	Sse232I
+MroI	TCCGGA	1	-1			-4	CCGG	defined	5prime	1	1	1	0	AccIII,Aor13HI,BseAI,Bsp13I,BspEI,BspMII,Kpn2I
+MroNI	GCCGGC	1	-1			-4	CCGG	defined	5prime	1	1	1	0	KroI,KroNI,MspGI,NaeI,NgoMIV,PdiI
+MroXI	GAANNNNTTC	5	-5			0		defined	blunt	5	5	1	0	Asp700I,PdmI,XmnI
+MscI	TGGCCA	3	-3			0		defined	blunt	3	3	1	1	BalI,HauII,MlsI,MluNI,Mox20I,Msp20I
+MseI	TTAA	1	-1			-2	TA	defined	5prime	1	1	1	1	SaqAI,Tru1I,Tru9I
+MslI	CAYNNNNRTG	5	-5			0		defined	blunt	5	5	1	0	RseI,SmiMI
+Msp20I	TGGCCA	3	-3			0		defined	blunt	3	3	1	0	BalI,HauII,MlsI,MluNI,Mox20I,MscI
+MspA1I	CMGCKG	3	-3			0		defined	blunt	3	3	1	1	NspBII
+MspCI	CTTAAG	1	-1			-4	TTAA	defined	5prime	1	1	1	0	AflII,BfrI,BspTI,BstAFI,Vha464I
+MspF392I	CCCAATV							unknown	unknown	0	0	0	1	
+MspGI	GCCGGC	5	-5			4	CCGG	defined	3prime	5	5	1	0	KroI,KroNI,MroNI,NaeI,NgoMIV,PdiI
+MspI	CCGG	1	-1			-2	CG	defined	5prime	1	1	1	1	BsiSI,HapII,HpaII,Sth302II
+MspI7II	ACGRAG							unknown	unknown	0	0	0	1	
+MspI7IV	GCMGAAG							unknown	unknown	0	0	0	1	
+MspJI	CNNR	13	13			-4	NNNN	ambiguous	5prime	13	-13	0	0	
+MspR9I	CCNGG	2	-2			-1	N	ambiguous	5prime	2	2	1	0	Bme1390I,BmrFI,BstSCI,ScrFI,StyD4I
+MspSC27II	CCGCGAC							unknown	unknown	0	0	0	1	
+MssI	GTTTAAAC	4	-4			0		defined	blunt	4	4	1	0	PmeI
+MstI	TGCGCA	3	-3			0		defined	blunt	3	3	1	0	Acc16I,FspI,NsbI
+MteI	GCGCNGCGC	4	-4			-1	N	ambiguous	5prime	4	4	1	0	
+MtuHN878II	CACGCAG							unknown	unknown	0	0	0	1	
+MunI	CAATTG	1	-1			-4	AATT	defined	5prime	1	1	1	1	MfeI
+Mva1269I	GAATGC	7	-1			2	CN	ambiguous	3prime	7	1	0	0	BsmI,PctI
+MvaI	CCWGG	2	-2			-1	W	ambiguous	5prime	2	2	1	1	AjnI,BciT130I,BseBI,Bst2UI,BstNI,Dde51507I,EcoRII,Psp6I,PspGI
+MvnI	CGCG	2	-2			0		defined	blunt	2	2	1	0	AccII,Bsh1236I,BspFNI,BstFNI,BstUI,FnuDII,SelI
+MwoI	GCNNNNNNNGC	7	-7			3	NNN	ambiguous	3prime	7	7	1	1	BstMWI,HpyF10VI
+NaeI	GCCGGC	3	-3			0		defined	blunt	3	3	1	1	KroI,KroNI,MroNI,MspGI,NgoMIV,PdiI
+Nal45188II	ACCAGC							unknown	unknown	0	0	0	1	
+Nan12227I	CCANNNNNNTCY							unknown	unknown	0	0	0	1	
+NarI	GGCGCC	2	-2			-2	CG	defined	5prime	2	2	1	0	DinI,EgeI,EheI,KasI,Mly113I,PluTI,SfoI,SspDI
+Nbr128II	ACCGAC							unknown	unknown	0	0	0	1	
+NciI	CCSGG	2	-2			-1	S	ambiguous	5prime	2	2	1	1	AsuC2I,BcnI,BpuMI,CauII,EcoHI
+NcoI	CCATGG	1	-1			-4	CATG	defined	5prime	1	1	1	1	Bsp19I
+NdeI	CATATG	2	-2			-2	TA	defined	5prime	2	2	1	1	FauNDI
+NdeII	GATC	0	0			-4	GATC	defined	5prime	0	0	1	0	Asi256I,Bsp143I,BssMI,BstKTI,BstMBI,ChaI,DpnI,DpnII,Kzo9I,MalI,MboI,Sau3AI
+NgoAVII	GCCGC	12	7			0		defined	blunt	12	-7	0	1	
+NgoAVIII	GACNNNNNTGA	-12	-25	24	11	2	NN	ambiguous	3prime	-12,24	25,-11	0	1	
+NgoMIV	GCCGGC	1	-1			-4	CCGG	defined	5prime	1	1	1	1	KroI,KroNI,MroNI,MspGI,NaeI,PdiI
+NhaXI	CAAGRAG							unknown	unknown	0	0	0	1	
+NheI	GCTAGC	1	-1			-4	CTAG	defined	5prime	1	1	1	1	AsuNHI,BmtI,BspOI
+NhoI	GCWGC							unknown	unknown	0	0	1	0	ApeKI,TseI
+NlaCI	CATCAC	25	17			2	NN	ambiguous	3prime	25	-17	0	1	
+NlaIII	CATG	4	-4			4	CATG	defined	3prime	4	4	1	1	CviAII,FaeI,FatI,Hin1II,Hsp92II,UpaP162I
+NlaIV	GGNNCC	3	-3			0		defined	blunt	3	3	1	1	BmiI,BspLI,PspN4I
+Nli3877I	CYCGRG	5	-5			4	YCGR	ambiguous	3prime	5	5	1	0	Ama87I,AvaI,BmeT110I,BsiHKCI,BsoBI,Eco88I
+NmeA6CIII	GCCGAC	27	19			2	NN	ambiguous	3prime	27	-19	0	1	
+NmeAIII	GCCGAG	27	19			2	NN	ambiguous	3prime	27	-19	0	1	
+NmeDI	RCCGGY	-12	-13	13	12	-5	NNNNN	ambiguous	5prime	-12,13	13,-12	1	1	Bse118I,BsrFI,BssAI,Cfr10I
+NmuCI	GTSAC	0	0			-5	GTSAC	ambiguous	5prime	0	0	1	0	TseFI,Tsp45I
+NotI	GCGGCCGC	2	-2			-4	GGCC	defined	5prime	2	2	1	1	CciNI
+NpeUS61II	GATCGAC							unknown	unknown	0	0	0	1	
+NruI	TCGCGA	3	-3			0		defined	blunt	3	3	1	1	Bsp68I,BtuMI,RruI
+NsbI	TGCGCA	3	-3			0		defined	blunt	3	3	1	0	Acc16I,FspI,MstI
+NsiI	ATGCAT	5	-5			4	TGCA	defined	3prime	5	5	1	1	AvaIII,EcoT22I,Mph1103I,Ppu10I,Zsp2I
+NspBII	CMGCKG	3	-3			0		defined	blunt	3	3	1	0	MspA1I
+NspES21II	CRTTCAG							unknown	unknown	0	0	0	1	
+NspI	RCATGY	5	-5			4	CATG	defined	3prime	5	5	1	1	BstNSI,XceI
+NspV	TTCGAA	2	-2			-2	CG	defined	5prime	2	2	1	0	AsuII,Bpu14I,Bsp119I,BspT104I,BstBI,SfuI
+ObaBS10I	ACGAG							unknown	unknown	0	0	0	1	
+OgrI	CAACNAC							unknown	unknown	0	0	0	1	
+OliI	CACNNNNGTG	5	-5			0		defined	blunt	5	5	1	0	AleI
+OspHL35III	YAGGAG							unknown	unknown	0	0	0	1	
+PabI	GTAC	3	-3			2	TA	defined	3prime	3	3	1	1	AfaI,Csp6I,CviQI,RsaI,RsaNI
+Pac19842II	CCTTGA							unknown	unknown	0	0	0	1	
+PacI	TTAATTAA	5	-5			2	AT	defined	3prime	5	5	1	0	
+PacIII	GTAATC							unknown	unknown	0	0	0	1	
+Pae10662III	TGACGAG							unknown	unknown	0	0	0	1	
+Pae8506I	CATCGAR							unknown	unknown	0	0	0	1	
+PaeI	GCATGC	5	-5			4	CATG	defined	3prime	5	5	1	0	SphI
+PaePA99III	AAGAYC							unknown	unknown	0	0	0	1	
+PaeR7I	CTCGAG	1	-1			-4	TCGA	defined	5prime	1	1	1	1	SciI,Sfr274I,SlaI,XhoI
+PagI	TCATGA	1	-1			-4	CATG	defined	5prime	1	1	1	0	BspHI,CciI
+Pal408I	CCRTGAG							unknown	unknown	0	0	0	1	
+PalAI	GGCGCGCC	2	-2			-4	CGCG	defined	5prime	2	2	1	0	AscI,SgsI
+PaqCI	CACCTGC	11	8			-4	NNNN	ambiguous	5prime	11	-8	0	1	AarI
+PasI	CCCWGGG	2	-2			-3	CWG	ambiguous	5prime	2	2	1	0	
+PauI	GCGCGC	1	-1			-4	CGCG	defined	5prime	1	1	1	0	BsePI,BssHII,McaTI,PteI
+Pba2294I	GTAAG							unknown	unknown	0	0	0	1	
+Pbu13063II	GTATYC							unknown	unknown	0	0	0	1	
+PcaII	GACGAG							unknown	unknown	0	0	0	1	
+PceI	AGGCCT	3	-3			0		defined	blunt	3	3	1	0	Eco147I,SseBI,StuI
+PciI	ACATGT	1	-1			-4	CATG	defined	5prime	1	1	1	0	BspLU11I,PscI
+PciSI	GCTCTTC	8	4			-3	NNN	ambiguous	5prime	8	-4	0	0	BspQI,LguI,SapI
+Pcr308II	CCAAAG							unknown	unknown	0	0	0	1	
+PcsI	WCGNNNNNNNCGW	7	-7			1	N	ambiguous	3prime	7	7	1	0	
+PctI	GAATGC	7	-1			2	CN	ambiguous	3prime	7	1	0	0	BsmI,Mva1269I
+Pdi8503III	CCGGNAG							unknown	unknown	0	0	0	1	
+PdiI	GCCGGC	3	-3			0		defined	blunt	3	3	1	0	KroI,KroNI,MroNI,MspGI,NaeI,NgoMIV
+PdmI	GAANNNNTTC	5	-5			0		defined	blunt	5	5	1	0	Asp700I,MroXI,XmnI
+Pdu1735I	CACCAC							unknown	unknown	0	0	0	1	
+PenI	GCAGT							unknown	unknown	0	0	0	0	
+PfeI	GAWTC	1	-1			-3	AWT	ambiguous	5prime	1	1	1	0	TfiI
+Pfl10783II	GCGTCAG							unknown	unknown	0	0	0	1	
+Pfl1108I	TCGTAG							unknown	unknown	0	0	0	0	
+Pfl23II	CGTACG	1	-1			-4	GTAC	defined	5prime	1	1	1	0	BsiWI,PspLI,SplI
+Pfl3756II	CCCTNAG							unknown	unknown	0	0	0	1	
+Pfl8569I	GCNNGC	3	-3			0		defined	blunt	3	3	1	0	BstC8I,Cac8I
+PflFI	GACNNNGTC	4	-4			-1	N	ambiguous	5prime	4	4	1	0	PsyI,Tth111I
+PflMI	CCANNNNNTGG	7	-7			3	NNN	ambiguous	3prime	7	7	1	1	AccB7I,Van91I
+PflPt14I	RGCCCAC							unknown	unknown	0	0	0	1	
+PfoI	TCCNGGA	1	-1			-5	CCNGG	ambiguous	5prime	1	1	1	0	
+PfrJS12IV	TANAAG							unknown	unknown	0	0	0	1	
+PfrJS12V	GGCGGAG							unknown	unknown	0	0	0	1	
+PfrJS15III	CTTCNAC							unknown	unknown	0	0	0	1	
+PgaP73III	TTCGAG							unknown	unknown	0	0	0	1	
+Pin17FIII	GGYGAB							unknown	unknown	0	0	0	1	
+PinAI	ACCGGT	1	-1			-4	CCGG	defined	5prime	1	1	1	0	AgeI,AsiGI,BshTI,CspAI
+PinP23II	CTRKCAG							unknown	unknown	0	0	0	1	
+PinP59III	GAAGNAG							unknown	unknown	0	0	0	1	
+PkrI	GCNGC	3	-3			1	N	ambiguous	3prime	3	3	1	0	BisI,BlsI,BthCI,Fnu4HI,Fsp4HI,GluI,SatI
+PlaDI	CATCAG	27	19			2	NN	ambiguous	3prime	27	-19	0	1	
+Ple19I	CGATCG	4	-4			2	AT	defined	3prime	4	4	1	0	PvuI
+PleI	GAGTC	9	5			-1	N	ambiguous	5prime	9	-5	0	1	BspD6I,MlyI,PpsI,SchI
+PliMI	CGCCGAC							unknown	unknown	0	0	0	1	
+PluTI	GGCGCC	5	-5			4	GCGC	defined	3prime	5	5	1	1	DinI,EgeI,EheI,KasI,Mly113I,NarI,SfoI,SspDI
+PmaCI	CACGTG	3	-3			0		defined	blunt	3	3	1	0	AcvI,BbrPI,Eco72I,PmlI,PspCI
+Pme10899I	GACAGG							unknown	unknown	0	0	0	1	
+PmeI	GTTTAAAC	4	-4			0		defined	blunt	4	4	1	0	MssI
+PmlI	CACGTG	3	-3			0		defined	blunt	3	3	1	1	AcvI,BbrPI,Eco72I,PmaCI,PspCI
+PpiI	GAACNNNNNCTC	-7	-24	25	8	5	NNNNN	ambiguous	3prime	-7,25	24,-8	0	1	
+PpiP13II	CGCRGAC							unknown	unknown	0	0	0	1	
+PpsI	GAGTC	9	5			-1	N	ambiguous	5prime	9	-5	0	0	BspD6I,MlyI,PleI,SchI
+Ppu10I	ATGCAT	1	-1			-4	TGCA	defined	5prime	1	1	1	0	AvaIII,EcoT22I,Mph1103I,NsiI,Zsp2I
+Ppu21I	YACGTR	3	-3			0		defined	blunt	3	3	1	0	BsaAI,BstBAI
+PpuMI	RGGWCCY	2	-2			-3	GWC	ambiguous	5prime	2	2	1	1	Psp5II,PspPPI
+Pru8113I	CAGANGC							unknown	unknown	0	0	0	1	
+PscI	ACATGT	1	-1			-4	CATG	defined	5prime	1	1	1	0	BspLU11I,PciI
+Pse18267I	RCCGAAG							unknown	unknown	0	0	0	1	
+PshAI	GACNNNNGTC	5	-5			0		defined	blunt	5	5	1	1	BoxI,BstPAI
+PshBI	ATTAAT	2	-2			-2	TA	defined	5prime	2	2	1	0	AseI,VspI
+PsiI	TTATAA	3	-3			0		defined	blunt	3	3	1	1	AanI
+Psp0357II	GCGAAG							unknown	unknown	0	0	0	1	
+Psp03I	GGWCC	4	-4			3	GWC	ambiguous	3prime	4	4	1	0	AvaII,Bme18I,Eco47I,SinI,VpaK11AI,VpaK11BI
+Psp124BI	GAGCTC	5	-5			4	AGCT	defined	3prime	5	5	1	0	Ecl136II,Eco53kI,EcoICRI,SacI,SstI,UcoMSI
+Psp1406I	AACGTT	2	-2			-2	CG	defined	5prime	2	2	1	0	AclI
+Psp5II	RGGWCCY	2	-2			-3	GWC	ambiguous	5prime	2	2	1	0	PpuMI,PspPPI
+Psp6I	CCWGG	0	0			-5	CCWGG	ambiguous	5prime	0	0	1	0	AjnI,BciT130I,BseBI,Bst2UI,BstNI,Dde51507I,EcoRII,MvaI,PspGI
+PspAT13III	CCGANAG							unknown	unknown	0	0	0	1	
+PspCI	CACGTG	3	-3			0		defined	blunt	3	3	1	0	AcvI,BbrPI,Eco72I,PmaCI,PmlI
+PspD7DII	CCGCGAG							unknown	unknown	0	0	0	1	
+PspEI	GGTNACC	1	-1			-5	GTNAC	ambiguous	5prime	1	1	1	0	BstEII,BstPI,Eco91I,EcoO65I
+PspFI	CCCAGC	1	-1			-4	CCAG	defined	5prime	1	1	0	0	BseYI,GsaI
+PspGI	CCWGG	0	0			-5	CCWGG	ambiguous	5prime	0	0	1	1	AjnI,BciT130I,BseBI,Bst2UI,BstNI,Dde51507I,EcoRII,MvaI,Psp6I
+PspLI	CGTACG	1	-1			-4	GTAC	defined	5prime	1	1	1	0	BsiWI,Pfl23II,SplI
+PspMR102II	CAAGAAC							unknown	unknown	0	0	0	1	
+PspN4I	GGNNCC	3	-3			0		defined	blunt	3	3	1	0	BmiI,BspLI,NlaIV
+PspOMI	GGGCCC	1	-1			-4	GGCC	defined	5prime	1	1	1	1	ApaI,Bsp120I
+PspOMII	CGCCCAR	27	18			2	NN	ambiguous	3prime	27	-18	0	1	
+PspPI	GGNCC	1	-1			-3	GNC	ambiguous	5prime	1	1	1	1	AspS9I,AsuI,BmgT120I,Cfr13I,FmuI,Sau96I,UnbI
+PspPPI	RGGWCCY	2	-2			-3	GWC	ambiguous	5prime	2	2	1	0	PpuMI,Psp5II
+PspPRI	CCYCAG	21	13			2	NN	ambiguous	3prime	21	-13	0	1	
+PspR84I	TACYCAC							unknown	unknown	0	0	0	1	
+PspXI	VCTCGAGB	2	-2			-4	TCGA	defined	5prime	2	2	1	0	
+PsrI	GAACNNNNNNTAC	-7	-25	25	7	5	NNNNN	ambiguous	3prime	-7,25	25,-7	0	0	
+PssI	RGGNCCY	5	-5			3	GNC	ambiguous	3prime	5	5	1	0	DraII,EcoO109I
+Pst14472I	CNYACAC							unknown	unknown	0	0	0	1	
+Pst145I	CTAMRAG							unknown	unknown	0	0	0	1	
+Pst273I	GATCGAG							unknown	unknown	0	0	0	1	
+PstI	CTGCAG	5	-5			4	TGCA	defined	3prime	5	5	1	1	BspMAI
+PstNI	CAGNNNCTG	6	-6			3	NNN	ambiguous	3prime	6	6	1	0	AlwNI,CaiI
+PsuGI	BBCGD							unknown	unknown	0	0	0	0	
+PsuI	RGATCY	1	-1			-4	GATC	defined	5prime	1	1	1	0	BstX2I,BstYI,MflI,XhoII
+PsyI	GACNNNGTC	4	-4			-1	N	ambiguous	5prime	4	4	1	0	PflFI,Tth111I
+PteI	GCGCGC	1	-1			-4	CGCG	defined	5prime	1	1	1	0	BsePI,BssHII,McaTI,PauI
+PvuI	CGATCG	4	-4			2	AT	defined	3prime	4	4	1	0	Ple19I
+PvuII	CAGCTG	3	-3			0		defined	blunt	3	3	1	1	
+Ran11014IV	GAAAGAG							unknown	unknown	0	0	0	1	
+Rba2021I	CACGAGH							unknown	unknown	0	0	0	1	
+RceI	CATCGAC	27	18			2	NN	ambiguous	3prime	27	-18	0	1	
+RdeGBI	CCGCAG							unknown	unknown	0	0	0	1	
+RdeGBII	ACCCAG	26	18			2	NN	ambiguous	3prime	26	-18	0	1	
+RdeGBIII	TGRYCA	-9	-17	17	9	2	NN	ambiguous	3prime	-9,17	17,-9	1	1	
+Rer8036II	CCGAKGG							unknown	unknown	0	0	0	1	
+RflFIII	CGCCAG							unknown	unknown	0	0	0	1	
+RgaI	GCGATCGC	5	-5			2	AT	defined	3prime	5	5	1	0	AsiSI,SfaAI,SgfI
+Rgo13296IV	GRAAGCG							unknown	unknown	0	0	0	1	
+Rho5650I	AACGAG							unknown	unknown	0	0	0	1	
+RigI	GGCCGGCC	6	-6			4	CCGG	defined	3prime	6	6	1	0	FseI
+Rkr11038I	GGANNNNNRTGA							unknown	unknown	0	0	0	1	
+RlaI	VCW							unknown	unknown	0	0	0	0	
+RlaII	ACACAG	26	18			2	NN	ambiguous	3prime	26	-18	0	1	
+RleAI	CCCACA	18	9			3	NNN	ambiguous	3prime	18	-9	0	0	
+Rmu369III	GGCYAC							unknown	unknown	0	0	0	1	
+RpaB5I	CGRGGAC	27	18			2	NN	ambiguous	3prime	27	-18	0	1	
+RpaBI	CCCGCAG	27	18			2	NN	ambiguous	3prime	27	-18	0	1	
+RpaI	GTYGGAG	18	9			2	NN	ambiguous	3prime	18	-9	0	1	
+RpaTI	GRTGGAG							unknown	unknown	0	0	0	1	
+RruI	TCGCGA	3	-3			0		defined	blunt	3	3	1	0	Bsp68I,BtuMI,NruI
+RsaI	GTAC	2	-2			0		defined	blunt	2	2	1	1	AfaI,Csp6I,CviQI,PabI,RsaNI
+RsaNI	GTAC	1	-1			-2	TA	defined	5prime	1	1	1	0	AfaI,Csp6I,CviQI,PabI,RsaI
+RseI	CAYNNNNRTG	5	-5			0		defined	blunt	5	5	1	0	MslI,SmiMI
+Rsp008IV	ACGCAG							unknown	unknown	0	0	0	1	
+Rsp008V	GCCCAT							unknown	unknown	0	0	0	1	
+Rsp531II	CACACG							unknown	unknown	0	0	0	1	
+RspPBTS2III	CTTCGAG							unknown	unknown	0	0	0	1	
+Rsr2I	CGGWCCG	2	-2			-3	GWC	ambiguous	5prime	2	2	1	0	CpoI,CspI,RsrII
+RsrII	CGGWCCG	2	-2			-3	GWC	ambiguous	5prime	2	2	1	1	CpoI,CspI,Rsr2I
+Rtr1953I	TGANNNNNNTGA							unknown	unknown	0	0	0	1	
+SacI	GAGCTC	5	-5			4	AGCT	defined	3prime	5	5	1	1	Ecl136II,Eco53kI,EcoICRI,Psp124BI,SstI,UcoMSI
+SacII	CCGCGG	4	-4			2	GC	defined	3prime	4	4	1	1	Cfr42I,KspI,Sfr303I,SgrBI
+Saf8902III	CAATNAG							unknown	unknown	0	0	0	1	
+Sag901I	GCAAAT							unknown	unknown	0	0	0	1	
+SalI	GTCGAC	1	-1			-4	TCGA	defined	5prime	1	1	1	1	
+SanDI	GGGWCCC	2	-2			-3	GWC	ambiguous	5prime	2	2	1	0	KflI
+SapI	GCTCTTC	8	4			-3	NNN	ambiguous	5prime	8	-4	0	1	BspQI,LguI,PciSI
+SaqAI	TTAA	1	-1			-2	TA	defined	5prime	1	1	1	0	MseI,Tru1I,Tru9I
+SatI	GCNGC	2	-2			-1	N	ambiguous	5prime	2	2	1	0	BisI,BlsI,BthCI,Fnu4HI,Fsp4HI,GluI,PkrI
+Sau1803III	CGANNNNNNTAC							unknown	unknown	0	0	0	1	
+Sau3AI	GATC	0	0			-4	GATC	defined	5prime	0	0	1	1	Asi256I,Bsp143I,BssMI,BstKTI,BstMBI,ChaI,DpnI,DpnII,Kzo9I,MalI,MboI,NdeII
+Sau5656II	GTTGCA							unknown	unknown	0	0	0	1	
+Sau64037IV	GTANNNNNNTGG							unknown	unknown	0	0	0	1	
+Sau96I	GGNCC	1	-1			-3	GNC	ambiguous	5prime	1	1	1	1	AspS9I,AsuI,BmgT120I,Cfr13I,FmuI,PspPI,UnbI
+SauI	CCTNAGG	2	-2			-3	TNA	ambiguous	5prime	2	2	1	0	AxyI,Bse21I,Bsu36I,Eco81I
+SauMJ015III	GARCNAG							unknown	unknown	0	0	0	1	
+Sba460II	GGNGAYG							unknown	unknown	0	0	0	1	
+SbfI	CCTGCAGG	6	-6			4	TGCA	defined	3prime	6	6	1	1	SdaI,Sse8387I
+Sbo46I	TGAAC							unknown	unknown	0	0	0	1	
+ScaI	AGTACT	3	-3			0		defined	blunt	3	3	1	1	BmcAI,ZrmI
+SchI	GAGTC	10	5			0		defined	blunt	10	-5	0	0	BspD6I,MlyI,PleI,PpsI
+SciI	CTCGAG	3	-3			0		defined	blunt	3	3	1	0	PaeR7I,Sfr274I,SlaI,XhoI
+ScoDS2II	GCTAAT							unknown	unknown	0	0	0	1	
+ScrFI	CCNGG	2	-2			-1	N	ambiguous	5prime	2	2	1	1	Bme1390I,BmrFI,BstSCI,MspR9I,StyD4I
+SdaI	CCTGCAGG	6	-6			4	TGCA	defined	3prime	6	6	1	0	SbfI,Sse8387I
+SdeAI	CAGRAG	27	19			2	NN	ambiguous	3prime	27	-19	0	1	
+SdeOSI	GACNNNNRTGA	-11	-24	23	10	2	NN	ambiguous	3prime	-11,23	24,-10	0	1	
+SduI	GDGCHC	5	-5			4	DGCH	ambiguous	3prime	5	5	1	0	Bsp1286I,MhlI
+Sdy5370I	CACNNNNNTCY							unknown	unknown	0	0	0	1	
+Sdy7136I	GAGNNNNNTAA							unknown	unknown	0	0	0	1	
+Sdy9603I	GCANNNNNNNTGA							unknown	unknown	0	0	0	1	
+SecI	CCNNGG	1	-1			-4	CNNG	ambiguous	5prime	1	1	1	0	BsaJI,BseDI,BssECI
+SelI	CGCG	0	0			-4	CGCG	defined	5prime	0	0	1	0	AccII,Bsh1236I,BspFNI,BstFNI,BstUI,FnuDII,MvnI
+Sen17963III	CCAAAC							unknown	unknown	0	0	0	1	
+Sen5794III	ACGAACB							unknown	unknown	0	0	0	1	
+Sen6480IV	GTTCAT							unknown	unknown	0	0	0	1	
+SenA1673III	GNGGCAG							unknown	unknown	0	0	0	1	
+SenSARA26III	ACRCAG							unknown	unknown	0	0	0	1	
+SenTFIV	GATCAG							unknown	unknown	0	0	0	1	
+Sep11964I	CGYCAT							unknown	unknown	0	0	0	1	
+Seq11824I	CTANNNNNCTC							unknown	unknown	0	0	0	1	
+SetI	ASST	4	-4			4	ASST	ambiguous	3prime	4	4	1	0	
+SexAI	ACCWGGT	1	-1			-5	CCWGG	ambiguous	5prime	1	1	1	1	CsiI,MabI
+SfaAI	GCGATCGC	5	-5			2	AT	defined	3prime	5	5	1	0	AsiSI,RgaI,SgfI
+SfaNI	GCATC	10	9			-4	NNNN	ambiguous	5prime	10	-9	0	0	BmsI,BscAI,LweI
+SfcI	CTRYAG	1	-1			-4	TRYA	ambiguous	5prime	1	1	1	0	BfmI,BstSFI,SfeI
+SfeI	CTRYAG	1	-1			-4	TRYA	ambiguous	5prime	1	1	1	0	BfmI,BstSFI,SfcI
+SfiI	GGCCNNNNNGGCC	8	-8			3	NNN	ambiguous	3prime	8	8	1	1	
+Sfl13829III	GNYCAG							unknown	unknown	0	0	0	1	
+SfoI	GGCGCC	3	-3			0		defined	blunt	3	3	1	1	DinI,EgeI,EheI,KasI,Mly113I,NarI,PluTI,SspDI
+Sfr274I	CTCGAG	1	-1			-4	TCGA	defined	5prime	1	1	1	0	PaeR7I,SciI,SlaI,XhoI
+Sfr303I	CCGCGG	4	-4			2	GC	defined	3prime	4	4	1	0	Cfr42I,KspI,SacII,SgrBI
+SfuI	TTCGAA	2	-2			-2	CG	defined	5prime	2	2	1	0	AsuII,Bpu14I,Bsp119I,BspT104I,BstBI,NspV
+SgeI	CNNG	13	13			-4	NNNN	ambiguous	5prime	13	-13	1	0	
+SgfI	GCGATCGC	5	-5			2	AT	defined	3prime	5	5	1	0	AsiSI,RgaI,SfaAI
+Sgr7807I	GCCGAGG							unknown	unknown	0	0	0	1	
+SgrAI	CRCCGGYG	2	-2			-4	CCGG	defined	5prime	2	2	1	1	
+SgrAII	CGAGATC							unknown	unknown	0	0	0	1	
+SgrBI	CCGCGG	4	-4			2	GC	defined	3prime	4	4	1	0	Cfr42I,KspI,SacII,Sfr303I
+SgrDI	CGTCGACG	2	-2			-4	TCGA	defined	5prime	2	2	1	0	
+SgrTI	CCDS	14	14			-4	NNNN	ambiguous	5prime	14	-14	0	0	
+SgsI	GGCGCGCC	2	-2			-4	CGCG	defined	5prime	2	2	1	0	AscI,PalAI
+SimI	GGGTC	2	0			-3	GTC	defined	5prime	2	0	0	0	
+SinI	GGWCC	1	-1			-3	GWC	ambiguous	5prime	1	1	1	1	AvaII,Bme18I,Eco47I,Psp03I,VpaK11AI,VpaK11BI
+SlaI	CTCGAG	1	-1			-4	TCGA	defined	5prime	1	1	1	0	PaeR7I,SciI,Sfr274I,XhoI
+Sma10259II	CAAAGA							unknown	unknown	0	0	0	1	
+Sma325I	ARCCCT							unknown	unknown	0	0	0	1	
+SmaI	CCCGGG	3	-3			0		defined	blunt	3	3	1	1	Cfr9I,TspMI,XmaI
+SmaUMH5I	CTTGAC							unknown	unknown	0	0	0	1	
+SmaUMH8I	GCGAACB							unknown	unknown	0	0	0	1	
+SmiI	ATTTAAAT	4	-4			0		defined	blunt	4	4	1	0	SwaI
+SmiMI	CAYNNNNRTG	5	-5			0		defined	blunt	5	5	1	0	MslI,RseI
+SmlI	CTYRAG	1	-1			-4	TYRA	ambiguous	5prime	1	1	1	1	SmoI
+SmoI	CTYRAG	1	-1			-4	TYRA	ambiguous	5prime	1	1	1	0	SmlI
+Sna507VIII	CRTTGAG							unknown	unknown	0	0	0	1	
+SnaBI	TACGTA	3	-3			0		defined	blunt	3	3	1	1	BstSNI,Eco105I
+SnaI	GTATAC							unknown	unknown	0	0	1	0	BssNAI,Bst1107I,BstZ17I
+Sno506I	GGCCGAG							unknown	unknown	0	0	0	1	
+Spe19205IV	GGACY							unknown	unknown	0	0	0	1	
+SpeI	ACTAGT	1	-1			-4	CTAG	defined	5prime	1	1	1	1	AhlI,BcuI
+SphI	GCATGC	5	-5			4	CATG	defined	3prime	5	5	1	0	PaeI
+SplI	CGTACG	1	-1			-4	GTAC	defined	5prime	1	1	1	0	BsiWI,Pfl23II,PspLI
+SpnRII	TCGAG							unknown	unknown	0	0	0	1	
+SpoDI	GCGGRAG							unknown	unknown	0	0	0	1	
+SrfI	GCCCGGGC	4	-4			0		defined	blunt	4	4	1	0	
+Sse232I	CGCCGGCG	2	-2			-4	CCGG	defined	5prime	2	2	1	0	MreI
+Sse8387I	CCTGCAGG	6	-6			4	TGCA	defined	3prime	6	6	1	0	SbfI,SdaI
+Sse8647I	AGGWCCT	2	-2			-3	GWC	ambiguous	5prime	2	2	1	0	
+Sse9I	AATT	0	0			-4	AATT	defined	5prime	0	0	1	1	MluCI,TasI,TspEI
+SseBI	AGGCCT	3	-3			0		defined	blunt	3	3	1	0	Eco147I,PceI,StuI
+SsiI	CCGC	1	-1			-2	CG	defined	5prime	1	1	0	0	AciI,BspACI
+Ssp6803IV	GAAGGC							unknown	unknown	0	0	0	1	
+Ssp714II	CGCAGCG							unknown	unknown	0	0	0	1	
+SspD5I	GGTGA	13	8			0		defined	blunt	13	-8	0	0	AsuHPI,HphI
+SspDI	GGCGCC	1	-1			-4	GCGC	defined	5prime	1	1	1	0	DinI,EgeI,EheI,KasI,Mly113I,NarI,PluTI,SfoI
+SspI	AATATT	3	-3			0		defined	blunt	3	3	1	1	
+SspJOR1II	AGCGANC							unknown	unknown	0	0	0	1	
+SspMI	CTAG	1	-1			-2	TA	defined	5prime	1	1	1	0	BfaI,FspBI,MaeI,XspI
+SstE37I	CGAAGAC	27	18			2	NN	ambiguous	3prime	27	-18	0	1	
+SstI	GAGCTC	5	-5			4	AGCT	defined	3prime	5	5	1	0	Ecl136II,Eco53kI,EcoICRI,Psp124BI,SacI,UcoMSI
+Sth132I	CCCG	8	8			-4	NNNN	ambiguous	5prime	8	-8	0	0	
+Sth20745III	GGACGAC							unknown	unknown	0	0	0	1	
+Sth302II	CCGG	2	-2			0		defined	blunt	2	2	1	0	BsiSI,HapII,HpaII,MspI
+SthSt3II	GAAGT							unknown	unknown	0	0	0	1	
+StsI	GGATG	15	14			-4	NNNN	ambiguous	5prime	15	-14	0	1	BseGI,BstF5I,BtsCI,FokI
+StuI	AGGCCT	3	-3			0		defined	blunt	3	3	1	0	Eco147I,PceI,SseBI
+StyD4I	CCNGG	0	0			-5	CCNGG	ambiguous	5prime	0	0	1	1	Bme1390I,BmrFI,BstSCI,MspR9I,ScrFI
+StyI	CCWWGG	1	-1			-4	CWWG	ambiguous	5prime	1	1	1	1	BssT1I,Eco130I,EcoT14I,ErhI
+SurP32aII	ACRGAG							unknown	unknown	0	0	0	1	
+SwaI	ATTTAAAT	4	-4			0		defined	blunt	4	4	1	1	SmiI
+Sxy1780I	GGGTNA							unknown	unknown	0	0	0	1	
+TaaI	ACNGT	3	-3			1	N	ambiguous	3prime	3	3	1	0	Bst4CI,HpyCH4III,Tsp4CI
+TagI	ACGT	2	-2			0		defined	blunt	2	2	1	0	HpyCH4IV,HpySE526I,MaeII,TaiI
+TaiI	ACGT	4	-4			4	ACGT	defined	3prime	4	4	1	0	HpyCH4IV,HpySE526I,MaeII,TagI
+TaqI	TCGA	1	-1			-2	CG	defined	5prime	1	1	1	1	EsaBC3I
+TaqII	GACCGA	17	9			2	NN	ambiguous	3prime	17	-9	0	1	
+TaqIII	CACCCA	17	9			2	NN	ambiguous	3prime	17	-9	0	1	
+TasI	AATT	0	0			-4	AATT	defined	5prime	0	0	1	0	MluCI,Sse9I,TspEI
+TatI	WGTACW	1	-1			-4	GTAC	defined	5prime	1	1	1	0	
+TauI	GCSGC	4	-4			3	CSG	ambiguous	3prime	4	4	1	0	
+TfiI	GAWTC	1	-1			-3	AWT	ambiguous	5prime	1	1	1	1	PfeI
+TkoI	GTGAAG	26	18			2	NN	ambiguous	3prime	26	-18	0	1	Cdu23823II
+TkoII	TTCAAG	16	8			2	NN	ambiguous	3prime	16	-8	0	1	
+TpyTP2I	ACCAAG							unknown	unknown	0	0	0	1	
+Tru1I	TTAA	1	-1			-2	TA	defined	5prime	1	1	1	0	MseI,SaqAI,Tru9I
+Tru9I	TTAA	1	-1			-2	TA	defined	5prime	1	1	1	0	MseI,SaqAI,Tru1I
+TscAI	CASTG	7	-7			10	NNCASTGNN	ambiguous	3prime	7	7	1	0	TspRI
+TseFI	GTSAC	0	0			-5	GTSAC	ambiguous	5prime	0	0	1	0	NmuCI,Tsp45I
+TseI	GCWGC	1	-1			-3	CWG	ambiguous	5prime	1	1	1	1	ApeKI,NhoI
+TsoI	TARCCA	17	9			2	NN	ambiguous	3prime	17	-9	0	1	
+Tsp45I	GTSAC	0	0			-5	GTSAC	ambiguous	5prime	0	0	1	1	NmuCI,TseFI
+Tsp4CI	ACNGT	3	-3			1	N	ambiguous	3prime	3	3	1	0	Bst4CI,HpyCH4III,TaaI
+TspARh3I	GRACGAC							unknown	unknown	0	0	0	1	
+TspDTI	ATGAA	16	9			2	NN	ambiguous	3prime	16	-9	0	0	
+TspEI	AATT	0	0			-4	AATT	defined	5prime	0	0	1	0	MluCI,Sse9I,TasI
+TspGWI	ACGGA	16	9			2	NN	ambiguous	3prime	16	-9	0	1	
+TspMI	CCCGGG	1	-1			-4	CCGG	defined	5prime	1	1	1	1	Cfr9I,SmaI,XmaI
+TspRI	CASTG	7	-7			10	NNCASTGNN	ambiguous	3prime	7	7	1	1	TscAI
+TssI	GAGNNNCTC							unknown	unknown	0	0	1	0	
+TstI	CACNNNNNNTCC	-8	-25	24	7	5	NNNNN	ambiguous	3prime	-8,24	25,-7	0	1	
+TsuI	GCGAC							unknown	unknown	0	0	0	0	
+Tth111I	GACNNNGTC	4	-4			-1	N	ambiguous	5prime	4	4	1	1	PflFI,PsyI
+Tth111II	CAARCA	17	9			2	NN	ambiguous	3prime	17	-9	0	1	
+UbaF11I	TCGTA							unknown	unknown	0	0	0	0	
+UbaF12I	CTACNNNGTC							unknown	unknown	0	0	0	0	
+UbaF13I	GAGNNNNNNCTGG							unknown	unknown	0	0	0	0	
+UbaF14I	CCANNNNNTCG							unknown	unknown	0	0	0	0	
+UbaF9I	TACNNNNNRTGT							unknown	unknown	0	0	0	0	
+UbaPI	CGAACG							unknown	unknown	0	0	0	0	
+UcoMSI	GAGCTC	-7	-11	11	7	-2	NN	ambiguous	5prime	-7,11	11,-7	1	0	Ecl136II,Eco53kI,EcoICRI,Psp124BI,SacI,SstI
+UnbI	GGNCC	0	0			-5	GGNCC	ambiguous	5prime	0	0	1	0	AspS9I,AsuI,BmgT120I,Cfr13I,FmuI,PspPI,Sau96I
+UpaP162I	CATG	2	-2			0		defined	blunt	2	2	1	1	CviAII,FaeI,FatI,Hin1II,Hsp92II,NlaIII
+Van9116I	CCKAAG							unknown	unknown	0	0	0	1	
+Van91I	CCANNNNNTGG	7	-7			3	NNN	ambiguous	3prime	7	7	1	0	AccB7I,PflMI
+VchE4II	RTAAAYG							unknown	unknown	0	0	0	1	
+Vdi96II	GNCYTAG							unknown	unknown	0	0	0	1	
+Vha464I	CTTAAG	1	-1			-4	TTAA	defined	5prime	1	1	1	0	AflII,BfrI,BspTI,BstAFI,MspCI
+VneI	GTGCAC	1	-1			-4	TGCA	defined	5prime	1	1	1	0	Alw44I,ApaLI
+VpaK11AI	GGWCC	0	0			-5	GGWCC	ambiguous	5prime	0	0	1	0	AvaII,Bme18I,Eco47I,Psp03I,SinI,VpaK11BI
+VpaK11BI	GGWCC	1	-1			-3	GWC	ambiguous	5prime	1	1	1	0	AvaII,Bme18I,Eco47I,Psp03I,SinI,VpaK11AI
+VpaSKIII	CGTCAG							unknown	unknown	0	0	0	1	
+VspI	ATTAAT	2	-2			-2	TA	defined	5prime	2	2	1	1	AseI,PshBI
+Vtu19109I	CACRAYC							unknown	unknown	0	0	0	1	
+WviI	CACRAG	27	19			2	NN	ambiguous	3prime	27	-19	0	1	
+XagI	CCTNNNNNAGG	5	-5			-1	N	ambiguous	5prime	5	5	1	0	BstENI,EcoNI
+XapI	RAATTY	1	-1			-4	AATT	defined	5prime	1	1	1	0	AcsI,ApoI
+XbaI	TCTAGA	1	-1			-4	CTAG	defined	5prime	1	1	1	1	
+Xca85IV	TACGAG							unknown	unknown	0	0	0	1	
+XceI	RCATGY	5	-5			4	CATG	defined	3prime	5	5	1	0	BstNSI,NspI
+XcmI	CCANNNNNNNNNTGG	8	-8			1	N	ambiguous	3prime	8	8	1	1	
+XhoI	CTCGAG	1	-1			-4	TCGA	defined	5prime	1	1	1	1	PaeR7I,SciI,Sfr274I,SlaI
+XhoII	RGATCY	1	-1			-4	GATC	defined	5prime	1	1	1	1	BstX2I,BstYI,MflI,PsuI
+XmaI	CCCGGG	1	-1			-4	CCGG	defined	5prime	1	1	1	1	Cfr9I,SmaI,TspMI
+XmaIII	CGGCCG	1	-1			-4	GGCC	defined	5prime	1	1	1	1	BseX3I,BstZI,EagI,EclXI,Eco52I
+XmaJI	CCTAGG	1	-1			-4	CTAG	defined	5prime	1	1	1	0	AspA2I,AvrII,BlnI
+XmiI	GTMKAC	2	-2			-2	MK	ambiguous	5prime	2	2	1	0	AccI,FblI
+XmnI	GAANNNNTTC	5	-5			0		defined	blunt	5	5	1	1	Asp700I,MroXI,PdmI
+XspI	CTAG	1	-1			-2	TA	defined	5prime	1	1	1	0	BfaI,FspBI,MaeI,SspMI
+YkrI	C	11	9			1	N	ambiguous	3prime	11	-9	0	0	AbaSI,BmeDI,EcoO157SI
+Yps3606I	CGGAAG							unknown	unknown	0	0	0	1	
+Yru12986I	AGGAAG							unknown	unknown	0	0	0	1	
+ZraI	GACGTC	3	-3			0		defined	blunt	3	3	1	0	AatII
+ZrmI	AGTACT	3	-3			0		defined	blunt	3	3	1	0	BmcAI,ScaI
+Zsp2I	ATGCAT	5	-5			4	TGCA	defined	3prime	5	5	1	0	AvaIII,EcoT22I,Mph1103I,NsiI,Ppu10I
+'''
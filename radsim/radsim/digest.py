@@ -1,19 +1,21 @@
 from __future__ import print_function, division, absolute_import
-from Bio.Seq import Seq
-from Bio import Restriction
-from Bio.Restriction import Analysis, RestrictionBatch
 from collections import namedtuple
-import screed
+import numpy as np
 import sys
 
-# Get all enzymes supported by the Bio.Retriction module
-RE_ENZYMES = set(Restriction.Restriction_Dictionary.rest_dict.keys())
+from . import metrics as _metrics
+from .engines import get_engine
+from .enzymes import find_enzymes, get_enzyme, names
 
+# Names of all enzymes in REBASE
+RE_ENZYMES = set(names())
 
-def list_enzymes(stream=sys.stderr):
+
+def list_enzymes(stream=sys.stderr, **filters):
+    '''Prints the name and site of the enzymes ``enzymes.find_enzymes()``
+    returns for ``filters``'''
     print("The following enzymes are supported:", file=stream)
-    for enzyme_str in RE_ENZYMES:
-        enzyme = getattr(Restriction, enzyme_str)
+    for enzyme in find_enzymes(**filters):
         print(enzyme, enzyme.site, sep='\t', file=stream)
 
 
@@ -21,30 +23,199 @@ def list_enzymes(stream=sys.stderr):
 Fragment = namedtuple('Fragment', ['lhs', 'rhs', 'lhs_enzyme', 'rhs_enzyme',
                                    'len'])
 
+# Columns of the fragment tables returned by Digest.fragments_array().
+# Enzymes are stored as codes, i.e. their index in Digest.enzymes, and contig
+# is the index of the sequence in tables covering a whole genome.
+FRAGMENT_DTYPE = np.dtype([
+    ('contig', np.int32),
+    ('lhs', np.int64),
+    ('rhs', np.int64),
+    ('len', np.int64),
+    ('lhs_enzyme', np.uint8),
+    ('rhs_enzyme', np.uint8),
+])
+
 
 class Digest(object):
     '''Class whose methods digest sequences, returning different formats'''
 
-    def __init__(self, enzyme, r2_enzyme=None):
+    def __init__(self, enzyme, r2_enzyme=None, engine='numpy',
+                 site_cache=None):
+        '''``engine`` names the site search backend to use, one of
+        ``radsim.engines.ENGINES``. All engines give identical results.
+
+        If ``site_cache`` (a ``radsim.sitecache.SiteCache``) is given,
+        ``re_sites()`` looks up the sites of sequences it caches there before
+        searching, and stores them after.'''
         # If we don't have an r2 enzyme, use the r1 enzyme
         if r2_enzyme is None:
             r2_enzyme = enzyme
-        self.enzyme = enzyme
-        self.r2_enzyme = r2_enzyme
-        self.enzyme_set = list(set([enzyme, r2_enzyme]))
+        # Enzymes may be given by name, as enzymes.Enzyme or from
+        # Bio.Restriction
+        self.enzyme = get_enzyme(enzyme)
+        self.r2_enzyme = get_enzyme(r2_enzyme)
+        # A fixed order of enzymes, used to encode them as small integers.
+        # Enzymes are searched in this order, so that where two enzymes cut at
+        # the same position, the same one is always reported.
+        self.enzymes = sorted(set([self.enzyme, self.r2_enzyme]), key=str)
+        self.engine = get_engine(engine, self.enzymes)
+        self.site_cache = site_cache
+
+    def site_arrays(self, sequence):
+        '''As ``re_sites()``, as a sorted int64 array of sites and a uint8
+        array of the enzyme at each, as an index into ``self.enzymes``'''
+        metrics = _metrics.active
+        if metrics is not None:
+            started = metrics.start()
+        cache = self.site_cache
+        if cache is not None and not cache.caches(sequence):
+            cache = None
+        if cache is not None:
+            key = cache.key(sequence, self.enzymes)
+            cached = cache.get(key, self.enzymes)
+            if cached is not None:
+                if metrics is not None:
+                    metrics.stop('site_cache', started, site_cache_hits=1,
+                                 sites=len(cached[0]))
+                return cached
+        found = self.engine.search_arrays(sequence)
+        sites = np.concatenate(
+            [np.zeros(0, dtype=np.int64)] +
+            [found[enzyme] + (enzyme.fst3 - 1) for enzyme in self.enzymes])
+        codes = np.repeat(np.arange(len(self.enzymes), dtype=np.uint8),
+                          [len(found[enzyme]) for enzyme in self.enzymes])
+        # Where enzymes cut at the same position, the last one wins
+        order = np.argsort(sites, kind='stable')
+        sites, codes = sites[order], codes[order]
+        last = np.ones(len(sites), dtype=bool)
+        last[:-1] = sites[1:] != sites[:-1]
+        sites, codes = sites[last], codes[last]
+        if cache is not None:
+            cache.put(key, self.enzymes, sites, codes)
+        if metrics is not None:
+            metrics.stop('search', started, bases_searched=len(sequence),
+                         sites=len(sites))
+        return sites, codes
 
     def re_sites(self, sequence):
-        seq = Seq(sequence)
-        # Set up analysis class with our enzymes and seq
-        rb = RestrictionBatch(self.enzyme_set)
-
-        # Do digest and reformat to dict of {site: enz, site:enz}
-        re_sites = {}
-        for enzyme, cutsites in rb.search(seq).items():
-            for cut in cutsites:
-                cut = cut + enzyme.fst3 - 1
-                re_sites[cut] = enzyme
-        return sorted(re_sites.items())
+        '''Returns a sorted list of ``(site, enzyme)`` in ``sequence``'''
+        sites, codes = self.site_arrays(sequence)
+        enzymes = self.enzymes
+        return [(site, enzymes[code])
+                for site, code in zip(sites.tolist(), codes.tolist())]
+
+    @property
+    def min_site_shift(self):
+        '''The furthest before its recognition site that a site can lie'''
+        return min(min(spec.fwd_offsets + spec.rev_offsets) +
+                   spec.enzyme.fst3 - 1 for spec in self.engine.specs)
+
+    @property
+    def window_overlap(self):
+        '''Overlap needed between windows passed to ``iter_re_sites()``'''
+        return max(spec.size for spec in self.engine.specs) - 1
+
+    @property
+    def site_reach(self):
+        '''How far beyond an interval we must read to find its sites exactly'''
+        return self.window_overlap + 1 + max(
+            max(abs(offset + spec.enzyme.fst3 - 1)
+                for offset in spec.fwd_offsets + spec.rev_offsets) +
+            abs(spec.ovhg or 0) for spec in self.engine.specs)
+
+    def region_re_sites(self, sequence, start, end):
+        '''The sites ``re_sites()`` would give within ``[start, end)`` of
+        ``sequence``, reading only that region and a margin around it.
+
+        ``sequence`` need only support ``len()`` and slicing, as do
+        ``TwoBitSequence`` and ``regions.FaidxSequence``. Sites are in the
+        coordinates of the whole sequence.
+        '''
+        reach = self.site_reach
+        pad_start = max(0, start - reach)
+        pad_end = min(len(sequence), end + reach)
+        window = (pad_start, sequence[pad_start:pad_end],
+                  pad_end == len(sequence))
+        return [(site, enzyme) for site, enzyme in self.iter_re_sites([window])
+                if start <= site < end]
+
+    def iter_re_sites(self, windows):
+        '''As ``re_sites()``, for a sequence read in overlapping windows.
+
+        ``windows`` yields ``(start, sequence, last)`` tuples, as from
+        ``seqio.iter_fasta_windows()``, overlapping by at least
+        ``window_overlap`` bases. Yields exactly the sites ``re_sites()`` would
+        give for the whole sequence, in order, holding back only those sites
+        near the end of each window that a later window might precede or that
+        might be dropped as falling past the end of the sequence.
+        '''
+        enzymes = self.enzymes
+        for sites, codes in self.iter_site_batches(windows):
+            for site, code in zip(sites.tolist(), codes.tolist()):
+                yield site, enzymes[code]
+
+    def iter_site_batches(self, windows):
+        '''As ``iter_re_sites()``, but yields the sites found after each window
+        as arrays, as ``site_arrays()`` returns'''
+        overlap = self.window_overlap
+        specs = self.engine.specs
+        min_shift = self.min_site_shift
+        # {site: [(enzyme code, cut, crick cut, droppable)]}
+        pending = {}
+        for start, sequence, last in windows:
+            metrics = _metrics.active
+            if metrics is not None:
+                started = metrics.start()
+            batch = []
+            seen = start + len(sequence)
+            # Matches are assigned to the window they start in. A match at 0
+            # is on the space Biopython prepends, which only the first window
+            # has.
+            lowest = 0 if start == 0 else 1
+            highest = len(sequence) if last else len(sequence) - overlap
+            matches = self.engine.matches(sequence)
+            for rank, (spec, (fwd, rev)) in enumerate(zip(specs, matches)):
+                fwd = fwd[(fwd >= lowest) & (fwd <= highest)] + start
+                rev = rev[(rev >= lowest) & (rev <= highest)] + start
+                cuts = spec.raw_cuts(fwd, rev)
+                crick = cuts - spec.ovhg if spec.drop else cuts
+                if spec.drop:
+                    keep = (cuts > 1) & (crick > 1)
+                    cuts, crick = cuts[keep], crick[keep]
+                sites = cuts + (spec.enzyme.fst3 - 1)
+                for site, cut, crick_cut in zip(sites.tolist(), cuts.tolist(),
+                                                crick.tolist()):
+                    pending.setdefault(site, []).append(
+                        (rank, cut, crick_cut, spec.drop))
+
+            # Later windows only have sites at or after this
+            threshold = start + highest + 1 + min_shift
+            for site in sorted(pending):
+                if not last and site >= threshold:
+                    break
+                # As in re_sites(), the last enzyme cutting here wins, unless
+                # its cut is dropped. Wait on any we can't yet decide.
+                code = None
+                undecided = False
+                candidates = sorted(pending[site], key=lambda c: -c[0])
+                for rank, cut, crick_cut, drop in candidates:
+                    if not drop or (cut <= seen and crick_cut <= seen):
+                        code = rank
+                        break
+                    if not last:
+                        # Only dropped if the sequence ends before the cut
+                        undecided = True
+                        break
+                if undecided:
+                    break
+                del pending[site]
+                if code is not None:
+                    batch.append((site, code))
+            if metrics is not None:
+                metrics.stop('search', started, bases_searched=len(sequence),
+                             sites=len(batch))
+            yield (np.array([site for site, _ in batch], dtype=np.int64),
+                   np.array([code for _, code in batch], dtype=np.uint8))
 
     def iter_fragments(self, sequence, force_different_enzymes=True, minlen=0,
                        maxlen=sys.maxsize):
@@ -60,31 +231,124 @@ class Digest(object):
         lhs/rhs are python slice intervals, i.e.:
         (first to include, first not to include)
         '''
+        return self.iter_table_fragments(self.fragments_array(
+            sequence, minlen=minlen, maxlen=maxlen,
+            force_different_enzymes=force_different_enzymes))
 
-        # loop through sites, yielding a Fragment for each
-        last_enzyme = None
-        last_start = None
-        for cut, enzyme in self.re_sites(sequence):
-            # Special case for the first site
-            if last_enzyme is None:
-                last_start = cut
-                last_enzyme = enzyme
-                continue
+    def fragments_array(self, sequence, force_different_enzymes=True,
+                        minlen=0, maxlen=sys.maxsize, contig=0):
+        '''As ``iter_fragments()``, but returns fragments as a table, a numpy
+        structured array of ``FRAGMENT_DTYPE``. Enzyme columns are indices
+        into ``self.enzymes``, and ``contig`` fills the contig column.'''
+        sites, codes = self.site_arrays(sequence)
+        return self.site_fragments_array(
+            sites, codes, minlen=minlen, maxlen=maxlen, contig=contig,
+            force_different_enzymes=force_different_enzymes)
 
-            this_end = cut + enzyme.size
+    def encode_sites(self, sites):
+        '''Converts ``(site, enzyme)`` pairs, as from ``re_sites()``, to the
+        arrays ``site_arrays()`` returns'''
+        index = {enzyme: i for i, enzyme in enumerate(self.enzymes)}
+        sites = list(sites)
+        return (np.array([site for site, _ in sites], dtype=np.int64),
+                np.array([index[enzyme] for _, enzyme in sites],
+                         dtype=np.uint8))
 
-            fraglen = this_end - last_start
-            if fraglen < minlen or fraglen > maxlen:
-                last_enzyme = enzyme
-                last_start = cut
-                continue
-            if force_different_enzymes and self.r2_enzyme is not None and self.enzyme != self.r2_enzyme and last_enzyme == enzyme:
-                last_enzyme = enzyme
-                last_start = cut
+    def site_fragments_array(self, sites, codes, force_different_enzymes=True,
+                             minlen=0, maxlen=sys.maxsize, contig=0):
+        '''Returns the table of fragments between sorted ``sites`` (see
+        ``fragments_array()``), with ``codes`` the enzyme at each.
+
+        Every site starts the next fragment, whether or not the one it ends
+        is kept, so fragments are simply consecutive pairs of sites, filtered
+        by length and (for ddRAD) by having different enzymes at each end.
+        '''
+        metrics = _metrics.active
+        if metrics is not None:
+            started = metrics.start()
+        sizes = np.array([enzyme.size for enzyme in self.enzymes],
+                         dtype=np.int64)
+        # Each fragment spans consecutive sites
+        lhs = sites[:-1]
+        rhs = sites[1:] + sizes[codes[1:]]
+        length = rhs - lhs
+        keep = (length >= minlen) & (length <= maxlen)
+        # Strict isoschizomers cut at the same sites, so are treated as one
+        if (force_different_enzymes and
+                not self.enzyme.same_cuts(self.r2_enzyme)):
+            keep &= codes[:-1] != codes[1:]
+        table = np.zeros(np.count_nonzero(keep), dtype=FRAGMENT_DTYPE)
+        table['contig'] = contig
+        table['lhs'] = lhs[keep]
+        table['rhs'] = rhs[keep]
+        table['len'] = length[keep]
+        table['lhs_enzyme'] = codes[:-1][keep]
+        table['rhs_enzyme'] = codes[1:][keep]
+        if metrics is not None:
+            metrics.stop('fragments', started, fragments=len(table))
+        return table
+
+    def different_enzymes(self, table):
+        '''Returns the fragments of a fragment table with different enzymes
+        at each end, i.e. those ``force_different_enzymes`` keeps'''
+        if self.enzyme.same_cuts(self.r2_enzyme):
+            return table
+        return table[table['lhs_enzyme'] != table['rhs_enzyme']]
+
+    def iter_table_fragments(self, table):
+        '''Yields each row of a fragment table as a ``Fragment``'''
+        enzymes = self.enzymes
+        columns = [table[name].tolist() for name in
+                   ('lhs', 'rhs', 'lhs_enzyme', 'rhs_enzyme', 'len')]
+        for lhs, rhs, lhs_enzyme, rhs_enzyme, length in zip(*columns):
+            yield Fragment(lhs=lhs, rhs=rhs, lhs_enzyme=enzymes[lhs_enzyme],
+                           rhs_enzyme=enzymes[rhs_enzyme], len=length)
+
+    def iter_window_fragments(self, windows, force_different_enzymes=True,
+                              minlen=0, maxlen=sys.maxsize):
+        '''As ``iter_fragments()``, for a sequence read in overlapping windows
+        (see ``iter_re_sites()``). Fragments may span windows.'''
+        tables = self.iter_window_fragment_tables(
+            windows, minlen=minlen, maxlen=maxlen,
+            force_different_enzymes=force_different_enzymes)
+        for table in tables:
+            for fragment in self.iter_table_fragments(table):
+                yield fragment
+
+    def iter_window_fragment_tables(self, windows, force_different_enzymes=True,
+                                    minlen=0, maxlen=sys.maxsize, contig=0):
+        '''As ``fragments_array()``, for a sequence read in overlapping
+        windows. Yields a table of the fragments completed by each window's
+        sites.'''
+        results = self.iter_window_site_tables(
+            windows, minlen=minlen, maxlen=maxlen, contig=contig,
+            force_different_enzymes=force_different_enzymes)
+        for _, _, table in results:
+            yield table
+
+    def iter_window_site_tables(self, windows, force_different_enzymes=True,
+                                minlen=0, maxlen=sys.maxsize, contig=0):
+        '''As ``iter_window_fragment_tables()``, but yields ``(sites, codes,
+        table)``: the sites found after each window, as from
+        ``iter_site_batches()``, and the fragments they complete. Windows
+        finding no sites are skipped.'''
+        sites = np.zeros(0, dtype=np.int64)
+        codes = np.zeros(0, dtype=np.uint8)
+        for new_sites, new_codes in self.iter_site_batches(windows):
+            if not len(new_sites):
                 continue
-            # Create fragment before switch below
-            fragment = Fragment(lhs=last_start, rhs=this_end, len=fraglen,
-                                lhs_enzyme=last_enzyme, rhs_enzyme=enzyme)
-            last_enzyme = enzyme
-            last_start = cut
-            yield fragment
+            # The previous batch's last site starts this batch's first fragment
+            sites = np.concatenate((sites[-1:], new_sites))
+            codes = np.concatenate((codes[-1:], new_codes))
+            yield new_sites, new_codes, self.site_fragments_array(
+                sites, codes, minlen=minlen, maxlen=maxlen, contig=contig,
+                force_different_enzymes=force_different_enzymes)
+
+    def iter_site_fragments(self, sites, force_different_enzymes=True,
+                            minlen=0, maxlen=sys.maxsize):
+        '''Yields the fragments between ``sites``, an ordered iterable of
+        ``(cut, enzyme)`` as from ``re_sites()``'''
+        sites, codes = self.encode_sites(sites)
+        return self.iter_table_fragments(self.site_fragments_array(
+            sites, codes, minlen=minlen, maxlen=maxlen,
+            force_different_enzymes=force_different_enzymes))
@@ -0,0 +1,394 @@
+from __future__ import print_function, division, absolute_import
+from collections import deque
+import itertools
+import re
+
+import numpy as np
+
+from .enzymes import get_enzyme
+
+# Upper-cases ASCII letters, leaves every other byte untouched (as
+# ``bytes.upper()`` does).
+_UPPER = np.arange(256, dtype=np.uint8)
+_UPPER[ord('a'):ord('z') + 1] -= ord('a') - ord('A')
+
+
+def _token_table(token):
+    '''Returns a boolean lookup table of the bytes matched by ``token``'''
+    table = np.zeros(256, dtype=bool)
+    if token == '.':
+        # Like the regex wildcard, match anything but a newline
+        table[:] = True
+        table[ord('\n')] = False
+    else:
+        for base in token.strip('[]'):
+            table[ord(base)] = True
+    return table
+
+
+class SiteSpec(object):
+    '''Everything a search engine needs to know about one enzyme (an
+    ``enzymes.Enzyme``).
+
+    Match positions follow the Bio.Restriction convention: they index into the
+    sequence with a single space prepended, i.e. they are 1-based for the
+    sequence itself. ``fwd_offsets``/``rev_offsets`` convert a match position
+    into the positions ``RestrictionType.search()`` reports.
+    '''
+
+    def __init__(self, enzyme):
+        self.enzyme = enzyme
+        self.name = str(enzyme)
+        self.size = enzyme.size
+        self.palindromic = enzyme.palindromic
+        self.fwd_offsets = list(enzyme.fwd_offsets)
+        self.rev_offsets = list(enzyme.rev_offsets)
+        self.ovhg = enzyme.ovhg
+        # Enzymes with unknown cut positions never drop sites on linear seqs
+        self.drop = enzyme.cut != 'unknown'
+        self.fwd_tokens = enzyme.site_tokens()
+        self.rev_tokens = None
+        # As Bio.Restriction's ``compsite``: overlapping matches of the site,
+        # or of its reverse complement in the ``rev`` group
+        pattern = '(?=(?P<fwd>{}))'.format(''.join(self.fwd_tokens))
+        if not self.palindromic:
+            self.rev_tokens = enzyme.site_tokens(-1)
+            pattern += '|(?=(?P<rev>{}))'.format(''.join(self.rev_tokens))
+        self.regex = re.compile(pattern.encode('ascii'))
+
+    def raw_cuts(self, fwd, rev):
+        '''Converts match positions to cut positions, before dropping those
+        that fall outside the sequence'''
+        parts = [fwd + off for off in self.fwd_offsets]
+        if not self.palindromic:
+            parts.extend(rev + off for off in self.rev_offsets)
+        return np.concatenate(parts) if parts else np.zeros(0, dtype=np.int64)
+
+    def cut_positions(self, fwd, rev, length):
+        '''Converts match positions to cut positions, as Biopython reports
+
+        ``fwd`` and ``rev`` are arrays of match positions on the top and bottom
+        strand, and ``length`` is the length of the searched sequence.
+        '''
+        cuts = self.raw_cuts(fwd, rev)
+        if self.drop:
+            crick = cuts - self.ovhg
+            keep = (cuts > 1) & (cuts <= length) & (crick > 1) & (crick <= length)
+            cuts = cuts[keep]
+        return cuts
+
+
+class SearchEngine(object):
+    '''Base class for restriction site search backends.
+
+    Engines are built once per ``Digest`` from a sequence of enzymes (names,
+    ``enzymes.Enzyme``s or Bio.Restriction enzymes), and their ``search()``
+    method returns the same mapping as ``RestrictionBatch.search()``:
+    ``{enzyme: [cut positions]}``, in the order of ``enzymes``, with each
+    enzyme an ``enzymes.Enzyme``.
+    '''
+    name = None
+
+    def __init__(self, enzymes):
+        self.enzymes = [get_enzyme(enzyme) for enzyme in enzymes]
+        self.specs = [SiteSpec(enzyme) for enzyme in self.enzymes]
+
+    def matches(self, sequence):
+        '''Finds recognition sites of each enzyme in ``sequence``.
+
+        Returns a list with a ``(fwd, rev)`` tuple of int64 arrays of match
+        positions per enzyme, in the order of ``self.specs``.
+        '''
+        raise NotImplementedError
+
+    def search_arrays(self, sequence):
+        '''As ``search()``, but with cut positions as int64 arrays'''
+        length = len(sequence)
+        found = {}
+        for spec, (fwd, rev) in zip(self.specs, self.matches(sequence)):
+            found[spec.enzyme] = spec.cut_positions(fwd, rev, length)
+        return found
+
+    def search(self, sequence):
+        return {enzyme: cuts.tolist()
+                for enzyme, cuts in self.search_arrays(sequence).items()}
+
+
+def _as_bytes(sequence):
+    '''Sequences may be str, bytes, or provide ``tobytes()`` (e.g. a
+    ``TwoBitSequence``)'''
+    if isinstance(sequence, bytes):
+        return sequence
+    if hasattr(sequence, 'tobytes'):
+        return sequence.tobytes()
+    return sequence.encode('ascii')
+
+
+def _regex_matches(spec, data):
+    '''Matches ``spec``'s compsite regex over ``data``, which must already
+    have the leading space and be upper case.'''
+    fwd, rev = [], []
+    for match in spec.regex.finditer(data):
+        if spec.palindromic or match.group('fwd') is not None:
+            fwd.append(match.start())
+        else:
+            rev.append(match.start())
+    return np.array(fwd, dtype=np.int64), np.array(rev, dtype=np.int64)
+
+
+class BiopythonEngine(SearchEngine):
+    '''Reference engine, which defers to Bio.Restriction'''
+    name = 'biopython'
+
+    def __init__(self, enzymes):
+        super(BiopythonEngine, self).__init__(enzymes)
+        # Bio.Restriction is slow to import, and only this engine needs it
+        from Bio import Restriction
+        self.bio_enzymes = [getattr(Restriction, spec.name)
+                            for spec in self.specs]
+
+    @staticmethod
+    def _formatted_seq(sequence):
+        from Bio.Restriction.Restriction import FormattedSeq
+        from Bio.Seq import Seq
+        return FormattedSeq(Seq(_as_bytes(sequence)))
+
+    def matches(self, sequence):
+        fseq = self._formatted_seq(sequence)
+        found = []
+        for spec, bio_enzyme in zip(self.specs, self.bio_enzymes):
+            fwd, rev = [], []
+            for start, group in fseq.finditer(bio_enzyme.compsite, spec.size):
+                if spec.palindromic or group(spec.name):
+                    fwd.append(start)
+                else:
+                    rev.append(start)
+            found.append((np.array(fwd, dtype=np.int64),
+                          np.array(rev, dtype=np.int64)))
+        return found
+
+    def search(self, sequence):
+        # Equivalent to RestrictionBatch.search(), without the batch caching a
+        # copy of the last sequence searched.
+        fseq = self._formatted_seq(sequence)
+        return {enzyme: bio_enzyme.search(fseq) for enzyme, bio_enzyme in
+                zip(self.enzymes, self.bio_enzymes)}
+
+    def search_arrays(self, sequence):
+        return {enzyme: np.array(cuts, dtype=np.int64)
+                for enzyme, cuts in self.search(sequence).items()}
+
+
+class BytesEngine(SearchEngine):
+    '''Runs each enzyme's ``compsite`` regex directly over the sequence bytes'''
+    name = 'bytes'
+
+    def matches(self, sequence):
+        data = b' ' + _as_bytes(sequence).upper()
+        return [_regex_matches(spec, data) for spec in self.specs]
+
+
+class NumpyEngine(SearchEngine):
+    '''Vectorised engine working on the sequence as a uint8 array.
+
+    Each site is matched by filtering candidate positions one site position at
+    a time, starting from the most specific one, so that every pass after the
+    first only touches the remaining candidates.
+    '''
+    name = 'numpy'
+
+    def __init__(self, enzymes):
+        super(NumpyEngine, self).__init__(enzymes)
+        self.patterns = []
+        for spec in self.specs:
+            fwd = self._compile(spec.fwd_tokens)
+            rev = self._compile(spec.rev_tokens) if spec.rev_tokens else None
+            self.patterns.append((fwd, rev))
+
+    @staticmethod
+    def _compile(tokens):
+        tables = [(pos, _token_table(tok)) for pos, tok in enumerate(tokens)]
+        # Most specific positions first
+        tables.sort(key=lambda pt: pt[1].sum())
+        return len(tokens), tables
+
+    @staticmethod
+    def encode(sequence):
+        '''Encodes ``sequence`` as an upper-cased uint8 array, with a leading
+        space so that array indices are Biopython match positions.'''
+        arr = np.empty(len(sequence) + 1, dtype=np.uint8)
+        arr[0] = ord(' ')
+        arr[1:] = np.frombuffer(_as_bytes(sequence), dtype=np.uint8)
+        return _UPPER[arr]
+
+    @staticmethod
+    def _find(arr, pattern):
+        size, tables = pattern
+        nstarts = len(arr) - size + 1
+        if nstarts <= 0:
+            return np.zeros(0, dtype=np.int64)
+        pos, table = tables[0]
+        starts = np.flatnonzero(table[arr[pos:pos + nstarts]])
+        for pos, table in tables[1:]:
+            if len(starts) == 0:
+                break
+            starts = starts[table[arr[starts + pos]]]
+        return starts.astype(np.int64)
+
+    def matches(self, sequence):
+        arr = self.encode(sequence)
+        found = []
+        for spec, (fwd_pat, rev_pat) in zip(self.specs, self.patterns):
+            fwd = self._find(arr, fwd_pat)
+            if rev_pat is None:
+                rev = np.zeros(0, dtype=np.int64)
+            else:
+                # A top-strand match takes precedence at the same position
+                rev = np.setdiff1d(self._find(arr, rev_pat), fwd,
+                                   assume_unique=True)
+            found.append((fwd, rev))
+        return found
+
+
+# Symbols of the Aho-Corasick alphabet: the four bases, any other byte, and
+# newline (which, as for the regex wildcard, nothing matches).
+_AC_BASES = 'ACGT'
+_AC_OTHER = 4
+_AC_NEWLINE = 5
+_AC_NSYMBOLS = 6
+_AC_TABLE = bytearray([_AC_OTHER]) * 256
+for _i, _base in enumerate(_AC_BASES):
+    _AC_TABLE[ord(_base)] = _AC_TABLE[ord(_base.lower())] = _i
+_AC_TABLE[ord('\n')] = _AC_NEWLINE
+_AC_TABLE = bytes(_AC_TABLE)
+
+
+def _token_symbols(token):
+    if token == '.':
+        return tuple(range(_AC_NEWLINE))
+    return tuple(_AC_BASES.index(base) for base in token.strip('[]'))
+
+
+class AhoCorasickEngine(SearchEngine):
+    '''Finds the sites of every enzyme in a single pass over the sequence.
+
+    All sites, expanded over their degenerate positions, and their reverse
+    complements are compiled into one Aho-Corasick automaton, so the cost of a
+    search barely depends on the number of enzymes. Sites whose expansion would
+    exceed ``max_expansions`` patterns (e.g. those with long runs of N) are
+    searched for with their regex instead.
+    '''
+    name = 'aho-corasick'
+
+    def __init__(self, enzymes, max_expansions=4096):
+        super(AhoCorasickEngine, self).__init__(enzymes)
+        self.max_expansions = max_expansions
+        self.fallback = []
+        patterns = []
+        for idx, spec in enumerate(self.specs):
+            strands = [spec.fwd_tokens]
+            if spec.rev_tokens:
+                strands.append(spec.rev_tokens)
+            choices = [[_token_symbols(tok) for tok in tokens]
+                       for tokens in strands]
+            nexpand = sum(np.prod([len(c) for c in ch]) for ch in choices)
+            if nexpand > max_expansions:
+                self.fallback.append(idx)
+                continue
+            for strand, symbols in enumerate(choices):
+                for pattern in itertools.product(*symbols):
+                    patterns.append((pattern, idx * 2 + strand))
+        self._build(patterns)
+
+    def _build(self, patterns):
+        '''Builds the automaton as a dense DFA transition table.
+
+        States are pre-multiplied by the alphabet size so that the transition
+        from ``state`` on ``sym`` is simply ``delta[state + sym]``.
+        '''
+        width = _AC_NSYMBOLS
+        children = [{}]
+        outputs = [[]]
+        for pattern, slot in patterns:
+            node = 0
+            for sym in pattern:
+                nxt = children[node].get(sym)
+                if nxt is None:
+                    nxt = len(children)
+                    children[node][sym] = nxt
+                    children.append({})
+                    outputs.append([])
+                node = nxt
+            outputs[node].append((slot, len(pattern) - 1))
+
+        delta = [0] * (len(children) * width)
+        fail = [0] * len(children)
+        queue = deque()
+        for sym, child in children[0].items():
+            delta[sym] = child * width
+            queue.append(child)
+        while queue:
+            node = queue.popleft()
+            outputs[node].extend(outputs[fail[node]])
+            for sym in range(width):
+                child = children[node].get(sym)
+                if child is None:
+                    delta[node * width + sym] = delta[fail[node] * width + sym]
+                else:
+                    fail[child] = delta[fail[node] * width + sym] // width
+                    delta[node * width + sym] = child * width
+                    queue.append(child)
+        self.delta = delta
+        self.outputs = [None] * len(delta)
+        for node, out in enumerate(outputs):
+            if out:
+                self.outputs[node * width] = tuple(out)
+
+    def _scan(self, data):
+        hits = [[] for _ in range(len(self.specs) * 2)]
+        delta = self.delta
+        outputs = self.outputs
+        state = 0
+        for i, sym in enumerate(bytearray(data.translate(_AC_TABLE))):
+            state = delta[state + sym]
+            out = outputs[state]
+            if out is not None:
+                for slot, back in out:
+                    hits[slot].append(i - back)
+        return hits
+
+    def matches(self, sequence):
+        data = b' ' + _as_bytes(sequence).upper()
+        hits = self._scan(data)
+        found = []
+        for idx, spec in enumerate(self.specs):
+            fwd = np.array(hits[idx * 2], dtype=np.int64)
+            rev = np.array(hits[idx * 2 + 1], dtype=np.int64)
+            if len(rev):
+                # A top-strand match takes precedence at the same position
+                rev = np.setdiff1d(rev, fwd, assume_unique=True)
+            found.append((fwd, rev))
+        for idx in self.fallback:
+            found[idx] = _regex_matches(self.specs[idx], data)
+        return found
+
+
+ENGINES = {
+    AhoCorasickEngine.name: AhoCorasickEngine,
+    BiopythonEngine.name: BiopythonEngine,
+    BytesEngine.name: BytesEngine,
+    NumpyEngine.name: NumpyEngine,
+}
+
+
+def get_engine(name, enzymes, **kwargs):
+    '''Creates the search engine called ``name`` for ``enzymes``
+
+    Extra keyword arguments are passed on to the engine's constructor.
+    '''
+    try:
+        engine_class = ENGINES[name]
+    except KeyError:
+        raise ValueError("Unknown search engine '{}', choose from: {}".format(
+            name, ', '.join(sorted(ENGINES))))
+    return engine_class(enzymes, **kwargs)
@@ -0,0 +1,256 @@
+'''Restriction enzymes, from a table compiled from REBASE.
+
+The table (``_enzyme_table.py``) is generated from the REBASE data Biopython
+ships, by running this module with Biopython installed::
+
+    python -m radsim.enzymes radsim/_enzyme_table.py
+
+Loading it is a single string constant, and enzymes are only found and parsed
+when first looked up, so using a few enzymes costs microseconds rather than the
+fraction of a second importing ``Bio.Restriction`` takes.
+'''
+from __future__ import print_function, division, absolute_import
+from collections import namedtuple
+import sys
+
+# IUPAC codes, as matched by the regexes Bio.Restriction builds from sites
+_IUPAC = {
+    'A': 'A', 'C': 'C', 'G': 'G', 'T': 'T',
+    'R': '[AG]', 'Y': '[CT]', 'S': '[CG]', 'W': '[AT]', 'K': '[GT]',
+    'M': '[AC]', 'B': '[CGT]', 'D': '[AGT]', 'H': '[ACT]', 'V': '[ACG]',
+    'N': '.',
+}
+_COMPLEMENT = {
+    'A': 'T', 'C': 'G', 'G': 'C', 'T': 'A',
+    'R': 'Y', 'Y': 'R', 'S': 'S', 'W': 'W', 'K': 'M',
+    'M': 'K', 'B': 'V', 'D': 'H', 'H': 'D', 'V': 'B',
+    'N': 'N',
+}
+
+# Kinds of end an enzyme leaves, and whether its cut positions are known
+OVERHANGS = ('5prime', '3prime', 'blunt', 'unknown')
+CUTS = ('defined', 'ambiguous', 'unknown')
+
+
+class Enzyme(namedtuple('Enzyme', [
+        'name', 'site', 'size', 'fst5', 'fst3', 'scd5', 'scd3', 'ovhg',
+        'ovhgseq', 'cut', 'overhang', 'fwd_offsets', 'rev_offsets',
+        'palindromic', 'methylable', 'isoschizomers'])):
+    '''A restriction enzyme.
+
+    Fields follow Bio.Restriction: ``fst5``/``fst3`` (and ``scd5``/``scd3``
+    for enzymes cutting twice) give the cuts relative to the recognition
+    ``site``, ``ovhg`` the overhang length (negative for 5' overhangs), and
+    ``fwd_offsets``/``rev_offsets`` convert a match position on the top and
+    bottom strand to cut positions, as ``RestrictionType._modify()`` and
+    ``_rev_modify()`` do. Unknown values are None. ``cut`` is one of ``CUTS``,
+    ``overhang`` one of ``OVERHANGS``, ``methylable`` is whether REBASE lists
+    the enzyme as sensitive to methylation of its site, and ``isoschizomers``
+    names the other enzymes recognising the same site.
+
+    Converts to a string, and its repr, as its name, and compares equal to the
+    Bio.Restriction enzyme of that name, so either can be given to, and
+    compared with those from, ``Digest``.
+    '''
+    __slots__ = ()
+
+    def __str__(self):
+        return self.name
+
+    # So Fragments and test failures print enzymes readably
+    __repr__ = __str__
+
+    def __eq__(self, other):
+        if isinstance(other, Enzyme):
+            return tuple.__eq__(self, other)
+        # Bio.Restriction enzymes are classes, named as they convert to str
+        return (isinstance(other, type) and hasattr(other, 'charac') and
+                str(other) == self.name)
+
+    def __ne__(self, other):
+        return not self == other
+
+    def __hash__(self):
+        return hash(self.name)
+
+    @property
+    def charac(self):
+        return self.fst5, self.fst3, self.scd5, self.scd3, self.site
+
+    def same_cuts(self, other):
+        '''True if ``other`` recognises the same site and cuts it in the same
+        places, i.e. is a strict isoschizomer (as Bio.Restriction's ``!=``
+        is False for).'''
+        return self.charac == other.charac
+
+    def site_tokens(self, strand=1):
+        '''The recognition site as regex tokens, one per base: a base, a
+        character class or ``.``. ``strand`` -1 gives the reverse
+        complement.'''
+        site = _searched(self.site)
+        if strand < 0:
+            site = ''.join(_COMPLEMENT[base] for base in reversed(site))
+        return [_IUPAC[base] for base in site]
+
+
+# Enzymes parsed so far, by name
+_enzymes = {}
+
+
+def _table_line(name):
+    '''The line of the table describing enzyme ``name``, or None'''
+    from ._enzyme_table import TABLE
+    # Every line, including the first, follows a newline
+    start = TABLE.find('\n' + name + '\t')
+    if start < 0:
+        return None
+    return TABLE[start + 1:TABLE.index('\n', start + 1)]
+
+
+def _searched(site):
+    # A few sites list alternatives, as 'SITE1|SITE2', but like
+    # Bio.Restriction, only the first is searched for
+    return site.partition('|')[0]
+
+
+def _int(field):
+    return int(field) if field else None
+
+
+def _ints(field):
+    return tuple(int(value) for value in field.split(',')) if field else ()
+
+
+def _parse(line):
+    (name, site, fst5, fst3, scd5, scd3, ovhg, ovhgseq, cut, overhang,
+     fwd_offsets, rev_offsets, palindromic, methylable,
+     isoschizomers) = line.split('\t')
+    ovhg = _int(ovhg)
+    return Enzyme(
+        name=name, site=site, size=len(_searched(site)), fst5=_int(fst5),
+        fst3=_int(fst3), scd5=_int(scd5), scd3=_int(scd3), ovhg=ovhg,
+        # Blunt ends have an empty overhang, unknown ones None
+        ovhgseq=None if ovhg is None else ovhgseq, cut=cut,
+        overhang=overhang,
+        fwd_offsets=_ints(fwd_offsets), rev_offsets=_ints(rev_offsets),
+        palindromic=palindromic == '1', methylable=methylable == '1',
+        isoschizomers=tuple(isoschizomers.split(',')) if isoschizomers
+        else ())
+
+
+def names():
+    '''The names of all enzymes, in alphabetical order'''
+    from ._enzyme_table import TABLE
+    return [line.partition('\t')[0] for line in TABLE.split('\n')[1:-1]]
+
+
+def get_enzyme(enzyme):
+    '''Returns the ``Enzyme`` named ``enzyme``, which may also be an
+    ``Enzyme`` or a Bio.Restriction enzyme. Raises ValueError if it's not
+    known.'''
+    if isinstance(enzyme, Enzyme):
+        return enzyme
+    name = str(enzyme)
+    found = _enzymes.get(name)
+    if found is None:
+        line = _table_line(name)
+        if line is None:
+            raise ValueError("Unknown enzyme '{}'".format(name))
+        found = _enzymes[name] = _parse(line)
+    return found
+
+
+def find_enzymes(site_lengths=None, overhangs=None, defined=False,
+                 methylable=None):
+    '''Returns the enzymes, sorted by name, with a site of one of
+    ``site_lengths`` bases, leaving one of ``overhangs`` (see
+    ``OVERHANGS``), with known cuts if ``defined``, and if ``methylable`` is
+    not None, blocked by methylation or not. Filters that are None pass any
+    enzyme.'''
+    found = []
+    for name in names():
+        enzyme = get_enzyme(name)
+        if site_lengths is not None and enzyme.size not in site_lengths:
+            continue
+        if overhangs is not None and enzyme.overhang not in overhangs:
+            continue
+        if defined and enzyme.cut == 'unknown':
+            continue
+        if methylable is not None and enzyme.methylable != methylable:
+            continue
+        found.append(enzyme)
+    return found
+
+
+def write_enzymes(enzymes, stream=sys.stdout):
+    '''Writes a table describing each of ``enzymes``'''
+    print('enzyme', 'site', 'size', 'cuts', 'overhang', 'overhang_seq',
+          'methylable', 'isoschizomers', sep='\t', file=stream)
+    for enzyme in enzymes:
+        cuts = [enzyme.fst5, enzyme.fst3, enzyme.scd5, enzyme.scd3]
+        print(enzyme.name, enzyme.site, enzyme.size,
+              ','.join('.' if cut is None else str(cut) for cut in cuts),
+              enzyme.overhang, enzyme.ovhgseq or '.',
+              'yes' if enzyme.methylable else 'no',
+              ','.join(enzyme.isoschizomers) or '.', sep='\t', file=stream)
+
+
+def __getattr__(name):
+    # Enzymes as attributes, like Bio.Restriction: radsim.enzymes.PstI
+    try:
+        return get_enzyme(name)
+    except ValueError:
+        raise AttributeError("module {!r} has no attribute {!r}".format(
+            __name__, name))
+
+
+def _bio_row(enzyme, isoschizomers):
+    from Bio.Restriction import Restriction
+    if enzyme.is_5overhang():
+        overhang = '5prime'
+    elif enzyme.is_3overhang():
+        overhang = '3prime'
+    elif enzyme.is_blunt():
+        overhang = 'blunt'
+    else:
+        overhang = 'unknown'
+    if issubclass(enzyme, Restriction.NotDefined):
+        cut = 'unknown'
+    elif issubclass(enzyme, Restriction.Ambiguous):
+        cut = 'ambiguous'
+    else:
+        cut = 'defined'
+    assert enzyme.size == len(_searched(enzyme.site)), enzyme
+    values = [str(enzyme), enzyme.site, enzyme.fst5, enzyme.fst3,
+              enzyme.scd5, enzyme.scd3, enzyme.ovhg, enzyme.ovhgseq, cut,
+              overhang, ','.join(map(str, enzyme._modify(0))),
+              ','.join(map(str, enzyme._rev_modify(0))),
+              int(enzyme.is_palindromic()), int(enzyme.is_methylable()),
+              ','.join(isoschizomers)]
+    return '\t'.join('' if value is None else str(value) for value in values)
+
+
+def build_table(stream):
+    '''Writes the ``_enzyme_table`` module, from Bio.Restriction'''
+    import Bio
+    from Bio import Restriction
+    from Bio.Restriction.Restriction_Dictionary import rest_dict
+    enzymes = [getattr(Restriction, name) for name in sorted(rest_dict)]
+    by_site = {}
+    for enzyme in enzymes:
+        by_site.setdefault(enzyme.site, []).append(str(enzyme))
+    print('# Generated by ``python -m radsim.enzymes`` from the REBASE data '
+          'in', file=stream)
+    print('# Biopython {}. Do not edit. Columns are the fields of '
+          '``enzymes.Enzyme``.'.format(Bio.__version__), file=stream)
+    print("TABLE = '''", file=stream)
+    for enzyme in enzymes:
+        isoschizomers = [name for name in by_site[enzyme.site]
+                         if name != str(enzyme)]
+        print(_bio_row(enzyme, isoschizomers), file=stream)
+    print("'''", file=stream)
+
+
+if __name__ == '__main__':
+    with open(sys.argv[1], 'w') as fh:
+        build_table(fh)
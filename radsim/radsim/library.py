@@ -0,0 +1,159 @@
+from __future__ import print_function, division, absolute_import
+import numpy as np
+
+from .utils import stream_key
+
+# Columns of the coverage tables returned by LibraryModel.simulate(), one row
+# per fragment: the fraction of fragments surviving size selection, the
+# expected number of reads, and the sampled number of molecules in the
+# library, of reads, and of reads that aren't PCR duplicates.
+COVERAGE_DTYPE = np.dtype([
+    ('selected', np.float64),
+    ('expected', np.float64),
+    ('molecules', np.int64),
+    ('reads', np.int64),
+    ('unique', np.int64),
+])
+
+
+def _logistic(x):
+    # As 1 / (1 + exp(-x)), without overflowing far from 0
+    return 0.5 * (1 + np.tanh(x / 2))
+
+
+class BeadSelection(object):
+    '''Double-sided bead (e.g. SPRI) size selection: the fraction of fragments
+    of each length kept rises, and then falls, as logistic curves, reaching
+    half at ``lower`` and ``upper``. ``width`` is the number of bases over
+    which each curve goes from a quarter to three quarters.'''
+
+    def __init__(self, lower, upper, width=50):
+        if upper < lower:
+            raise ValueError("Size selection range is empty")
+        if width <= 0:
+            raise ValueError("Size selection width must be positive")
+        self.lower = lower
+        self.upper = upper
+        # Logistic curves go from 1/4 to 3/4 over 2 * ln(3) scale units
+        self.scale = width / (2 * np.log(3))
+
+    def __call__(self, lengths):
+        lengths = np.asarray(lengths, dtype=np.float64)
+        return (_logistic((lengths - self.lower) / self.scale) *
+                _logistic((self.upper - lengths) / self.scale))
+
+
+class GelSelection(object):
+    '''Gel excision: the fraction of fragments kept is a normal curve around
+    the middle of ``[lower, upper]``, with ``lower`` and ``upper`` two
+    standard deviations from it'''
+
+    def __init__(self, lower, upper):
+        if upper <= lower:
+            raise ValueError("Size selection range is empty")
+        self.mean = (lower + upper) / 2
+        self.sd = (upper - lower) / 4
+
+    def __call__(self, lengths):
+        lengths = np.asarray(lengths, dtype=np.float64)
+        return np.exp(-0.5 * ((lengths - self.mean) / self.sd) ** 2)
+
+
+class LibraryModel(object):
+    '''Models the reads a library of digested fragments gives.
+
+    Each of ``copies`` genome copies contributes each fragment to the library
+    with the probability ``selection`` (a function of fragment length, e.g. a
+    ``BeadSelection``; by default all are kept) gives. Molecules are then
+    amplified over ``pcr_cycles`` cycles, with a per-cycle efficiency of
+    ``pcr_efficiency`` falling exponentially with length, by a factor of e
+    every ``pcr_decay`` bases. Finally ``reads`` reads are sequenced, each from
+    a molecule chosen in proportion to its amplified abundance. Reads from a
+    molecule already read are PCR duplicates.
+
+    Random numbers for each contig come from a stream seeded by ``seed``, the
+    contig's name and (for regions) its start, and only the split of reads
+    between contigs uses a shared stream, so results are the same however the
+    contigs were digested (serially, on several threads, or in chunks).
+    '''
+
+    def __init__(self, copies=1000, selection=None, pcr_cycles=12,
+                 pcr_efficiency=0.95, pcr_decay=2000, reads=1000000,
+                 seed=None):
+        self.copies = copies
+        self.selection = selection
+        self.pcr_cycles = pcr_cycles
+        self.pcr_efficiency = pcr_efficiency
+        self.pcr_decay = pcr_decay
+        self.reads = reads
+        # Fix the entropy, so contig streams agree even without a seed
+        self.seed = np.random.SeedSequence(seed).entropy
+
+    def rng(self, name=None, start=0):
+        '''Returns the random generator for contig ``name`` (or the region of
+        it from ``start``), or if None, the one splitting reads between
+        contigs'''
+        key = () if name is None else stream_key(name, start)
+        return np.random.default_rng(
+            np.random.SeedSequence(self.seed, spawn_key=key))
+
+    def selected(self, lengths):
+        '''The fraction of fragments of each of ``lengths`` kept by size
+        selection'''
+        if self.selection is None:
+            return np.ones(len(lengths))
+        return self.selection(lengths)
+
+    def amplification(self, lengths):
+        '''The number of copies each molecule of each of ``lengths`` has after
+        PCR'''
+        lengths = np.asarray(lengths, dtype=np.float64)
+        efficiency = self.pcr_efficiency * np.exp(-lengths / self.pcr_decay)
+        return (1 + efficiency) ** self.pcr_cycles
+
+    def simulate(self, contigs, starts=None):
+        '''Simulates coverage of ``contigs``, a list of ``(name, table)``
+        where ``table`` is a fragment table (see
+        ``Digest.fragments_array()``). ``starts`` are where each contig
+        starts in its sequence, if they are regions. Returns a coverage table
+        (of ``COVERAGE_DTYPE``) for each, in the same order.'''
+        if starts is None:
+            starts = [0] * len(contigs)
+        coverages = []
+        sampled = []
+        for (name, table), start in zip(contigs, starts):
+            coverage = np.zeros(len(table), dtype=COVERAGE_DTYPE)
+            coverage['selected'] = self.selected(table['len'])
+            amplification = self.amplification(table['len'])
+            rng = self.rng(name, start)
+            coverage['molecules'] = rng.binomial(self.copies,
+                                                 coverage['selected'])
+            coverages.append(coverage)
+            sampled.append((rng, coverage['molecules'] * amplification))
+            # Expected reads, until divided by the genome total below
+            coverage['expected'] = (self.copies * coverage['selected'] *
+                                    amplification)
+
+        expected_total = sum(coverage['expected'].sum()
+                             for coverage in coverages)
+        if expected_total > 0:
+            for coverage in coverages:
+                coverage['expected'] *= self.reads / expected_total
+        totals = np.array([weights.sum() for _, weights in sampled])
+        if not totals.sum():
+            return coverages
+        contig_reads = self.rng().multinomial(self.reads,
+                                              totals / totals.sum())
+        for coverage, (rng, weights), n, total in zip(
+                coverages, sampled, contig_reads.tolist(), totals.tolist()):
+            if not n:
+                continue
+            reads = rng.multinomial(n, weights / total)
+            coverage['reads'] = reads
+            # Reads pick a fragment's molecules uniformly, so each molecule is
+            # read with probability 1 - (1 - 1/molecules)^reads
+            molecules = np.maximum(coverage['molecules'], 1)
+            unique = rng.binomial(coverage['molecules'],
+                                  1 - (1 - 1 / molecules) ** reads)
+            coverage['unique'] = np.minimum(unique, reads)
+        return coverages
@@ -1,28 +1,110 @@
 from __future__ import print_function, division, absolute_import
-from collections import Counter
 from argparse import ArgumentParser, FileType
+import os
 import sys
 
-import numpy as np
-import screed
+# Commands are run many times on small inputs, so startup time matters. Each
+# entry point imports only the modules it uses (NumPy, Biopython and screed
+# are slow to import), when it runs, so e.g. --help is quick.
 
-from .digest import Digest
-from .utils import (
-    clamp,
-    output_frag_fasta,
-    output_bed,
-    perror,
-    seqfile_iter_frags,
-)
+# The names of engines.ENGINES, and enzymes.OVERHANGS, without importing them
+ENGINE_NAMES = ('aho-corasick', 'biopython', 'bytes', 'numpy')
+OVERHANGS = ('5prime', '3prime', 'blunt', 'unknown')
 
 
-def add_common_args(ap):
+def add_genome_args(ap):
     ap.add_argument('--genome', '-i', required=True, type=str,
-                    help='Genome sequence (in fasta format)')
+                    help='Genome sequence (in fasta or .2bit format)')
+    ap.add_argument('--genome-cache', default=None, metavar='FILE',
+                    help='Read the genome from this .2bit file, creating it '
+                    'from --genome if it is missing or out of date')
+
+
+def genome_file(args):
+    '''Returns the genome file to read, creating --genome-cache if needed'''
+    cache = args.genome_cache
+    if cache is None:
+        return args.genome
+    if (not os.path.exists(cache) or
+            os.path.getmtime(cache) < os.path.getmtime(args.genome)):
+        from .twobit import fasta_to_twobit
+        # Write then rename, so concurrent runs never see a partial cache
+        tmp = '{}.{}.tmp'.format(cache, os.getpid())
+        fasta_to_twobit(args.genome, tmp)
+        os.rename(tmp, cache)
+    return cache
+
+
+def add_common_args(ap):
+    add_genome_args(ap)
     ap.add_argument('--enzyme', '-e', required=True,
                     help='Restriction enzyme name')
     ap.add_argument('--enzyme2', '-r', default=None,
                     help='Second restriction enzyme name (for ddRAD, etc)')
+    ap.add_argument('--engine', default='numpy', choices=ENGINE_NAMES,
+                    help='Restriction site search backend (default numpy)')
+    ap.add_argument('--threads', '-t', default=1, type=int,
+                    help='Number of worker processes (default 1)')
+    ap.add_argument('--region', action='append', default=[],
+                    metavar='CHR:START-END',
+                    help='Only digest this region (1-based, inclusive; may be '
+                    'given more than once)')
+    ap.add_argument('--regions', default=None, metavar='BED',
+                    help='Only digest the regions in this BED file')
+    ap.add_argument('--site-cache', default=None, metavar='DIR',
+                    help='Reuse RE sites found in previous runs, stored in '
+                    'this directory (not used with --regions or --chunk-size)')
+    ap.add_argument('--site-cache-size', default=1024, type=int, metavar='MB',
+                    help='Delete the least recently used cached sites to '
+                    'keep --site-cache under this size (default 1024)')
+    ap.add_argument('--no-progress', action='store_true',
+                    help="Don't show progress (only shown if stderr is a "
+                    "terminal)")
+
+
+def make_digest(args):
+    '''Returns the Digest the common arguments describe'''
+    from .digest import Digest
+    site_cache = None
+    if args.site_cache:
+        from .sitecache import SiteCache
+        site_cache = SiteCache(args.site_cache,
+                               max_bytes=args.site_cache_size * 1024 * 1024)
+    return Digest(args.enzyme, args.enzyme2, engine=args.engine,
+                  site_cache=site_cache)
+
+
+def genome_regions(ap, args):
+    '''Returns the regions to digest as (chr, start, end), or None for all'''
+    if not (args.region or args.regions):
+        return None
+    if args.threads > 1 or getattr(args, 'chunk_size', None):
+        ap.error("--region(s) can't be combined with --threads or --chunk-size")
+    from .regions import check_indexable, parse_region, read_bed_regions
+    try:
+        check_indexable(genome_file(args))
+        regions = [parse_region(region) for region in args.region]
+    except ValueError as exc:
+        ap.error(str(exc))
+    if args.regions:
+        regions.extend(read_bed_regions(args.regions))
+    return regions
+
+
+def make_progress(ap, args):
+    '''Returns a Progress for the genome (or regions) being digested, or None
+    if progress isn't to be shown'''
+    if args.no_progress or not sys.stderr.isatty():
+        return None
+    from .progress import Progress, genome_size
+    regions = genome_regions(ap, args)
+    if regions is None:
+        total = genome_size(genome_file(args))
+    elif all(end is not None for _, _, end in regions):
+        total = sum(end - start for _, start, end in regions)
+    else:
+        total = None
+    return Progress(total)
 
 
 def add_frag_len_args(ap):
@@ -32,6 +114,109 @@ def add_frag_len_args(ap):
                     help='Minimum fragment size')
 
 
+def add_chunk_args(ap):
+    ap.add_argument('--chunk-size', '-c', default=None, type=int,
+                    metavar='BASES',
+                    help='Read and digest each sequence in windows of this '
+                    'many bases, bounding memory use for huge chromosomes')
+
+
+def add_compress_args(ap):
+    ap.add_argument('--compress-threads', default=4, type=int, metavar='N',
+                    help='Number of threads compressing .gz output (default 4)')
+
+
+def add_metrics_args(ap):
+    ap.add_argument('--profile', action='store_true',
+                    help='Print the time spent in each stage, and a profile '
+                    'of the slowest functions, to stderr')
+    ap.add_argument('--metrics-json', default=None, metavar='FILE',
+                    help='Write timings, counts of bases, sites, fragments '
+                    'and bytes, and peak memory use to FILE as JSON')
+
+
+def start_metrics(args, command):
+    '''Starts collecting metrics if they were asked for, returning the
+    ``metrics.Session`` to pass to ``finish_metrics()``'''
+    if not (args.profile or args.metrics_json):
+        return None
+    from .metrics import Session
+    return Session(command, profile=args.profile,
+                   metrics_json=args.metrics_json)
+
+
+def finish_metrics(session):
+    if session is not None:
+        session.finish()
+
+
+def add_enzyme_filter_args(ap):
+    ap.add_argument('--site-len', nargs='+', type=int, default=None,
+                    metavar='N', help='Only enzymes with sites of N bases')
+    ap.add_argument('--overhang', nargs='+', default=None, choices=OVERHANGS,
+                    help='Only enzymes leaving these ends')
+    ap.add_argument('--blunt', action='store_true',
+                    help='Include blunt cutters (as --overhang blunt)')
+    ap.add_argument('--methylation-insensitive', action='store_true',
+                    help='Exclude enzymes blocked by methylation of their '
+                    'site')
+
+
+def enzyme_filters(args, defined=False):
+    '''The enzymes.find_enzymes() arguments the filter arguments describe'''
+    overhangs = args.overhang
+    if args.blunt:
+        overhangs = (overhangs or []) + ['blunt']
+    return dict(site_lengths=args.site_len, overhangs=overhangs,
+                defined=defined,
+                methylable=False if args.methylation_insensitive else None)
+
+
+def check_stdout(ap, *outputs):
+    '''Exits with an error if more than one of ``outputs`` (paths, or files
+    from ``FileType``) is stdout, where they would be interleaved'''
+    if sum(out == '-' or out is sys.stdout for out in outputs) > 1:
+        ap.error("Only one output can be - (stdout)")
+
+
+def check_chunk_args(ap, args):
+    if args.chunk_size is not None and args.chunk_size < 1:
+        ap.error("--chunk-size must be positive")
+    if args.chunk_size and args.threads > 1:
+        ap.error("--chunk-size can't be combined with --threads")
+
+
+def make_histogram(ap, args):
+    from .stats import Histogram
+    try:
+        return Histogram(args.min, args.max, bins=args.bins, log=args.log_bins)
+    except ValueError as exc:
+        ap.error(str(exc))
+
+
+def fragment_sinks(args, digestor):
+    '''Sinks writing fragments to --output-fasta and --output-bed'''
+    from .sinks import FragmentBedSink, FragmentFastaSink
+    from .writers import BedWriter, FastaWriter, open_output
+    sinks = []
+    if args.output_fasta:
+        sinks.append(FragmentFastaSink(FastaWriter(open_output(
+            args.output_fasta, args.compress_threads))))
+    if args.output_bed:
+        sinks.append(FragmentBedSink(BedWriter(open_output(
+            args.output_bed, args.compress_threads)), digestor.enzymes))
+    return sinks
+
+
+def run_digest(ap, args, digestor, sinks, **kwargs):
+    '''Digests the genome the common arguments describe once, feeding
+    ``sinks``. ``kwargs`` are passed on to ``sinks.run_sinks()``.'''
+    from .sinks import run_sinks
+    run_sinks(genome_file(args), digestor, sinks, threads=args.threads,
+              regions=genome_regions(ap, args),
+              progress=make_progress(ap, args), **kwargs)
+
+
 def hist_main():
     ap = ArgumentParser(description="Create histogram of fragment sizes")
     add_common_args(ap)
@@ -39,63 +224,483 @@ def hist_main():
     ap.add_argument('--output', '-o', type=FileType('w'), default=sys.stdout,
                     help='Output file (default stdout)')
     ap.add_argument('--bins', '-b', type=int, default=100,
-                    help='Number of bins in histogram')
+                    help='Number of bins in histogram, spanning --min to '
+                    '--max')
+    ap.add_argument('--log-bins', action='store_true',
+                    help='Space bins evenly on a log scale')
+    ap.add_argument('--stats', type=FileType('w'), default=None,
+                    metavar='FILE',
+                    help='Also write fragment length statistics for each '
+                    'sequence, and the whole genome (as contig *), to FILE')
+    add_chunk_args(ap)
+    add_metrics_args(ap)
     args = ap.parse_args()
-    digestor = Digest(args.enzyme, args.enzyme2)
-
-    sizes = []
-    frags = seqfile_iter_frags(args.genome, digestor, minlen=args.min,
-                               maxlen=args.max)
-    for _, frag in frags:
-        sizes.append(frag.len)
-    sizes = np.array(sizes)
-    counts, edges = np.histogram(sizes)
-    last = edges[0]
-    for i, count in enumerate(counts):
-        range_str = "{}-{}".format(last, edges[i+1]-1)
-        print(i+1, range_str, count, sep='\t', file=args.output)
-        last = edges[i]
+    session = start_metrics(args, 'radsim-hist')
+    from .sinks import HistogramSink, LengthStatsSink
+    check_chunk_args(ap, args)
+    check_stdout(ap, args.output, args.stats)
+    sinks = [HistogramSink(make_histogram(ap, args), args.output)]
+    if args.stats:
+        sinks.append(LengthStatsSink(args.stats))
+    run_digest(ap, args, make_digest(args), sinks, minlen=args.min,
+               maxlen=args.max, chunk_size=args.chunk_size)
+    finish_metrics(session)
+
+
+def screen_main():
+    ap = ArgumentParser(description="Rank enzymes and enzyme pairs by how "
+                        "close they come to a target number of loci")
+    add_genome_args(ap)
+    enzymes = ap.add_mutually_exclusive_group(required=True)
+    enzymes.add_argument('--enzymes', '-e', nargs='+', metavar='ENZYME',
+                         help='Candidate restriction enzyme names')
+    enzymes.add_argument('--all-enzymes', '-a', action='store_true',
+                         help='Screen all supported enzymes, or those passing '
+                         'the filters below')
+    ap.add_argument('--target', required=True, type=int,
+                    help='Target number of loci')
+    ap.add_argument('--tolerance', default=0.5, type=float,
+                    help='Skip enzymes and pairs that cannot give at least '
+                    'target * (1 - tolerance) loci (default 0.5)')
+    ap.add_argument('--no-pairs', action='store_true',
+                    help='Only screen single enzymes')
+    ap.add_argument('--top', type=int, default=None, metavar='N',
+                    help='Only output the N best enzymes/pairs')
+    ap.add_argument('--output', '-o', type=FileType('w'), default=sys.stdout,
+                    help='Output file (default stdout)')
+    ap.add_argument('--engine', default='aho-corasick', choices=ENGINE_NAMES,
+                    help='Restriction site search backend '
+                    '(default aho-corasick)')
+    add_frag_len_args(ap)
+    add_enzyme_filter_args(ap)
+    add_metrics_args(ap)
+    args = ap.parse_args()
+    session = start_metrics(args, 'radsim-screen')
+    from .enzymes import find_enzymes, get_enzyme, names
+    from .screen import genome_sites, screen_enzymes
+
+    if args.all_enzymes:
+        enzymes = find_enzymes(**enzyme_filters(args))
+    else:
+        known = set(names())
+        unknown = [name for name in args.enzymes if name not in known]
+        if unknown:
+            ap.error("Unknown enzyme(s): " + ', '.join(unknown))
+        enzymes = [get_enzyme(name) for name in args.enzymes]
+    # Enzymes with unknown cut positions can't be used to digest
+    enzymes = [enzyme for enzyme in enzymes if enzyme.fst3 is not None]
+
+    cuts = genome_sites(genome_file(args), enzymes, engine=args.engine)
+    results, pruned = screen_enzymes(cuts, args.target, minlen=args.min,
+                                     maxlen=args.max, tolerance=args.tolerance,
+                                     pairs=not args.no_pairs)
+    print('enzyme', 'enzyme2', 'sites', 'fragments', 'loci', 'bp', sep='\t',
+          file=args.output)
+    for res in results[:args.top]:
+        r2_enzyme = '-' if res.r2_enzyme is None else res.r2_enzyme
+        print(res.enzyme, r2_enzyme, res.sites, res.fragments, res.loci,
+              res.bp, sep='\t', file=args.output)
+    print("Skipped", pruned, "enzymes/pairs that cannot reach the target",
+          file=sys.stderr)
+    finish_metrics(session)
 
 
 def digest_main():
     ap = ArgumentParser(description="Performs in-silico digestion of a genome")
-    ap.add_argument('--output-fasta', type=FileType('w'),
-                    help="Fasta file to output fragment sequences")
-    ap.add_argument('--output-bed', type=FileType('w'),
-                    help="Bed file to output fragment sequences")
+    ap.add_argument('--output-fasta', metavar='FILE',
+                    help="Fasta file to output fragment sequences (BGZF "
+                    "compressed if it ends in .gz; - for stdout)")
+    ap.add_argument('--output-bed', metavar='FILE',
+                    help="Bed file to output fragment sequences (BGZF "
+                    "compressed if it ends in .gz; - for stdout)")
     ap.add_argument('--ddrad', action="store_true",
                     help="Enforce different enzymes on each end of the frament.")
     add_common_args(ap)
     add_frag_len_args(ap)
+    add_chunk_args(ap)
+    add_compress_args(ap)
+    add_metrics_args(ap)
     args = ap.parse_args()
+    session = start_metrics(args, 'radsim-digest')
+    check_chunk_args(ap, args)
     if not (args.output_fasta or args.output_bed):
         ap.error("One of --output-fasta FILE or --output-bed FILE is required")
-    digestor = Digest(args.enzyme, args.enzyme2)
+    check_stdout(ap, args.output_fasta, args.output_bed)
+    digestor = make_digest(args)
+    sinks = fragment_sinks(args, digestor)
+    run_digest(ap, args, digestor, sinks, minlen=args.min, maxlen=args.max,
+               chunk_size=args.chunk_size,
+               force_different_enzymes=args.ddrad)
+    finish_metrics(session)
 
-    frags = seqfile_iter_frags(args.genome, digestor, minlen=args.min,
-                               maxlen=args.max, force_different_enzymes=args.ddrad)
-    for read, frag in frags:
-        if args.output_fasta:
-            output_frag_fasta(read, frag, args.output_fasta)
-        if args.output_bed:
-            site_name = '{}[{}]_{}[{}]'.format(frag.lhs, frag.lhs_enzyme,
-                                               frag.rhs, frag.rhs_enzyme)
-            output_bed(read.name, frag.lhs, frag.rhs, site_name, args.output_bed)
+
+def reads_main():
+    ap = ArgumentParser(description="Simulates paired-end reads from the ends "
+                        "of digested fragments")
+    ap.add_argument('--output-r1', '-1', required=True, metavar='FILE',
+                    help="FASTQ file to output R1 reads (BGZF compressed if it "
+                    "ends in .gz; - for stdout)")
+    ap.add_argument('--output-r2', '-2', default=None, metavar='FILE',
+                    help="FASTQ file to output R2 reads (default: single-end "
+                    "reads)")
+    ap.add_argument('--read-length', '-l', default=100, type=int,
+                    help='Read length (default 100)')
+    ap.add_argument('--reads-per-fragment', default=1, type=int, metavar='N',
+                    help='Reads (or pairs) to simulate from each fragment '
+                    '(default 1)')
+    ap.add_argument('--quality-profile', default=None, metavar='FILE',
+                    help='Mean (and optionally standard deviation) of the '
+                    'Phred quality at each read position, one per line '
+                    '(default: Q37 falling to Q30)')
+    ap.add_argument('--indel-fraction', default=0.1, type=float,
+                    help='Fraction of sequencing errors that are indels '
+                    '(default 0.1)')
+    ap.add_argument('--seed', default=None, type=int,
+                    help='Random seed, for reproducible reads')
+    ap.add_argument('--ddrad', action="store_true",
+                    help="Enforce different enzymes on each end of the frament.")
+    add_common_args(ap)
+    add_frag_len_args(ap)
+    add_chunk_args(ap)
+    add_compress_args(ap)
+    add_metrics_args(ap)
+    args = ap.parse_args()
+    session = start_metrics(args, 'radsim-reads')
+    from .reads import ReadSimulator, format_fastq, read_quality_profile
+    from .utils import seqfile_iter_fragment_tables
+    from .writers import open_output
+    check_chunk_args(ap, args)
+    check_stdout(ap, args.output_r1, args.output_r2)
+    if args.read_length < 1:
+        ap.error("--read-length must be positive")
+    if args.reads_per_fragment < 1:
+        ap.error("--reads-per-fragment must be positive")
+    if not 0 <= args.indel_fraction <= 1:
+        ap.error("--indel-fraction must be between 0 and 1")
+    profile = None
+    if args.quality_profile:
+        profile = read_quality_profile(args.quality_profile, args.read_length)
+    digestor = make_digest(args)
+    simulator = ReadSimulator(digestor, read_length=args.read_length,
+                              profile=profile,
+                              indel_fraction=args.indel_fraction,
+                              seed=args.seed)
+
+    tables = seqfile_iter_fragment_tables(
+        genome_file(args), digestor, minlen=args.min, maxlen=args.max,
+        threads=args.threads, chunk_size=args.chunk_size,
+        regions=genome_regions(ap, args), force_different_enzymes=args.ddrad,
+        progress=make_progress(ap, args))
+    outputs = [open_output(args.output_r1, args.compress_threads)]
+    if args.output_r2:
+        outputs.append(open_output(args.output_r2, args.compress_threads))
+    for names, r1, r2 in simulator.simulate_tables(tables,
+                                                   args.reads_per_fragment):
+        for mate, (output, reads) in enumerate(zip(outputs, (r1, r2)), 1):
+            output.write(format_fastq(names, reads, mate))
+    for output in outputs:
+        output.close()
+    finish_metrics(session)
+
+
+def library_main():
+    ap = ArgumentParser(description="Simulates size selection, PCR and "
+                        "sequencing of a library, giving each fragment's "
+                        "coverage")
+    ap.add_argument('--output', '-o', default='-', metavar='FILE',
+                    help="Output table (BGZF compressed if it ends in .gz; "
+                    "default stdout)")
+    ap.add_argument('--reads', default=1000000, type=int,
+                    help='Number of reads (or pairs) sequenced (default 1e6)')
+    ap.add_argument('--copies', default=1000, type=int,
+                    help='Number of genome copies in the library (default '
+                    '1000)')
+    ap.add_argument('--selection', default='none',
+                    choices=('none', 'bead', 'gel'),
+                    help='Size selection method (default none)')
+    ap.add_argument('--select-min', default=None, type=int, metavar='BASES',
+                    help='Fragment length half of fragments are kept at '
+                    '(bead), or two standard deviations below the mean (gel)')
+    ap.add_argument('--select-max', default=None, type=int, metavar='BASES',
+                    help='As --select-min, at the upper end')
+    ap.add_argument('--select-width', default=50, type=int, metavar='BASES',
+                    help='Width of bead selection cutoffs: the lengths over '
+                    'which the fraction kept goes from 1/4 to 3/4 (default '
+                    '50)')
+    ap.add_argument('--pcr-cycles', default=12, type=int,
+                    help='Number of PCR cycles (default 12)')
+    ap.add_argument('--pcr-efficiency', default=0.95, type=float,
+                    help='Fraction of molecules copied in each PCR cycle, '
+                    'for very short fragments (default 0.95)')
+    ap.add_argument('--pcr-decay', default=2000, type=float, metavar='BASES',
+                    help='PCR efficiency falls by a factor of e for every '
+                    'this many bases of fragment length (default 2000)')
+    ap.add_argument('--seed', default=None, type=int,
+                    help='Random seed, for reproducible coverage')
+    ap.add_argument('--ddrad', action="store_true",
+                    help="Enforce different enzymes on each end of the frament.")
+    add_common_args(ap)
+    add_frag_len_args(ap)
+    add_chunk_args(ap)
+    add_compress_args(ap)
+    add_metrics_args(ap)
+    args = ap.parse_args()
+    session = start_metrics(args, 'radsim-library')
+    import numpy as np
+    from .library import BeadSelection, GelSelection, LibraryModel
+    from .utils import seqfile_iter_fragment_tables
+    from .writers import BedWriter, open_output
+    check_chunk_args(ap, args)
+    if args.reads < 0 or args.copies < 0:
+        ap.error("--reads and --copies can't be negative")
+    if not 0 <= args.pcr_efficiency <= 1:
+        ap.error("--pcr-efficiency must be between 0 and 1")
+    selection = None
+    if args.selection != 'none':
+        if args.select_min is None or args.select_max is None:
+            ap.error("--selection needs --select-min and --select-max")
+        try:
+            if args.selection == 'bead':
+                selection = BeadSelection(args.select_min, args.select_max,
+                                          args.select_width)
+            else:
+                selection = GelSelection(args.select_min, args.select_max)
+        except ValueError as exc:
+            ap.error(str(exc))
+    model = LibraryModel(copies=args.copies, selection=selection,
+                         pcr_cycles=args.pcr_cycles,
+                         pcr_efficiency=args.pcr_efficiency,
+                         pcr_decay=args.pcr_decay, reads=args.reads,
+                         seed=args.seed)
+    digestor = make_digest(args)
+
+    tables = seqfile_iter_fragment_tables(
+        genome_file(args), digestor, minlen=args.min, maxlen=args.max,
+        threads=args.threads, chunk_size=args.chunk_size,
+        regions=genome_regions(ap, args), force_different_enzymes=args.ddrad,
+        progress=make_progress(ap, args))
+    # Reads are shared between contigs, so all must be digested first. Chunks
+    # of a sequence share its record, while regions each have their own.
+    records = []
+    parts = []
+    for read, table in tables:
+        if not records or records[-1] is not read:
+            records.append(read)
+            parts.append([])
+        parts[-1].append(table)
+    contigs = [(read.name, np.concatenate(tables))
+               for read, tables in zip(records, parts)]
+    coverages = model.simulate(contigs, starts=[
+        getattr(read, 'start', 0) for read in records])
+
+    output = open_output(args.output, args.compress_threads)
+    writer = BedWriter(output)
+    writer.write('#contig', 'start', 'end',
+                 'length\tselected\texpected\treads\tunique')
+    for (name, table), coverage in zip(contigs, coverages):
+        labels = ['{}\t{:.4g}\t{:.4g}\t{}\t{}'.format(*row) for row in zip(
+            table['len'].tolist(), coverage['selected'].tolist(),
+            coverage['expected'].tolist(), coverage['reads'].tolist(),
+            coverage['unique'].tolist())]
+        writer.write_many(name, table['lhs'], table['rhs'], labels)
+    writer.close()
+    output.close()
+    reads = sum(int(coverage['reads'].sum()) for coverage in coverages)
+    unique = sum(int(coverage['unique'].sum()) for coverage in coverages)
+    loci = sum(int(np.count_nonzero(coverage['reads']))
+               for coverage in coverages)
+    duplicates = 1 - unique / reads if reads else 0
+    print("Sequenced", reads, "reads from", loci, "loci;",
+          "{:.1%} are PCR duplicates".format(duplicates), file=sys.stderr)
+    finish_metrics(session)
+
+
+def variants_main():
+    ap = ArgumentParser(description="Digests the haplotypes in a VCF, giving "
+                        "each sample's fragments, to model allele dropout")
+    ap.add_argument('--vcf', '-v', required=True, metavar='FILE',
+                    help='Variants of each sample (phased for exact results; '
+                    'may be gzip or BGZF compressed)')
+    ap.add_argument('--output', '-o', default='-', metavar='FILE',
+                    help="Output table (BGZF compressed if it ends in .gz; "
+                    "default stdout)")
+    ap.add_argument('--variable-only', action='store_true',
+                    help='Only output fragments some haplotype lacks')
+    ap.add_argument('--ddrad', action="store_true",
+                    help="Enforce different enzymes on each end of the frament.")
+    add_common_args(ap)
+    add_frag_len_args(ap)
+    add_compress_args(ap)
+    add_metrics_args(ap)
+    args = ap.parse_args()
+    session = start_metrics(args, 'radsim-variants')
+    from .utils import open_genome, record_contig_times
+    from .variants import VariantDigest, read_vcf, write_fragment_presence
+    from .writers import BedWriter, open_output
+    if args.region or args.regions or args.threads > 1:
+        ap.error("--region(s) and --threads aren't supported here")
+    digestor = make_digest(args)
+    samples, haplotype_samples, variants = read_vcf(args.vcf)
+    if not samples:
+        ap.error("The VCF has no samples")
+    vdigest = VariantDigest(digestor, haplotype_samples, minlen=args.min,
+                            maxlen=args.max,
+                            force_different_enzymes=args.ddrad)
+
+    output = open_output(args.output, args.compress_threads)
+    writer = BedWriter(output)
+    writer.write('#contig', 'start', 'end',
+                 'length\t' + '\t'.join(samples))
+    results = record_contig_times(
+        (read, vdigest.fragment_presence(read.sequence,
+                                         variants.get(read.name), contig=i))
+        for i, read in enumerate(open_genome(genome_file(args))))
+    progress = make_progress(ap, args)
+    if progress is not None:
+        results = progress.track(results)
+    for read, (table, counts) in results:
+        write_fragment_presence(writer, read.name, table, counts,
+                                vdigest.ploidy, args.variable_only)
+    writer.close()
+    output.close()
+    finish_metrics(session)
 
 
 def rebed_main():
     ap = ArgumentParser(description="Produces a BED file containing RE sites")
     ap.add_argument('--length', '-l', type=int, default=0, metavar='INT',
                     help='Include a window of INT bases around each RE site in the output')
+    ap.add_argument('--output', '-o', default='-', metavar='FILE',
+                    help='Output file (default stdout; BGZF compressed if it '
+                    'ends in .gz)')
+    add_common_args(ap)
+    add_compress_args(ap)
+    add_metrics_args(ap)
+    args = ap.parse_args()
+    session = start_metrics(args, 'radsim-rebed')
+    from .sinks import SiteBedSink
+    from .writers import BedWriter, open_output
+    digestor = make_digest(args)
+    bed = BedWriter(open_output(args.output, args.compress_threads))
+    run_digest(ap, args, digestor,
+               [SiteBedSink(bed, digestor.enzymes, window=args.length)])
+    finish_metrics(session)
+
+
+def index_main():
+    ap = ArgumentParser(description="Converts a fasta genome to .2bit format, "
+                        "which all radsim commands read much faster")
+    ap.add_argument('--genome', '-i', required=True, type=str,
+                    help='Genome sequence (in fasta format)')
+    ap.add_argument('--output', '-o', default=None, metavar='FILE',
+                    help='Output .2bit file (default: GENOME.2bit)')
+    add_metrics_args(ap)
+    args = ap.parse_args()
+    session = start_metrics(args, 'radsim-index')
+    from .twobit import fasta_to_twobit
+    output = args.output
+    if output is None:
+        output = args.genome + '.2bit'
+    fasta_to_twobit(args.genome, output)
+    finish_metrics(session)
+
+
+def enzymes_main():
+    ap = ArgumentParser(description="Lists restriction enzymes, with their "
+                        "sites, cut positions, overhangs, methylation "
+                        "sensitivity and isoschizomers")
+    ap.add_argument('--enzymes', '-e', nargs='+', default=None,
+                    metavar='ENZYME',
+                    help='Only list these enzymes (default all, or those '
+                    'passing the filters below)')
+    add_enzyme_filter_args(ap)
+    ap.add_argument('--defined', action='store_true',
+                    help='Exclude enzymes with unknown cut positions')
     ap.add_argument('--output', '-o', type=FileType('w'), default=sys.stdout,
                     help='Output file (default stdout)')
-    add_common_args(ap)
     args = ap.parse_args()
-    digest = Digest(args.enzyme, args.enzyme2)
-
-    for read in screed.open(args.genome, parse_description=True):
-        seq = read.sequence
-        seql = len(read.sequence)
-        for cut, enz in digest.re_sites(seq):
-            output_bed(read.name, clamp(cut-args.length, 0, seql),
-                    clamp(cut + enz.size+args.length, 0, seql), str(enz), args.output)
+    from .enzymes import find_enzymes, get_enzyme, write_enzymes
+
+    if args.enzymes:
+        try:
+            enzymes = [get_enzyme(name) for name in args.enzymes]
+        except ValueError as exc:
+            ap.error(str(exc))
+    else:
+        enzymes = find_enzymes(**enzyme_filters(args, defined=args.defined))
+    write_enzymes(enzymes, args.output)
+
+
+def radsim_main():
+    ap = ArgumentParser(prog='radsim', description="Simulates reduced "
+                        "representation sequencing by restriction digestion")
+    commands = ap.add_subparsers(dest='command', metavar='COMMAND')
+    commands.required = True
+    run = commands.add_parser(
+        'run', help='Digest a genome once, writing any of the outputs of '
+        'radsim-hist, radsim-digest and radsim-rebed',
+        description="Digests a genome once, writing any combination of a "
+        "fragment length histogram and statistics, fragment BED and fasta, "
+        "and a BED of RE sites")
+    run.add_argument('--output-hist', type=FileType('w'), default=None,
+                     metavar='FILE',
+                     help='Histogram of fragment sizes, as from radsim-hist')
+    run.add_argument('--bins', '-b', type=int, default=100,
+                     help='Number of bins in histogram, spanning --min to '
+                     '--max')
+    run.add_argument('--log-bins', action='store_true',
+                     help='Space bins evenly on a log scale')
+    run.add_argument('--output-stats', type=FileType('w'), default=None,
+                     metavar='FILE',
+                     help='Fragment length statistics for each sequence, '
+                     'and the whole genome (as contig *)')
+    run.add_argument('--output-fasta', metavar='FILE',
+                     help="Fragment sequences (BGZF compressed if it ends in "
+                     ".gz; - for stdout)")
+    run.add_argument('--output-bed', metavar='FILE',
+                     help="Fragment BED file (BGZF compressed if it ends in "
+                     ".gz; - for stdout)")
+    run.add_argument('--output-sites', metavar='FILE',
+                     help="BED file of RE sites, as from radsim-rebed (BGZF "
+                     "compressed if it ends in .gz; - for stdout)")
+    run.add_argument('--site-window', type=int, default=0, metavar='INT',
+                     help='Include a window of INT bases around each RE site '
+                     'in --output-sites')
+    run.add_argument('--ddrad', action="store_true",
+                     help="Only output fragments with different enzymes on "
+                     "each end to --output-fasta and --output-bed (the "
+                     "histogram and statistics always are, as from "
+                     "radsim-hist)")
+    add_common_args(run)
+    add_frag_len_args(run)
+    add_chunk_args(run)
+    add_compress_args(run)
+    add_metrics_args(run)
+    args = ap.parse_args()
+    session = start_metrics(args, 'radsim run')
+    from .sinks import HistogramSink, LengthStatsSink, SiteBedSink
+    from .writers import BedWriter, open_output
+    check_chunk_args(run, args)
+    if not (args.output_hist or args.output_stats or args.output_fasta or
+            args.output_bed or args.output_sites):
+        run.error("At least one --output-* FILE is required")
+    check_stdout(run, args.output_hist, args.output_stats, args.output_fasta,
+                 args.output_bed, args.output_sites)
+    digestor = make_digest(args)
+    sinks = []
+    if args.output_hist:
+        sinks.append(HistogramSink(make_histogram(run, args),
+                                   args.output_hist,
+                                   force_different_enzymes=True))
+    if args.output_stats:
+        sinks.append(LengthStatsSink(args.output_stats,
+                                     force_different_enzymes=True))
+    sinks.extend(fragment_sinks(args, digestor))
+    if args.output_sites:
+        bed = BedWriter(open_output(args.output_sites, args.compress_threads))
+        sinks.append(SiteBedSink(bed, digestor.enzymes,
+                                 window=args.site_window))
+    run_digest(run, args, digestor, sinks, minlen=args.min, maxlen=args.max,
+               chunk_size=args.chunk_size,
+               force_different_enzymes=args.ddrad)
+    finish_metrics(session)
@@ -0,0 +1,169 @@
+from __future__ import print_function, division, absolute_import
+from collections import Counter
+import json
+import resource
+import sys
+import time
+
+# The Metrics being collected, or None when instrumentation is off. Code is
+# instrumented by checking this before measuring anything, so when off, it
+# costs one global lookup per call:
+#
+#     metrics = radsim.metrics.active
+#     if metrics is not None:
+#         started = metrics.start()
+#     ...
+#     if metrics is not None:
+#         metrics.stop('search', started, bases=len(sequence))
+active = None
+
+
+def _peak_rss(who):
+    # Kilobytes on Linux, bytes on macOS
+    scale = 1 if sys.platform == 'darwin' else 1024
+    return resource.getrusage(who).ru_maxrss * scale
+
+
+class Metrics(object):
+    '''Wall and CPU time spent in each stage of a run, counters of the work
+    done (bases, sites, fragments, bytes), and how long each contig took.
+
+    Stages don't nest. CPU time is the whole process', so includes any
+    threads running at the time.
+    '''
+
+    def __init__(self):
+        # {stage: [calls, wall seconds, cpu seconds]}
+        self.stages = {}
+        self.counters = Counter()
+        # [name, bases, seconds] of each contig, in order
+        self.contigs = []
+        self._started = self.start()
+
+    @staticmethod
+    def start():
+        '''Returns a token to pass to ``stop()``'''
+        return time.perf_counter(), time.process_time()
+
+    def stop(self, stage, started, **counts):
+        '''Adds the time since ``started`` to ``stage``, and ``counts`` to the
+        counters'''
+        wall = time.perf_counter() - started[0]
+        cpu = time.process_time() - started[1]
+        totals = self.stages.get(stage)
+        if totals is None:
+            totals = self.stages[stage] = [0, 0.0, 0.0]
+        totals[0] += 1
+        totals[1] += wall
+        totals[2] += cpu
+        if counts:
+            self.counters.update(counts)
+        return wall
+
+    def count(self, **counts):
+        self.counters.update(counts)
+
+    def contig(self, name, bases, seconds):
+        '''Records the time spent digesting a contig'''
+        self.contigs.append([name, bases, seconds])
+
+    def timed(self, iterable, stage, bases=len):
+        '''Yields the items of ``iterable``, timing how long each takes to
+        produce as ``stage`` and counting ``bases(item)`` bases read'''
+        items = iter(iterable)
+        while True:
+            started = self.start()
+            try:
+                item = next(items)
+            except StopIteration:
+                return
+            self.stop(stage, started, bases_read=bases(item))
+            yield item
+
+    def snapshot(self):
+        '''The stages and counters, to send from a worker process to be
+        ``merge()``d'''
+        return self.stages, dict(self.counters)
+
+    def merge(self, snapshot):
+        stages, counters = snapshot
+        for stage, (calls, wall, cpu) in stages.items():
+            totals = self.stages.setdefault(stage, [0, 0.0, 0.0])
+            totals[0] += calls
+            totals[1] += wall
+            totals[2] += cpu
+        self.counters.update(counters)
+
+    def report(self, command):
+        '''Returns a dict of all measurements, for ``command``'''
+        wall = time.perf_counter() - self._started[0]
+        cpu = time.process_time() - self._started[1]
+        bases = self.counters.get('bases_read', 0)
+        return {
+            'command': command,
+            'wall_seconds': wall,
+            'cpu_seconds': cpu,
+            'peak_rss': _peak_rss(resource.RUSAGE_SELF),
+            'peak_rss_children': _peak_rss(resource.RUSAGE_CHILDREN),
+            'mbp_per_second': bases / 1e6 / wall if wall else 0.0,
+            'stages': {stage: {'calls': calls, 'wall_seconds': stage_wall,
+                               'cpu_seconds': stage_cpu}
+                       for stage, (calls, stage_wall, stage_cpu) in
+                       sorted(self.stages.items())},
+            'counters': dict(sorted(self.counters.items())),
+            'contigs': [{'name': name, 'bases': contig_bases,
+                         'seconds': seconds}
+                        for name, contig_bases, seconds in self.contigs],
+        }
+
+
+def write_summary(report, stream=sys.stderr):
+    '''Writes a readable summary of a ``Metrics.report()``'''
+    wall = report['wall_seconds']
+    print('{}: {:.3f}s wall, {:.3f}s CPU, peak RSS {:.1f} MB'.format(
+        report['command'], wall, report['cpu_seconds'],
+        report['peak_rss'] / 2 ** 20), file=stream)
+    print('stage', 'calls', 'wall_s', 'cpu_s', '%wall', sep='\t', file=stream)
+    for stage, totals in report['stages'].items():
+        print(stage, totals['calls'], '{:.3f}'.format(totals['wall_seconds']),
+              '{:.3f}'.format(totals['cpu_seconds']),
+              '{:.1f}'.format(100 * totals['wall_seconds'] / wall if wall
+                              else 0), sep='\t', file=stream)
+    for name, value in report['counters'].items():
+        print(name, value, sep='\t', file=stream)
+    print('Mbp/s', '{:.2f}'.format(report['mbp_per_second']), sep='\t',
+          file=stream)
+
+
+class Session(object):
+    '''Instrumentation for one run of a command: starts collecting metrics
+    (and, if ``profile``, a cProfile profile) on creation, and ``finish()``
+    writes them out, to stderr if ``profile`` and as JSON to
+    ``metrics_json``'''
+
+    def __init__(self, command, profile=False, metrics_json=None):
+        global active
+        self.command = command
+        self.metrics_json = metrics_json
+        self.metrics = active = Metrics()
+        self.profiler = None
+        if profile:
+            import cProfile
+            self.profiler = cProfile.Profile()
+            self.profiler.enable()
+
+    def finish(self):
+        global active
+        if self.profiler is not None:
+            self.profiler.disable()
+        report = self.metrics.report(self.command)
+        active = None
+        if self.metrics_json:
+            with open(self.metrics_json, 'w') as fh:
+                json.dump(report, fh, indent=1)
+        if self.profiler is not None:
+            import pstats
+            write_summary(report)
+            stats = pstats.Stats(self.profiler, stream=sys.stderr)
+            stats.sort_stats('cumulative').print_stats(25)
+        return report
@@ -0,0 +1,113 @@
+from __future__ import print_function, division, absolute_import
+import os
+import sys
+import time
+
+from .regions import RegionRecord
+from .seqio import open_seqfile
+from .twobit import TwoBitFile, is_twobit
+
+
+def genome_size(path):
+    '''The number of bases in genome ``path``, from the index of a .2bit file
+    or a fasta's .fai. Otherwise, uncompressed fasta sizes are estimated from
+    the file size and line width. Returns None if the size is unknown.'''
+    if is_twobit(path):
+        genome = TwoBitFile(path)
+        return sum(len(genome.sequence(name)) for name in genome.names)
+    if os.path.exists(path + '.fai'):
+        with open(path + '.fai') as fh:
+            return sum(int(line.split('\t')[1]) for line in fh if line.strip())
+    with open(path, 'rb') as fh:
+        if fh.read(2) in (b'\x1f\x8b', b'BZ'):
+            return None
+    # Assume most of the file is sequence lines as wide as the first
+    with open_seqfile(path) as fh:
+        width = 0
+        for line in fh:
+            if not line.startswith('>'):
+                width = len(line.rstrip('\r\n'))
+                break
+    if not width:
+        return 0
+    return os.path.getsize(path) * width // (width + 1)
+
+
+def record_bases(read):
+    '''The number of bases of ``read`` processed: all of a region or a whole
+    sequence, or as many as have been read of a ``seqio.WindowedRecord``'''
+    if isinstance(read, RegionRecord):
+        return read.end - read.start
+    return len(read.sequence)
+
+
+class Progress(object):
+    '''Shows bases processed out of ``total`` (None if unknown), with the
+    rate in Mbp/s and an ETA, as a progress bar on ``stream``.
+
+    ``update()`` can be called as often as needed: the bar is only redrawn
+    every ``interval`` seconds, and otherwise ``update()`` just reads the
+    clock.
+    '''
+
+    def __init__(self, total=None, interval=0.5, stream=sys.stderr):
+        import progressbar
+        self.total = total
+        self.interval = interval
+        self._next = 0.0
+        self._started = time.time()
+        self.done = 0
+        self._text = progressbar.FormatCustomText(
+            '%(done).1f%(total)s Mbp, %(rate).2f Mbp/s ',
+            dict(done=0.0, total='', rate=0.0))
+        if total:
+            self._text.update_mapping(total=' of {:.1f}'.format(total / 1e6))
+            widgets = [self._text, progressbar.Percentage(), ' ',
+                       progressbar.Bar(), ' ', progressbar.ETA()]
+            max_value = total
+        else:
+            widgets = [self._text, progressbar.Timer()]
+            max_value = progressbar.UnknownLength
+        self.bar = progressbar.ProgressBar(max_value=max_value,
+                                           widgets=widgets, fd=stream)
+        self.bar.start()
+
+    def update(self, done):
+        '''Sets the number of bases processed so far'''
+        self.done = done
+        now = time.time()
+        if now >= self._next:
+            self._next = now + self.interval
+            self._draw(now)
+
+    def _draw(self, now):
+        done = self.done
+        if self.total:
+            # Estimated totals may be exceeded
+            done = min(done, self.total)
+        elapsed = now - self._started
+        self._text.update_mapping(done=self.done / 1e6,
+                                  rate=self.done / 1e6 / elapsed
+                                  if elapsed else 0.0)
+        self.bar.update(done, force=True)
+
+    def finish(self):
+        self._draw(time.time())
+        self.bar.finish()
+
+    def track(self, results):
+        '''Yields the ``(read, result)`` pairs of ``results``, as from
+        ``utils.seqfile_iter_fragment_tables()``, updating progress with the
+        bases of each read as it is processed, then finishes'''
+        finished = 0
+        last_read = None
+        try:
+            for read, result in results:
+                if read is not last_read:
+                    if last_read is not None:
+                        finished += record_bases(last_read)
+                    last_read = read
+                self.update(finished + record_bases(read))
+                yield read, result
+        finally:
+            self.finish()
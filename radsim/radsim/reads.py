@@ -0,0 +1,241 @@
+from __future__ import print_function, division, absolute_import
+import numpy as np
+
+from .seqio import sequence_bytes
+from .utils import stream_key
+
+# Complements of ASCII bases, keeping case. Anything else becomes N.
+_COMPLEMENT = np.full(256, ord('N'), dtype=np.uint8)
+for _base, _comp in zip('ACGTNacgtn', 'TGCANtgcan'):
+    _COMPLEMENT[ord(_base)] = ord(_comp)
+# ASCII base to 0-3, or 4 for anything else
+_BASE_CODE = np.full(256, 4, dtype=np.uint8)
+for _code, _base in enumerate('ACGT'):
+    _BASE_CODE[ord(_base)] = _BASE_CODE[ord(_base.lower())] = _code
+_CODE_BASE = np.frombuffer(b'ACGTN', dtype=np.uint8)
+
+
+def default_quality_profile(read_length):
+    '''Mean and standard deviation of Phred quality at each read position,
+    declining from about Q37 to Q30 along the read, as is typical of
+    Illumina reads'''
+    mean = np.linspace(37, 30, read_length)
+    return mean, np.full(read_length, 3.0)
+
+
+def read_quality_profile(path, read_length):
+    '''Reads a quality profile: one line per read position, with the mean
+    Phred quality and optionally its standard deviation (default 3). The
+    last position's values are reused for reads longer than the profile.'''
+    mean = []
+    sd = []
+    with open(path) as fh:
+        for line in fh:
+            fields = line.split()
+            if not fields or fields[0].startswith('#'):
+                continue
+            mean.append(float(fields[0]))
+            sd.append(float(fields[1]) if len(fields) > 1 else 3.0)
+    if not mean:
+        raise ValueError("Empty quality profile: " + path)
+    mean = np.array(mean[:read_length] + [mean[-1]] * (read_length - len(mean)))
+    sd = np.array(sd[:read_length] + [sd[-1]] * (read_length - len(sd)))
+    return mean, sd
+
+
+# Reads simulated at once, bounding memory use
+READ_BATCH = 4096
+
+
+class ReadSimulator(object):
+    '''Simulates reads from the ends of fragments, in vectorised batches.
+
+    R1 is read from the end cut by ``digestor.enzyme``, and R2 from the
+    ``digestor.r2_enzyme`` end. Where both ends were cut by the same enzyme,
+    the orientation is random. Reads are ``read_length`` long, or shorter if
+    the fragment is.
+
+    Each base's Phred quality is drawn from ``profile``, a ``(mean, sd)``
+    pair of arrays per read position, and is an error with the probability
+    the quality implies. ``indel_fraction`` of errors are insertions or
+    deletions (equally often), the rest substitutions.
+
+    Reads are simulated in batches of ``batch_size`` reads, counted from the
+    first fragment of each contig, each with random numbers from a stream
+    seeded by ``seed``, the contig's name (and for regions, start) and the
+    batch number. Reads are therefore the same however the contigs were
+    digested (serially, on several threads, or in chunks).
+    '''
+
+    def __init__(self, digestor, read_length=100, profile=None,
+                 indel_fraction=0.1, seed=None, batch_size=READ_BATCH):
+        self.read_length = read_length
+        if profile is None:
+            profile = default_quality_profile(read_length)
+        self.quality_mean, self.quality_sd = profile
+        self.indel_fraction = indel_fraction
+        self.batch_size = batch_size
+        # Fix the entropy, so batch streams agree even without a seed
+        self.seed = np.random.SeedSequence(seed).entropy
+        names = [str(enzyme) for enzyme in digestor.enzymes]
+        self._r1_code = names.index(str(digestor.enzyme))
+        self._r2_code = names.index(str(digestor.r2_enzyme))
+
+    def rng(self, name, batch, start=0):
+        '''Returns the random generator for ``batch`` of contig ``name``, or
+        of the region of it from ``start``'''
+        key = stream_key(name, start) + (batch,)
+        return np.random.default_rng(
+            np.random.SeedSequence(self.seed, spawn_key=key))
+
+    def orientations(self, table, rng):
+        '''Returns a boolean array, True where R1 reads forward from the
+        fragment's lhs, and False where it reads back from the rhs'''
+        lhs, rhs = table['lhs_enzyme'], table['rhs_enzyme']
+        forward = (lhs == self._r1_code) & (rhs == self._r2_code)
+        reverse = (rhs == self._r1_code) & (lhs == self._r2_code)
+        either = forward == reverse
+        forward[either] = rng.random(np.count_nonzero(either)) < 0.5
+        return forward
+
+    def templates(self, data, first, table, forward):
+        '''Returns an array of the bases each read starts from, twice the read
+        length to allow for deletions, and the number of those in the
+        fragment. ``data`` holds the sequence from position ``first``.'''
+        width = 2 * self.read_length
+        lhs = table['lhs'] - first
+        rhs = np.minimum(table['rhs'] - first, len(data))
+        offsets = np.arange(width)
+        index = np.where(forward[:, None], lhs[:, None] + offsets,
+                         rhs[:, None] - 1 - offsets)
+        available = np.minimum(rhs - lhs, width)
+        seq = np.frombuffer(data, dtype=np.uint8)
+        bases = seq[np.clip(index, 0, max(len(seq) - 1, 0))] if len(seq) else \
+            np.zeros(index.shape, dtype=np.uint8)
+        bases = np.where(forward[:, None], bases, _COMPLEMENT[bases])
+        # Reads are upper case
+        bases = _CODE_BASE[_BASE_CODE[bases]]
+        return bases, available
+
+    def reads(self, templates, available, rng):
+        '''Simulates a read from each template, returning arrays of bases and
+        ASCII qualities (both ``read_length`` wide), and read lengths'''
+        n, length = len(templates), self.read_length
+        quality = rng.normal(self.quality_mean, self.quality_sd, (n, length))
+        quality = np.clip(np.rint(quality), 2, 41)
+        error = rng.random((n, length)) < 10.0 ** (-quality / 10.0)
+        quality = quality.astype(np.uint8)
+        indel = error & (rng.random((n, length)) < self.indel_fraction)
+        insertion = indel & (rng.random((n, length)) < 0.5)
+        deletion = indel & ~insertion
+        substitution = error & ~indel
+
+        # Each base consumes one template base, except that insertions
+        # consume none and deletions skip one
+        consumed = np.ones((n, length), dtype=np.int64)
+        consumed[insertion] = 0
+        consumed[deletion] = 2
+        source = np.cumsum(consumed, axis=1) - consumed + deletion
+        rows = np.arange(n)[:, None]
+        bases = templates[rows, np.minimum(source, templates.shape[1] - 1)]
+        bases[insertion] = _CODE_BASE[rng.integers(0, 4, np.count_nonzero(
+            insertion))]
+        codes = _BASE_CODE[bases[substitution]]
+        shifted = (codes + rng.integers(1, 4, len(codes))) % 4
+        bases[substitution] = np.where(codes < 4, _CODE_BASE[shifted],
+                                       bases[substitution])
+        # Reads end where they run off the fragment
+        lengths = np.count_nonzero(source < available[:, None], axis=1)
+        return bases, quality + 33, lengths
+
+    def _fragments(self, read, table):
+        # The templates of both ends of each fragment, taken while the
+        # sequence they come from is at hand
+        first = int(table['lhs'].min())
+        data = sequence_bytes(read.sequence, first, int(table['rhs'].max()))
+        ones = np.ones(len(table), dtype=bool)
+        lhs, available = self.templates(data, first, table, ones)
+        rhs, _ = self.templates(data, first, table, ~ones)
+        return table, lhs, rhs, available
+
+    def _batch(self, read, batch, fragments, copies):
+        # Simulates copies read pairs from each of the fragments of a batch
+        table, lhs, rhs, available = [
+            np.concatenate(arrays) if len(arrays) > 1 else arrays[0]
+            for arrays in zip(*fragments)]
+        if copies > 1:
+            table, lhs, rhs, available = [
+                np.repeat(arr, copies, axis=0)
+                for arr in (table, lhs, rhs, available)]
+        name = read.name
+        rng = self.rng(name, batch, getattr(read, 'start', 0))
+        forward = self.orientations(table, rng)
+        r1 = self.reads(np.where(forward[:, None], lhs, rhs), available, rng)
+        r2 = self.reads(np.where(forward[:, None], rhs, lhs), available, rng)
+        copy = np.tile(np.arange(copies), len(table) // copies).tolist()
+        names = ['{}_{}_{}_{}'.format(name, lhs, rhs, i) for lhs, rhs, i in
+                 zip(table['lhs'].tolist(), table['rhs'].tolist(), copy)]
+        return names, r1, r2
+
+    def simulate_tables(self, tables, copies=1):
+        '''Simulates ``copies`` read pairs from each fragment of ``tables``,
+        ``(read, table)`` pairs as from
+        ``utils.seqfile_iter_fragment_tables()``. Yields ``(names, r1, r2)``
+        for each batch, where ``r1`` and ``r2`` are ``(bases, qualities,
+        lengths)`` as from ``reads()``.'''
+        per_batch = max(1, self.batch_size // copies)
+        last_read = None
+        batch = 0
+        pending = []
+        npending = 0
+        for read, table in tables:
+            if read is not last_read:
+                if pending:
+                    yield self._batch(last_read, batch, pending, copies)
+                last_read = read
+                batch = 0
+                pending = []
+                npending = 0
+            table = table[table['lhs'] >= 0]
+            start = 0
+            while start < len(table):
+                end = min(len(table), start + per_batch - npending)
+                pending.append(self._fragments(read, table[start:end]))
+                npending += end - start
+                start = end
+                if npending == per_batch:
+                    yield self._batch(last_read, batch, pending, copies)
+                    batch += 1
+                    pending = []
+                    npending = 0
+        if pending:
+            yield self._batch(last_read, batch, pending, copies)
+
+    def simulate(self, read, table, copies=1):
+        '''Simulates ``copies`` read pairs from each fragment in ``table``,
+        taking sequence from ``read``, as ``simulate_tables()`` does, but
+        returning all of them at once as ``(names, r1, r2)``.'''
+        batches = list(self.simulate_tables([(read, table)], copies))
+        if not batches:
+            return [], None, None
+        names = [name for batch in batches for name in batch[0]]
+        r1, r2 = [tuple(np.concatenate(arrays) for arrays in
+                        zip(*[batch[mate] for batch in batches]))
+                  for mate in (1, 2)]
+        return names, r1, r2
+
+
+def format_fastq(names, reads, mate):
+    '''Formats reads, as from ``ReadSimulator.reads()``, as FASTQ bytes, with
+    ``/mate`` appended to each name'''
+    bases, quality, lengths = reads
+    width = bases.shape[1]
+    bases, quality = bases.tobytes(), quality.tobytes()
+    suffix = '/{}\n'.format(mate).encode('ascii')
+    parts = []
+    for i, (name, length) in enumerate(zip(names, lengths.tolist())):
+        start = i * width
+        parts.extend((b'@', name.encode('utf-8'), suffix,
+                      bases[start:start + length], b'\n+\n',
+                      quality[start:start + length], b'\n'))
+    return b''.join(parts)
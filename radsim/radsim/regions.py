@@ -0,0 +1,159 @@
+from __future__ import print_function, division, absolute_import
+import mmap
+import os
+
+from .twobit import TwoBitFile, is_twobit
+
+
+def parse_region(region):
+    '''Parses a samtools-style region, ``chr``, or ``chr:start-end`` (1-based,
+    inclusive), returning ``(chr, start, end)`` as a python slice interval.
+    ``end`` is None if it isn't given.'''
+    name, sep, span = region.rpartition(':')
+    if sep:
+        start, _, end = span.replace(',', '').partition('-')
+        try:
+            start = int(start) - 1
+            end = int(end) if end else None
+        except ValueError:
+            # A colon in a sequence name, not a span
+            return region, 0, None
+        if start < 0 or (end is not None and end <= start):
+            raise ValueError("Invalid region: " + region)
+        return name, start, end
+    return region, 0, None
+
+
+def read_bed_regions(path):
+    '''Reads ``(chr, start, end)`` regions from a BED file'''
+    regions = []
+    with open(path) as fh:
+        for line in fh:
+            if not line.strip() or line.startswith(('#', 'track', 'browser')):
+                continue
+            fields = line.split('\t')
+            regions.append((fields[0], int(fields[1]), int(fields[2])))
+    return regions
+
+
+def write_fai(fasta, fai):
+    '''Writes a samtools faidx index of ``fasta`` to ``fai``'''
+    entries = []
+    with open(fasta, 'rb') as fh:
+        name = None
+        offset = 0
+        for line in fh:
+            if line.startswith(b'>'):
+                name = line[1:].split(None, 1)[0].decode('utf-8')
+                entries.append([name, 0, offset + len(line), 0, 0])
+            elif name is not None:
+                entry = entries[-1]
+                bases = len(line.rstrip(b'\r\n'))
+                if entry[1] == 0:
+                    entry[3], entry[4] = bases, len(line)
+                entry[1] += bases
+            offset += len(line)
+    with open(fai, 'w') as fh:
+        for entry in entries:
+            print(*entry, sep='\t', file=fh)
+
+
+def check_indexable(path):
+    '''Raises ValueError if ``path`` is a compressed fasta, so can't be
+    read through a ``FastaIndex``'''
+    if is_twobit(path):
+        return
+    with open(path, 'rb') as fh:
+        if fh.read(2) == b'\x1f\x8b':
+            raise ValueError(
+                "Can't read regions of compressed fasta {}: decompress it, "
+                "or convert it with radsim-index".format(path))
+
+
+class FastaIndex(object):
+    '''Random access to an uncompressed fasta file, through its ``.fai``
+    index (which is created if missing or older than the fasta) and a memory
+    map of the file.'''
+
+    def __init__(self, path):
+        self.path = path
+        check_indexable(path)
+        fai = path + '.fai'
+        if (not os.path.exists(fai) or
+                os.path.getmtime(fai) < os.path.getmtime(path)):
+            write_fai(path, fai)
+        self._entries = {}
+        with open(fai) as fh:
+            for line in fh:
+                name, length, offset, linebases, linewidth = line.split('\t')[:5]
+                self._entries[name] = (int(length), int(offset), int(linebases),
+                                       int(linewidth))
+        with open(path, 'rb') as fh:
+            self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+
+    def sequence(self, name):
+        '''Returns a ``FaidxSequence`` for the sequence called ``name``'''
+        try:
+            entry = self._entries[name]
+        except KeyError:
+            raise KeyError("No sequence named '{}' in {}".format(name,
+                                                                 self.path))
+        return FaidxSequence(self._mmap, *entry)
+
+
+class FaidxSequence(object):
+    '''A sequence in a memory-mapped fasta file. Slicing reads just the
+    requested bases, as a str.'''
+
+    def __init__(self, data, length, offset, linebases, linewidth):
+        self._data = data
+        self.length = length
+        self._offset = offset
+        self._linebases = linebases
+        self._linewidth = linewidth
+
+    def __len__(self):
+        return self.length
+
+    def _byte(self, pos):
+        line, col = divmod(pos, self._linebases)
+        return self._offset + line * self._linewidth + col
+
+    def decode(self, start, stop):
+        start, stop = max(start, 0), min(stop, self.length)
+        if stop <= start:
+            return b''
+        data = self._data[self._byte(start):self._byte(stop - 1) + 1]
+        return data.replace(b'\n', b'').replace(b'\r', b'')
+
+    def tobytes(self):
+        return self.decode(0, self.length)
+
+    def __str__(self):
+        return self.tobytes().decode('ascii')
+
+    def __getitem__(self, item):
+        if not isinstance(item, slice) or item.step not in (None, 1):
+            raise TypeError("FaidxSequence only supports simple slices")
+        start, stop, _ = item.indices(self.length)
+        return self.decode(start, stop).decode('ascii')
+
+
+def open_indexed_genome(path):
+    '''Opens a .2bit or uncompressed fasta genome for random access. Either
+    way, the returned object's ``sequence(name)`` method returns a lazily
+    sliceable sequence.'''
+    if is_twobit(path):
+        return TwoBitFile(path)
+    return FastaIndex(path)
+
+
+class RegionRecord(object):
+    '''A record for a region of a sequence, like screed's. ``sequence`` is
+    the whole (lazily read) sequence, so coordinates are as in the genome.'''
+
+    def __init__(self, name, sequence, start, end):
+        self.name = name
+        self.sequence = sequence
+        self.start = start
+        self.end = end
@@ -0,0 +1,272 @@
+from __future__ import print_function, division, absolute_import
+from collections import namedtuple
+
+import numpy as np
+
+from . import metrics as _metrics
+from .engines import get_engine
+from .utils import open_genome
+
+# Cuts on different contigs are kept in a single array per enzyme by offsetting
+# each contig by a multiple of this stride. Any "fragment" spanning two contigs
+# is therefore far longer than a real one, and is easily excluded.
+CONTIG_STRIDE = 1 << 40
+
+# Most cuts merged at once when screening enzyme pairs, bounding memory use
+PAIR_BATCH = 1 << 22
+
+# A screened enzyme or pair of enzymes. ``fragments`` counts all fragments
+# (with different enzymes at each end for pairs), and ``loci``/``bp`` count
+# those within the size selection window and their total length.
+ScreenResult = namedtuple('ScreenResult', ['enzyme', 'r2_enzyme', 'sites',
+                                           'fragments', 'loci', 'bp'])
+
+
+def genome_sites(seqfile, enzymes, engine='aho-corasick'):
+    '''Finds the cuts of every enzyme in ``enzymes`` across all of ``seqfile``
+
+    The genome is read and searched once, for all enzymes. Returns a dict of
+    ``{enzyme: cuts}``, where cuts are sorted int64 arrays of cut positions as
+    reported by ``Digest.re_sites()``, offset by contig (see
+    ``CONTIG_STRIDE``).
+    '''
+    names = sorted(set(str(enzyme) for enzyme in enzymes))
+    searcher = get_engine(engine, names)
+    cuts = {enzyme: [] for enzyme in searcher.enzymes}
+    for i, read in enumerate(open_genome(seqfile)):
+        metrics = _metrics.active
+        if metrics is not None:
+            started = metrics.start()
+        offset = i * CONTIG_STRIDE
+        for enzyme, sites in searcher.search_arrays(read.sequence).items():
+            cuts[enzyme].append(np.unique(sites + (enzyme.fst3 - 1)) + offset)
+        if metrics is not None:
+            seconds = metrics.stop('search', started,
+                                   bases_searched=len(read.sequence))
+            metrics.contig(read.name, len(read.sequence), seconds)
+    return {enzyme: np.concatenate(arrays) if arrays else
+            np.zeros(0, dtype=np.int64) for enzyme, arrays in cuts.items()}
+
+
+def single_fragment_lengths(cuts, size):
+    '''Lengths of all fragments between consecutive cuts of one enzyme'''
+    lengths = cuts[1:] + size - cuts[:-1]
+    return lengths[lengths < CONTIG_STRIDE // 2]
+
+
+def pair_fragment_lengths(enzyme, cuts, r2_enzyme, r2_cuts):
+    '''Lengths of fragments with different enzymes at each end
+
+    Equivalent to digesting with both enzymes and keeping fragments as
+    ``Digest.iter_fragments(force_different_enzymes=True)`` does, without
+    merging the two sets of cuts. Each fragment must have an ``r2_enzyme`` cut
+    at one end, so we look up the neighbouring ``enzyme`` cuts of each of
+    those, which is cheapest when ``r2_cuts`` is the smaller array.
+    '''
+    if enzyme.same_cuts(r2_enzyme):
+        # Strict isoschizomers, which Digest treats as a single enzyme
+        return single_fragment_lengths(np.union1d(cuts, r2_cuts), enzyme.size)
+    # Where both enzymes cut at the same position, Digest keeps whichever
+    # enzyme comes last in Digest.enzymes, i.e. by name.
+    pos = np.searchsorted(cuts, r2_cuts)
+    shared = r2_cuts[cuts[np.minimum(pos, len(cuts) - 1)] == r2_cuts]
+    if len(cuts) and len(shared):
+        if str(r2_enzyme) > str(enzyme):
+            cuts = np.setdiff1d(cuts, shared, assume_unique=True)
+        else:
+            r2_cuts = np.setdiff1d(r2_cuts, shared, assume_unique=True)
+        pos = np.searchsorted(cuts, r2_cuts)
+
+    # cuts[pos - 1] < r2_cuts < cuts[pos]. Successive r2 cuts with the same pos
+    # have no cut of ``enzyme`` between them, so only the first of a run
+    # borders one on its left, and only the last on its right.
+    left = pos > 0
+    left[1:] &= pos[1:] != pos[:-1]
+    right = pos < len(cuts)
+    right[:-1] &= pos[:-1] != pos[1:]
+    lengths = np.concatenate([
+        r2_cuts[left] + r2_enzyme.size - cuts[pos[left] - 1],
+        cuts[pos[right]] + enzyme.size - r2_cuts[right],
+    ])
+    return lengths[lengths < CONTIG_STRIDE // 2]
+
+
+def _summarise(enzyme, r2_enzyme, sites, lengths, minlen, maxlen):
+    window = lengths[(lengths >= minlen) & (lengths <= maxlen)]
+    return ScreenResult(enzyme=enzyme, r2_enzyme=r2_enzyme, sites=sites,
+                        fragments=len(lengths), loci=len(window),
+                        bp=int(window.sum()))
+
+
+def most_pair_loci(cuts, minlen, size):
+    '''An upper bound on the loci of at least ``minlen`` bases given by any
+    pair of enzymes including one with ``cuts``, where neither enzyme's site
+    is longer than ``size``.
+
+    A pair's fragment has a cut of this enzyme at one end, and no other cut of
+    it before its far end, so each cut begins at most one fragment to its
+    right, and only if the next cut is at least ``minlen - size`` away, and
+    likewise on its left. Contig ends are offset far apart, so always count.
+    '''
+    if not len(cuts):
+        return 0
+    return 2 * (np.count_nonzero(np.diff(cuts) >= minlen - size) + 1)
+
+
+def pair_summaries(enzyme, ranks, r2_enzymes, r2_ranks, positions, minlen,
+                   maxlen):
+    '''Summarises the fragments of ``enzyme`` paired with each of
+    ``r2_enzymes``, none of them its strict isoschizomer, yielding a
+    ``ScreenResult`` per pair in order.
+
+    Cuts are given as ``ranks``, indices into ``positions``, the sorted array
+    of all cut positions. This vectorises ``pair_fragment_lengths()`` over all
+    the pairs: the neighbouring cuts of ``enzyme`` are found for the cuts of
+    every r2 enzyme at once, by looking up their ranks in a table, so the cost
+    is in the r2 cuts, best the fewer of each pair.
+    '''
+    n = len(r2_enzymes)
+    cuts = positions[ranks]
+    # Whether ``enzyme`` cuts at each position, and how many times before it
+    is_cut = np.zeros(len(positions), dtype=bool)
+    is_cut[ranks] = True
+    below = np.cumsum(is_cut)
+    below -= is_cut
+
+    pair = np.repeat(np.arange(n), [len(r2) for r2 in r2_ranks])
+    queries = np.concatenate(r2_ranks)
+    # Indices of the neighbouring cuts of ``enzyme`` on each side
+    left = below[queries] - 1
+    right = left + 1
+    shared = is_cut[queries]
+    dropped = None
+    if shared.any():
+        # Where both enzymes cut at the same position, Digest keeps whichever
+        # enzyme comes last in Digest.enzymes, i.e. by name. If that's
+        # ``enzyme``, the r2 cut is dropped, and so borders no fragments, and
+        # splits its run at the cut of ``enzyme``. Otherwise that cut is
+        # skipped over.
+        r2_first = np.array([str(r2) < str(enzyme) for r2 in r2_enzymes],
+                            dtype=bool)
+        dropped = shared & r2_first[pair]
+        left += dropped
+        right += shared & ~dropped
+
+    # Successive r2 cuts with no cut of ``enzyme`` between them form a run, of
+    # which only the first borders one on its left, and only the last on its
+    # right.
+    starts = np.ones(len(pair), dtype=bool)
+    starts[1:] = (pair[1:] != pair[:-1]) | (right[:-1] <= left[1:])
+    ends = np.ones(len(pair), dtype=bool)
+    ends[:-1] = starts[1:]
+    starts &= left >= 0
+    ends &= right < len(cuts)
+    if dropped is not None:
+        starts &= ~dropped
+        ends &= ~dropped
+    sizes = np.array([r2.size for r2 in r2_enzymes], dtype=np.int64)
+    queries = positions[queries]
+    lengths = np.concatenate([
+        queries[starts] + sizes[pair[starts]] - cuts[left[starts]],
+        cuts[right[ends]] + enzyme.size - queries[ends],
+    ])
+    pair = np.concatenate([pair[starts], pair[ends]])
+    is_frag = lengths < CONTIG_STRIDE // 2
+    if not is_frag.all():
+        lengths, pair = lengths[is_frag], pair[is_frag]
+    fragments = np.bincount(pair, minlength=n)
+    in_window = (lengths >= minlen) & (lengths <= maxlen)
+    lengths, pair = lengths[in_window], pair[in_window]
+    loci = np.bincount(pair, minlength=n)
+    bp = np.bincount(pair, weights=lengths, minlength=n)
+    for i, r2_enzyme in enumerate(r2_enzymes):
+        yield ScreenResult(enzyme=enzyme, r2_enzyme=r2_enzyme,
+                           sites=len(cuts) + len(r2_ranks[i]),
+                           fragments=int(fragments[i]), loci=int(loci[i]),
+                           bp=int(round(bp[i])))
+
+
+def _batches(r2_enzymes, r2_cuts):
+    # Split r2 enzymes into batches of at most PAIR_BATCH cuts
+    start, total = 0, 0
+    for i, r2 in enumerate(r2_cuts):
+        total += len(r2)
+        if total > PAIR_BATCH and i > start:
+            yield r2_enzymes[start:i], r2_cuts[start:i]
+            start, total = i, len(r2)
+    if start < len(r2_cuts):
+        yield r2_enzymes[start:], r2_cuts[start:]
+
+
+def screen_enzymes(genome_cuts, target, minlen=0, maxlen=None, tolerance=0.5,
+                   pairs=True):
+    '''Screens single enzymes and enzyme pairs for the number of loci they give
+
+    ``genome_cuts`` is as returned by ``genome_sites()``. Enzymes or pairs that
+    cannot possibly give at least ``target * (1 - tolerance)`` loci are
+    skipped: one enzyme gives at most one fragment fewer than its number of
+    cuts, and a pair gives at most ``most_pair_loci()`` of either enzyme,
+    which is twice the number of cuts of its rarer enzyme when ``minlen`` is
+    0. The remaining pairs including each enzyme are merged together (see
+    ``pair_summaries()``).
+
+    Returns a list of ``ScreenResult``, with those closest to ``target``
+    first, and the number of enzymes and pairs that were pruned.
+    '''
+    if maxlen is None:
+        maxlen = CONTIG_STRIDE
+    lowest = target * (1 - tolerance)
+    results = []
+    pruned = 0
+
+    enzymes = sorted(genome_cuts, key=str)
+    for enzyme in enzymes:
+        cuts = genome_cuts[enzyme]
+        if len(cuts) < lowest:
+            pruned += 1
+            continue
+        lengths = single_fragment_lengths(cuts, enzyme.size)
+        results.append(_summarise(enzyme, None, len(cuts), lengths, minlen,
+                                  maxlen))
+
+    if pairs:
+        size = max([enzyme.size for enzyme in enzymes] or [0])
+        most = {enzyme: most_pair_loci(genome_cuts[enzyme], minlen, size)
+                for enzyme in enzymes}
+        positions = np.unique(np.concatenate(
+            [genome_cuts[enzyme] for enzyme in enzymes] or [[]]).astype(
+                np.int64))
+        ranks = {enzyme: np.searchsorted(positions, genome_cuts[enzyme])
+                 for enzyme in enzymes}
+        # Pair each enzyme with those with fewer cuts, to look those up
+        by_cuts = sorted(enzymes, key=lambda e: (len(genome_cuts[e]), str(e)))
+        for i, enzyme in enumerate(by_cuts):
+            cuts = genome_cuts[enzyme]
+            r2_enzymes = []
+            for r2_enzyme in by_cuts[:i]:
+                r2_cuts = genome_cuts[r2_enzyme]
+                if min(most[enzyme], most[r2_enzyme]) < lowest:
+                    pruned += 1
+                elif enzyme.same_cuts(r2_enzyme):
+                    # Strict isoschizomers, which Digest treats as one enzyme
+                    lengths = pair_fragment_lengths(enzyme, cuts, r2_enzyme,
+                                                    r2_cuts)
+                    results.append(_summarise(enzyme, r2_enzyme,
+                                              len(cuts) + len(r2_cuts),
+                                              lengths, minlen, maxlen))
+                else:
+                    r2_enzymes.append(r2_enzyme)
+            for batch in _batches(r2_enzymes, [ranks[r2_enzyme]
+                                               for r2_enzyme in r2_enzymes]):
+                results.extend(pair_summaries(enzyme, ranks[enzyme], batch[0],
+                                              batch[1], positions, minlen,
+                                              maxlen))
+        # Name each pair's enzymes in order
+        results = [res._replace(enzyme=res.r2_enzyme, r2_enzyme=res.enzyme)
+                   if res.r2_enzyme is not None and
+                   str(res.r2_enzyme) < str(res.enzyme) else res
+                   for res in results]
+
+    results.sort(key=lambda r: (abs(r.loci - target), str(r.enzyme),
+                                str(r.r2_enzyme)))
+    return results, pruned
@@ -0,0 +1,257 @@
+from __future__ import print_function, division, absolute_import
+import bz2
+from collections import deque
+import gzip
+import io
+from multiprocessing import cpu_count
+from multiprocessing.pool import ThreadPool
+import struct
+import zlib
+
+# Threads decompressing BGZF input, by default
+BGZF_READ_THREADS = min(4, cpu_count())
+
+
+def is_bgzf(path):
+    '''Whether ``path`` is BGZF compressed (e.g. by ``bgzip``)'''
+    with open(path, 'rb') as fh:
+        header = fh.read(16)
+    return (len(header) == 16 and header[:4] == b'\x1f\x8b\x08\x04' and
+            header[12:14] == b'BC')
+
+
+def _inflate(cdata):
+    return zlib.decompress(cdata, -15)
+
+
+class BgzfReader(io.RawIOBase):
+    '''Reads a BGZF file, decompressing blocks on a pool of ``threads``
+    threads.
+
+    Each block's compressed size is in its header, so blocks are split off
+    without decompressing them, and up to ``4 * threads`` are decompressed
+    ahead of the reader. zlib releases the GIL, so decompression overlaps
+    with whatever the reading thread does with the data, e.g. digestion.
+    '''
+
+    def __init__(self, path, threads=None):
+        self._file = open(path, 'rb')
+        self._threads = threads or BGZF_READ_THREADS
+        self._pool = ThreadPool(self._threads)
+        self._pending = deque()
+        self._data = b''
+        self._pos = 0
+        self._eof = False
+
+    def _read_block(self):
+        '''Returns the next block's compressed data, or None at the end'''
+        header = self._file.read(12)
+        if len(header) < 12:
+            return None
+        xlen, = struct.unpack('<H', header[10:12])
+        extra = self._file.read(xlen)
+        bsize = None
+        pos = 0
+        while pos + 4 <= xlen:
+            sub_id, sub_len = extra[pos:pos + 2], struct.unpack(
+                '<H', extra[pos + 2:pos + 4])[0]
+            if sub_id == b'BC':
+                bsize, = struct.unpack('<H', extra[pos + 4:pos + 6])
+            pos += 4 + sub_len
+        if bsize is None:
+            raise IOError("Not a BGZF block at offset {}".format(
+                self._file.tell() - 12 - xlen))
+        cdata = self._file.read(bsize - xlen - 19)
+        self._file.read(8)  # CRC32 and ISIZE
+        return cdata
+
+    def _fill(self):
+        while not self._eof and len(self._pending) < 4 * self._threads:
+            cdata = self._read_block()
+            if cdata is None:
+                self._eof = True
+                break
+            self._pending.append(self._pool.apply_async(_inflate, (cdata,)))
+
+    def readable(self):
+        return True
+
+    def readinto(self, buf):
+        while self._pos >= len(self._data):
+            self._fill()
+            if not self._pending:
+                return 0
+            self._data = self._pending.popleft().get()
+            self._pos = 0
+        size = min(len(buf), len(self._data) - self._pos)
+        buf[:size] = self._data[self._pos:self._pos + size]
+        self._pos += size
+        return size
+
+    def close(self):
+        if not self.closed:
+            self._pool.terminate()
+            self._file.close()
+        super(BgzfReader, self).close()
+
+
+def open_seqfile(path, threads=None):
+    '''Opens a (possibly gzip or bzip2 compressed) sequence file as text.
+    BGZF files are decompressed by ``BgzfReader``, on ``threads`` threads.'''
+    if is_bgzf(path):
+        return io.TextIOWrapper(io.BufferedReader(BgzfReader(path, threads),
+                                                  1 << 20))
+    with open(path, 'rb') as fh:
+        magic = fh.read(3)
+    if magic[:2] == b'\x1f\x8b':
+        return io.TextIOWrapper(gzip.open(path))
+    if magic == b'BZh':
+        return io.TextIOWrapper(bz2.BZ2File(path))
+    return open(path)
+
+
+def _header_name(header):
+    '''The name of a record, as screed gives with ``parse_description``'''
+    fields = header[1:].split(None, 1)
+    return fields[0] if fields else ''
+
+
+def sequence_bytes(sequence, start, stop):
+    '''Returns bases ``[start, stop)`` of ``sequence`` as bytes. Lazy
+    sequences, e.g. ``TwoBitSequence``, are decoded straight to bytes.'''
+    if hasattr(sequence, 'tobytes'):
+        return sequence.decode(start, stop)
+    data = sequence[start:stop]
+    if isinstance(data, bytes):
+        return data
+    return data.encode('ascii')
+
+
+class FastaRecord(object):
+    '''A fasta record, with ``name`` and ``sequence`` as from screed'''
+
+    def __init__(self, name, sequence):
+        self.name = name
+        self.sequence = sequence
+
+
+def iter_fasta_records(path, threads=None):
+    '''Yields each record of (possibly compressed) fasta file ``path``'''
+    with open_seqfile(path, threads) as fh:
+        name = None
+        parts = []
+        for line in fh:
+            if line.startswith('>'):
+                if name is not None:
+                    yield FastaRecord(name, ''.join(parts))
+                name = _header_name(line)
+                parts = []
+            else:
+                parts.append(line.strip())
+        if name is not None:
+            yield FastaRecord(name, ''.join(parts))
+
+
+def _contig_windows(lines, size, overlap, state):
+    parts = []
+    buffered = 0
+    start = 0
+    state['header'] = None
+    for line in lines:
+        if line.startswith('>'):
+            state['header'] = line
+            break
+        line = line.strip()
+        parts.append(line)
+        buffered += len(line)
+        while buffered >= size + overlap:
+            data = ''.join(parts)
+            yield start, data[:size + overlap], False
+            data = data[size:]
+            parts = [data]
+            buffered = len(data)
+            start += size
+    yield start, ''.join(parts), True
+
+
+def iter_fasta_windows(path, size, overlap=0):
+    '''Reads each sequence in fasta file ``path`` as overlapping windows.
+
+    Yields ``(name, windows)`` for each sequence, where ``windows`` yields
+    ``(start, sequence, last)`` tuples. Each window holds the bases ``[start,
+    start + size + overlap)``, and successive windows start ``size`` bases
+    apart. ``last`` is True for the final window of each sequence, which may
+    be shorter. Only one window of a sequence is in memory at a time.
+
+    As with ``itertools.groupby``, ``windows`` must be consumed before moving
+    on to the next sequence.
+    '''
+    with open_seqfile(path) as fh:
+        lines = iter(fh)
+        header = None
+        for line in lines:
+            if line.startswith('>'):
+                header = line
+                break
+        state = {}
+        while header is not None:
+            windows = _contig_windows(lines, size, overlap, state)
+            yield _header_name(header), windows
+            # Skip whatever the caller didn't read
+            for _ in windows:
+                pass
+            header = state['header']
+
+
+class RollingSequence(object):
+    '''The most recent bases of a sequence being read in windows.
+
+    Supports slicing with coordinates of the whole sequence, as long as the
+    slice lies within the last ``keep`` bases added.
+    '''
+
+    def __init__(self, keep):
+        self.keep = keep
+        self.offset = 0
+        self.data = ''
+
+    def add(self, start, window):
+        '''Adds ``window``, which starts at ``start`` in the whole sequence'''
+        end = self.offset + len(self.data)
+        self.data += window[end - start:]
+        if len(self.data) > self.keep:
+            trim = len(self.data) - self.keep
+            self.data = self.data[trim:]
+            self.offset += trim
+
+    def __len__(self):
+        '''Number of bases read so far'''
+        return self.offset + len(self.data)
+
+    def __getitem__(self, item):
+        if not isinstance(item, slice) or item.step is not None:
+            raise TypeError("RollingSequence only supports simple slices")
+        start = 0 if item.start is None else item.start
+        stop = len(self) if item.stop is None else item.stop
+        if start < self.offset:
+            raise IndexError("Bases before {} are no longer kept".format(
+                self.offset))
+        return self.data[start - self.offset:stop - self.offset]
+
+
+class WindowedRecord(object):
+    '''Stands in for a screed record of a sequence read in windows.
+
+    ``sequence`` is a ``RollingSequence``, which is kept up to date as
+    ``windows`` is consumed.
+    '''
+
+    def __init__(self, name, windows, keep):
+        self.name = name
+        self.sequence = RollingSequence(keep)
+        self._windows = windows
+
+    def windows(self):
+        for start, window, last in self._windows:
+            self.sequence.add(start, window)
+            yield start, window, last
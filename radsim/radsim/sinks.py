@@ -0,0 +1,228 @@
+'''Outputs fed from a single digestion pass.
+
+Each ``Sink`` receives the sites and/or fragment tables of every sequence as
+the genome is digested, so any combination of outputs needs the genome to be
+read and searched only once (see ``run_sinks()``).
+'''
+from __future__ import print_function, division, absolute_import
+import sys
+
+import numpy as np
+
+from .stats import LengthStats, write_length_stats
+from .utils import (
+    seqfile_iter_fragment_tables,
+    seqfile_iter_site_arrays,
+    seqfile_iter_site_fragment_tables,
+)
+
+
+class Sink(object):
+    '''Base class of outputs. Subclasses set ``wants_sites`` and/or
+    ``wants_fragments``, and override the matching ``add_*()`` methods, which
+    are called in genome order, and ``close()`` to finish the output.
+
+    ``force_different_enzymes`` is whether the sink only wants fragments with
+    different enzymes at each end, or None to take what ``run_sinks()`` is
+    asked for.'''
+    wants_sites = False
+    wants_fragments = False
+    force_different_enzymes = None
+
+    def add_sites(self, read, sites, codes):
+        '''Adds sites, as from ``Digest.site_arrays()``'''
+
+    def add_fragments(self, read, table):
+        '''Adds a fragment table, as from ``Digest.fragments_array()``'''
+
+    def close(self):
+        pass
+
+
+class HistogramSink(Sink):
+    '''Writes a ``stats.Histogram`` of fragment lengths to ``stream``'''
+    wants_fragments = True
+
+    def __init__(self, hist, stream, force_different_enzymes=None):
+        self.hist = hist
+        self.stream = stream
+        self.force_different_enzymes = force_different_enzymes
+
+    def add_fragments(self, read, table):
+        self.hist.add(table['len'])
+
+    def close(self):
+        for i, first, last, count in self.hist.rows():
+            range_str = "{}-{}".format(first, last)
+            print(i, range_str, count, sep='\t', file=self.stream)
+
+
+class LengthStatsSink(Sink):
+    '''Writes fragment length statistics for each sequence, and the whole
+    genome (as contig ``*``), to ``stream``'''
+    wants_fragments = True
+
+    def __init__(self, stream, force_different_enzymes=None):
+        self.stream = stream
+        self.force_different_enzymes = force_different_enzymes
+        self.stats = []
+        self._read = None
+
+    def add_fragments(self, read, table):
+        if read is not self._read:
+            self.stats.append((read.name, LengthStats()))
+            self._read = read
+        self.stats[-1][1].add(table['len'])
+
+    def close(self):
+        genome = LengthStats()
+        for _, contig in self.stats:
+            genome.merge(contig)
+        write_length_stats(self.stats + [('*', genome)], self.stream)
+
+
+class FragmentBedSink(Sink):
+    '''Writes fragments to a ``writers.BedWriter``, named by the enzymes at
+    their ends. Closing the sink closes the writer and its stream.'''
+    wants_fragments = True
+
+    def __init__(self, writer, enzymes):
+        self.writer = writer
+        self.enzymes = enzymes
+
+    def add_fragments(self, read, table):
+        self.writer.write_fragments(read.name, table, self.enzymes)
+
+    def close(self):
+        self.writer.close()
+        self.writer.stream.close()
+
+
+class FragmentFastaSink(Sink):
+    '''Writes fragment sequences to a ``writers.FastaWriter``, closing it
+    and its stream when closed'''
+    wants_fragments = True
+
+    def __init__(self, writer):
+        self.writer = writer
+
+    def add_fragments(self, read, table):
+        self.writer.write_fragments(read, table)
+
+    def close(self):
+        self.writer.close()
+        self.writer.stream.close()
+
+
+def _no_intervals():
+    return (np.zeros(0, dtype=np.int64), np.zeros(0, dtype=np.int64),
+            np.zeros(0, dtype=object))
+
+
+class SiteBedSink(Sink):
+    '''Writes each RE site to a ``writers.BedWriter``, named by its enzyme,
+    with ``window`` bases either side.
+
+    Intervals are clipped to the sequence. Closing the sink closes the writer
+    and its stream. Sequences read in windows (see
+    ``seqio.WindowedRecord``) only have a length once read to the end, so
+    intervals that may reach past the bases read so far are held back until
+    then.
+    '''
+    wants_sites = True
+
+    def __init__(self, writer, enzymes, window=0):
+        self.writer = writer
+        self.window = window
+        self.names = np.array([str(enzyme) for enzyme in enzymes],
+                              dtype=object)
+        self.sizes = np.array([enzyme.size for enzyme in enzymes],
+                              dtype=np.int64)
+        self._read = None
+        # (starts, stops, labels) of the intervals held back
+        self._held = _no_intervals()
+
+    def _write(self, name, starts, stops, labels):
+        if len(starts):
+            self.writer.write_many(name, starts, stops, labels)
+
+    def _release(self):
+        if self._read is not None:
+            starts, stops, labels = self._held
+            self._write(self._read.name, starts,
+                        np.minimum(stops, len(self._read.sequence)), labels)
+
+    def add_sites(self, read, sites, codes):
+        if read is not self._read:
+            self._release()
+            self._read = read
+            self._held = _no_intervals()
+        held = self._held
+        starts = np.concatenate((held[0], np.maximum(sites - self.window, 0)))
+        stops = np.concatenate((held[1],
+                                sites + self.sizes[codes] + self.window))
+        labels = np.concatenate((held[2], self.names[codes]))
+        # Write up to the first interval that may still need clipping
+        past = np.flatnonzero(stops > len(read.sequence))
+        ready = past[0] if len(past) else len(stops)
+        self._write(read.name, starts[:ready], stops[:ready], labels[:ready])
+        self._held = starts[ready:], stops[ready:], labels[ready:]
+
+    def close(self):
+        self._release()
+        self.writer.close()
+        self.writer.stream.close()
+
+
+def run_sinks(seqfile, digestor, sinks, minlen=0, maxlen=sys.maxsize,
+              threads=1, chunk_size=None, regions=None, progress=None,
+              force_different_enzymes=True, **kwargs):
+    '''Digests ``seqfile`` once, feeding the sites and/or fragments of each
+    sequence to every one of ``sinks``, then closes them.
+
+    Fragments are between ``minlen`` and ``maxlen`` long; sites are all those
+    found. ``force_different_enzymes`` applies to sinks that don't set their
+    own. Other arguments are as for ``utils.seqfile_iter_fragment_tables()``.
+    '''
+    want_sites = any(sink.wants_sites for sink in sinks)
+    want_fragments = any(sink.wants_fragments for sink in sinks)
+    site_sinks = [sink for sink in sinks if sink.wants_sites]
+    fragment_sinks = [sink for sink in sinks if sink.wants_fragments]
+    # Whether each fragment sink wants fragments with different enzymes. If
+    # any wants all of them, those are found, and filtered for the rest.
+    different = [force_different_enzymes
+                 if sink.force_different_enzymes is None
+                 else sink.force_different_enzymes for sink in fragment_sinks]
+    kwargs['force_different_enzymes'] = all(different)
+    filtered = any(different) and not all(different)
+    # Only find what's needed; sites can only be found in chunks along with
+    # fragments
+    if want_sites and (want_fragments or chunk_size):
+        if not want_fragments:
+            # No need to keep the bases of long fragments
+            maxlen = 0
+        results = seqfile_iter_site_fragment_tables(
+            seqfile, digestor, minlen, maxlen, threads=threads,
+            chunk_size=chunk_size, regions=regions, progress=progress,
+            **kwargs)
+    elif want_sites:
+        sites = seqfile_iter_site_arrays(seqfile, digestor, threads=threads,
+                                         regions=regions, progress=progress)
+        results = ((read, (found, codes, None))
+                   for read, (found, codes) in sites)
+    else:
+        tables = seqfile_iter_fragment_tables(
+            seqfile, digestor, minlen, maxlen, threads=threads,
+            chunk_size=chunk_size, regions=regions, progress=progress,
+            **kwargs)
+        results = ((read, (None, None, table)) for read, table in tables)
+    for read, (sites, codes, table) in results:
+        for sink in site_sinks:
+            sink.add_sites(read, sites, codes)
+        if filtered:
+            different_table = digestor.different_enzymes(table)
+        for sink, different_enzymes in zip(fragment_sinks, different):
+            sink.add_fragments(read, different_table if filtered and
+                               different_enzymes else table)
+    for sink in sinks:
+        sink.close()
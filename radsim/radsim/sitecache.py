@@ -0,0 +1,135 @@
+from __future__ import print_function, division, absolute_import
+import hashlib
+import os
+
+import numpy as np
+
+from .engines import _as_bytes
+
+_SUFFIX = '.sites.npz'
+
+# Sequences shorter than this are searched faster than their entry is loaded
+MIN_LENGTH = 50000
+
+# Fraction of max_bytes that eviction leaves, so it isn't needed again for a
+# while
+EVICT_TO = 0.9
+
+
+class SiteCache(object):
+    '''An on-disk cache of the RE sites of sequences, shared between runs.
+
+    Entries are keyed by a checksum of the sequence and the names of the
+    enzymes, so a cache directory can be shared by any number of genomes and
+    enzyme combinations. Each holds the sorted site positions, delta encoded
+    in the narrowest integer type that fits, and the enzyme at each site as an
+    index into the (sorted) enzyme names, compressed with
+    ``numpy.savez_compressed``.
+
+    Sequences shorter than ``min_length`` aren't cached, as loading their
+    entry would be slower than searching them again.
+
+    If ``max_bytes`` is given, the least recently used entries are deleted
+    whenever new ones push the cache past that size, down to ``EVICT_TO`` of
+    it. The size of the cache is counted when the first entry is stored, and
+    then kept up to date, so storing an entry doesn't list the directory.
+    '''
+
+    def __init__(self, directory, max_bytes=None, min_length=MIN_LENGTH):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.min_length = min_length
+        self._total = None
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def caches(self, sequence):
+        '''Whether the sites of ``sequence`` are worth caching'''
+        return len(sequence) >= self.min_length
+
+    def key(self, sequence, enzymes):
+        '''Returns the key of the sites of ``enzymes`` in ``sequence``'''
+        digest = hashlib.sha1()
+        digest.update(' '.join(str(enzyme) for enzyme in enzymes).encode('ascii'))
+        digest.update(b'\0')
+        digest.update(_as_bytes(sequence))
+        return digest.hexdigest()
+
+    def path(self, key):
+        return os.path.join(self.directory, key + _SUFFIX)
+
+    def get(self, key, enzymes):
+        '''Returns ``(sites, codes)`` arrays stored under ``key``, or None.
+        ``codes`` index ``enzymes``, which must be the ones stored.'''
+        path = self.path(key)
+        try:
+            with np.load(path) as entry:
+                names = entry['enzymes'].tolist()
+                first = entry['first']
+                deltas = entry['deltas']
+                codes = entry['codes']
+            # Mark as recently used
+            os.utime(path, None)
+        except (IOError, OSError, KeyError, ValueError):
+            # Missing, or evicted or corrupted under us
+            return None
+        if names != [str(enzyme) for enzyme in enzymes]:
+            return None
+        return np.cumsum(deltas, dtype=np.int64) + int(first), codes
+
+    def put(self, key, enzymes, sites, codes):
+        '''Stores sorted ``sites`` with ``codes`` indexing ``enzymes``'''
+        sites = np.asarray(sites, dtype=np.int64)
+        first = sites[0] if len(sites) else 0
+        deltas = np.diff(sites, prepend=first)
+        deltas = deltas.astype(np.min_scalar_type(deltas.max() if len(deltas)
+                                                  else 0))
+        path = self.path(key)
+        # Write then rename, so concurrent runs never see a partial entry
+        tmp = '{}.{}.tmp.npz'.format(path, os.getpid())
+        np.savez_compressed(tmp, enzymes=np.array([str(e) for e in enzymes]),
+                            first=np.int64(first), deltas=deltas,
+                            codes=np.asarray(codes, dtype=np.uint8))
+        try:
+            # The entry this replaces, if any, no longer counts
+            replaced = os.path.getsize(path)
+        except OSError:
+            replaced = 0
+        os.rename(tmp, path)
+        if self.max_bytes is None:
+            return
+        if self._total is None:
+            self._total = sum(size for _, size, _ in self.entries())
+        else:
+            self._total += os.path.getsize(path) - replaced
+        if self._total > self.max_bytes:
+            self._total = self.evict(int(self.max_bytes * EVICT_TO))
+
+    def entries(self):
+        '''Returns ``(mtime, size, path)`` of each entry, oldest first'''
+        entries = []
+        for name in os.listdir(self.directory):
+            if not name.endswith(_SUFFIX):
+                continue
+            path = os.path.join(self.directory, name)
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            entries.append((stat.st_mtime, stat.st_size, path))
+        return sorted(entries)
+
+    def evict(self, max_bytes):
+        '''Deletes least recently used entries until at most ``max_bytes``
+        remain, returning the bytes remaining'''
+        entries = self.entries()
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in entries:
+            if total <= max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+            total -= size
+        return total
@@ -0,0 +1,220 @@
+from __future__ import print_function, division, absolute_import
+from fractions import Fraction
+import math
+
+import numpy as np
+
+
+class Histogram(object):
+    '''A histogram of integer lengths in ``[lo, hi]``, in fixed bins, filled
+    incrementally from arrays of lengths.
+
+    Bins are evenly spaced, or if ``log`` is True, evenly spaced on a log
+    scale. Bin edges are whole numbers, so there may be fewer than ``bins``
+    bins if the range is narrow (or, with ``log``, starts low). Lengths
+    outside ``[lo, hi]`` are counted in ``below`` and ``above``.
+    '''
+
+    def __init__(self, lo, hi, bins=100, log=False):
+        if hi < lo:
+            raise ValueError("Histogram range is empty")
+        if bins < 1:
+            raise ValueError("Histogram needs at least one bin")
+        self.lo = lo
+        self.hi = hi
+        self.log = log
+        if log:
+            edges = np.geomspace(max(lo, 1), hi + 1, bins + 1)
+        else:
+            edges = np.linspace(lo, hi + 1, bins + 1)
+        edges = np.unique(np.round(edges).astype(np.int64))
+        edges[0] = lo
+        # Bin i holds lengths edges[i] to edges[i + 1] - 1
+        self.edges = edges
+        self.counts = np.zeros(len(edges) - 1, dtype=np.int64)
+        self.below = 0
+        self.above = 0
+
+    def add(self, lengths):
+        '''Counts each of the array of ``lengths``'''
+        lengths = np.asarray(lengths)
+        inside = (lengths >= self.lo) & (lengths <= self.hi)
+        self.below += int(np.count_nonzero(lengths < self.lo))
+        self.above += int(np.count_nonzero(lengths > self.hi))
+        bins = np.searchsorted(self.edges, lengths[inside], side='right') - 1
+        self.counts += np.bincount(bins, minlength=len(self.counts))
+
+    def merge(self, other):
+        '''Adds the counts of ``other``, which must have the same bins'''
+        if not np.array_equal(self.edges, other.edges):
+            raise ValueError("Can't merge histograms with different bins")
+        self.counts += other.counts
+        self.below += other.below
+        self.above += other.above
+
+    def rows(self):
+        '''Yields ``(bin number, first length, last length, count)`` for each
+        bin, numbered from 1'''
+        edges = self.edges.tolist()
+        for i, count in enumerate(self.counts.tolist()):
+            yield i + 1, edges[i], edges[i + 1] - 1, count
+
+
+# Lengths below this are counted in an array; LengthStats counts longer ones
+# individually
+DENSE_LENGTHS = 1 << 20
+
+
+class LengthStats(object):
+    '''Summary statistics of integer lengths, added piecewise from arrays.
+
+    Lengths are kept as exact counts of each length, so statistics from
+    separate parts of a genome, or separate workers, ``merge()`` exactly, in
+    any order. Quantiles are exact too, rather than estimated as by a t-digest
+    or KLL sketch.
+
+    Lengths below ``dense`` are counted in an array, ``counts``, taking at
+    most ``8 * dense`` bytes (8 MB by default). Longer lengths are counted in
+    a dict, ``long``, which stays small however long they are, as a genome
+    can only hold a few fragments that long. Memory is therefore bounded
+    without limiting lengths to ``--max``.
+    '''
+
+    def __init__(self, lengths=(), dense=DENSE_LENGTHS):
+        self.dense = dense
+        self.counts = np.zeros(0, dtype=np.int64)
+        self.long = {}
+        self.add(lengths)
+
+    def _grow(self, size):
+        if size > len(self.counts):
+            counts = np.zeros(size, dtype=np.int64)
+            counts[:len(self.counts)] = self.counts
+            self.counts = counts
+
+    def _add_long(self, length, count):
+        if length < self.dense:
+            self._grow(length + 1)
+            self.counts[length] += count
+        else:
+            self.long[length] = self.long.get(length, 0) + count
+
+    def _add_counts(self, counts):
+        # Adds counts of each length from 0
+        for length in np.flatnonzero(counts[self.dense:]).tolist():
+            length += self.dense
+            self._add_long(length, int(counts[length]))
+        counts = counts[:self.dense]
+        self._grow(len(counts))
+        self.counts[:len(counts)] += counts
+
+    def add(self, lengths):
+        '''Adds each of the array of ``lengths``'''
+        lengths = np.asarray(lengths, dtype=np.int64)
+        if not len(lengths):
+            return
+        if lengths.min() < 0:
+            raise ValueError("Lengths can't be negative")
+        is_long = lengths >= self.dense
+        if is_long.any():
+            values, counts = np.unique(lengths[is_long], return_counts=True)
+            for length, count in zip(values.tolist(), counts.tolist()):
+                self._add_long(length, count)
+            lengths = lengths[~is_long]
+        self._add_counts(np.bincount(lengths))
+
+    def merge(self, other):
+        '''Adds the lengths counted by ``other``'''
+        self._add_counts(other.counts)
+        for length, count in other.long.items():
+            self._add_long(length, count)
+
+    def _lengths(self):
+        # Arrays of each length counted, in order, and its count
+        lengths = np.flatnonzero(self.counts)
+        counts = self.counts[lengths]
+        if self.long:
+            long_lengths = sorted(self.long)
+            lengths = np.concatenate([lengths, long_lengths])
+            counts = np.concatenate([counts, [self.long[length]
+                                              for length in long_lengths]])
+        return lengths, counts
+
+    @property
+    def n(self):
+        return int(self.counts.sum()) + sum(self.long.values())
+
+    def _sums(self):
+        # Exact, as python ints, however large
+        lengths, counts = self._lengths()
+        counts = counts.tolist()
+        lengths = lengths.tolist()
+        return (sum(c * x for c, x in zip(counts, lengths)),
+                sum(c * x * x for c, x in zip(counts, lengths)))
+
+    @property
+    def mean(self):
+        n = self.n
+        if not n:
+            return None
+        return self._sums()[0] / n
+
+    @property
+    def variance(self):
+        '''Sample variance, or None for fewer than two lengths'''
+        n = self.n
+        if n < 2:
+            return None
+        total, squares = self._sums()
+        return (n * squares - total * total) / (n * (n - 1))
+
+    @property
+    def stdev(self):
+        variance = self.variance
+        return None if variance is None else variance ** 0.5
+
+    @property
+    def min(self):
+        lengths = self._lengths()[0]
+        return int(lengths[0]) if len(lengths) else None
+
+    @property
+    def max(self):
+        lengths = self._lengths()[0]
+        return int(lengths[-1]) if len(lengths) else None
+
+    def quantile(self, q):
+        '''The smallest length with at least a fraction ``q`` of lengths at
+        or below it (numpy's 'inverted_cdf' quantile)'''
+        if not 0 <= q <= 1:
+            raise ValueError("Quantiles must be between 0 and 1")
+        n = self.n
+        if not n:
+            return None
+        # Fraction avoids rounding up e.g. 0.3 * 10 to just over 3
+        rank = max(1, int(math.ceil(Fraction(q) * n)))
+        lengths, counts = self._lengths()
+        return int(lengths[np.searchsorted(np.cumsum(counts), rank)])
+
+    @property
+    def median(self):
+        return self.quantile(0.5)
+
+
+# Columns written by write_length_stats()
+STATS_QUANTILES = (0.05, 0.25, 0.5, 0.75, 0.95)
+STATS_HEADER = (['contig', 'fragments', 'mean', 'stdev', 'min'] +
+                ['p{:g}'.format(q * 100) for q in STATS_QUANTILES] + ['max'])
+
+
+def write_length_stats(stats, stream):
+    '''Writes a table of ``stats``, a list of ``(name, LengthStats)``'''
+    print(*STATS_HEADER, sep='\t', file=stream)
+    for name, stat in stats:
+        row = [name, stat.n] + [None if x is None else '{:.2f}'.format(x)
+                                for x in (stat.mean, stat.stdev)]
+        row.append(stat.min)
+        row += [stat.quantile(q) for q in STATS_QUANTILES]
+        row.append(stat.max)
+        print(*['NA' if x is None else x for x in row], sep='\t',
+              file=stream)
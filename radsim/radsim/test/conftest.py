@@ -0,0 +1,24 @@
+import random
+
+import pytest
+
+
+def _write_genome(path, lengths, seed=5, width=60):
+    '''Writes random sequences of ``lengths`` to fasta ``path``, as contig0,
+    contig1..., with descriptions, returning ``(name, sequence)`` of each'''
+    rand = random.Random(seed)
+    seqs = []
+    with open(str(path), 'w') as fh:
+        for i, length in enumerate(lengths):
+            seq = ''.join(rand.choice('ACGT') for _ in range(length))
+            seqs.append(('contig{}'.format(i), seq))
+            print('>contig{} description'.format(i), file=fh)
+            for start in range(0, length, width):
+                print(seq[start:start + width], file=fh)
+    return seqs
+
+
+@pytest.fixture
+def write_genome():
+    '''The function writing a random test genome'''
+    return _write_genome
@@ -61,3 +61,50 @@ def test_digest_iter_fragments_2_enzymes():
     seq2 = seq[frags[1].lhs:frags[1].rhs]
     assert seq1 == 'CTGCAGacgtaGATATC', seq1
     assert seq2 == 'GATATCacgtCTGCAG', seq2
+
+
+def reference_fragments(dig, sites, force_different_enzymes, minlen, maxlen):
+    '''The original per-site fragment loop, as a reference'''
+    from radsim import Fragment
+    last_enzyme = None
+    last_start = None
+    for cut, enzyme in sites:
+        if last_enzyme is None:
+            last_start = cut
+            last_enzyme = enzyme
+            continue
+        this_end = cut + enzyme.size
+        fraglen = this_end - last_start
+        skip = fraglen < minlen or fraglen > maxlen or (
+            force_different_enzymes and
+            not dig.enzyme.same_cuts(dig.r2_enzyme) and
+            last_enzyme == enzyme)
+        if not skip:
+            yield Fragment(lhs=last_start, rhs=this_end, len=fraglen,
+                           lhs_enzyme=last_enzyme, rhs_enzyme=enzyme)
+        last_enzyme = enzyme
+        last_start = cut
+
+
+def test_digest_fragments_array():
+    '''Check the fragment table agrees with the per-site loop'''
+    import random
+    from radsim import Digest, FRAGMENT_DTYPE
+    from Bio.Restriction import MspI, NlaIII, HpaII
+    rand = random.Random(11)
+    seq = ''.join(rand.choice('ACGT') for _ in range(20000))
+    for dig in (Digest(MspI, NlaIII), Digest(MspI), Digest(MspI, HpaII)):
+        sites = dig.re_sites(seq)
+        for ddrad in (True, False):
+            table = dig.fragments_array(seq, force_different_enzymes=ddrad,
+                                        minlen=20, maxlen=300, contig=4)
+            assert table.dtype == FRAGMENT_DTYPE
+            assert (table['contig'] == 4).all()
+            expected = list(reference_fragments(dig, sites, ddrad, 20, 300))
+            assert len(expected) > 0
+            assert list(dig.iter_table_fragments(table)) == expected
+            assert list(dig.iter_site_fragments(
+                sites, force_different_enzymes=ddrad, minlen=20,
+                maxlen=300)) == expected
+            assert [dig.enzymes[code] for code in table['lhs_enzyme']] == \
+                [frag.lhs_enzyme for frag in expected]
@@ -0,0 +1,63 @@
+import random
+
+import pytest
+
+from radsim.engines import ENGINES, get_engine
+
+
+def random_seq(length, alphabet='ACGTacgtN', seed=42):
+    rand = random.Random(seed)
+    return ''.join(rand.choice(alphabet) for _ in range(length))
+
+
+@pytest.mark.parametrize('engine', sorted(ENGINES))
+def test_engine_re_sites(engine):
+    '''Check each engine gives the expected sites on a small sequence'''
+    from radsim import Digest
+    from radsim.enzymes import PstI
+    dig = Digest(PstI, engine=engine)
+    seq = "NNCTGCAGacgtaCTGCAGacgtCTGCAGNN"
+    got = list(dig.re_sites(seq))
+    expected = [(2, PstI), (13, PstI), (23, PstI), ]
+    assert got == expected
+
+
+@pytest.mark.parametrize('engine', sorted(ENGINES))
+def test_engine_matches_biopython(engine):
+    '''Check engines agree with Bio.Restriction, across site types
+
+    Includes palindromic and non-palindromic, degenerate, and two-cut enzymes.
+    '''
+    from Bio.Restriction import RestrictionBatch
+    from Bio.Seq import Seq
+    names = ['PstI', 'MspI', 'ApeKI', 'BbvI', 'BaeI', 'BsaJI', 'XcmI',
+             'FspEI']
+    batch = RestrictionBatch(names)
+    eng = get_engine(engine, names)
+    for seq in [random_seq(5000), random_seq(3), '',
+                'GCAGC' + random_seq(20, 'ACGT') + 'GCTGC']:
+        expected = {str(enzyme): cuts for enzyme, cuts in
+                    batch.search(Seq(seq)).items()}
+        got = eng.search(seq)
+        for enzyme in eng.enzymes:
+            assert sorted(got[enzyme]) == sorted(expected[str(enzyme)]), \
+                enzyme
+
+
+def test_unknown_engine():
+    from radsim import Digest
+    with pytest.raises(ValueError):
+        Digest('PstI', engine='nonexistent')
+
+
+def test_aho_corasick_many_enzymes():
+    '''Check the single-pass engine agrees with per-enzyme scanning'''
+    from radsim.digest import RE_ENZYMES
+    names = sorted(RE_ENZYMES)[:40]
+    seq = random_seq(3000)
+    expected = get_engine('bytes', names).search(seq)
+    aho = get_engine('aho-corasick', names, max_expansions=64)
+    assert aho.fallback, 'expected some enzymes to fall back to regexes'
+    got = aho.search(seq)
+    for enzyme in aho.enzymes:
+        assert sorted(got[enzyme]) == sorted(expected[enzyme]), enzyme
@@ -0,0 +1,81 @@
+import re
+import subprocess
+import sys
+
+import pytest
+
+from radsim import enzymes
+from radsim.enzymes import find_enzymes, get_enzyme
+
+
+def test_table_matches_biopython():
+    '''Check every enzyme in the table is as Bio.Restriction describes it'''
+    from Bio.Restriction import Restriction
+    from Bio.Restriction.Restriction_Dictionary import rest_dict
+    group = re.compile(r'\(\?P<(\w+)>([^)]*)\)')
+    token = re.compile(r'\[[A-Z]+\]|\.|[A-Z]')
+    assert enzymes.names() == sorted(rest_dict)
+    for name in rest_dict:
+        bio = getattr(Restriction, name)
+        enzyme = get_enzyme(name)
+        assert str(enzyme) == name
+        assert (enzyme.site, enzyme.size, enzyme.ovhg, enzyme.ovhgseq) == \
+            (bio.site, bio.size, bio.ovhg, bio.ovhgseq)
+        assert enzyme.charac == bio.charac
+        assert list(enzyme.fwd_offsets) == list(bio._modify(0))
+        assert list(enzyme.rev_offsets) == list(bio._rev_modify(0))
+        assert enzyme.palindromic == bio.is_palindromic()
+        assert enzyme.methylable == bio.is_methylable()
+        assert enzyme.cut == 'unknown' if bio.is_unknown() else True
+        assert sorted(enzyme.isoschizomers) == \
+            sorted(str(iso) for iso in bio.isoschizomers())
+        # Sites match as the regexes Biopython searches with do
+        sites = dict(group.findall(bio.compsite.pattern))
+        assert enzyme.site_tokens() == token.findall(sites[name])
+        if not enzyme.palindromic:
+            assert enzyme.site_tokens(-1) == token.findall(sites[name + '_as'])
+
+
+def test_get_enzyme():
+    from Bio.Restriction import PstI
+    pst1 = get_enzyme('PstI')
+    assert get_enzyme(PstI) is pst1
+    assert get_enzyme(pst1) is pst1
+    assert enzymes.PstI is pst1
+    assert (pst1.site, pst1.overhang, pst1.cut) == ('CTGCAG', '3prime',
+                                                    'defined')
+    assert get_enzyme('MspI').same_cuts(get_enzyme('HpaII'))
+    assert not get_enzyme('MspI').same_cuts(get_enzyme('NlaIII'))
+    # Equal to the Bio.Restriction enzyme of the same name only
+    from Bio.Restriction import HpaII, MspI
+    assert pst1 == PstI and get_enzyme('MspI') == MspI
+    assert get_enzyme('MspI') != HpaII and pst1 != 'PstI'
+    assert {pst1, get_enzyme('PstI')} == {pst1}
+    assert str(pst1) == repr(pst1) == 'PstI'
+    with pytest.raises(ValueError):
+        get_enzyme('Pst')
+    with pytest.raises(AttributeError):
+        enzymes.NotAnEnzyme
+
+
+def test_find_enzymes():
+    found = find_enzymes(site_lengths=[6], overhangs=['5prime', 'blunt'])
+    assert found and all(enzyme.size == 6 for enzyme in found)
+    assert set(enzyme.overhang for enzyme in found) == set(['5prime',
+                                                            'blunt'])
+    assert 'EcoRI' in [str(enzyme) for enzyme in found]
+    assert found == sorted(found, key=str)
+    insensitive = find_enzymes(defined=True, methylable=False)
+    assert insensitive
+    assert not any(enzyme.methylable or enzyme.cut == 'unknown'
+                   for enzyme in insensitive)
+    assert len(find_enzymes()) == len(enzymes.names())
+
+
+def test_digest_without_biopython():
+    '''Digesting with the table doesn't import Bio.Restriction'''
+    code = ('import sys; from radsim import Digest; '
+            'Digest("PstI", "MspI").re_sites("CTGCAGCCGG"); '
+            'print("Bio" in sys.modules)')
+    out = subprocess.check_output([sys.executable, '-c', code])
+    assert out.decode().strip() == 'False'
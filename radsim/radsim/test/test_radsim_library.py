@@ -0,0 +1,89 @@
+import numpy as np
+
+from radsim import Digest
+from radsim.digest import FRAGMENT_DTYPE
+from radsim.library import BeadSelection, GelSelection, LibraryModel
+
+
+def fragment_table(lengths):
+    table = np.zeros(len(lengths), dtype=FRAGMENT_DTYPE)
+    table['len'] = lengths
+    table['rhs'] = np.cumsum(lengths)
+    table['lhs'] = table['rhs'] - table['len']
+    return table
+
+
+def test_selection_curves():
+    bead = BeadSelection(200, 400, width=40)
+    kept = bead([100, 200, 300, 400, 600])
+    assert np.allclose(kept[[1, 3]], 0.5, atol=1e-3)
+    assert kept[2] > 0.99 and kept[0] < 0.01 and kept[4] < 0.01
+    # A quarter to three quarters over the width
+    assert np.allclose(bead([180, 220]), [0.25, 0.75], atol=1e-3)
+    gel = GelSelection(200, 400)
+    assert np.allclose(gel([300, 250, 200]), np.exp([0, -0.5, -2]))
+
+
+def test_library_reads():
+    rand = np.random.default_rng(2)
+    contigs = [('chr{}'.format(i), fragment_table(rand.integers(50, 1000, n)))
+               for i, n in enumerate((300, 1, 0, 500))]
+    model = LibraryModel(copies=20, selection=BeadSelection(200, 500),
+                         reads=20000, seed=7)
+    coverages = model.simulate(contigs)
+    assert [len(cov) for cov in coverages] == [300, 1, 0, 500]
+    reads = np.concatenate([cov['reads'] for cov in coverages])
+    unique = np.concatenate([cov['unique'] for cov in coverages])
+    molecules = np.concatenate([cov['molecules'] for cov in coverages])
+    expected = np.concatenate([cov['expected'] for cov in coverages])
+    assert reads.sum() == 20000
+    assert np.isclose(expected.sum(), 20000)
+    assert (unique <= reads).all() and (unique <= molecules).all()
+    assert (reads[molecules == 0] == 0).all()
+    # Well covered fragments sequence most of their molecules
+    deep = reads > 5 * molecules
+    assert deep.sum() > 10
+    assert unique[deep].sum() > 0.9 * molecules[deep].sum()
+    # Sampled coverage follows the expectation
+    assert np.corrcoef(reads, expected)[0, 1] > 0.9
+
+
+def test_library_reproducible():
+    '''Each contig's results depend only on the seed, not on the other
+    contigs, save for the reads they get'''
+    seq = ''.join(np.random.default_rng(1).choice(list('ACGT'), 100000))
+    table = Digest('PstI', 'MspI', engine='numpy').fragments_array(seq)
+    selection = GelSelection(100, 600)
+    model = LibraryModel(selection=selection, seed=3)
+    first = model.simulate([('a', table), ('b', table)])
+    again = LibraryModel(selection=selection, seed=3).simulate(
+        [('a', table), ('b', table)])
+    alone = LibraryModel(selection=selection, seed=3).simulate([('b', table)])
+    assert all((x == y).all() for x, y in zip(first, again))
+    assert (first[1]['molecules'] == alone[0]['molecules']).all()
+    assert not (first[0]['molecules'] == first[1]['molecules']).all()
+    # Shorter fragments amplify better
+    amplification = model.amplification([100, 1000])
+    assert amplification[0] > amplification[1]
+
+
+def test_library_regions_independent():
+    '''Regions of one contig get their own random streams'''
+    table = fragment_table(np.full(500, 300))
+    model = LibraryModel(copies=50, selection=BeadSelection(200, 400),
+                         reads=10000, seed=3)
+    apart = model.simulate([('a', table), ('a', table)], starts=[0, 1000])
+    assert not (apart[0]['molecules'] == apart[1]['molecules']).all()
+    assert not (apart[0]['reads'] == apart[1]['reads']).all()
+    same = model.simulate([('a', table), ('a', table)], starts=[1000, 1000])
+    assert (same[0]['molecules'] == same[1]['molecules']).all()
+    assert (same[1]['molecules'] == apart[1]['molecules']).all()
+
+
+def test_selection_long_fragments():
+    '''Fragments far outside the window are dropped without overflow'''
+    import warnings
+    with warnings.catch_warnings():
+        warnings.simplefilter('error')
+        kept = BeadSelection(200, 400, width=40)([1, 300, 10 ** 6])
+    assert kept[0] < 1e-4 and kept[2] == 0 and kept[1] > 0.99
@@ -0,0 +1,91 @@
+import subprocess
+import sys
+
+from radsim import main
+from radsim.engines import ENGINES
+from radsim.enzymes import OVERHANGS
+
+
+def test_engine_names():
+    assert list(main.ENGINE_NAMES) == sorted(ENGINES)
+    assert main.OVERHANGS == OVERHANGS
+
+
+def test_lazy_imports():
+    '''Importing the package and its commands doesn't import any of the slow
+    dependencies, or run git for the version'''
+    code = ('import sys, radsim, radsim.main; '
+            'print(" ".join(sorted(set(sys.modules) & '
+            '{"Bio", "numpy", "screed", "subprocess"})))')
+    out = subprocess.check_output([sys.executable, '-c', code])
+    assert out.decode().strip() == ''
+
+
+def test_package_exports():
+    import radsim
+    for name in radsim.__all__:
+        assert getattr(radsim, name) is not None
+    assert 'Digest' in dir(radsim)
+
+
+def run_main(monkeypatch, command, argv):
+    monkeypatch.setattr(sys, 'argv', [command] + argv)
+    getattr(main, command)()
+
+
+def test_run_matches_commands(tmpdir, monkeypatch, write_genome):
+    '''Check radsim run writes what radsim-hist and radsim-digest do, with
+    and without --ddrad'''
+    genome = tmpdir.join('genome.fa')
+    write_genome(genome, [3000, 20000, 5000])
+    common = ['-i', str(genome), '-e', 'PstI', '-r', 'MspI', '--min', '10',
+              '--max', '800', '--no-progress']
+    paths = {name: str(tmpdir.join(name)) for name in (
+        'hist', 'stats', 'bed', 'run.hist', 'run.stats', 'run.bed')}
+    for ddrad in ([], ['--ddrad']):
+        run_main(monkeypatch, 'hist_main',
+                 common + ['-o', paths['hist'], '--stats', paths['stats']])
+        run_main(monkeypatch, 'digest_main',
+                 common + ddrad + ['--output-bed', paths['bed']])
+        run_main(monkeypatch, 'radsim_main', ['run'] + common + ddrad + [
+            '--output-hist', paths['run.hist'], '--output-stats',
+            paths['run.stats'], '--output-bed', paths['run.bed']])
+        outputs = {}
+        for name, path in paths.items():
+            with open(path) as fh:
+                outputs[name] = fh.read()
+        for name in ('hist', 'stats', 'bed'):
+            assert outputs[name]
+            assert outputs['run.' + name] == outputs[name], (name, ddrad)
+
+
+def test_regions_of_compressed_fasta(tmpdir, monkeypatch, capsys):
+    import gzip
+    import pytest
+    genome = tmpdir.join('genome.fa.gz')
+    with gzip.open(str(genome), 'wt') as fh:
+        fh.write('>chr1\nACGT\n')
+    with pytest.raises(SystemExit):
+        run_main(monkeypatch, 'hist_main', ['-i', str(genome), '-e', 'PstI',
+                                            '--region', 'chr1:1-2'])
+    assert 'compressed fasta' in capsys.readouterr().err
+
+
+def test_one_stdout_output(tmpdir, monkeypatch, capsys, write_genome):
+    '''Check only one output may go to stdout'''
+    import pytest
+    genome = tmpdir.join('genome.fa')
+    write_genome(genome, [3000])
+    common = ['-i', str(genome), '-e', 'PstI', '--no-progress']
+    for command, argv in [
+            ('radsim_main', ['run'] + common + ['--output-bed', '-',
+                                                '--output-fasta', '-']),
+            ('radsim_main', ['run'] + common + ['--output-hist', '-',
+                                                '--output-sites', '-']),
+            ('digest_main', common + ['--output-bed', '-',
+                                      '--output-fasta', '-']),
+            ('reads_main', common + ['-1', '-', '-2', '-']),
+            ('hist_main', common + ['--stats', '-'])]:
+        with pytest.raises(SystemExit):
+            run_main(monkeypatch, command, argv)
+        assert 'Only one output' in capsys.readouterr().err
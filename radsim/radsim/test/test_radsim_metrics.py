@@ -0,0 +1,63 @@
+import json
+
+from radsim import Digest, metrics
+from radsim.metrics import Metrics, Session
+from radsim.utils import seqfile_iter_fragment_tables
+
+
+def test_metrics_stages():
+    m = Metrics()
+    started = m.start()
+    m.stop('search', started, sites=3, bases_searched=10)
+    m.stop('search', m.start(), sites=2)
+    other = Metrics()
+    other.stop('fragments', other.start(), fragments=4)
+    m.merge(other.snapshot())
+    report = m.report('test')
+    assert report['stages']['search']['calls'] == 2
+    assert report['stages']['fragments']['calls'] == 1
+    assert report['counters'] == {'sites': 5, 'bases_searched': 10,
+                                  'fragments': 4}
+    assert report['peak_rss'] > 0
+    assert list(m.timed(['ACGT', 'AC'], 'read')) == ['ACGT', 'AC']
+    assert m.counters['bases_read'] == 6
+
+
+def digest_counters(genome, **kwargs):
+    session = Session('test')
+    dig = Digest('PstI', 'MspI', engine='numpy')
+    tables = list(seqfile_iter_fragment_tables(genome, dig, 1, 10000,
+                                               **kwargs))
+    report = session.finish()
+    assert metrics.active is None
+    assert [c['name'] for c in report['contigs']] == \
+        ['contig0', 'contig1', 'contig2']
+    assert report['counters']['fragments'] == sum(len(t) for _, t in tables)
+    return report
+
+
+def test_digest_metrics(tmpdir, write_genome):
+    genome = str(tmpdir.join('genome.fa'))
+    write_genome(genome, [20000, 500, 8000])
+    serial = digest_counters(genome)
+    assert serial['counters']['bases_read'] == 28500
+    assert serial['counters']['bases_searched'] == 28500
+    assert set(serial['stages']) == {'read', 'search', 'fragments'}
+    # Workers' measurements are sent back
+    threaded = digest_counters(genome, threads=2)
+    for counter in ('bases_searched', 'sites', 'fragments'):
+        assert threaded['counters'][counter] == serial['counters'][counter]
+    assert 'wait' in threaded['stages']
+    chunked = digest_counters(genome, chunk_size=3000)
+    assert chunked['counters']['sites'] == serial['counters']['sites']
+
+
+def test_session_json(tmpdir):
+    path = str(tmpdir.join('metrics.json'))
+    session = Session('radsim-test', metrics_json=path)
+    Digest('PstI').site_arrays('ACTGCAGT' * 10)
+    session.finish()
+    with open(path) as fh:
+        report = json.load(fh)
+    assert report['command'] == 'radsim-test'
+    assert report['counters']['sites'] == 10
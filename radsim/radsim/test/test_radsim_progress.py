@@ -0,0 +1,41 @@
+import gzip
+import io
+
+from radsim import Digest
+from radsim.progress import Progress, genome_size
+from radsim.regions import write_fai
+from radsim.twobit import fasta_to_twobit
+from radsim.utils import seqfile_iter_frags, seqfile_iter_site_arrays
+
+
+def test_genome_size(tmpdir, write_genome):
+    fasta = str(tmpdir.join('genome.fa'))
+    write_genome(fasta, [6000, 3000])
+    # Estimated without an index
+    assert abs(genome_size(fasta) - 9000) < 100
+    write_fai(fasta, fasta + '.fai')
+    assert genome_size(fasta) == 9000
+    fasta_to_twobit(fasta, str(tmpdir.join('genome.2bit')))
+    assert genome_size(str(tmpdir.join('genome.2bit'))) == 9000
+    gz = str(tmpdir.join('genome.fa.gz'))
+    with open(fasta, 'rb') as src, gzip.open(gz, 'wb') as dst:
+        dst.write(src.read())
+    assert genome_size(gz) is None
+
+
+def test_progress_tracks_bases(tmpdir, write_genome):
+    fasta = str(tmpdir.join('genome.fa'))
+    write_genome(fasta, [6000, 3000, 500])
+    dig = Digest('PstI')
+    for kwargs in ({}, {'threads': 2}, {'chunk_size': 1000}):
+        progress = Progress(9500, stream=io.StringIO())
+        seen = []
+        frags = seqfile_iter_frags(fasta, dig, 1, 10000, progress=progress,
+                                   **kwargs)
+        for read, _ in frags:
+            seen.append(progress.done)
+        assert seen == sorted(seen)
+        assert progress.done == 9500
+    progress = Progress(stream=io.StringIO())
+    list(seqfile_iter_site_arrays(fasta, dig, progress=progress))
+    assert progress.done == 9500
@@ -0,0 +1,118 @@
+import random
+
+import numpy as np
+
+from radsim import Digest
+from radsim.reads import ReadSimulator, format_fastq
+from radsim.seqio import FastaRecord
+
+
+COMPLEMENT = {'A': 'T', 'C': 'G', 'G': 'C', 'T': 'A'}
+
+
+def revcomp(seq):
+    return ''.join(COMPLEMENT[base] for base in reversed(seq))
+
+
+def digest_record(seed=5):
+    rand = random.Random(seed)
+    read = FastaRecord('chr1', ''.join(rand.choice('ACGT')
+                                       for _ in range(30000)))
+    dig = Digest('PstI', 'MspI', engine='numpy')
+    return dig, read, dig.fragments_array(read.sequence, maxlen=1000)
+
+
+def test_reads_without_errors():
+    '''Check R1 reads in from the first enzyme's end, and R2 from the other'''
+    dig, read, table = digest_record()
+    assert len(table)
+    perfect = (np.full(60, 80.0), np.zeros(60))
+    sim = ReadSimulator(dig, read_length=60, profile=perfect, seed=1)
+    names, r1, r2 = sim.simulate(read, table)
+    pstI = [str(e) for e in dig.enzymes].index('PstI')
+    for i, frag in enumerate(table):
+        lhs, rhs = int(frag['lhs']), int(frag['rhs'])
+        assert names[i] == 'chr1_{}_{}_0'.format(lhs, rhs)
+        fwd = read.sequence[lhs:rhs][:60]
+        rev = revcomp(read.sequence[lhs:rhs])[:60]
+        seq1 = r1[0][i, :r1[2][i]].tobytes().decode()
+        seq2 = r2[0][i, :r2[2][i]].tobytes().decode()
+        if frag['lhs_enzyme'] == frag['rhs_enzyme']:
+            assert sorted([seq1, seq2]) == sorted([fwd, rev])
+        elif frag['lhs_enzyme'] == pstI:
+            assert (seq1, seq2) == (fwd, rev)
+        else:
+            assert (seq1, seq2) == (rev, fwd)
+
+
+def test_read_errors():
+    dig, read, table = digest_record()
+    # ddRAD fragments, so R1 always reads from the PstI end
+    table = table[(table['len'] >= 100) &
+                  (table['lhs_enzyme'] != table['rhs_enzyme'])]
+    pstI = [str(e) for e in dig.enzymes].index('PstI')
+    templates = np.array([
+        list(read.sequence[lhs:lhs + 100].encode()) if enz == pstI else
+        list(revcomp(read.sequence[rhs - 100:rhs]).encode())
+        for lhs, rhs, enz in zip(table['lhs'], table['rhs'],
+                                 table['lhs_enzyme'])]).repeat(20, axis=0)
+    # Q10: one error in 10 bases, with no indels
+    profile = (np.full(100, 10.0), np.zeros(100))
+    sim = ReadSimulator(dig, read_length=100, profile=profile,
+                        indel_fraction=0, seed=2)
+    names, r1, r2 = sim.simulate(read, table, copies=20)
+    assert len(names) == 20 * len(table)
+    assert names[1].endswith('_1')
+    bases, quality, lengths = r1
+    assert (lengths == 100).all()
+    assert (quality == ord('+')).all()
+    assert 0.08 < (bases != templates).mean() < 0.12
+
+
+def test_reads_deterministic_fastq():
+    dig, read, table = digest_record()
+    fastq = []
+    for _ in range(2):
+        sim = ReadSimulator(dig, read_length=50, seed=7)
+        names, r1, r2 = sim.simulate(read, table)
+        fastq.append(format_fastq(names, r1, 1))
+    assert fastq[0] == fastq[1]
+    lines = fastq[0].split(b'\n')
+    assert lines[0] == '@chr1_{}_{}_0/1'.format(table['lhs'][0],
+                                                table['rhs'][0]).encode()
+    assert lines[2] == b'+'
+    assert len(lines[1]) == len(lines[3]) <= 50
+
+
+def test_reads_same_across_chunks(tmpdir, write_genome):
+    '''Check reads don't depend on how the genome was digested'''
+    from radsim.utils import seqfile_iter_fragment_tables
+    genome = str(tmpdir.join('genome.fa'))
+    write_genome(genome, [30000, 0, 10, 20000, 5000])
+    dig = Digest('MspI', 'NlaIII', engine='numpy')
+    fastq = []
+    for kwargs in [{}, dict(threads=2), dict(chunk_size=999),
+                   dict(chunk_size=5000)]:
+        sim = ReadSimulator(dig, read_length=50, seed=7, batch_size=30)
+        tables = seqfile_iter_fragment_tables(genome, dig, 10, 1000,
+                                              **kwargs)
+        fastq.append(b''.join(format_fastq(names, r1, 1) +
+                              format_fastq(names, r2, 2)
+                              for names, r1, r2 in
+                              sim.simulate_tables(tables, copies=2)))
+    assert fastq[0].count(b'\n@') > 100
+    assert all(out == fastq[0] for out in fastq[1:])
+
+
+def test_reads_regions_independent():
+    '''Check regions of one contig get their own random streams'''
+    from radsim.regions import RegionRecord
+    dig, read, table = digest_record()
+    sim = ReadSimulator(dig, read_length=50, seed=7)
+    end = len(read.sequence)
+    regions = [RegionRecord(read.name, read.sequence, start, end)
+               for start in (0, 0, 100)]
+    # Qualities are drawn for every base
+    r1s = [sim.simulate(region, table)[1][1] for region in regions]
+    assert (r1s[0] == r1s[1]).all()
+    assert not (r1s[0] == r1s[2]).all()
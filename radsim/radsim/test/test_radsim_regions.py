@@ -0,0 +1,89 @@
+import random
+
+import pytest
+
+from radsim.regions import FastaIndex, parse_region, read_bed_regions
+from radsim.twobit import fasta_to_twobit
+
+
+def test_parse_region():
+    assert parse_region('chr1') == ('chr1', 0, None)
+    assert parse_region('chr1:1-100') == ('chr1', 0, 100)
+    assert parse_region('chr1:1,001-2,000') == ('chr1', 1000, 2000)
+    assert parse_region('chr1:50') == ('chr1', 49, None)
+    assert parse_region('HLA:A*01') == ('HLA:A*01', 0, None)
+    with pytest.raises(ValueError):
+        parse_region('chr1:100-10')
+
+
+def test_read_bed_regions(tmpdir):
+    bed = tmpdir.join('regions.bed')
+    bed.write('track name=x\n# comment\nchr1\t0\t10\tname\nchr2\t5\t7\n')
+    assert read_bed_regions(str(bed)) == [('chr1', 0, 10), ('chr2', 5, 7)]
+
+
+def test_fasta_index_slices(tmpdir, write_genome):
+    '''Check slicing via the .fai index matches the sequences'''
+    fasta = tmpdir.join('genome.fa')
+    seqs = write_genome(fasta, [1000, 60, 7])
+    index = FastaIndex(str(fasta))
+    assert tmpdir.join('genome.fa.fai').check()
+    rand = random.Random(1)
+    for name, seq in seqs:
+        sequence = index.sequence(name)
+        assert len(sequence) == len(seq)
+        assert str(sequence) == seq
+        for _ in range(100):
+            start = rand.randrange(len(seq) + 2)
+            stop = rand.randrange(len(seq) + 2)
+            assert sequence[start:stop] == seq[start:stop]
+
+
+def test_fasta_index_rebuilt(tmpdir, write_genome):
+    '''Check a stale index is rebuilt, and compressed fasta refused'''
+    import gzip
+    import os
+    fasta = tmpdir.join('genome.fa')
+    write_genome(fasta, [100, 200])
+    FastaIndex(str(fasta))
+    fai = str(fasta) + '.fai'
+    os.utime(fai, (0, 0))
+    seqs = write_genome(fasta, [300, 50], seed=8)
+    index = FastaIndex(str(fasta))
+    assert [str(index.sequence(name)) for name, _ in seqs] == \
+        [seq for _, seq in seqs]
+    packed = tmpdir.join('genome.fa.gz')
+    with gzip.open(str(packed), 'wt') as fh:
+        fh.write(fasta.read())
+    with pytest.raises(ValueError):
+        FastaIndex(str(packed))
+
+
+@pytest.mark.parametrize('twobit', [False, True])
+def test_region_sites_match_whole_digest(tmpdir, twobit, write_genome):
+    '''Check region sites are exactly those of a whole-sequence digest'''
+    from radsim import Digest
+    from radsim.utils import iter_region_sites
+    from radsim.enzymes import BsaXI, MspI
+    fasta = tmpdir.join('genome.fa')
+    seqs = write_genome(fasta, [20000, 30])
+    genome = str(fasta)
+    if twobit:
+        genome = str(tmpdir.join('genome.2bit'))
+        fasta_to_twobit(str(fasta), genome)
+    # BsaXI cuts either side of its site, so sites near region edges depend
+    # on bases outside them.
+    digestor = Digest(BsaXI, MspI)
+    rand = random.Random(2)
+    for name, seq in seqs:
+        sites = digestor.re_sites(seq)
+        regions = [(name, 0, len(seq)), (name, 0, None)]
+        for _ in range(50):
+            start = rand.randrange(len(seq))
+            regions.append((name, start, start + rand.choice([3, 40, 2000])))
+        results = iter_region_sites(genome, digestor, regions)
+        for (_, start, end), (read, got) in zip(regions, results):
+            end = len(seq) if end is None else end
+            assert read.sequence[start:end] == seq[start:end]
+            assert got == [(cut, enz) for cut, enz in sites
+                           if start <= cut < end]
@@ -0,0 +1,80 @@
+from radsim.screen import (
+    genome_sites,
+    pair_fragment_lengths,
+    screen_enzymes,
+    single_fragment_lengths,
+)
+
+
+def test_screen_matches_digest(tmpdir, write_genome):
+    '''Check screened fragment lengths agree with Digest.iter_fragments()'''
+    import screed
+    from radsim import Digest
+    from radsim.enzymes import PstI, MspI, HpaII, BbvI
+    genome = tmpdir.join('genome.fa')
+    write_genome(genome, [20000, 15, 5000])
+    enzymes = [PstI, MspI, HpaII, BbvI]
+    cuts = genome_sites(str(genome), enzymes)
+    for enzyme in enzymes:
+        for r2_enzyme in enzymes:
+            dig = Digest(enzyme, r2_enzyme)
+            expected = sorted(frag.len
+                              for read in screed.open(str(genome))
+                              for frag in dig.iter_fragments(read.sequence))
+            if enzyme is r2_enzyme:
+                got = single_fragment_lengths(cuts[enzyme], enzyme.size)
+            else:
+                got = pair_fragment_lengths(enzyme, cuts[enzyme], r2_enzyme,
+                                            cuts[r2_enzyme])
+            assert sorted(got.tolist()) == expected, (enzyme, r2_enzyme)
+
+
+def test_screen_enzymes_prunes(tmpdir, write_genome):
+    '''Check enzymes that can't reach the target are skipped'''
+    from radsim.enzymes import SbfI, MspI, NlaIII
+    genome = tmpdir.join('genome.fa')
+    write_genome(genome, [50000])
+    cuts = genome_sites(str(genome), [SbfI, MspI, NlaIII])
+    target = len(cuts[MspI]) // 2
+    results, pruned = screen_enzymes(cuts, target, tolerance=0.1)
+    screened = set((res.enzyme, res.r2_enzyme) for res in results)
+    # SbfI is rare: it's pruned alone and in every pair
+    assert pruned == 3
+    assert screened == set([(MspI, None), (NlaIII, None), (MspI, NlaIII)])
+    distances = [abs(res.loci - target) for res in results]
+    assert distances == sorted(distances)
+
+
+def test_screen_enzymes_pairs(tmpdir, write_genome):
+    '''Check pairs screened together agree with pair_fragment_lengths(), and
+    that only pairs short of the target are pruned'''
+    from radsim.enzymes import get_enzyme
+    genome = tmpdir.join('genome.fa')
+    write_genome(genome, [30000, 10, 8000])
+    # Including enzymes cutting at the same positions, e.g. NlaIII and FatI,
+    # and strict isoschizomers
+    enzymes = [get_enzyme(name) for name in
+               ['BamHI', 'Sau3AI', 'MboI', 'BglII', 'PstI', 'MspI', 'HpaII',
+                'NlaIII', 'FatI', 'ApeKI', 'SbfI']]
+    cuts = genome_sites(str(genome), enzymes)
+    everything, pruned = screen_enzymes(cuts, 0, minlen=50, maxlen=400,
+                                        tolerance=1)
+    assert pruned == 0
+    pairs = [res for res in everything if res.r2_enzyme is not None]
+    assert len(pairs) == len(enzymes) * (len(enzymes) - 1) // 2
+    for res in pairs:
+        assert str(res.enzyme) < str(res.r2_enzyme)
+        lengths = pair_fragment_lengths(res.enzyme, cuts[res.enzyme],
+                                        res.r2_enzyme, cuts[res.r2_enzyme])
+        window = lengths[(lengths >= 50) & (lengths <= 400)]
+        assert (res.fragments, res.loci, res.bp) == \
+            (len(lengths), len(window), window.sum()), res
+
+    target = sorted(res.loci for res in pairs)[len(pairs) // 2]
+    results, pruned = screen_enzymes(cuts, target, minlen=50, maxlen=400)
+    assert pruned > 0
+    screened = set((res.enzyme, res.r2_enzyme) for res in results)
+    for res in everything:
+        if res.loci >= target / 2:
+            assert (res.enzyme, res.r2_enzyme) in screened
+            assert res in results
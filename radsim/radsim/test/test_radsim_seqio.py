@@ -0,0 +1,63 @@
+from radsim.seqio import iter_fasta_windows, RollingSequence
+
+
+def test_iter_fasta_windows(tmpdir):
+    '''Check windows tile each sequence, with the requested overlap'''
+    fasta = tmpdir.join('seqs.fa')
+    fasta.write('>one desc\nACGTA\nCGTAC\nGT\n>two\n>three\nAC\n')
+    got = [(name, list(windows))
+           for name, windows in iter_fasta_windows(str(fasta), 4, 2)]
+    assert got == [
+        ('one', [(0, 'ACGTAC', False), (4, 'ACGTAC', False),
+                 (8, 'ACGT', True)]),
+        ('two', [(0, '', True)]),
+        ('three', [(0, 'AC', True)]),
+    ]
+
+
+def test_iter_fasta_windows_unconsumed(tmpdir):
+    '''Check sequences are still separated if windows aren't read'''
+    fasta = tmpdir.join('seqs.fa')
+    fasta.write('>one\nACGTACGTACGT\n>two\nAC\n')
+    names = [name for name, _ in iter_fasta_windows(str(fasta), 2)]
+    assert names == ['one', 'two']
+
+
+def test_rolling_sequence():
+    seq = RollingSequence(keep=5)
+    seq.add(0, 'ACGTAC')
+    seq.add(4, 'ACGGTT')
+    assert len(seq) == 10
+    assert seq[6:9] == 'GGT'
+    try:
+        seq[2:6]
+    except IndexError:
+        pass
+    else:
+        assert False, 'expected IndexError'
+
+
+def test_bgzf_fasta_records(tmpdir):
+    '''Check BGZF fasta is read in parallel, as screed reads plain fasta'''
+    import random
+    import screed
+    from radsim.seqio import is_bgzf, iter_fasta_records
+    from radsim.writers import open_output
+    rand = random.Random(4)
+    fasta = tmpdir.join('genome.fa')
+    with open(str(fasta), 'w') as fh:
+        for i, length in enumerate([200000, 0, 70]):
+            seq = ''.join(rand.choice('ACGTn') for _ in range(length))
+            print('>seq{} desc'.format(i), file=fh)
+            for start in range(0, length, 70):
+                print(seq[start:start + 70], file=fh)
+    bgzf = str(tmpdir.join('genome.fa.gz'))
+    with open_output(bgzf) as out:
+        out.write(fasta.read_binary())
+    assert is_bgzf(bgzf)
+    assert not is_bgzf(str(fasta))
+    expected = [(rec.name, rec.sequence) for rec in
+                screed.open(str(fasta), parse_description=True)]
+    got = [(rec.name, rec.sequence) for rec in
+           iter_fasta_records(bgzf, threads=3)]
+    assert got == expected
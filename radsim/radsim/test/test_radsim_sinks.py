@@ -0,0 +1,73 @@
+import six
+
+
+def run_outputs(tmpdir, genome, digestor, tag, **kwargs):
+    '''Runs every sink in one pass, returning each output's text'''
+    from radsim.sinks import (FragmentBedSink, FragmentFastaSink,
+                              HistogramSink, LengthStatsSink, SiteBedSink,
+                              run_sinks)
+    from radsim.stats import Histogram
+    from radsim.writers import BedWriter, FastaWriter, open_output
+    paths = [str(tmpdir.join(tag + name))
+             for name in ('.bed', '.fa', '.sites.bed')]
+    hist, stats = six.StringIO(), six.StringIO()
+    sinks = [HistogramSink(Histogram(10, 800, bins=20), hist),
+             LengthStatsSink(stats),
+             FragmentBedSink(BedWriter(open_output(paths[0])),
+                             digestor.enzymes),
+             FragmentFastaSink(FastaWriter(open_output(paths[1]))),
+             SiteBedSink(BedWriter(open_output(paths[2])), digestor.enzymes,
+                         window=30)]
+    run_sinks(str(genome), digestor, sinks, minlen=10, maxlen=800, **kwargs)
+    outputs = [hist.getvalue(), stats.getvalue()]
+    for path in paths:
+        with open(path) as fh:
+            outputs.append(fh.read())
+    return outputs
+
+
+def test_run_sinks(tmpdir, write_genome):
+    '''Check one pass writes what the separate commands would, however the
+    genome is read'''
+    from radsim import Digest
+    from radsim.utils import seqfile_iter_site_arrays
+    genome = tmpdir.join('genome.fa')
+    write_genome(genome, [3000, 0, 10, 20000, 5000])
+    dig = Digest('PstI', 'MspI')
+    hist, stats, bed, fasta, sites = run_outputs(tmpdir, genome, dig, 'serial')
+    assert hist and stats and bed and fasta and sites
+    # Sites with their windows, clipped to each sequence
+    expected = []
+    for read, (found, codes) in seqfile_iter_site_arrays(str(genome), dig):
+        for site, code in zip(found, codes):
+            enzyme = dig.enzymes[code]
+            expected.append('{}\t{}\t{}\t{}\n'.format(
+                read.name, max(site - 30, 0),
+                min(site + enzyme.size + 30, len(read.sequence)), enzyme))
+    assert sites == ''.join(expected)
+    for tag, kwargs in [('threads', dict(threads=2)),
+                        ('chunks', dict(chunk_size=999)),
+                        ('small', dict(chunk_size=50))]:
+        got = run_outputs(tmpdir, genome, dig, tag, **kwargs)
+        assert got == [hist, stats, bed, fasta, sites], tag
+
+
+def test_run_sinks_sites_only(tmpdir, write_genome):
+    '''Check sites are the same when no fragments are wanted'''
+    from radsim import Digest
+    from radsim.sinks import SiteBedSink, run_sinks
+    from radsim.writers import BedWriter, open_output
+    genome = tmpdir.join('genome.fa')
+    write_genome(genome, [3000, 20000, 5000])
+    dig = Digest('BbvI', 'NlaIII')
+    outputs = []
+    for i, chunk_size in enumerate([None, 999, 50]):
+        path = str(tmpdir.join('{}.bed'.format(i)))
+        sink = SiteBedSink(BedWriter(open_output(path)), dig.enzymes,
+                           window=100)
+        run_sinks(str(genome), dig, [sink], chunk_size=chunk_size)
+        with open(path) as fh:
+            outputs.append(fh.read())
+    assert outputs[0]
+    assert outputs[1] == outputs[0]
+    assert outputs[2] == outputs[0]
@@ -0,0 +1,108 @@
+import os
+import random
+
+import numpy as np
+
+from radsim import Digest
+from radsim.sitecache import SiteCache
+
+
+def random_seq(length, seed=5):
+    rand = random.Random(seed)
+    return ''.join(rand.choice('ACGT') for _ in range(length))
+
+
+def test_site_cache_hit(tmpdir):
+    '''Check cached sites are identical, and found without searching'''
+    from radsim.enzymes import BsaXI, MspI
+    seq = random_seq(50000)
+    expected = Digest(BsaXI, MspI).re_sites(seq)
+    cache = SiteCache(str(tmpdir.join('cache')))
+    dig = Digest(BsaXI, MspI, site_cache=cache)
+    assert dig.re_sites(seq) == expected
+    assert len(cache.entries()) == 1
+
+    def fail(sequence):
+        raise AssertionError("searched despite cache")
+    dig = Digest(BsaXI, MspI, site_cache=cache)
+    dig.engine.search_arrays = fail
+    assert dig.re_sites(seq) == expected
+    # A different sequence or enzyme set is a miss
+    assert cache.get(cache.key(seq[1:], dig.enzymes), dig.enzymes) is None
+    assert cache.get(cache.key(seq, [MspI]), [MspI]) is None
+
+
+def test_site_cache_encoding(tmpdir):
+    '''Check negative and widely spaced sites survive delta encoding'''
+    cache = SiteCache(str(tmpdir))
+    sites = np.array([-3, 0, 5, 70000, 2**33], dtype=np.int64)
+    codes = np.array([0, 1, 1, 0, 1], dtype=np.uint8)
+    cache.put('k', ['A', 'B'], sites, codes)
+    got_sites, got_codes = cache.get('k', ['A', 'B'])
+    assert got_sites.tolist() == sites.tolist()
+    assert got_codes.tolist() == codes.tolist()
+    cache.put('empty', ['A'], np.zeros(0, dtype=np.int64), [])
+    assert [arr.tolist() for arr in cache.get('empty', ['A'])] == [[], []]
+
+
+def test_site_cache_evicts_lru(tmpdir):
+    cache = SiteCache(str(tmpdir))
+    rand = np.random.RandomState(0)
+    for i, key in enumerate(['a', 'b', 'c']):
+        sites = np.cumsum(rand.randint(1, 1000, size=1000))
+        cache.put(key, ['A'], sites, np.zeros(1000, dtype=np.uint8))
+        os.utime(cache.path(key), (i, i))
+    # Reading 'a' makes 'b' the least recently used
+    assert cache.get('a', ['A']) is not None
+    size = sum(size for _, size, _ in cache.entries())
+    cache.evict(size - 1)
+    assert not os.path.exists(cache.path('b'))
+    assert os.path.exists(cache.path('a'))
+    assert os.path.exists(cache.path('c'))
+
+
+def test_site_cache_skips_short(tmpdir):
+    '''Check sequences quicker to search than to load aren't cached'''
+    from radsim.enzymes import MspI
+    cache = SiteCache(str(tmpdir), min_length=1000)
+    dig = Digest(MspI, site_cache=cache)
+    short, long_ = random_seq(999), random_seq(1000)
+    assert dig.re_sites(short) == Digest(MspI).re_sites(short)
+    assert cache.entries() == []
+    dig.re_sites(long_)
+    assert len(cache.entries()) == 1
+
+
+def test_site_cache_counts_size(tmpdir, monkeypatch):
+    '''Check storing entries lists the cache once, keeping count of its
+    size, and evicting only as it overflows'''
+    cache = SiteCache(str(tmpdir), max_bytes=10 ** 9)
+    listed = []
+    entries = cache.entries
+
+    def counted():
+        listed.append(1)
+        return entries()
+    monkeypatch.setattr(cache, 'entries', counted)
+    rand = np.random.RandomState(0)
+    for i in range(20):
+        sites = np.cumsum(rand.randint(1, 1000, size=1000))
+        cache.put(str(i), ['A'], sites, np.zeros(1000, dtype=np.uint8))
+    assert len(listed) == 1
+    total = sum(size for _, size, _ in entries())
+    assert cache._total == total
+    # Overflowing evicts down to EVICT_TO of the limit
+    cache.max_bytes = total
+    cache.put('last', ['A'], sites, np.zeros(1000, dtype=np.uint8))
+    assert len(listed) == 2
+    remaining = sum(size for _, size, _ in entries())
+    assert cache._total == remaining <= 0.9 * total
+    assert os.path.exists(cache.path('last'))
+    assert not os.path.exists(cache.path('0'))
+    # Rewriting entries replaces their sizes in the count
+    cache.max_bytes = 10 ** 9
+    for i in range(15, 20):
+        sites = np.cumsum(rand.randint(1, 10 ** 6, size=2000))
+        cache.put(str(i), ['A'], sites, np.zeros(2000, dtype=np.uint8))
+    assert len(listed) == 2
+    assert cache._total == sum(size for _, size, _ in entries())
@@ -0,0 +1,120 @@
+import numpy as np
+import pytest
+
+from radsim.stats import Histogram, LengthStats
+
+
+def test_histogram_bins():
+    '''Check bins tile [lo, hi] and count every length in range'''
+    rand = np.random.RandomState(2)
+    lengths = rand.randint(0, 1200, size=5000)
+    for log in (False, True):
+        hist = Histogram(50, 1000, bins=17, log=log)
+        # Added piecewise, as when streaming fragment tables
+        for part in np.array_split(lengths, 7):
+            hist.add(part)
+        rows = list(hist.rows())
+        assert rows[0][1] == 50
+        assert rows[-1][2] == 1000
+        for (_, _, last, _), (_, first, _, _) in zip(rows, rows[1:]):
+            assert first == last + 1
+        for _, first, last, count in rows:
+            assert count == np.count_nonzero((lengths >= first) &
+                                             (lengths <= last))
+        assert hist.below == np.count_nonzero(lengths < 50)
+        assert hist.above == np.count_nonzero(lengths > 1000)
+    assert len(list(Histogram(50, 1000, bins=17).rows())) == 17
+    # Log bins are wider at the top
+    widths = np.diff(Histogram(1, 10000, bins=20, log=True).edges)
+    assert (np.diff(widths) >= 0).all()
+
+
+def test_histogram_narrow_range():
+    hist = Histogram(10, 12, bins=100)
+    hist.add([10, 11, 11, 12])
+    assert list(hist.rows()) == [(1, 10, 10, 1), (2, 11, 11, 2),
+                                 (3, 12, 12, 1)]
+    with pytest.raises(ValueError):
+        Histogram(10, 9)
+
+
+def test_histogram_merge():
+    one, two, both = [Histogram(1, 500, bins=10) for _ in range(3)]
+    one.add([1, 2, 300, 600])
+    two.add([499, 0])
+    both.add([1, 2, 300, 600, 499, 0])
+    one.merge(two)
+    assert one.counts.tolist() == both.counts.tolist()
+    assert (one.below, one.above) == (1, 1)
+    with pytest.raises(ValueError):
+        one.merge(Histogram(1, 500, bins=11))
+
+
+def test_length_stats_merge_exactly():
+    '''Check stats match numpy's, however the lengths are split up'''
+    rand = np.random.RandomState(3)
+    lengths = rand.randint(1, 3000, size=10001)
+    whole = LengthStats(lengths)
+    merged = LengthStats()
+    for part in np.array_split(lengths, 13)[::-1]:
+        merged.merge(LengthStats(part))
+    for stats in (whole, merged):
+        assert stats.n == len(lengths)
+        assert stats.mean == lengths.mean()
+        assert stats.variance == pytest.approx(lengths.var(ddof=1))
+        assert (stats.min, stats.max) == (lengths.min(), lengths.max())
+        for q in (0, 0.05, 0.3, 0.5, 0.95, 1):
+            assert stats.quantile(q) == np.percentile(
+                lengths, q * 100, method='inverted_cdf')
+    assert whole.counts.tolist() == merged.counts.tolist()
+    assert LengthStats([1, 2, 3, 4, 5, 6, 7, 8, 9, 10]).quantile(0.3) == 3
+    assert LengthStats().median is None
+    assert LengthStats().mean is None and LengthStats([5]).stdev is None
+
+
+def test_length_stats_long_lengths():
+    '''Check lengths past the dense array are counted exactly, without
+    growing it'''
+    rand = np.random.RandomState(4)
+    lengths = np.concatenate([rand.randint(1, 3000, size=1000),
+                              [10 ** 12, 10 ** 9, 10 ** 9, 5000]])
+    whole = LengthStats(lengths, dense=4000)
+    merged = LengthStats(dense=100)
+    for part in np.array_split(lengths, 7):
+        merged.merge(LengthStats(part, dense=4000))
+    for stats in (whole, merged):
+        assert len(stats.counts) <= stats.dense
+        assert stats.n == len(lengths)
+        assert stats.mean == lengths.mean()
+        assert (stats.min, stats.max) == (lengths.min(), 10 ** 12)
+        for q in (0, 0.5, 0.998, 1):
+            assert stats.quantile(q) == np.percentile(
+                lengths, q * 100, method='inverted_cdf')
+    assert whole.long == {5000: 1, 10 ** 9: 2, 10 ** 12: 1}
+
+
+def test_fragment_length_stats(tmpdir, write_genome):
+    '''Check per-sequence stats, including from parallel runs'''
+    from radsim import Digest
+    from radsim.utils import fragment_length_stats, genome_fragments_array
+    genome = str(tmpdir.join('genome.fa'))
+    write_genome(genome, [20000, 0, 5000])
+    dig = Digest('PstI', 'MspI')
+    names, table = genome_fragments_array(genome, dig, 10, 1000)
+    for threads in (1, 2):
+        stats = fragment_length_stats(genome, dig, 10, 1000, threads=threads)
+        assert [name for name, _ in stats] == names
+        for i, (_, stat) in enumerate(stats):
+            lengths = table['len'][table['contig'] == i]
+            assert stat.counts.tolist() == LengthStats(lengths).counts.tolist()
+
+
+def test_write_length_stats_missing():
+    '''Check empty stats write NA in every column'''
+    import six
+    from radsim.stats import write_length_stats
+    out = six.StringIO()
+    write_length_stats([('a', LengthStats([10])), ('b', LengthStats())], out)
+    rows = [line.split('\t') for line in out.getvalue().splitlines()]
+    assert rows[1][:5] == ['a', '1', '10.00', 'NA', '10']
+    assert rows[2] == ['b', '0'] + ['NA'] * (len(rows[0]) - 2)
@@ -0,0 +1,54 @@
+import pickle
+
+from radsim.twobit import TwoBitFile, fasta_to_twobit, is_twobit
+
+
+SEQS = [
+    ('one', 'ACGTNNNNacgtnnACGTRYacgtAC'),
+    ('empty', ''),
+    ('two', 'nnnnGATTACAgattacaNNNN' * 50),
+]
+
+
+def make_twobit(tmpdir):
+    fasta = tmpdir.join('genome.fa')
+    fasta.write(''.join('>{} desc\n{}\n'.format(name, seq)
+                        for name, seq in SEQS))
+    twobit = str(tmpdir.join('genome.2bit'))
+    fasta_to_twobit(str(fasta), twobit)
+    return str(fasta), twobit
+
+
+def test_twobit_roundtrip(tmpdir):
+    '''Check sequences, masking and N runs survive conversion'''
+    fasta, twobit = make_twobit(tmpdir)
+    assert is_twobit(twobit)
+    assert not is_twobit(fasta)
+    records = list(TwoBitFile(twobit))
+    assert [rec.name for rec in records] == [name for name, _ in SEQS]
+    for rec, (_, seq) in zip(records, SEQS):
+        # Other IUPAC codes become N, keeping their case
+        expected = seq.replace('R', 'N').replace('Y', 'N')
+        assert len(rec.sequence) == len(seq)
+        assert str(rec.sequence) == expected
+        assert rec.sequence[3:17] == expected[3:17]
+        assert rec.sequence[5:] == expected[5:]
+
+
+def test_twobit_windows(tmpdir):
+    _, twobit = make_twobit(tmpdir)
+    seq = TwoBitFile(twobit).sequence('two')
+    windows = list(seq.windows(300, 5))
+    assert [start for start, _, _ in windows] == [0, 300, 600, 900]
+    assert [last for _, _, last in windows] == [False, False, False, True]
+    for start, window, _ in windows:
+        assert window == seq[start:start + 305]
+
+
+def test_twobit_pickle(tmpdir):
+    '''Check sequences pickle by reference to their file'''
+    _, twobit = make_twobit(tmpdir)
+    seq = TwoBitFile(twobit).sequence('two')
+    dumped = pickle.dumps(seq)
+    assert len(dumped) < 200
+    assert str(pickle.loads(dumped)) == str(seq)
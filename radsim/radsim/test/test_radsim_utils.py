@@ -0,0 +1,73 @@
+def test_seqfile_iter_frags_threads(tmpdir, write_genome):
+    '''Check parallel digestion gives identical fragments, in order'''
+    from radsim import Digest
+    from radsim.utils import seqfile_iter_frags
+    genome = tmpdir.join('genome.fa')
+    write_genome(genome, [3000, 0, 10, 20000, 5000, 7000])
+    dig = Digest('PstI', 'MspI')
+    serial = [(read.name, frag) for read, frag in
+              seqfile_iter_frags(str(genome), dig, 10, 1000)]
+    parallel = [(read.name, frag) for read, frag in
+                seqfile_iter_frags(str(genome), dig, 10, 1000, threads=2)]
+    assert len(serial) > 0
+    assert serial == parallel
+
+
+def test_seqfile_iter_sites_threads(tmpdir, write_genome):
+    '''Check parallel site finding gives identical sites, in order'''
+    from radsim import Digest
+    from radsim.utils import seqfile_iter_sites
+    genome = tmpdir.join('genome.fa')
+    write_genome(genome, [3000, 20000, 5000])
+    dig = Digest('BbvI', 'NlaIII')
+    serial = [(read.name, sites) for read, sites in
+              seqfile_iter_sites(str(genome), dig)]
+    parallel = [(read.name, sites) for read, sites in
+                seqfile_iter_sites(str(genome), dig, threads=3)]
+    assert serial == parallel
+
+
+def test_seqfile_iter_frags_chunks(tmpdir, write_genome):
+    '''Check digesting in windows gives identical fragments and sequences'''
+    from radsim import Digest
+    from radsim.utils import seqfile_iter_frags
+    genome = tmpdir.join('genome.fa')
+    write_genome(genome, [3000, 0, 10, 20000, 5000])
+    for enzymes in [('PstI', 'MspI'), ('BbvI', 'NlaIII'), ('ApeKI', None)]:
+        dig = Digest(*enzymes, engine='numpy')
+        whole = [(read.name, frag, read.sequence[frag.lhs:frag.rhs])
+                 for read, frag in seqfile_iter_frags(str(genome), dig, 10,
+                                                      800)]
+        for chunk_size in [50, 999, 100000]:
+            chunked = [(read.name, frag, read.sequence[frag.lhs:frag.rhs])
+                       for read, frag in seqfile_iter_frags(
+                           str(genome), dig, 10, 800, chunk_size=chunk_size)]
+            assert whole == chunked, (enzymes, chunk_size)
+
+
+def test_genome_fragments_array(tmpdir, write_genome):
+    '''Check the genome-wide fragment table indexes contigs by name'''
+    from radsim import Digest, genome_fragments_array
+    from radsim.utils import seqfile_iter_frags
+    genome = tmpdir.join('genome.fa')
+    write_genome(genome, [3000, 0, 20000])
+    dig = Digest('PstI', 'MspI')
+    expected = [(read.name, frag.lhs, frag.rhs) for read, frag in
+                seqfile_iter_frags(str(genome), dig, 10, 1000)]
+    assert len(expected) > 0
+    for chunk_size in (None, 1000):
+        names, table = genome_fragments_array(str(genome), dig, 10, 1000,
+                                              chunk_size=chunk_size)
+        assert names == ['contig0', 'contig1', 'contig2']
+        got = [(names[row['contig']], row['lhs'], row['rhs']) for row in table]
+        assert got == expected
+
+
+def test_stream_key():
+    from radsim.utils import stream_key
+    keys = [stream_key(name) for name in
+            ['scaffold_{}'.format(i) for i in range(10000)]]
+    assert len(set(keys)) == len(keys)
+    assert all(len(key) == 7 for key in keys)
+    assert stream_key('chr1', 100) != stream_key('chr1')
+    assert stream_key('chr1', 1 << 33) != stream_key('chr1')
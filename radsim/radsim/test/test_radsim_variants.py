@@ -0,0 +1,116 @@
+import random
+
+import numpy as np
+
+from radsim import Digest
+from radsim.variants import ContigVariants, VariantDigest, read_vcf
+
+
+def random_seq(length, rand):
+    return ''.join(rand.choice('ACGT') for _ in range(length))
+
+
+def apply_snps(seq, positions, alts, alleles):
+    seq = list(seq)
+    for pos, alt, allele in zip(positions, alts, alleles):
+        if allele:
+            seq[pos] = alt[allele - 1]
+    return ''.join(seq)
+
+
+def test_read_vcf(tmpdir):
+    vcf = tmpdir.join('calls.vcf')
+    vcf.write('##fileformat=VCFv4.2\n'
+              '#CHROM\tPOS\tID\tREF\tALT\tQUAL\tFILTER\tINFO\tFORMAT\ta\tb\n'
+              'chr1\t20\t.\tA\tG\t.\t.\t.\tGT:DP\t0|1:5\t1|1:3\n'
+              'chr1\t10\t.\tC\tT,<DEL>\t.\t.\t.\tGT\t2|1\t.|0\n'
+              'chr1\t30\t.\tG\tA\t.\t.\t.\tGT\t0|0\t0/0\n'
+              'chr2\t5\t.\tAT\tA\t.\t.\t.\tGT\t0/1\t0|0\n')
+    samples, haplotype_samples, contigs = read_vcf(str(vcf))
+    assert samples == ['a', 'b']
+    assert haplotype_samples.tolist() == [0, 0, 1, 1]
+    assert list(contigs) == ['chr1', 'chr2']
+    chr1 = contigs['chr1']
+    # Sorted, with symbolic alleles and missing calls as the reference, and
+    # the variant nobody carries dropped
+    assert chr1.positions.tolist() == [9, 19]
+    assert chr1.refs == ['C', 'A']
+    assert chr1.alts == [['T', None], ['G']]
+    assert chr1.genotypes.tolist() == [[0, 1, 0, 0], [0, 1, 1, 1]]
+    assert contigs['chr2'].genotypes.tolist() == [[0, 1, 0, 0]]
+
+
+def test_fragment_presence_snps():
+    '''Check each haplotype's fragments match digesting its whole sequence'''
+    rand = random.Random(3)
+    seq = random_seq(20000, rand)
+    dig = Digest('PstI', 'MspI', engine='numpy')
+    ref_sites, _ = dig.site_arrays(seq)
+    # Hit many sites, and add variants at random, some close together
+    positions = sorted(set(
+        [int(site) + rand.randint(-3, 6) for site in ref_sites[::2]] +
+        [rand.randrange(10, len(seq) - 10) for _ in range(300)]))
+    alts = [[base for base in 'ACGT' if base != seq[pos]][:rand.randint(1, 3)]
+            for pos in positions]
+    samples = 4
+    genotypes = np.array([[rand.choice([0] * 3 + list(range(1, len(alt) + 1)))
+                           for _ in range(samples * 2)] for alt in alts])
+    variants = ContigVariants('chr1', positions, [seq[p] for p in positions],
+                              alts, genotypes)
+    haplotype_samples = np.repeat(np.arange(samples), 2)
+    vdig = VariantDigest(dig, haplotype_samples, maxlen=1000)
+    table, counts = vdig.fragment_presence(seq, variants, contig=2)
+    assert (table['contig'] == 2).all()
+    assert (np.diff(table['lhs']) >= 0).all()
+
+    expected = np.zeros((len(table), samples), dtype=np.int64)
+    index = {(int(lhs), int(rhs)): i for i, (lhs, rhs) in
+             enumerate(zip(table['lhs'], table['rhs']))}
+    assert len(index) == len(table)
+    for haplotype, sample in enumerate(haplotype_samples):
+        hap_seq = apply_snps(seq, positions, alts, genotypes[:, haplotype])
+        hap_table = dig.fragments_array(hap_seq, maxlen=1000)
+        for lhs, rhs in zip(hap_table['lhs'], hap_table['rhs']):
+            expected[index[(int(lhs), int(rhs))], sample] += 1
+    assert (counts == expected).all()
+    # Some fragments must drop out, and some appear
+    assert (counts < 2).any()
+    assert len(table) > len(dig.fragments_array(seq, maxlen=1000))
+
+
+def test_fragment_presence_indels():
+    seq = 'A' * 50 + 'CTGCAG' + 'T' * 100 + 'CTGCAG' + 'A' * 100
+    dig = Digest('PstI')
+    # Haplotype 1 inserts a site, haplotype 2 deletes the second site
+    variants = ContigVariants('chr1', [100, 155], ['T', 'TCTGCAG'],
+                              [['TCTGCAG'], ['T']], [[1, 0], [0, 1]])
+    vdig = VariantDigest(dig, [0, 1])
+    table, counts = vdig.fragment_presence(seq, variants)
+    rows = sorted(zip(table['lhs'].tolist(), table['rhs'].tolist(),
+                      counts.tolist()))
+    # Neither haplotype has the reference fragment: one splits it, and the
+    # other, left with one site, has no fragments at all
+    assert rows == [(50, 107, [1, 0]), (50, 162, [0, 0]), (101, 162, [1, 0])]
+    sites, _ = vdig.haplotype_sites(seq, variants, [1, 0], 0, len(seq))
+    # The inserted site lies within the allele, so maps to its reference base
+    assert sites.tolist() == [50, 101, 156]
+
+
+def test_fragment_presence_indel_lengths():
+    '''Check indels filter fragments by the haplotype's lengths'''
+    seq = 'A' * 50 + 'CTGCAG' + 'T' * 100 + 'CTGCAG' + 'A' * 100
+    dig = Digest('PstI')
+    # Haplotype 1 inserts 200 bases between the sites, haplotype 2 deletes 40
+    variants = ContigVariants('chr1', [100, 110], ['T', 'T' * 41],
+                              [['T' * 201], ['T']], [[1, 0], [0, 1]])
+    vdig = VariantDigest(dig, [0, 1], maxlen=150)
+    table, counts = vdig.fragment_presence(seq, variants)
+    rows = sorted(zip(table['lhs'].tolist(), table['rhs'].tolist(),
+                      table['len'].tolist(), counts.tolist()))
+    # The insertion pushes haplotype 1's fragment past maxlen, and the
+    # deletion shortens haplotype 2's
+    assert rows == [(50, 162, 72, [0, 1]), (50, 162, 112, [0, 0])]
+    table, counts = VariantDigest(dig, [0, 0], maxlen=150).fragment_presence(
+        seq, ContigVariants('chr1', [100], ['T'], [['T' * 201]], [[1, 0]]))
+    assert table['len'].tolist() == [112]
+    assert counts.tolist() == [[1]]
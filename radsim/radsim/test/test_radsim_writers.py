@@ -0,0 +1,79 @@
+import random
+
+import six
+
+from radsim.writers import BedWriter, FastaWriter
+
+
+class Record(object):
+    def __init__(self, name, sequence):
+        self.name = name
+        self.sequence = sequence
+
+
+def digest_record(seed=3):
+    from radsim import Digest
+    from radsim.enzymes import MspI, NlaIII
+    rand = random.Random(seed)
+    read = Record('chr1', ''.join(rand.choice('ACGT') for _ in range(20000)))
+    dig = Digest(MspI, NlaIII)
+    return dig, read, dig.fragments_array(read.sequence, maxlen=500)
+
+
+def test_bed_writer_matches_output_bed():
+    from radsim.utils import output_bed
+    dig, read, table = digest_record()
+    expected = six.StringIO()
+    for frag in dig.iter_table_fragments(table):
+        label = '{}[{}]_{}[{}]'.format(frag.lhs, frag.lhs_enzyme, frag.rhs,
+                                       frag.rhs_enzyme)
+        output_bed(read.name, frag.lhs, frag.rhs, label, expected)
+    got = six.BytesIO()
+    # A small buffer, to flush part way through
+    with BedWriter(got, buffer_size=1000) as bed:
+        bed.write_fragments(read.name, table[:10], dig.enzymes)
+        bed.write_fragments(read.name, table[10:], dig.enzymes)
+    assert len(table) > 10
+    assert got.getvalue() == expected.getvalue().encode()
+
+
+def test_fasta_writer_matches_output_frag_fasta():
+    from radsim.utils import output_frag_fasta
+    dig, read, table = digest_record()
+    expected = six.StringIO()
+    for frag in dig.iter_table_fragments(table):
+        output_frag_fasta(read, frag, expected)
+    got = six.BytesIO()
+    with FastaWriter(got, buffer_size=1000) as fasta:
+        fasta.write_fragments(read, table[:5])
+        fasta.write_fragments(read, table[5:])
+        fasta.write('empty', '')
+    assert len(table) > 5
+    assert got.getvalue() == (expected.getvalue() + '>empty\n').encode()
+
+
+def test_bgzf_output(tmpdir):
+    '''Check .gz output is BGZF, and decompresses to what was written'''
+    import gzip
+    import struct
+    from radsim.writers import BGZF_EOF, open_output
+    rand = random.Random(1)
+    data = ''.join(rand.choice('ACGT\n') for _ in range(300000)).encode()
+    for threads in (1, 3):
+        path = str(tmpdir.join('out{}.fa.gz'.format(threads)))
+        with open_output(path, threads=threads) as out:
+            out.write(data[:10])
+            out.write(data[10:])
+        with gzip.open(path) as fh:
+            assert fh.read() == data
+        with open(path, 'rb') as fh:
+            raw = fh.read()
+        assert raw.endswith(BGZF_EOF)
+        # Walk the blocks by their recorded sizes
+        pos = blocks = 0
+        while pos < len(raw):
+            assert raw[pos + 12:pos + 14] == b'BC'
+            pos += struct.unpack('<H', raw[pos + 16:pos + 18])[0] + 1
+            blocks += 1
+        assert pos == len(raw)
+        assert blocks == 6
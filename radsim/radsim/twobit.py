@@ -0,0 +1,281 @@
+from __future__ import print_function, division, absolute_import
+import mmap
+import shutil
+import struct
+import tempfile
+import time
+
+import numpy as np
+
+from . import metrics as _metrics
+from .seqio import iter_fasta_windows
+
+# UCSC .2bit format, see https://genome.ucsc.edu/FAQ/FAQformat.html#format7
+TWOBIT_SIGNATURE = 0x1A412743
+_BASES = b'TCAG'
+
+# Each byte packs four bases, the first in the most significant bits
+_UNPACK = np.array([[_BASES[(byte >> shift) & 3] for shift in (6, 4, 2, 0)]
+                    for byte in range(256)], dtype=np.uint8)
+_PACK = np.zeros(256, dtype=np.uint8)
+for _code, _base in enumerate(_BASES.decode('ascii')):
+    _PACK[ord(_base)] = _PACK[ord(_base.lower())] = _code
+_IS_N = np.ones(256, dtype=bool)
+for _base in 'ACGTacgt':
+    _IS_N[ord(_base)] = False
+_IS_LOWER = np.zeros(256, dtype=bool)
+_IS_LOWER[ord('a'):ord('z') + 1] = True
+
+# Window size used when packing, a multiple of 4 bases
+_PACK_WINDOW = 1 << 22
+
+
+def _runs(mask, offset=0):
+    '''Returns starts and ends of runs of True in boolean array ``mask``'''
+    edges = np.diff(np.concatenate(([0], mask.view(np.int8), [0])))
+    return np.flatnonzero(edges == 1) + offset, np.flatnonzero(edges == -1) + offset
+
+
+class _BlockList(object):
+    '''Accumulates runs from successive windows, merging those that touch'''
+
+    def __init__(self):
+        self.starts = []
+        self.ends = []
+
+    def add(self, starts, ends):
+        starts, ends = starts.tolist(), ends.tolist()
+        if starts and self.ends and self.ends[-1] == starts[0]:
+            self.ends[-1] = ends[0]
+            starts, ends = starts[1:], ends[1:]
+        self.starts.extend(starts)
+        self.ends.extend(ends)
+
+    def tobytes(self):
+        starts = np.array(self.starts, dtype='<u4')
+        sizes = np.array(self.ends, dtype='<u4') - starts
+        return struct.pack('<I', len(starts)) + starts.tobytes() + sizes.tobytes()
+
+
+def _pack_record(windows, out):
+    '''Packs a sequence given as windows, writing its .2bit record to ``out``.
+    Returns the sequence's length.'''
+    length = 0
+    nblocks = _BlockList()
+    maskblocks = _BlockList()
+    packed = tempfile.TemporaryFile()
+    for start, window, _ in windows:
+        seq = np.frombuffer(window.encode('ascii'), dtype=np.uint8)
+        length += len(seq)
+        nblocks.add(*_runs(_IS_N[seq], start))
+        maskblocks.add(*_runs(_IS_LOWER[seq], start))
+        codes = _PACK[seq]
+        if len(codes) % 4:
+            codes = np.concatenate(
+                (codes, np.zeros(4 - len(codes) % 4, dtype=np.uint8)))
+        codes = codes.reshape(-1, 4)
+        packed.write(((codes[:, 0] << 6) | (codes[:, 1] << 4) |
+                      (codes[:, 2] << 2) | codes[:, 3]).tobytes())
+    out.write(struct.pack('<I', length))
+    out.write(nblocks.tobytes())
+    out.write(maskblocks.tobytes())
+    out.write(struct.pack('<I', 0))
+    packed.seek(0)
+    shutil.copyfileobj(packed, out)
+    packed.close()
+    return length
+
+
+def fasta_to_twobit(fasta, output):
+    '''Converts ``fasta`` to UCSC .2bit file ``output``.
+
+    Sequences are read in windows, so memory use doesn't depend on their
+    length. Bases other than ACGT are stored as N, and lower case bases are
+    recorded as masked blocks.
+    '''
+    names = []
+    offsets = []
+    with tempfile.TemporaryFile() as records:
+        metrics = _metrics.active
+        for name, windows in iter_fasta_windows(fasta, _PACK_WINDOW):
+            names.append(name.encode('utf-8'))
+            offsets.append(records.tell())
+            if metrics is None:
+                _pack_record(windows, records)
+                continue
+            started = time.perf_counter()
+            length = _pack_record(metrics.timed(
+                windows, 'read', bases=lambda window: len(window[1])), records)
+            metrics.contig(name, length, time.perf_counter() - started)
+        # Record offsets are from the start of the file, after the index
+        header_size = 16 + sum(1 + len(name) + 4 for name in names)
+        version, offset_fmt = 0, '<I'
+        if header_size + records.tell() > 0xffffffff:
+            header_size += 4 * len(names)
+            version, offset_fmt = 1, '<Q'
+        records.seek(0)
+        with open(output, 'wb') as out:
+            out.write(struct.pack('<IIII', TWOBIT_SIGNATURE, version,
+                                  len(names), 0))
+            for name, offset in zip(names, offsets):
+                out.write(struct.pack('<B', len(name)) + name)
+                out.write(struct.pack(offset_fmt, header_size + offset))
+            shutil.copyfileobj(records, out)
+
+
+def is_twobit(path):
+    '''Whether ``path`` is a .2bit file, of either byte order'''
+    with open(path, 'rb') as fh:
+        magic = fh.read(4)
+    if len(magic) < 4:
+        return False
+    return TWOBIT_SIGNATURE in (struct.unpack('<I', magic)[0],
+                                struct.unpack('>I', magic)[0])
+
+
+class TwoBitFile(object):
+    '''Memory-mapped reader of UCSC .2bit files.
+
+    Iterating gives records with ``name`` and ``sequence`` attributes, like
+    screed's. Each ``sequence`` is a ``TwoBitSequence``, which decodes bases
+    from the mapped file only when sliced.
+    '''
+
+    def __init__(self, path):
+        self.path = path
+        with open(path, 'rb') as fh:
+            self._mmap = mmap.mmap(fh.fileno(), 0, access=mmap.ACCESS_READ)
+        self._data = np.frombuffer(self._mmap, dtype=np.uint8)
+        signature, = struct.unpack_from('<I', self._mmap, 0)
+        self._endian = '<' if signature == TWOBIT_SIGNATURE else '>'
+        version, count, _ = struct.unpack_from(self._endian + 'III',
+                                               self._mmap, 4)
+        offset_fmt = self._endian + ('Q' if version == 1 else 'I')
+        self.names = []
+        self._offsets = []
+        pos = 16
+        for _ in range(count):
+            size = self._mmap[pos]
+            self.names.append(self._mmap[pos + 1:pos + 1 + size].decode('utf-8'))
+            pos += 1 + size
+            offset, = struct.unpack_from(offset_fmt, self._mmap, pos)
+            self._offsets.append(offset)
+            pos += struct.calcsize(offset_fmt)
+        self._index = {name: i for i, name in enumerate(self.names)}
+
+    def _u32(self, pos, count):
+        arr = np.frombuffer(self._mmap, dtype=self._endian + 'u4', count=count,
+                            offset=pos)
+        return arr.astype(np.int64)
+
+    def sequence(self, name):
+        '''Returns the ``TwoBitSequence`` called ``name``'''
+        pos = self._offsets[self._index[name]]
+        length, nblocks = struct.unpack_from(self._endian + 'II', self._mmap, pos)
+        nstarts = self._u32(pos + 8, nblocks)
+        nsizes = self._u32(pos + 8 + 4 * nblocks, nblocks)
+        pos += 8 + 8 * nblocks
+        maskblocks, = struct.unpack_from(self._endian + 'I', self._mmap, pos)
+        mstarts = self._u32(pos + 4, maskblocks)
+        msizes = self._u32(pos + 4 + 4 * maskblocks, maskblocks)
+        pos += 4 + 8 * maskblocks + 4
+        dna = self._data[pos:pos + (length + 3) // 4]
+        return TwoBitSequence(self.path, name, length, dna, (nstarts, nsizes),
+                              (mstarts, msizes))
+
+    def __len__(self):
+        return len(self.names)
+
+    def __iter__(self):
+        for name in self.names:
+            yield TwoBitRecord(name, self.sequence(name))
+
+
+class TwoBitRecord(object):
+    def __init__(self, name, sequence):
+        self.name = name
+        self.sequence = sequence
+
+
+# Files opened by _open_sequence, e.g. in worker processes
+_open_files = {}
+
+
+def _open_sequence(path, name):
+    if path not in _open_files:
+        _open_files[path] = TwoBitFile(path)
+    return _open_files[path].sequence(name)
+
+
+def _blocks_in(blocks, start, stop):
+    '''Yields the parts of ``blocks`` overlapping ``[start, stop)``, relative
+    to ``start``'''
+    starts, sizes = blocks
+    ends = starts + sizes
+    first = np.searchsorted(ends, start, side='right')
+    last = np.searchsorted(starts, stop, side='left')
+    for block_start, block_end in zip(starts[first:last].tolist(),
+                                      ends[first:last].tolist()):
+        yield max(block_start, start) - start, min(block_end, stop) - start
+
+
+class TwoBitSequence(object):
+    '''A sequence in a memory-mapped .2bit file.
+
+    Slicing decodes just the requested bases, as a str. ``tobytes()`` decodes
+    the whole sequence, and ``windows()`` decodes it piecewise, in the form
+    ``Digest.iter_re_sites()`` takes.
+    '''
+
+    def __init__(self, path, name, length, dna, nblocks, maskblocks):
+        self.path = path
+        self.name = name
+        self.length = length
+        self._dna = dna
+        self._nblocks = nblocks
+        self._maskblocks = maskblocks
+
+    def __reduce__(self):
+        # Pickle by reference, e.g. to send to worker processes
+        return _open_sequence, (self.path, self.name)
+
+    def __len__(self):
+        return self.length
+
+    def decode(self, start, stop):
+        '''Decodes bases ``[start, stop)`` to ASCII bytes'''
+        start, stop = max(start, 0), min(stop, self.length)
+        if stop <= start:
+            return b''
+        first = start // 4
+        bases = _UNPACK[self._dna[first:(stop + 3) // 4]].ravel()
+        bases = bases[start - 4 * first:stop - 4 * first]
+        for block_start, block_end in _blocks_in(self._nblocks, start, stop):
+            bases[block_start:block_end] = ord('N')
+        for block_start, block_end in _blocks_in(self._maskblocks, start, stop):
+            bases[block_start:block_end] |= 0x20
+        return bases.tobytes()
+
+    def tobytes(self):
+        return self.decode(0, self.length)
+
+    def __str__(self):
+        return self.tobytes().decode('ascii')
+
+    def __getitem__(self, item):
+        if not isinstance(item, slice) or item.step not in (None, 1):
+            raise TypeError("TwoBitSequence only supports simple slices")
+        start, stop, _ = item.indices(self.length)
+        return self.decode(start, stop).decode('ascii')
+
+    def windows(self, size, overlap=0):
+        '''Yields ``(start, sequence, last)`` windows, as
+        ``seqio.iter_fasta_windows()`` does'''
+        start = 0
+        while True:
+            stop = start + size + overlap
+            last = stop >= self.length
+            yield start, self[start:stop], last
+            if last:
+                return
+            start += size
@@ -1,6 +1,24 @@
 from __future__ import print_function, division, absolute_import
+from collections import deque
+from multiprocessing import Pool
+import hashlib
+import os
 import sys
-import screed
+import time
+
+import numpy as np
+
+from . import metrics as _metrics
+from .digest import FRAGMENT_DTYPE
+from .regions import open_indexed_genome, RegionRecord
+from .stats import LengthStats
+from .seqio import (
+    is_bgzf,
+    iter_fasta_records,
+    iter_fasta_windows,
+    WindowedRecord,
+)
+from .twobit import TwoBitFile, is_twobit
 
 
 def perror(*args, **kwargs):
@@ -10,22 +28,415 @@ def perror(*args, **kwargs):
 
 
 def output_frag_fasta(read, frag, stream, width=80):
+    metrics = _metrics.active
+    if metrics is not None:
+        started = metrics.start()
     print('>', read.name, '_', frag.lhs, '_', frag.rhs, sep='', file=stream)
     seq = read.sequence[frag.lhs:frag.rhs]
     for start in range(0, len(seq), width):
         print(seq[start:start+width], file=stream)
+    if metrics is not None:
+        metrics.stop('write', started, records_written=1)
 
 
 def output_bed(name, start, stop, label, stream):
+    metrics = _metrics.active
+    if metrics is not None:
+        started = metrics.start()
     print(name, start, stop, label, sep='\t', file=stream)
+    if metrics is not None:
+        metrics.stop('write', started, records_written=1)
+
+
+def open_genome(path):
+    '''Iterates over the records of a fasta or .2bit genome file, which have
+    ``name`` and ``sequence`` attributes'''
+    if is_twobit(path):
+        records = iter(TwoBitFile(path))
+    elif is_bgzf(path):
+        # Decompressed in parallel, overlapping with digestion
+        records = iter_fasta_records(path)
+    else:
+        import screed
+        records = screed.open(path, parse_description=True)
+    metrics = _metrics.active
+    if metrics is not None:
+        metrics.count(input_bytes=os.path.getsize(path))
+        return metrics.timed(records, 'read',
+                             bases=lambda read: len(read.sequence))
+    return records
+
+
+def iter_genome_windows(path, size, overlap=0):
+    '''As ``seqio.iter_fasta_windows()``, for a fasta or .2bit genome file'''
+    if is_twobit(path):
+        for record in TwoBitFile(path):
+            yield record.name, record.sequence.windows(size, overlap)
+    else:
+        for name, windows in iter_fasta_windows(path, size, overlap):
+            yield name, windows
+
+
+# Each worker process' copy of the Digest, set once by _init_worker
+_worker_digestor = None
+
+
+def _init_worker(digestor, instrument=False):
+    global _worker_digestor
+    _worker_digestor = digestor
+    if instrument:
+        _metrics.active = _metrics.Metrics()
+
+
+def _run_worker(func, sequence, kwargs):
+    metrics = _metrics.active
+    if metrics is None:
+        return func(_worker_digestor, sequence, **kwargs)
+    # Send this record's measurements back with its result
+    metrics.stages.clear()
+    metrics.counters.clear()
+    started = metrics.start()
+    result = func(_worker_digestor, sequence, **kwargs)
+    seconds = time.perf_counter() - started[0]
+    return result, seconds, metrics.snapshot()
+
+
+def _fragments_array(digestor, sequence, **kwargs):
+    return digestor.fragments_array(sequence, **kwargs)
+
+
+def _site_fragments_arrays(digestor, sequence, **kwargs):
+    sites, codes = digestor.site_arrays(sequence)
+    return sites, codes, digestor.site_fragments_array(sites, codes, **kwargs)
+
+
+def _pack_sites(digestor, sequence):
+    return digestor.site_arrays(sequence)
+
+
+def _unpack_sites(digestor, packed):
+    enzymes = digestor.enzymes
+    cuts, enz = [arr.tolist() for arr in packed]
+    return [(cut, enzymes[code]) for cut, code in zip(cuts, enz)]
+
+
+def pool_map_records(seqfile, func, digestor, threads, **kwargs):
+    '''Yields ``(read, func(digestor, read.sequence, **kwargs))`` for each
+    record of ``seqfile``, in order, running ``func`` in ``threads`` worker
+    processes.
+
+    Only sequences are sent to workers, and ``func`` should return compact
+    results. At most ``2 * threads`` records are in flight at any time, so
+    memory use doesn't grow with genome size.
+    '''
+    reads = open_genome(seqfile)
+    metrics = _metrics.active
+    pool = Pool(threads, initializer=_init_worker,
+                initargs=(digestor, metrics is not None))
+
+    def result(read, job):
+        if metrics is None:
+            return job.get()
+        started = metrics.start()
+        value, seconds, snapshot = job.get()
+        metrics.stop('wait', started)
+        metrics.merge(snapshot)
+        metrics.contig(read.name, len(read.sequence), seconds)
+        return value
+
+    try:
+        pending = deque()
+        for read in reads:
+            job = pool.apply_async(_run_worker, (func, read.sequence, kwargs))
+            pending.append((read, job))
+            if len(pending) >= 2 * threads:
+                read, job = pending.popleft()
+                yield read, result(read, job)
+        while pending:
+            read, job = pending.popleft()
+            yield read, result(read, job)
+    finally:
+        pool.terminate()
+
+
+def record_contig_times(results):
+    '''Yields the ``(read, result)`` pairs of ``results``, recording the time
+    spent producing each read's results as that contig's, if metrics are
+    being collected'''
+    metrics = _metrics.active
+    if metrics is None:
+        for item in results:
+            yield item
+        return
+    results = iter(results)
+    last_read = None
+    seconds = 0.0
+    while True:
+        started = time.perf_counter()
+        try:
+            read, result = next(results)
+        except StopIteration:
+            break
+        elapsed = time.perf_counter() - started
+        if read is not last_read:
+            if last_read is not None:
+                metrics.contig(last_read.name, len(last_read.sequence),
+                               seconds)
+            last_read = read
+            seconds = 0.0
+        seconds += elapsed
+        yield read, result
+    if last_read is not None:
+        metrics.contig(last_read.name, len(last_read.sequence), seconds)
+
 
+def iter_region_sites(seqfile, digestor, regions):
+    '''Finds RE sites in each of ``regions``, ``(name, start, end)`` tuples,
+    yielding ``(read, sites)`` pairs as ``seqfile_iter_sites()`` does.
 
-def seqfile_iter_frags(seqfile, digestor, minlen, maxlen, **kwargs):
-    for read in screed.open(seqfile, parse_description=True):
-        seq = read.sequence
-        for frag in digestor.iter_fragments(seq, minlen=minlen, maxlen=maxlen, **kwargs):
+    Only the regions (and a few bases around them) are read, from a .2bit or
+    indexed fasta ``seqfile``. Sites are as in a digest of the whole sequence,
+    restricted to those within the region. ``end`` may be None for the rest of
+    the sequence.
+    '''
+    genome = open_indexed_genome(seqfile)
+    for name, start, end in regions:
+        sequence = genome.sequence(name)
+        end = len(sequence) if end is None else min(end, len(sequence))
+        read = RegionRecord(name, sequence, start, end)
+        yield read, digestor.region_re_sites(sequence, start, end)
+
+
+def seqfile_iter_fragment_tables(seqfile, digestor, minlen, maxlen,
+                                 threads=1, chunk_size=None, regions=None,
+                                 progress=None, **kwargs):
+    '''Digests each sequence in ``seqfile``, yielding ``(read, table)`` pairs,
+    where ``table`` is as from ``Digest.fragments_array()``, with each
+    sequence's index in the file (or in ``regions``) as its contig.
+
+    ``threads``, ``chunk_size``, ``regions`` and ``progress`` are as for
+    ``seqfile_iter_frags()``. With ``chunk_size``, a sequence's fragments come
+    in several tables, one per window, as from
+    ``Digest.iter_window_fragment_tables()``.
+    '''
+    results = _iter_fragment_tables(seqfile, digestor, minlen, maxlen,
+                                    threads=threads, chunk_size=chunk_size,
+                                    regions=regions, **kwargs)
+    if progress is not None:
+        results = progress.track(results)
+    return results
+
+
+def seqfile_iter_site_fragment_tables(seqfile, digestor, minlen, maxlen,
+                                      threads=1, chunk_size=None,
+                                      regions=None, progress=None, **kwargs):
+    '''As ``seqfile_iter_fragment_tables()``, but yields ``(read, (sites,
+    codes, table))``, with the sites found, as from ``Digest.site_arrays()``,
+    as well as the fragments between them, so both come from one search.
+
+    With ``chunk_size``, each sequence's sites come in several batches, each
+    with the fragments it completes, as from
+    ``Digest.iter_window_site_tables()``.
+    '''
+    results = _iter_fragment_tables(seqfile, digestor, minlen, maxlen,
+                                    threads=threads, chunk_size=chunk_size,
+                                    regions=regions, with_sites=True,
+                                    **kwargs)
+    if progress is not None:
+        results = progress.track(results)
+    return results
+
+
+def _iter_fragment_tables(seqfile, digestor, minlen, maxlen, threads=1,
+                          chunk_size=None, regions=None, with_sites=False,
+                          **kwargs):
+    if chunk_size:
+        if threads > 1:
+            raise ValueError("Can't digest in chunks with multiple threads")
+        overlap = digestor.window_overlap
+        keep = maxlen + 2 * (chunk_size + overlap) - min(0, digestor.min_site_shift)
+        for item in record_contig_times(_iter_window_tables(
+                seqfile, digestor, chunk_size, keep, with_sites=with_sites,
+                minlen=minlen, maxlen=maxlen, **kwargs)):
+            yield item
+        return
+    if regions is not None:
+        results = record_contig_times(iter_region_sites(seqfile, digestor,
+                                                    regions))
+        for i, (read, sites) in enumerate(results):
+            sites, codes = digestor.encode_sites(sites)
+            table = digestor.site_fragments_array(
+                sites, codes, minlen=minlen, maxlen=maxlen, contig=i, **kwargs)
+            yield read, (sites, codes, table) if with_sites else table
+        return
+    func = _site_fragments_arrays if with_sites else _fragments_array
+    if threads > 1:
+        results = pool_map_records(seqfile, func, digestor, threads,
+                                   minlen=minlen, maxlen=maxlen, **kwargs)
+    else:
+        results = record_contig_times((read, func(
+            digestor, read.sequence, minlen=minlen, maxlen=maxlen, **kwargs))
+            for read in open_genome(seqfile))
+    for i, (read, result) in enumerate(results):
+        table = result[2] if with_sites else result
+        table['contig'] = i
+        yield read, result
+
+
+def _iter_window_tables(seqfile, digestor, chunk_size, keep, with_sites=False,
+                        **kwargs):
+    overlap = digestor.window_overlap
+    windowed = iter_genome_windows(seqfile, chunk_size, overlap)
+    metrics = _metrics.active
+    if metrics is not None:
+        metrics.count(input_bytes=os.path.getsize(seqfile))
+    for i, (name, windows) in enumerate(windowed):
+        read = WindowedRecord(name, windows, keep)
+        windows = read.windows()
+        if metrics is not None:
+            windows = metrics.timed(windows, 'read',
+                                    bases=lambda window: len(window[1]))
+        if with_sites:
+            results = digestor.iter_window_site_tables(windows, contig=i,
+                                                       **kwargs)
+        else:
+            results = digestor.iter_window_fragment_tables(windows, contig=i,
+                                                           **kwargs)
+        empty = True
+        for result in results:
+            empty = False
+            yield read, result
+        if empty:
+            # Every sequence gets at least one table
+            table = np.zeros(0, dtype=FRAGMENT_DTYPE)
+            if with_sites:
+                yield read, (np.zeros(0, dtype=np.int64),
+                             np.zeros(0, dtype=np.uint8), table)
+            else:
+                yield read, table
+
+
+def genome_fragments_array(seqfile, digestor, minlen, maxlen, threads=1,
+                           chunk_size=None, regions=None, **kwargs):
+    '''Digests all of ``seqfile``, returning ``(names, table)``: a single
+    fragment table for the whole genome, and the sequence names its contig
+    column indexes. Arguments are as for ``seqfile_iter_fragment_tables()``.
+    '''
+    names = []
+    tables = [np.zeros(0, dtype=FRAGMENT_DTYPE)]
+    results = seqfile_iter_fragment_tables(seqfile, digestor, minlen, maxlen,
+                                           threads=threads,
+                                           chunk_size=chunk_size,
+                                           regions=regions, **kwargs)
+    last_read = None
+    for read, table in results:
+        if read is not last_read:
+            names.append(read.name)
+            last_read = read
+        tables.append(table)
+    return names, np.concatenate(tables)
+
+
+def fragment_length_stats(seqfile, digestor, minlen, maxlen, threads=1,
+                          chunk_size=None, regions=None, **kwargs):
+    '''Digests all of ``seqfile``, returning a list of ``(name, LengthStats)``
+    of fragment lengths for each sequence. Arguments are as for
+    ``seqfile_iter_fragment_tables()``; merge the stats for genome-wide
+    figures.'''
+    stats = []
+    last_read = None
+    results = seqfile_iter_fragment_tables(seqfile, digestor, minlen, maxlen,
+                                           threads=threads,
+                                           chunk_size=chunk_size,
+                                           regions=regions, **kwargs)
+    for read, table in results:
+        if read is not last_read:
+            stats.append((read.name, LengthStats()))
+            last_read = read
+        stats[-1][1].add(table['len'])
+    return stats
+
+
+def seqfile_iter_frags(seqfile, digestor, minlen, maxlen, threads=1,
+                       chunk_size=None, regions=None, progress=None,
+                       **kwargs):
+    '''Digests each sequence in ``seqfile``, yielding ``(read, frag)`` pairs
+
+    If ``threads`` > 1, sequences are digested in parallel by a pool of worker
+    processes, with identical output.
+
+    If ``chunk_size`` is given, sequences are read and digested in windows of
+    about that many bases, again with identical output, so that memory use
+    doesn't depend on sequence length. ``read`` is then a
+    ``seqio.WindowedRecord``, whose ``sequence`` only holds enough of the
+    most recent bases to extract the current fragment, given ``maxlen``.
+
+    If ``regions`` is given, only fragments between sites within each region
+    are yielded (see ``iter_region_sites()``), in genome coordinates.
+
+    If ``progress`` (a ``progress.Progress``) is given, it is updated as each
+    sequence is digested.
+    '''
+    tables = seqfile_iter_fragment_tables(seqfile, digestor, minlen, maxlen,
+                                          threads=threads,
+                                          chunk_size=chunk_size,
+                                          regions=regions, progress=progress,
+                                          **kwargs)
+    for read, table in tables:
+        for frag in digestor.iter_table_fragments(table):
             yield read, frag
 
 
+def seqfile_iter_sites(seqfile, digestor, threads=1, regions=None):
+    '''Finds RE sites in each sequence in ``seqfile``, yielding ``(read,
+    sites)`` pairs, where ``sites`` is as returned by ``Digest.re_sites()``.
+    If ``regions`` is given, only sites within them are found.'''
+    if regions is not None:
+        for read, sites in iter_region_sites(seqfile, digestor, regions):
+            yield read, sites
+        return
+    results = seqfile_iter_site_arrays(seqfile, digestor, threads=threads)
+    for read, packed in results:
+        yield read, _unpack_sites(digestor, packed)
+
+
+def seqfile_iter_site_arrays(seqfile, digestor, threads=1, regions=None,
+                             progress=None):
+    '''As ``seqfile_iter_sites()``, but yields ``(read, (sites, codes))``,
+    with sites as arrays, as from ``Digest.site_arrays()``. ``progress`` is as
+    for ``seqfile_iter_frags()``.'''
+    results = _iter_site_arrays(seqfile, digestor, threads=threads,
+                                regions=regions)
+    if progress is not None:
+        results = progress.track(results)
+    return results
+
+
+def _iter_site_arrays(seqfile, digestor, threads=1, regions=None):
+    if regions is not None:
+        for read, sites in record_contig_times(iter_region_sites(
+                seqfile, digestor, regions)):
+            yield read, digestor.encode_sites(sites)
+        return
+    if threads > 1:
+        for result in pool_map_records(seqfile, _pack_sites, digestor,
+                                       threads):
+            yield result
+        return
+    results = ((read, digestor.site_arrays(read.sequence))
+               for read in open_genome(seqfile))
+    for item in record_contig_times(results):
+        yield item
+
+
+def stream_key(name, start=0):
+    '''Returns a ``numpy.random.SeedSequence`` spawn key for the random
+    stream of sequence ``name``, or of the region of it from ``start``: the
+    SHA-1 of the name, as 32-bit words, then ``start``'''
+    digest = hashlib.sha1(name.encode('utf-8')).digest()
+    words = np.frombuffer(digest, dtype='<u4').tolist()
+    return tuple(words) + (start & 0xffffffff, start >> 32)
+
+
 def clamp(n, mn, mx):
     return max(min(n, mx), mn)
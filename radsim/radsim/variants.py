@@ -0,0 +1,461 @@
+from __future__ import print_function, division, absolute_import
+from collections import OrderedDict
+import re
+import sys
+
+import numpy as np
+
+from .digest import FRAGMENT_DTYPE
+from .seqio import open_seqfile
+
+_GT_SPLIT = re.compile(r'[|/]')
+_BASES = re.compile(r'^[ACGTNacgtn]+$')
+
+
+class ContigVariants(object):
+    '''The variants on one sequence, sorted by position: 0-based
+    ``positions``, and ``refs`` and ``alts`` allele strings (``alts`` a list
+    per variant), with ``genotypes`` an array of the allele each haplotype
+    carries at each variant (0 for the reference)'''
+
+    def __init__(self, name, positions, refs, alts, genotypes):
+        self.name = name
+        self.positions = np.asarray(positions, dtype=np.int64)
+        self.refs = refs
+        self.alts = alts
+        self.genotypes = np.asarray(genotypes, dtype=np.int16)
+
+    def __len__(self):
+        return len(self.positions)
+
+    def __getitem__(self, index):
+        '''Slices variants, e.g. ``variants[first:stop]``'''
+        return ContigVariants(self.name, self.positions[index],
+                              self.refs[index], self.alts[index],
+                              self.genotypes[index])
+
+
+def _allele_codes(gt, alts, ploidy):
+    '''Parses a GT field to one allele code per haplotype. Missing alleles,
+    and alleles that aren't plain sequence, count as the reference.'''
+    codes = []
+    for allele in _GT_SPLIT.split(gt)[:ploidy]:
+        code = int(allele) if allele.isdigit() else 0
+        codes.append(code if code and alts[code - 1] is not None else 0)
+    return codes + [0] * (ploidy - len(codes))
+
+
+def read_vcf(path):
+    '''Reads a (possibly gzip or BGZF compressed) VCF file.
+
+    Returns ``(samples, haplotype_samples, contigs)``: the sample names, the
+    sample of each haplotype (as an index into ``samples``), and an
+    OrderedDict of ``ContigVariants`` by sequence name. Each sample has as
+    many haplotypes as alleles in its first genotype. Genotypes are taken as
+    phased, in the order given, whether or not they're separated by ``|``.
+    '''
+    samples = []
+    ploidy = None
+    records = OrderedDict()
+    with open_seqfile(path) as fh:
+        for line in fh:
+            if line.startswith('##'):
+                continue
+            fields = line.rstrip('\r\n').split('\t')
+            if line.startswith('#'):
+                samples = fields[9:]
+                continue
+            if len(fields) < 8:
+                continue
+            chrom, pos, _, ref, alt = fields[:5]
+            alts = [allele if _BASES.match(allele) else None
+                    for allele in alt.split(',')]
+            calls = fields[9:]
+            gt_index = None
+            if len(fields) > 8:
+                keys = fields[8].split(':')
+                if 'GT' in keys:
+                    gt_index = keys.index('GT')
+            if ploidy is None:
+                ploidy = [len(_GT_SPLIT.split(call.split(':')[gt_index]))
+                          if gt_index is not None else 2 for call in calls]
+            genotype = []
+            for call, n in zip(calls, ploidy):
+                if gt_index is None:
+                    genotype.extend([0] * n)
+                    continue
+                parts = call.split(':')
+                gt = parts[gt_index] if gt_index < len(parts) else '.'
+                genotype.extend(_allele_codes(gt, alts, n))
+            if not _BASES.match(ref) or not any(genotype):
+                # Nobody carries a (usable) alternate allele
+                continue
+            record = records.setdefault(chrom, ([], [], [], []))
+            record[0].append(int(pos) - 1)
+            record[1].append(ref)
+            record[2].append(alts)
+            record[3].append(genotype)
+    haplotype_samples = np.repeat(np.arange(len(samples)), ploidy or 0)
+    contigs = OrderedDict()
+    for name, (positions, refs, alts, genotypes) in records.items():
+        genotypes = np.array(genotypes, dtype=np.int16).reshape(
+            len(positions), len(haplotype_samples))
+        order = np.argsort(positions, kind='stable')
+        contigs[name] = ContigVariants(
+            name, np.array(positions, dtype=np.int64)[order],
+            [refs[i] for i in order], [alts[i] for i in order],
+            genotypes[order])
+    return samples, haplotype_samples, contigs
+
+
+class VariantDigest(object):
+    '''Digests the haplotypes of a population, given as variants against a
+    reference, to find which fragments each sample has.
+
+    Variants only change the sites within ``Digest.site_reach`` of them, so
+    rather than building each haplotype's sequence, variants close enough to
+    interact are grouped into clusters, and each distinct combination of
+    alleles that haplotypes carry in a cluster is applied to, and searched
+    in, only the sequence around it. Each haplotype's fragments are then the
+    reference fragments, with those around its non-reference clusters
+    replaced. Work thus scales with the number of variants (and distinct
+    haplotypes around each), not the genome size times the number of
+    samples, beyond digesting the reference once.
+
+    ``haplotype_samples`` is the sample of each haplotype, as from
+    ``read_vcf()``, and the remaining arguments are as for
+    ``Digest.fragments_array()``.
+    '''
+
+    def __init__(self, digestor, haplotype_samples, minlen=0,
+                 maxlen=sys.maxsize, force_different_enzymes=True):
+        self.digestor = digestor
+        self.haplotype_samples = np.asarray(haplotype_samples)
+        self.ploidy = np.bincount(self.haplotype_samples).astype(np.int16)
+        self.minlen = minlen
+        self.maxlen = maxlen
+        self.force_different_enzymes = force_different_enzymes
+
+    def _fragments(self, sites, codes, contig, shifts=None):
+        '''Fragments between ``sites``, in reference coordinates. Where a
+        haplotype's sites lie ``shifts`` from the reference by indels, its
+        fragment lengths, and so the size filter, use its own coordinates.'''
+        if shifts is None:
+            return self.digestor.site_fragments_array(
+                sites, codes, minlen=self.minlen, maxlen=self.maxlen,
+                force_different_enzymes=self.force_different_enzymes,
+                contig=contig)
+        # Unfiltered by size, both give the same fragments, in the same order
+        table, hap_table = (self.digestor.site_fragments_array(
+            positions, codes,
+            force_different_enzymes=self.force_different_enzymes,
+            contig=contig) for positions in (sites, sites + shifts))
+        length = hap_table['len']
+        keep = (length >= self.minlen) & (length <= self.maxlen)
+        table = table[keep]
+        table['len'] = length[keep]
+        return table
+
+    def clusters(self, sequence, variants):
+        '''Groups ``variants`` (a ``ContigVariants``) on ``sequence`` into
+        clusters that can each change sites independently. Returns a list of
+        ``(first, stop, start, end)``: the variants ``[first, stop)``, and the
+        interval of ``sequence`` where they may change sites.'''
+        if not len(variants):
+            return []
+        reach = self.digestor.site_reach
+        ends = variants.positions + np.array([len(ref) for ref in
+                                              variants.refs])
+        starts = variants.positions - reach
+        ends = np.maximum.accumulate(ends + reach)
+        # A variant starts a new cluster if it can't reach the previous ones
+        breaks = np.flatnonzero(starts[1:] >= ends[:-1]) + 1
+        firsts = np.concatenate([[0], breaks])
+        stops = np.concatenate([breaks, [len(variants)]])
+        return [(first, stop, max(0, int(starts[first])),
+                 min(len(sequence), int(ends[stop - 1])))
+                for first, stop in zip(firsts.tolist(), stops.tolist())]
+
+    def _window(self, sequence, variants, alleles, start, end):
+        reach = self.digestor.site_reach
+        return _HaplotypeWindow(sequence, variants, alleles,
+                                max(0, start - reach),
+                                min(len(sequence), end + reach))
+
+    def _window_sites(self, window, start, end):
+        '''Returns the sites, codes and shifts (haplotype less reference
+        position, from the start of the window) within ``[start, end)``'''
+        batches = list(self.digestor.iter_site_batches([
+            (window.pad_start, window.text, window.last)]))
+        hap_sites = np.concatenate([sites for sites, _ in batches])
+        sites = window.reference_positions(hap_sites)
+        codes = np.concatenate([codes for _, codes in batches])
+        keep = (sites >= start) & (sites < end)
+        sites, codes = sites[keep], codes[keep]
+        shifts = hap_sites[keep] - sites
+        # As in site_arrays(), the last of several at one position wins
+        last = np.ones(len(sites), dtype=bool)
+        last[:-1] = sites[1:] != sites[:-1]
+        return sites[last], codes[last], shifts[last]
+
+    def haplotype_sites(self, sequence, variants, alleles, start, end):
+        '''Returns the ``(sites, codes)``, as from ``Digest.site_arrays()``,
+        within ``[start, end)`` of a haplotype carrying ``alleles`` of
+        ``variants`` (an allele code for each), in reference coordinates.
+
+        Only ``[start, end)`` and a margin around it are read. Sites within
+        alternate alleles are placed at the nearest reference base. Where
+        alleles overlap, the first is applied, and later ones ignored.
+        '''
+        return self._window_sites(
+            self._window(sequence, variants, alleles, start, end), start,
+            end)[:2]
+
+    def _touched(self, windows):
+        '''Returns whether each of ``windows`` might have different sites to
+        the reference: whether, in the haplotype or the reference, any
+        recognition site, or its cuts, overlap the alleles that differ, or
+        whether an indel changes the length of the fragments across it. All
+        windows are searched at once, separated by newlines, which no site
+        matches.'''
+        engine = self.digestor.engine
+        texts = []
+        spans = []
+        offset = 0
+        for i, window in enumerate(windows):
+            for text, text_spans in ((window.text, window.alt_spans),
+                                     (window.ref_text, window.ref_spans)):
+                texts.append(text)
+                spans.extend((offset + lo, offset + hi, i)
+                             for lo, hi in text_spans)
+                offset += len(text) + 1
+        touched = np.array([window.pad_start == 0 or window.last or
+                            window.resized for window in windows], dtype=bool)
+        if not spans:
+            return touched
+        spans = np.array(spans, dtype=np.int64)
+        # Sites lie up to this far outside their recognition site
+        cut_reach = self.digestor.site_reach - self.digestor.window_overlap
+        for spec, (fwd, rev) in zip(engine.specs,
+                                    engine.matches('\n'.join(texts))):
+            matches = np.concatenate([fwd, rev]) - 1
+            first = matches - cut_reach
+            last = matches + spec.size + cut_reach
+            # The first span ending after each match's first base
+            span = np.searchsorted(spans[:, 1], first, 'right')
+            hit = span < len(spans)
+            span, last = span[hit], last[hit]
+            touched[spans[span[spans[span, 0] < last], 2]] = True
+        return touched
+
+    def fragment_presence(self, sequence, variants=None, contig=0):
+        '''Digests each haplotype of ``sequence`` carrying ``variants`` (a
+        ``ContigVariants``, or None for none).
+
+        Returns ``(table, counts)``: a fragment table (see
+        ``Digest.fragments_array()``) of the fragments any haplotype has,
+        sorted by position, and an array of how many of each sample's
+        haplotypes have each fragment. A count below the sample's ploidy
+        means allele dropout.
+        '''
+        digestor = self.digestor
+        ref_sites, ref_codes = digestor.site_arrays(sequence)
+        ref_table = self._fragments(ref_sites, ref_codes, contig)
+        counts = np.tile(self.ploidy, (len(ref_table), 1))
+        if variants is None or not len(variants):
+            return ref_table, counts
+
+        # The distinct combinations of alleles haplotypes carry in each
+        # cluster, and the window around each that isn't all reference
+        clusters = []
+        windows = []
+        for first, stop, start, end in self.clusters(sequence, variants):
+            genotypes = variants.genotypes[first:stop]
+            if len(genotypes) == 1:
+                combos, haplotype_combos = np.unique(genotypes[0],
+                                                     return_inverse=True)
+                combos = combos[:, None]
+            else:
+                combos, haplotype_combos = np.unique(
+                    genotypes.T, axis=0, return_inverse=True)
+            cluster_variants = variants[first:stop]
+            combo_windows = {}
+            for i, alleles in enumerate(combos.tolist()):
+                if any(alleles):
+                    combo_windows[i] = len(windows)
+                    windows.append(self._window(sequence, cluster_variants,
+                                                alleles, start, end))
+            clusters.append((start, end, haplotype_combos.reshape(-1),
+                             combo_windows))
+
+        # Search only the windows that might differ from the reference
+        touched = self._touched(windows)
+        changed = []
+        for start, end, haplotype_combos, combo_windows in clusters:
+            sites = {}
+            for combo, window in combo_windows.items():
+                if touched[window]:
+                    sites[combo] = (self._window_sites(windows[window], start,
+                                                       end) +
+                                    (windows[window].shift,))
+            combo_windows.clear()
+            combo_windows.update(sites)
+            changed.append(np.isin(haplotype_combos, list(sites)))
+        changed = np.array(changed).reshape(len(clusters), -1)
+        bounds = np.array([(start, end) for start, end, _, _ in clusters],
+                          dtype=np.int64).reshape(-1, 2)
+        first_site = np.searchsorted(ref_sites, bounds[:, 0])
+        past_site = np.searchsorted(ref_sites, bounds[:, 1])
+
+        novel = OrderedDict()
+        runs = {}
+        for haplotype, sample in enumerate(self.haplotype_samples.tolist()):
+            for run in _runs(np.flatnonzero(changed[:, haplotype]),
+                             first_site, past_site):
+                key = tuple((c, int(clusters[c][2][haplotype])) for c in run)
+                if key not in runs:
+                    runs[key] = self._run_fragments(
+                        key, clusters, ref_sites, ref_codes, ref_table,
+                        first_site, past_site, contig)
+                lo, hi, kept, added = runs[key]
+                counts[lo:hi, sample] -= 1
+                counts[kept, sample] += 1
+                for fragment in added:
+                    novel.setdefault(fragment, np.zeros_like(self.ploidy))
+                    novel[fragment][sample] += 1
+        if not novel:
+            return ref_table, counts
+        novel_table = np.array(list(novel), dtype=FRAGMENT_DTYPE)
+        table = np.concatenate([ref_table, novel_table])
+        counts = np.concatenate([counts, np.array(list(novel.values()))])
+        order = np.lexsort((table['rhs'], table['lhs']))
+        return table[order], counts[order]
+
+    def _run_fragments(self, key, clusters, ref_sites, ref_codes, ref_table,
+                       first_site, past_site, contig):
+        '''Digests a run of clusters with the allele combinations in ``key``.
+        Returns the range of reference fragments the run replaces, those it
+        keeps (as indices), and the new fragments, as tuples. Fragments whose
+        length indels change are new, though their ends are not.'''
+        first, last = key[0][0], key[-1][0]
+        # The reference sites either side of the run anchor its fragments,
+        # with the haplotype shifted by the indels of the clusters before
+        left = first_site[first] - 1
+        right = past_site[last]
+        sites = [ref_sites[max(left, 0):left + 1]]
+        codes = [ref_codes[max(left, 0):left + 1]]
+        shifts = [np.zeros(len(sites[0]), dtype=np.int64)]
+        shift = 0
+        for cluster, combo in key:
+            cluster_sites, cluster_codes, cluster_shifts, cluster_shift = \
+                clusters[cluster][3][combo]
+            sites.append(cluster_sites)
+            codes.append(cluster_codes)
+            shifts.append(cluster_shifts + shift)
+            shift += cluster_shift
+        sites.append(ref_sites[right:right + 1])
+        codes.append(ref_codes[right:right + 1])
+        shifts.append(np.full(len(sites[-1]), shift, dtype=np.int64))
+        fragments = self._fragments(np.concatenate(sites),
+                                    np.concatenate(codes), contig,
+                                    np.concatenate(shifts))
+
+        lhs = ref_table['lhs']
+        lo = 0 if left < 0 else np.searchsorted(lhs, ref_sites[left])
+        hi = (len(lhs) if right >= len(ref_sites) else
+              np.searchsorted(lhs, ref_sites[right]))
+        replaced = {fragment: lo + i for i, fragment in
+                    enumerate(ref_table[lo:hi].tolist())}
+        kept = []
+        added = []
+        for fragment in fragments.tolist():
+            if fragment in replaced:
+                kept.append(replaced[fragment])
+            else:
+                added.append(fragment)
+        return int(lo), int(hi), np.array(kept, dtype=np.int64), added
+
+
+class _HaplotypeWindow(object):
+    '''The sequence ``[pad_start, pad_end)`` of a haplotype carrying
+    ``alleles`` of ``variants`` (see ``VariantDigest.haplotype_sites()``), as
+    ``text``, with ``ref_text`` the reference sequence. ``alt_spans`` and
+    ``ref_spans`` are where the alleles applied lie in each, ``shift`` how
+    much longer the haplotype is, and ``resized`` whether any allele applied
+    is an indel.'''
+
+    def __init__(self, sequence, variants, alleles, pad_start, pad_end):
+        self.pad_start = pad_start
+        self.last = pad_end == len(sequence)
+        # Pieces of the haplotype, and where each starts in the haplotype and
+        # the reference. Sites in alleles are clamped to the reference allele.
+        pieces = []
+        hap_starts = []
+        ref_starts = []
+        clamps = []
+        self.alt_spans = []
+        self.ref_spans = []
+        hap = ref = pad_start
+        for pos, ref_allele, alts, allele in zip(
+                variants.positions.tolist(), variants.refs, variants.alts,
+                alleles):
+            if not allele or pos < ref or pos + len(ref_allele) > pad_end:
+                continue
+            alt = alts[allele - 1]
+            # The reference up to the allele, then the allele
+            pieces.extend((str(sequence[ref:pos]), alt))
+            hap_starts.extend((hap, hap + pos - ref))
+            ref_starts.extend((ref, pos))
+            clamps.extend((sys.maxsize, len(ref_allele)))
+            hap += pos - ref
+            self.alt_spans.append((hap - pad_start, hap - pad_start + len(alt)))
+            self.ref_spans.append((pos - pad_start,
+                                   pos - pad_start + len(ref_allele)))
+            hap += len(alt)
+            ref = pos + len(ref_allele)
+        pieces.append(str(sequence[ref:pad_end]))
+        hap_starts.append(hap)
+        ref_starts.append(ref)
+        clamps.append(sys.maxsize)
+        self.text = ''.join(pieces)
+        self.shift = hap - ref
+        self.resized = any(alt_hi - alt_lo != ref_hi - ref_lo for
+                           (alt_lo, alt_hi), (ref_lo, ref_hi) in
+                           zip(self.alt_spans, self.ref_spans))
+        self.ref_text = str(sequence[pad_start:pad_end])
+        self._hap_starts = np.array(hap_starts, dtype=np.int64)
+        self._ref_starts = np.array(ref_starts, dtype=np.int64)
+        self._clamps = np.array(clamps, dtype=np.int64)
+
+    def reference_positions(self, positions):
+        '''Maps positions in the haplotype to the reference'''
+        piece = np.maximum(
+            np.searchsorted(self._hap_starts, positions, 'right') - 1, 0)
+        return self._ref_starts[piece] + np.minimum(
+            positions - self._hap_starts[piece], self._clamps[piece])
+
+
+def _runs(changed, first_site, past_site):
+    '''Splits the indices of ``changed`` clusters into runs with no reference
+    sites between them, which must be digested together'''
+    run = []
+    for cluster in changed.tolist():
+        if run and past_site[run[-1]] < first_site[cluster]:
+            yield run
+            run = []
+        run.append(cluster)
+    if run:
+        yield run
+
+
+def write_fragment_presence(writer, name, table, counts, ploidy,
+                            variable_only=False):
+    '''Writes a row per fragment to ``writer`` (a ``writers.BedWriter``): its
+    position and length, and the number of each sample's haplotypes with it.
+    If ``variable_only``, only fragments some haplotype lacks are written.'''
+    if variable_only:
+        keep = (counts != ploidy).any(axis=1)
+        table, counts = table[keep], counts[keep]
+    labels = ['{}\t{}'.format(length, '\t'.join(map(str, row)))
+              for length, row in zip(table['len'].tolist(), counts.tolist())]
+    writer.write_many(name, table['lhs'], table['rhs'], labels)
@@ -0,0 +1,228 @@
+from __future__ import print_function, division, absolute_import
+from collections import deque
+import io
+from multiprocessing.pool import ThreadPool
+import struct
+import sys
+import zlib
+
+import numpy as np
+
+from . import metrics as _metrics
+from .engines import _as_bytes
+from .seqio import sequence_bytes
+
+# BGZF (blocked gzip) format, see the SAM specification, section 4.1. Each
+# block is a gzip member holding at most BGZF_BLOCK_SIZE bytes, whose header
+# records the member's compressed size so that readers can seek to blocks.
+BGZF_BLOCK_SIZE = 0xff00
+BGZF_EOF = (b'\x1f\x8b\x08\x04\x00\x00\x00\x00\x00\xff\x06\x00BC\x02\x00'
+            b'\x1b\x00\x03\x00\x00\x00\x00\x00\x00\x00\x00\x00')
+_BGZF_HEADER = struct.Struct('<4BIBBHBBHH')
+
+
+def bgzf_block(data, level=6):
+    '''Compresses ``data`` (at most ``BGZF_BLOCK_SIZE`` bytes) to a BGZF
+    block'''
+    compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+    cdata = compressor.compress(data) + compressor.flush()
+    header = _BGZF_HEADER.pack(0x1f, 0x8b, 8, 4, 0, 0, 0xff, 6, ord('B'),
+                               ord('C'), 2, len(cdata) + 25)
+    return b''.join((header, cdata, struct.pack('<II',
+                                                zlib.crc32(data) & 0xffffffff,
+                                                len(data))))
+
+
+class BgzfWriter(object):
+    '''A binary file object writing BGZF compressed data, which any gzip
+    reader can read, and which tools like ``tabix`` and ``samtools faidx``
+    can index. Blocks are compressed by a pool of ``threads`` threads (zlib
+    releases the GIL), and written in order.'''
+
+    def __init__(self, path, threads=1, level=6):
+        self._file = open(path, 'wb')
+        self.level = level
+        self._buffer = bytearray()
+        self._pending = deque()
+        self._threads = threads
+        self._pool = ThreadPool(threads) if threads > 1 else None
+
+    def _submit(self, data):
+        if self._pool is None:
+            self._file.write(bgzf_block(data, self.level))
+            return
+        self._pending.append(self._pool.apply_async(bgzf_block,
+                                                    (data, self.level)))
+        # Bound the number of blocks in memory
+        while len(self._pending) > 4 * self._threads:
+            self._file.write(self._pending.popleft().get())
+
+    def write(self, data):
+        buf = self._buffer
+        buf += data
+        if len(buf) >= BGZF_BLOCK_SIZE:
+            end = len(buf) - len(buf) % BGZF_BLOCK_SIZE
+            for start in range(0, end, BGZF_BLOCK_SIZE):
+                self._submit(bytes(buf[start:start + BGZF_BLOCK_SIZE]))
+            del buf[:end]
+        return len(data)
+
+    def flush(self):
+        pass
+
+    def close(self):
+        if self._file.closed:
+            return
+        if self._buffer:
+            self._submit(bytes(self._buffer))
+            self._buffer = bytearray()
+        while self._pending:
+            self._file.write(self._pending.popleft().get())
+        if self._pool is not None:
+            self._pool.close()
+            self._pool.join()
+        self._file.write(BGZF_EOF)
+        self._file.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+def open_output(path, threads=1):
+    '''Opens ``path`` for binary output, with ``-`` for stdout. Paths ending
+    in .gz or .bgz are BGZF compressed, on ``threads`` threads.'''
+    if path == '-':
+        return io.open(sys.stdout.fileno(), 'wb', closefd=False)
+    if path.endswith(('.gz', '.bgz')):
+        return BgzfWriter(path, threads=threads)
+    return io.open(path, 'wb')
+
+
+class BufferedWriter(object):
+    '''Collects formatted records, writing them to binary ``stream`` (e.g.
+    from ``open_output()``) in blocks of about ``buffer_size`` characters.
+    Use as a context manager, or call ``close()`` to write what remains
+    (``stream`` itself is left open).'''
+
+    # Joins the parts of a block, which are text or bytes
+    _empty = ''
+
+    def __init__(self, stream, buffer_size=1 << 20):
+        self.stream = stream
+        self.buffer_size = buffer_size
+        self._parts = []
+        self._size = 0
+
+    def _add(self, text):
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self.buffer_size:
+            self.flush()
+
+    def flush(self):
+        if self._parts:
+            metrics = _metrics.active
+            if metrics is not None:
+                started = metrics.start()
+            block = self._empty.join(self._parts)
+            if not isinstance(block, bytes):
+                block = block.encode('utf-8')
+            self.stream.write(block)
+            self._parts = []
+            self._size = 0
+            if metrics is not None:
+                metrics.stop('write', started, bytes_written=len(block))
+
+    def close(self):
+        self.flush()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+
+class BedWriter(BufferedWriter):
+    '''Writes BED records, as ``utils.output_bed()`` does'''
+
+    def write(self, name, start, stop, label):
+        self._add('{}\t{}\t{}\t{}\n'.format(name, start, stop, label))
+
+    def write_many(self, name, starts, stops, labels):
+        '''Writes a record per element of the arrays (or sequences) ``starts``,
+        ``stops`` and ``labels``, all on sequence ``name``'''
+        if isinstance(starts, np.ndarray):
+            starts, stops = starts.tolist(), stops.tolist()
+        prefix = '{}\t'.format(name)
+        self._add(''.join([
+            '{}{}\t{}\t{}\n'.format(prefix, start, stop, label)
+            for start, stop, label in zip(starts, stops, labels)]))
+
+    def write_fragments(self, name, table, enzymes):
+        '''Writes each fragment in a fragment table (see
+        ``Digest.fragments_array()``), labelled with its sites and enzymes.
+        ``enzymes`` is what the table's enzyme codes index.'''
+        names = [str(enzyme) for enzyme in enzymes]
+        lhs, rhs = table['lhs'].tolist(), table['rhs'].tolist()
+        labels = ['{}[{}]_{}[{}]'.format(left, names[left_enz], right,
+                                         names[right_enz])
+                  for left, right, left_enz, right_enz in
+                  zip(lhs, rhs, table['lhs_enzyme'].tolist(),
+                      table['rhs_enzyme'].tolist())]
+        self.write_many(name, lhs, rhs, labels)
+
+
+class FastaWriter(BufferedWriter):
+    '''Writes fasta records with sequence lines ``width`` long to binary
+    ``stream``, as ``utils.output_frag_fasta()`` does.
+
+    Fragment sequences are memoryviews of one buffer per fragment table, and
+    lines are views of those, so bases are only copied into the output
+    block.
+    '''
+    _empty = b''
+
+    def __init__(self, stream, width=80, buffer_size=1 << 20):
+        super(FastaWriter, self).__init__(stream, buffer_size)
+        self.width = width
+
+    def write(self, name, sequence):
+        '''Writes a record, where ``sequence`` is a str or bytes-like'''
+        if not isinstance(sequence, memoryview):
+            sequence = memoryview(_as_bytes(sequence))
+        self._write_view(name.encode('utf-8'), sequence)
+
+    def _write_view(self, name, view):
+        width = self.width
+        parts = self._parts
+        parts.extend((b'>', name, b'\n'))
+        for start in range(0, len(view), width):
+            parts.append(view[start:start + width])
+            parts.append(b'\n')
+        self._size += len(name) + len(view) + len(view) // width + 3
+        if self._size >= self.buffer_size:
+            self.flush()
+
+    def write_fragments(self, read, table):
+        '''Writes the sequence of each fragment in a fragment table, taken
+        from ``read``'''
+        if not len(table):
+            return
+        lhs, rhs = table['lhs'].tolist(), table['rhs'].tolist()
+        # One buffer covering all the fragments
+        first, last = max(lhs[0], 0), max(rhs)
+        sequence = read.sequence
+        data = memoryview(sequence_bytes(sequence, first, last))
+        name = read.name.encode('utf-8')
+        for left, right in zip(lhs, rhs):
+            header = b'%s_%d_%d' % (name, left, right)
+            if left < 0:
+                # Sites can precede the sequence; slice as python would
+                view = memoryview(_as_bytes(sequence[left:right]))
+            else:
+                view = data[left - first:right - first]
+            self._write_view(header, view)
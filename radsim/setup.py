@@ -1,5 +1,8 @@
 #!/usr/bin/env python
+import os
+
 from setuptools import setup
+from setuptools.command.develop import develop
 import versioneer
 
 
@@ -22,19 +25,62 @@ test_requires = [
 ]
 
 command_classes = versioneer.get_cmdclass()
+version = versioneer.get_version()
+
+# The version, written into the package when it's built or installed, so
+# importing radsim needn't compute it
+STATIC_VERSION = os.path.join('radsim', '_static_version.py')
+
+
+def write_static_version(root):
+    path = os.path.join(root, STATIC_VERSION)
+    if os.path.exists(path):
+        # Maybe a hard link to the source tree's copy
+        os.unlink(path)
+    with open(path, 'w') as fh:
+        fh.write('# Written by setup.py\n__version__ = {!r}\n'.format(version))
+
+
+class BuildPy(command_classes['build_py']):
+    def run(self):
+        super().run()
+        write_static_version(self.build_lib)
+
+
+class SDist(command_classes['sdist']):
+    def make_release_tree(self, base_dir, files):
+        super().make_release_tree(base_dir, files)
+        write_static_version(base_dir)
+
+
+class Develop(develop):
+    def run(self):
+        write_static_version(os.path.dirname(os.path.abspath(__file__)))
+        super().run()
+
+
+command_classes.update(build_py=BuildPy, sdist=SDist, develop=Develop)
 
 setup(
     name="radsim",
     packages=['radsim', ],
-    version=versioneer.get_version(),
+    version=version,
     entry_points={
         'console_scripts': [
+            'radsim = radsim.main:radsim_main',
             'radsim-hist = radsim.main:hist_main',
             'radsim-digest = radsim.main:digest_main',
             'radsim-rebed = radsim.main:rebed_main',
+            'radsim-reads = radsim.main:reads_main',
+            'radsim-library = radsim.main:library_main',
+            'radsim-variants = radsim.main:variants_main',
+            'radsim-screen = radsim.main:screen_main',
+            'radsim-index = radsim.main:index_main',
+            'radsim-enzymes = radsim.main:enzymes_main',
         ],
     },
     cmdclass=command_classes,
+    python_requires='>=3.7',
     install_requires=install_requires,
     tests_require=test_requires,
     setup_requires=setup_requires,
@@ -51,8 +97,8 @@ setup(
     ],
     classifiers=[
         "Programming Language :: Python",
-        "Programming Language :: Python :: 2",
         "Programming Language :: Python :: 3",
+        "Programming Language :: Python :: 3 :: Only",
         "Development Status :: 3 - Alpha",
         "Environment :: Console",
         "Intended Audience :: Developers",